@@ -1,8 +1,12 @@
 """Analyse de champs : défauts topologiques, projections, statistiques."""
 
-from .defects import detect_vortices, compute_winding_number, DefectMetrics
+from .defects import (
+    detect_vortices, detect_vortices_batch, count_defects, track_defects_over_time,
+    compute_winding_number, DefectMetrics
+)
 from .projection import ProjectionMap
 
-__all__ = ['detect_vortices', 'compute_winding_number', 'DefectMetrics', 'ProjectionMap']
+__all__ = ['detect_vortices', 'detect_vortices_batch', 'count_defects', 'track_defects_over_time',
+           'compute_winding_number', 'DefectMetrics', 'ProjectionMap']
 
 
@@ -9,7 +9,6 @@ Métrique phénoménologique : #défauts_actifs ~ fragmentation perceptuelle
 """
 
 import numpy as np
-from numba import jit
 from typing import List, Tuple, Dict
 from dataclasses import dataclass
 
@@ -54,65 +53,67 @@ class DefectMetrics:
         return total_potential
 
 
-@jit(nopython=True)
-def _compute_plaquette_winding(
-    phase: np.ndarray,
-    i: int,
-    j: int
-) -> float:
+def _wrapped_difference(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Différence de phase a - b ramenée dans [-π, π] (arctan2)."""
+    d = a - b
+    return np.arctan2(np.sin(d), np.cos(d))
+
+
+def compute_winding_number(phase_field: np.ndarray) -> np.ndarray:
     """
-    Calcule le winding number sur une plaquette 2×2.
+    Calcule le champ de winding number pour chaque plaquette.
     
-    Plaquette :
+    Plaquette (bords périodiques) :
         (i,j) → (i,j+1)
           ↑         ↓
         (i+1,j) ← (i+1,j+1)
     
-    Returns:
-        Winding number normalisé [-1, 1]
-    """
-    h, w = phase.shape
-    
-    # Coins de la plaquette
-    p00 = phase[i, j]
-    p01 = phase[i, (j + 1) % w]
-    p10 = phase[(i + 1) % h, j]
-    p11 = phase[(i + 1) % h, (j + 1) % w]
-    
-    # Différences de phase le long du contour
-    # Astuce : utiliser arctan2 pour gérer le wrapping [-π, π]
-    d1 = np.arctan2(np.sin(p01 - p00), np.cos(p01 - p00))
-    d2 = np.arctan2(np.sin(p11 - p01), np.cos(p11 - p01))
-    d3 = np.arctan2(np.sin(p10 - p11), np.cos(p10 - p11))
-    d4 = np.arctan2(np.sin(p00 - p10), np.cos(p00 - p10))
-    
-    # Winding number = somme totale / 2π
-    winding = (d1 + d2 + d3 + d4) / (2 * np.pi)
-    
-    return winding
-
-
-def compute_winding_number(phase_field: np.ndarray) -> np.ndarray:
-    """
-    Calcule le champ de winding number pour chaque plaquette.
+    Les quatre différences de phase du contour sont calculées pour toutes
+    les plaquettes à la fois, par décalages (np.roll) du champ.
     
     Args:
-        phase_field: Champ de phase 2D (H, W) avec θ ∈ [0, 2π)
+        phase_field: Champ de phase 2D (H, W) avec θ ∈ [0, 2π), ou pile
+            (..., H, W) de champs (ex. historique (T, H, W))
         
     Returns:
-        Champ 2D (H, W) de winding numbers. Valeurs typiques :
+        Champ (H, W) (ou (..., H, W)) de winding numbers. Valeurs typiques :
             ≈ 0 : pas de défaut
             ≈ +1 : vortex
             ≈ -1 : anti-vortex
     """
-    h, w = phase_field.shape
-    winding_field = np.zeros((h, w), dtype=np.float32)
+    p00 = phase_field
+    p01 = np.roll(phase_field, -1, axis=-1)
+    p10 = np.roll(phase_field, -1, axis=-2)
+    p11 = np.roll(p01, -1, axis=-2)
+    
+    # Winding number = somme des différences le long du contour / 2π
+    winding = (
+        _wrapped_difference(p01, p00)
+        + _wrapped_difference(p11, p01)
+        + _wrapped_difference(p10, p11)
+        + _wrapped_difference(p00, p10)
+    ) / (2 * np.pi)
+    
+    return winding.astype(np.float32)
+
+
+def _defect_metrics(winding_field: np.ndarray, threshold: float) -> DefectMetrics:
+    """DefectMetrics d'un champ de winding 2D (défauts : |winding| > threshold)."""
+    h, w = winding_field.shape
+    rows, cols = np.nonzero(np.abs(winding_field) > threshold)
     
-    for i in range(h):
-        for j in range(w):
-            winding_field[i, j] = _compute_plaquette_winding(phase_field, i, j)
+    # Quantification : +1 ou -1
+    charges = np.where(winding_field[rows, cols] > 0, 1, -1)
+    n_positive = int(np.count_nonzero(charges > 0))
     
-    return winding_field
+    return DefectMetrics(
+        n_defects=len(rows),
+        n_positive=n_positive,
+        n_negative=len(rows) - n_positive,
+        defect_positions=list(zip(rows.tolist(), cols.tolist())),
+        defect_charges=charges.tolist(),
+        defect_density=len(rows) / (h * w)
+    )
 
 
 def detect_vortices(
@@ -129,36 +130,49 @@ def detect_vortices(
     Returns:
         DefectMetrics contenant positions et charges des défauts
     """
-    winding_field = compute_winding_number(phase_field)
-    
-    defect_positions = []
-    defect_charges = []
-    
-    h, w = phase_field.shape
-    
-    for i in range(h):
-        for j in range(w):
-            w_val = winding_field[i, j]
-            
-            if abs(w_val) > threshold:
-                defect_positions.append((i, j))
-                # Quantification : +1 ou -1
-                charge = +1 if w_val > 0 else -1
-                defect_charges.append(charge)
+    return _defect_metrics(compute_winding_number(phase_field), threshold)
+
+
+def detect_vortices_batch(
+    phase_fields: np.ndarray,
+    threshold: float = 0.5
+) -> List[DefectMetrics]:
+    """
+    Détecte les défauts d'une pile de champs de phase en une seule passe.
     
-    n_positive = sum(1 for c in defect_charges if c > 0)
-    n_negative = sum(1 for c in defect_charges if c < 0)
+    Args:
+        phase_fields: Pile (N, H, W) (historique temporel ou ensemble)
+        threshold: Seuil de détection
+        
+    Returns:
+        Liste de N DefectMetrics, identiques à detect_vortices champ par champ
+    """
+    phase_fields = np.asarray(phase_fields)
+    if len(phase_fields) == 0:
+        return []
     
-    density = len(defect_positions) / (h * w)
+    winding = compute_winding_number(phase_fields)
+    return [_defect_metrics(field, threshold) for field in winding]
+
+
+def count_defects(
+    phase_fields: np.ndarray,
+    threshold: float = 0.5
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nombre de vortex et d'anti-vortex de chaque champ d'une pile.
     
-    return DefectMetrics(
-        n_defects=len(defect_positions),
-        n_positive=n_positive,
-        n_negative=n_negative,
-        defect_positions=defect_positions,
-        defect_charges=defect_charges,
-        defect_density=density
-    )
+    Args:
+        phase_fields: Pile (N, H, W) ou champ (H, W)
+        threshold: Seuil de détection
+        
+    Returns:
+        (n_positive, n_negative) de shape (N,) (scalaires pour un champ 2D)
+    """
+    winding = compute_winding_number(phase_fields)
+    n_positive = np.count_nonzero(winding > threshold, axis=(-2, -1))
+    n_negative = np.count_nonzero(winding < -threshold, axis=(-2, -1))
+    return n_positive, n_negative
 
 
 def track_defects_over_time(
@@ -169,19 +183,13 @@ def track_defects_over_time(
     Analyse temporelle des défauts.
     
     Args:
-        phase_history: Liste de champs de phase successifs
+        phase_history: Liste de champs de phase successifs, ou tableau (T, H, W)
         threshold: Seuil de détection
         
     Returns:
         Liste de DefectMetrics par timestep
     """
-    metrics_history = []
-    
-    for phase_field in phase_history:
-        metrics = detect_vortices(phase_field, threshold)
-        metrics_history.append(metrics)
-    
-    return metrics_history
+    return detect_vortices_batch(phase_history, threshold)
 
 
 def compute_defect_annihilation_rate(
@@ -6,9 +6,13 @@ Designed for use by AI agents and reproducible experiments.
 """
 
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Optional, Union
 from .core import CAEngine, IsingEngine
+from .core.rng import legacy_seeding, make_rng, set_legacy_seeding, spawn_seeds
+from .eval_cache import METRIC_SUITE_VERSION, EvaluationCache, cache_key, resolve_cache
 from .metrics.edge_score import composite_edge_metric
+from .metrics.streaming import composite_edge_metric_from_stream
 
 
 def evaluate_rule(
@@ -18,7 +22,11 @@ def evaluate_rule(
     seed: int = 42,
     ca_type: str = "elementary",
     boundary: str = "periodic",
-    return_history: bool = False
+    return_history: bool = False,
+    history_mode: str = "full",
+    history_size: Optional[int] = None,
+    until_attractor: bool = False,
+    cache=None
 ) -> Dict:
     """
     Evaluate a CA or Ising rule comprehensively.
@@ -37,6 +45,19 @@ def evaluate_rule(
         ca_type: Type of CA ("elementary", "life", "totalistic")
         boundary: Boundary conditions ("periodic", "fixed")
         return_history: If True, include full history in results
+        history_mode: Frames kept by the engine ("full", "ring", "strided",
+            "none"). Any mode other than "full" computes the metrics from
+            a streaming accumulator, so memory no longer grows with steps.
+        history_size: Ring length or stride for "ring" / "strided"
+        until_attractor: CA rules only. Stop simulating each trajectory
+            (main run and sensitivity runs) once a fixed point or short
+            cycle is reached and replay the cycle instead; metrics are
+            unchanged and the skipped steps are reported as steps_saved.
+        cache: Persistent result cache (see isinglab.eval_cache): None uses
+            the default cache (set_default_cache; none unless set), False
+            disables it, a path opens an EvaluationCache there. Results are
+            keyed by every argument above and the metric suite version;
+            unseeded runs and return_history=True bypass the cache.
         
     Returns:
         Dictionary with metrics:
@@ -49,7 +70,9 @@ def evaluate_rule(
         - attractor_type: Type of attractor ("fixed", "cycle", "chaotic")
         - attractor_period: Period of limit cycle (0 if not cyclic)
         - lambda_estimate: Langton's λ parameter estimate
-        - history: Full state history (if return_history=True)
+        - history: State history (if return_history=True; only the
+          frames retained by history_mode)
+        - steps_saved: Simulation steps skipped (if until_attractor=True)
         
     Example:
         >>> from isinglab.api import evaluate_rule
@@ -61,73 +84,197 @@ def evaluate_rule(
     if isinstance(grid_size, int):
         grid_size = (grid_size,)
     
+    cache = resolve_cache(cache)
+    if cache is None or return_history or seed is None:
+        return _evaluate_rule(rule, grid_size, steps, seed, ca_type, boundary,
+                              return_history, history_mode, history_size, until_attractor)
+    
+    key = _rule_cache_key(rule, grid_size, steps, seed, ca_type, boundary,
+                          history_mode, history_size, until_attractor)
+    metrics = cache.get(key)
+    if metrics is None:
+        metrics = _evaluate_rule(rule, grid_size, steps, seed, ca_type, boundary,
+                                 return_history, history_mode, history_size, until_attractor)
+        cache[key] = dict(metrics)
+    return dict(metrics)
+
+
+def _rule_cache_key(
+    rule: Union[int, Dict],
+    grid_size: Tuple[int, ...],
+    steps: int,
+    seed: int,
+    ca_type: str,
+    boundary: str,
+    history_mode: str = "full",
+    history_size: Optional[int] = None,
+    until_attractor: bool = False
+) -> str:
+    """Cache key of an evaluate_rule result (shared by evaluate_batch)."""
+    return cache_key(
+        kind="evaluate_rule", rule=rule, grid_size=grid_size, steps=steps, seed=seed,
+        ca_type=ca_type, boundary=boundary, history_mode=history_mode,
+        history_size=history_size, until_attractor=until_attractor,
+        legacy_seeding=legacy_seeding(), version=METRIC_SUITE_VERSION
+    )
+
+
+def _evaluate_rule(
+    rule: Union[int, Dict],
+    grid_size: Tuple[int, ...],
+    steps: int,
+    seed: int,
+    ca_type: str,
+    boundary: str,
+    return_history: bool,
+    history_mode: str,
+    history_size: Optional[int],
+    until_attractor: bool
+) -> Dict:
+    """Simulate and measure one rule (evaluate_rule without the cache)."""
+    engine_seed, sensitivity_seed, temp_seed = _seed_streams(seed)
+    
     # Initialize engine based on rule type
-    if isinstance(rule, dict):
-        # Ising model
-        engine = IsingEngine(
-            grid_size=grid_size if len(grid_size) == 2 else (grid_size[0], grid_size[0]),
-            J=rule.get("J", 1.0),
-            h=rule.get("h", 0.0),
-            temperature=rule.get("T", 1.0),
-            dynamics=rule.get("dynamics", "glauber"),
-            boundary=boundary,
-            seed=seed
-        )
-    else:
-        # CA model
-        engine = CAEngine(
-            grid_size=grid_size,
-            rule=rule,
-            ca_type=ca_type,
-            boundary=boundary,
-            seed=seed
-        )
+    engine = _new_engine(rule, grid_size, ca_type, boundary, engine_seed,
+                         history_mode=history_mode, history_size=history_size)
+    
+    # Ising dynamics are stochastic: no attractor shortcut
+    until_attractor = until_attractor and not isinstance(rule, dict)
+    run_kwargs = dict(until_attractor=True) if until_attractor else {}
+    steps_saved = 0
     
     # Run evolution
-    history = engine.run(steps)
+    history = engine.run(steps, **run_kwargs)
     
     # Create evolution function for sensitivity analysis
     def evolve_func(state, n_steps):
+        nonlocal steps_saved
+        # Only the final state is used: keep no history
+        temp_engine = _new_engine(rule, grid_size, ca_type, boundary, seed=temp_seed(),
+                                  history_mode="none", track_stream=False)
         if isinstance(rule, dict):
-            # Ising model - create temp engine with Ising params
-            temp_engine = IsingEngine(
-                grid_size=grid_size if len(grid_size) == 2 else (grid_size[0], grid_size[0]),
-                J=rule.get("J", 1.0),
-                h=rule.get("h", 0.0),
-                temperature=rule.get("T", 1.0),
-                dynamics=rule.get("dynamics", "glauber"),
-                boundary=boundary,
-                seed=None
-            )
             temp_engine.spins = state.copy()
         else:
-            # CA model
-            temp_engine = CAEngine(
-                grid_size=grid_size,
-                rule=rule,
-                ca_type=ca_type,
-                boundary=boundary,
-                seed=None
-            )
             temp_engine.grid = state.copy()
         
-        temp_engine.history = [state.copy()]
-        temp_engine.run(n_steps)
+        temp_engine.run(n_steps, **run_kwargs)
+        if until_attractor:
+            steps_saved += temp_engine.steps_saved
         
         return temp_engine.spins if isinstance(rule, dict) else temp_engine.grid
     
-    # Compute comprehensive metrics
-    metrics = composite_edge_metric(
-        history=history,
-        evolution_func=evolve_func,
-        initial_state=history[0],
-        steps=min(50, steps // 4),
-        seed=seed
+    # Perturbed trajectories of CA rules are evolved as one stack. Not in
+    # legacy seeding mode (per-sample temp engines draw from the shared
+    # global stream) nor with until_attractor (each run stops on its own).
+    batch_func = None
+    if not until_attractor and not legacy_seeding() and _can_batch([rule], grid_size, ca_type):
+        batch_func = _stack_evolve_func(rule, ca_type, boundary)
+    
+    # The unperturbed sensitivity run is a prefix of the main trajectory
+    # (CA rules are deterministic). Legacy mode still re-simulates it: its
+    # temp engine draws from the shared global stream.
+    reference_final = None
+    n_sens_steps = _sensitivity_steps(steps)
+    if (not isinstance(rule, dict) and not legacy_seeding()
+            and history_mode == "full" and len(history) > n_sens_steps):
+        reference_final = history[n_sens_steps]
+    
+    metrics = _finalize_metrics(rule, history, evolve_func, grid_size, steps, seed,
+                                return_history, stream=engine.stream,
+                                sensitivity_seed=sensitivity_seed,
+                                batch_evolve_func=batch_func,
+                                reference_final=reference_final)
+    if until_attractor:
+        metrics["steps_saved"] = engine.steps_saved + steps_saved
+    return metrics
+
+
+def _new_engine(
+    rule: Union[int, Dict],
+    grid_size: Tuple[int, ...],
+    ca_type: str,
+    boundary: str,
+    seed: Optional[int],
+    history_mode: str = "full",
+    history_size: Optional[int] = None,
+    track_stream: Optional[bool] = None
+) -> Union[CAEngine, IsingEngine]:
+    """Build the CA or Ising engine used by evaluate_rule."""
+    history_kwargs = dict(history_mode=history_mode, history_size=history_size,
+                          track_stream=track_stream)
+    if isinstance(rule, dict):
+        # Ising model
+        return IsingEngine(
+            grid_size=grid_size if len(grid_size) == 2 else (grid_size[0], grid_size[0]),
+            J=rule.get("J", 1.0),
+            h=rule.get("h", 0.0),
+            temperature=rule.get("T", 1.0),
+            dynamics=rule.get("dynamics", "glauber"),
+            boundary=boundary,
+            seed=seed,
+            update=rule.get("update", "random"),
+            **history_kwargs
+        )
+    
+    # CA model
+    return CAEngine(
+        grid_size=grid_size,
+        rule=rule,
+        ca_type=ca_type,
+        boundary=boundary,
+        seed=seed,
+        **history_kwargs
     )
+
+
+def _finalize_metrics(
+    rule: Union[int, Dict],
+    history: List[np.ndarray],
+    evolve_func,
+    grid_size: Tuple[int, ...],
+    steps: int,
+    seed: int,
+    return_history: bool = False,
+    stream=None,
+    sensitivity_seed=None,
+    batch_evolve_func=None,
+    reference_final=None
+) -> Dict:
+    """
+    Compute the evaluate_rule metrics dict from an evolved trajectory.
     
-    # Add lambda estimate
-    from .metrics.edge_score import lambda_parameter_estimate
-    metrics["lambda_estimate"] = lambda_parameter_estimate(history)
+    Metrics come from `stream` (a StreamingMetrics accumulator) when given,
+    otherwise from the full `history`. The sensitivity samples draw from
+    `sensitivity_seed` (see _seed_streams); `batch_evolve_func` evolves
+    them as one stack. `reference_final` is the unperturbed sensitivity
+    state when already known (history mode only).
+    """
+    if stream is not None:
+        metrics = composite_edge_metric_from_stream(
+            stream,
+            evolution_func=evolve_func,
+            steps=_sensitivity_steps(steps),
+            seed=sensitivity_seed,
+            batch_evolution_func=batch_evolve_func,
+            spins=isinstance(rule, dict)
+        )
+        metrics["lambda_estimate"] = stream.lambda_estimate()
+    else:
+        # Compute comprehensive metrics
+        metrics = composite_edge_metric(
+            history=history,
+            evolution_func=evolve_func,
+            initial_state=history[0],
+            steps=_sensitivity_steps(steps),
+            seed=sensitivity_seed,
+            batch_evolution_func=batch_evolve_func,
+            reference_final=reference_final,
+            spins=isinstance(rule, dict)
+        )
+        
+        # Add lambda estimate
+        from .metrics.edge_score import lambda_parameter_estimate
+        metrics["lambda_estimate"] = lambda_parameter_estimate(history)
     
     # Add metadata
     metrics["rule"] = rule
@@ -142,6 +289,149 @@ def evaluate_rule(
     return metrics
 
 
+def _seed_streams(seed: Optional[int]) -> Tuple:
+    """
+    Random streams of one evaluation, all derived from `seed`.
+    
+    Returns:
+        (engine seed, sensitivity seed, factory of temp engine seeds). The
+        initial condition, the sensitivity perturbations and the temporary
+        engines of the sensitivity runs use independent SeedSequence
+        children. In legacy seeding mode they are the int seed, the int
+        seed and None: one global stream, reseeded as before.
+    """
+    if legacy_seeding():
+        return seed, seed, lambda: None
+    engine_seq, sensitivity_seq, temp_seq = spawn_seeds(seed, 3)
+    return engine_seq, sensitivity_seq, lambda: temp_seq.spawn(1)[0]
+
+
+def _skip_temp_engine(grid_size: Tuple[int, ...], temp_seed) -> None:
+    """
+    Advance the random streams as building a temporary CA engine would.
+    
+    Each temp engine takes the next temp seed and draws its initial grid.
+    With SeedSequence seeds that grid comes from the engine's own stream and
+    nothing else moves; in legacy seeding mode it comes from the global RNG,
+    which the sensitivity perturbations also draw from.
+    """
+    seed = temp_seed()
+    if legacy_seeding():
+        make_rng(seed).integers(0, 2, size=grid_size)
+
+
+def _stack_evolve_func(rule: int, ca_type: str, boundary: str):
+    """Function (stack, n_steps) -> final stack evolving every grid with `rule`."""
+    from .core.ca_batch import rule_tables, evolve_batch
+    
+    tables = rule_tables([rule], ca_type)
+    
+    def evolve_stack(stack, n_steps):
+        stacked_tables = tuple(np.repeat(table, len(stack), axis=0) for table in tables)
+        return evolve_batch(stack, stacked_tables, n_steps, boundary, return_history=False)
+    
+    return evolve_stack
+
+
+def _sensitivity_steps(steps: int) -> int:
+    """Number of steps used for the Hamming sensitivity measurement."""
+    return min(50, steps // 4)
+
+
+def evaluate_rules_batched(
+    rules: List[int],
+    grid_size: Union[int, Tuple[int, ...]] = (100, 100),
+    steps: int = 200,
+    seed: int = 42,
+    ca_type: str = "elementary",
+    boundary: str = "periodic",
+    batch_size: int = 16
+) -> List[Dict]:
+    """
+    Evaluate many CA rules at once, sharing one array pass per step.
+    
+    All rules start from the same seeded initial grid (as evaluate_rule
+    does), so the whole batch is evolved as a (n_rules, ...) stack with
+    per-rule lookup tables. The perturbed trajectories used for the
+    sensitivity metric are evolved the same way. Returns exactly the
+    metrics evaluate_rule would return for each rule.
+    
+    Args:
+        rules: List of CA rule numbers
+        grid_size: Grid dimensions
+        steps: Evolution steps per run
+        seed: Random seed
+        ca_type: CA type ("elementary" or "life")
+        boundary: Boundary conditions
+        batch_size: Rules evolved together (bounds memory use)
+        
+    Returns:
+        List of metric dictionaries (one per rule, input order)
+    """
+    from .core.ca_batch import rule_tables, evolve_batch
+    from .metrics.sensitivity import hamming_sensitivity
+    
+    if isinstance(grid_size, int):
+        grid_size = (grid_size,)
+    
+    results = []
+    for start in range(0, len(rules), batch_size):
+        chunk = rules[start:start + batch_size]
+        tables = rule_tables(chunk, ca_type)
+        
+        engine_seed, sensitivity_seed, temp_seed = _seed_streams(seed)
+        initial = _new_engine(chunk[0], grid_size, ca_type, boundary, engine_seed).grid
+        stack = np.broadcast_to(initial, (len(chunk),) + initial.shape).copy()
+        history = evolve_batch(stack, tables, steps, boundary)
+        
+        # Record the perturbed initial states the sensitivity metric will use.
+        # Each call advances the random streams as evaluate_rule's temp engine
+        # does (legacy seeding mode shares the global RNG), so the recorded
+        # states match.
+        sensitivity_inputs = []
+        
+        def record_func(state, n_steps):
+            _skip_temp_engine(grid_size, temp_seed)
+            sensitivity_inputs.append(state.copy())
+            return state.copy()
+        
+        n_sens_steps = _sensitivity_steps(steps)
+        hamming_sensitivity(record_func, initial, steps=n_sens_steps, seed=sensitivity_seed,
+                            spins=False)
+        
+        # Evolve every (rule, perturbed state) pair in one stack
+        n_inputs = len(sensitivity_inputs)
+        sens_stack = np.concatenate([np.stack(sensitivity_inputs)] * len(chunk))
+        sens_tables = tuple(np.repeat(table, n_inputs, axis=0) for table in tables)
+        sens_final = evolve_batch(sens_stack, sens_tables, n_sens_steps, boundary,
+                                  return_history=False)
+        
+        for r, rule in enumerate(chunk):
+            finals = {
+                sensitivity_inputs[k].tobytes(): sens_final[r * n_inputs + k]
+                for k in range(n_inputs)
+            }
+            
+            def evolve_func(state, n_steps, rule=rule, finals=finals):
+                cached = finals.get(state.tobytes())
+                if cached is not None and n_steps == n_sens_steps:
+                    _skip_temp_engine(grid_size, temp_seed)
+                    return cached.copy()
+                temp_engine = _new_engine(rule, grid_size, ca_type, boundary, seed=temp_seed(),
+                                          history_mode="none", track_stream=False)
+                temp_engine.grid = state.copy()
+                temp_engine.run(n_steps)
+                return temp_engine.grid
+            
+            rule_history = [history[t, r] for t in range(steps + 1)]
+            results.append(
+                _finalize_metrics(rule, rule_history, evolve_func, grid_size, steps, seed,
+                                  sensitivity_seed=sensitivity_seed)
+            )
+    
+    return results
+
+
 def evaluate_batch(
     rules: List[Union[int, Dict]],
     grid_size: Union[int, Tuple[int, ...]] = (100, 100),
@@ -149,7 +439,12 @@ def evaluate_batch(
     seed: int = 42,
     ca_type: str = "elementary",
     boundary: str = "periodic",
-    n_seeds: int = 1
+    n_seeds: int = 1,
+    batched: Optional[bool] = None,
+    until_attractor: bool = False,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    cache=None
 ) -> List[Dict]:
     """
     Evaluate multiple rules in batch.
@@ -164,37 +459,77 @@ def evaluate_batch(
         ca_type: CA type
         boundary: Boundary conditions
         n_seeds: Number of different initial conditions per rule
+        batched: Evolve all rules together with evaluate_rules_batched.
+            None (default) batches whenever every rule is a CA rule number
+            and the grid/CA type combination is supported; results are
+            identical either way.
+        until_attractor: Stop each trajectory early on an attractor (see
+            evaluate_rule); every result then carries steps_saved. Runs the
+            per-rule path, so it cannot be combined with batched=True.
+        workers: Number of worker processes. None or 1 runs serially. Work
+            units are (rule chunk, seed index) pairs; every run is seeded
+            from `seed + seed index` only, so results and their order are
+            identical to the serial run.
+        chunk_size: Rules per work unit (default: spread the rules over
+            about 4 units per worker)
+        cache: Result cache, as in evaluate_rule and sharing its entries:
+            every (rule, seed) run is looked up first and only the missing
+            rules are simulated (batched or not), then stored. Worker
+            processes open the EvaluationCache directory themselves; other
+            mappings cannot be shared with workers and are bypassed when
+            workers > 1.
         
     Returns:
         List of metric dictionaries (one per rule)
     """
+    if batched is None:
+        batched = not until_attractor and _can_batch(rules, grid_size, ca_type)
+    elif batched and until_attractor:
+        raise ValueError("until_attractor is not supported with batched=True")
+    
+    n_workers = workers or 1
+    if chunk_size is None:
+        chunk_size = -(-len(rules) // (4 * n_workers)) if n_workers > 1 else len(rules)
+        chunk_size = max(1, chunk_size)
+    chunks = [rules[k:k + chunk_size] for k in range(0, len(rules), chunk_size)]
+    
+    # Cache of the work units: workers get the EvaluationCache location
+    cache = resolve_cache(cache)
+    if cache is None:
+        unit_cache = False
+    elif n_workers > 1 and len(chunks) * n_seeds > 1:
+        unit_cache = str(cache.directory) if isinstance(cache, EvaluationCache) else False
+    else:
+        unit_cache = cache
+    
+    units = [
+        (chunk, grid_size, steps, seed + i, ca_type, boundary, batched, until_attractor, unit_cache,
+         legacy_seeding())
+        for i in range(n_seeds)
+        for chunk in chunks
+    ]
+    
+    if n_workers > 1 and len(units) > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            outputs = list(executor.map(_evaluate_unit, units))
+    else:
+        outputs = [_evaluate_unit(unit) for unit in units]
+    
+    # Units are ordered by seed index, then by chunk
+    per_seed = [
+        [metrics for output in outputs[i * len(chunks):(i + 1) * len(chunks)] for metrics in output]
+        for i in range(n_seeds)
+    ]
+    
     results = []
     
-    for rule in rules:
+    for r, rule in enumerate(rules):
         if n_seeds == 1:
             # Single seed
-            metrics = evaluate_rule(
-                rule=rule,
-                grid_size=grid_size,
-                steps=steps,
-                seed=seed,
-                ca_type=ca_type,
-                boundary=boundary
-            )
-            results.append(metrics)
+            results.append(per_seed[0][r])
         else:
             # Multiple seeds: average metrics
-            all_metrics = []
-            for i in range(n_seeds):
-                metrics = evaluate_rule(
-                    rule=rule,
-                    grid_size=grid_size,
-                    steps=steps,
-                    seed=seed + i,
-                    ca_type=ca_type,
-                    boundary=boundary
-                )
-                all_metrics.append(metrics)
+            all_metrics = [seed_results[r] for seed_results in per_seed]
             
             # Average numerical metrics
             avg_metrics = {
@@ -221,11 +556,94 @@ def evaluate_batch(
             from collections import Counter
             avg_metrics["attractor_type"] = Counter(attractor_types).most_common(1)[0][0]
             
+            if until_attractor:
+                avg_metrics["steps_saved"] = sum(m.get("steps_saved", 0) for m in all_metrics)
+            
             results.append(avg_metrics)
     
     return results
 
 
+def _evaluate_unit(unit: Tuple) -> List[Dict]:
+    """
+    Evaluate one (rule chunk, seed) work unit of evaluate_batch.
+    
+    The unit carries the caller's seeding mode: spawn/forkserver workers
+    start from the module default, not from the caller's set_legacy_seeding.
+    """
+    *unit, legacy = unit
+    previous = set_legacy_seeding(legacy)
+    try:
+        return _evaluate_unit_rules(*unit)
+    finally:
+        set_legacy_seeding(previous)
+
+
+def _evaluate_unit_rules(
+    rules: List[Union[int, Dict]],
+    grid_size: Union[int, Tuple[int, ...]],
+    steps: int,
+    seed: int,
+    ca_type: str,
+    boundary: str,
+    batched: bool,
+    until_attractor: bool,
+    cache
+) -> List[Dict]:
+    """Body of _evaluate_unit, in the unit's seeding mode."""
+    cache = resolve_cache(cache)
+    if not batched:
+        return [
+            evaluate_rule(
+                rule=rule,
+                grid_size=grid_size,
+                steps=steps,
+                seed=seed,
+                ca_type=ca_type,
+                boundary=boundary,
+                until_attractor=until_attractor,
+                cache=False if cache is None else cache
+            )
+            for rule in rules
+        ]
+    
+    if cache is None:
+        return evaluate_rules_batched(
+            rules, grid_size=grid_size, steps=steps, seed=seed,
+            ca_type=ca_type, boundary=boundary
+        )
+    
+    # Known rules are read back; the others are evolved together, then stored
+    # (each result only depends on its own rule, not on the rest of the batch)
+    cache_grid = (grid_size,) if isinstance(grid_size, int) else grid_size
+    keys = [_rule_cache_key(rule, cache_grid, steps, seed, ca_type, boundary) for rule in rules]
+    results = [cache.get(key) for key in keys]
+    missing = [k for k, metrics in enumerate(results) if metrics is None]
+    if missing:
+        evaluated = evaluate_rules_batched(
+            [rules[k] for k in missing], grid_size=grid_size, steps=steps, seed=seed,
+            ca_type=ca_type, boundary=boundary
+        )
+        for k, metrics in zip(missing, evaluated):
+            cache[keys[k]] = dict(metrics)
+            results[k] = metrics
+    return [dict(metrics) for metrics in results]
+
+
+def _can_batch(
+    rules: List[Union[int, Dict]],
+    grid_size: Union[int, Tuple[int, ...]],
+    ca_type: str
+) -> bool:
+    """Whether evaluate_rules_batched supports this batch."""
+    if not rules or not all(isinstance(rule, (int, np.integer)) for rule in rules):
+        return False
+    n_dims = 1 if isinstance(grid_size, int) else len(grid_size)
+    if n_dims == 1:
+        return ca_type in ("elementary", "life")
+    return n_dims == 2 and ca_type == "life"
+
+
 def quick_scan(
     rule_range: Tuple[int, int],
     grid_size: Union[int, Tuple[int, ...]] = (50, 50),
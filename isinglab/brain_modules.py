@@ -6,6 +6,7 @@ Ce module expose les 5 brain modules v3.5 avec leurs propriétés documentées.
 
 from typing import Dict, List, Tuple, Optional
 from .core.ca_vectorized import create_rule_function_vectorized
+from .core.ca_bitpacked import create_rule_function_bitpacked
 
 
 # Catalogue des brain modules validés
@@ -113,12 +114,13 @@ def get_brain_by_notation(notation: str) -> Optional[Dict]:
     return None
 
 
-def get_brain_rule_function(name: str):
+def get_brain_rule_function(name: str, bitpacked: bool = False):
     """
     Récupère la fonction règle vectorisée d'un brain module.
     
     Args:
         name: Nom du module
+        bitpacked: Utiliser le moteur bit-packed (grandes grilles, longs runs)
     
     Returns:
         Fonction règle vectorisée (grid -> new_grid)
@@ -127,6 +129,8 @@ def get_brain_rule_function(name: str):
     if config is None:
         raise ValueError(f"Brain module '{name}' not found")
     
+    if bitpacked:
+        return create_rule_function_bitpacked(config["born"], config["survive"])
     return create_rule_function_vectorized(config["born"], config["survive"])
 
 
@@ -6,6 +6,7 @@ import numpy as np
 
 from isinglab.meta_learner import MemoryAggregator, train_meta_model, CandidateSelector
 from isinglab.meta_learner.pareto import select_pareto_hof
+from isinglab.meta_learner.rule_registry import RuleRegistry, entry_code
 from isinglab.rules import load_hof_rules, add_or_update_rule, save_hof_rules
 from isinglab.memory_explorer import MemoryExplorer, parse_notation
 from isinglab.metrics.functional import infer_module_profile
@@ -17,6 +18,7 @@ class ClosedLoopAGI:
     def __init__(self, config: Dict = None):
         self.config = config or {
             'evaluation_seed': 42,
+            'evaluation_cache': None,  # Dossier du cache persistant des évaluations (None : désactivé)
             'use_pareto': False,  # v2.2: Désactivé au profit de quotas simples
             'profile_stability_min': 0.67,  # v2.2: Stabilité multi-grilles minimale
             'hof_profile_quotas': {  # v2.2: Quotas par profil
@@ -53,7 +55,8 @@ class ClosedLoopAGI:
         self.meta_memory: List[Dict] = []
         self.meta_model = None
         self.selector = None
-        self.explorer = MemoryExplorer(output_dir='results/scans')
+        self.explorer = MemoryExplorer(output_dir='results/scans',
+                                       cache=self.config.get('evaluation_cache'))
 
         Path('logs').mkdir(parents=True, exist_ok=True)
         self.log_file = Path('logs') / f"agi_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
@@ -125,20 +128,25 @@ class ClosedLoopAGI:
         
         return dist_born + dist_survive
     
-    def _is_diverse_enough(self, candidate: Dict, hof_rules: List[Dict]) -> Tuple[bool, str]:
+    def _is_diverse_enough(self, candidate: Dict, hof_rules) -> Tuple[bool, str]:
         """
         Vérifie si une règle candidate est suffisamment différente du HoF actuel.
         Retourne (is_diverse, reason).
+        
+        `hof_rules` : liste de règles ou RuleRegistry déjà construit ; les
+        distances au HoF entier sont un popcount de XOR sur les codes 18 bits.
         """
-        if not hof_rules:
+        if len(hof_rules) == 0:
             return True, "HoF empty"
         
         min_distance = self.config.get('diversity_threshold', 2)
+        registry = hof_rules if isinstance(hof_rules, RuleRegistry) else RuleRegistry.from_rules(hof_rules)
         
-        for hof_rule in hof_rules:
-            distance = self._compute_rule_distance(candidate, hof_rule)
-            if distance < min_distance:
-                return False, f"Too similar to {hof_rule.get('notation')} (dist={distance})"
+        distances = registry.distances(entry_code(candidate))
+        close = np.flatnonzero(distances < min_distance)
+        if len(close):
+            row = close[0]
+            return False, f"Too similar to {registry.notations[row]} (dist={distances[row]})"
         
         return True, "Diverse"
     
@@ -215,6 +223,10 @@ class ClosedLoopAGI:
         results = self.explorer.explore_batch(candidates, grid_size=eval_grid, steps=steps, seed=self.config['evaluation_seed'])
         evaluated = [r for r in results if 'error' not in r]
         self._log(f"  {len(evaluated)} / {len(results)} evaluated successfully")
+        if hasattr(self.explorer.cache, 'stats'):
+            cache_stats = self.explorer.cache.stats()
+            self._log(f"  [CACHE] hits={cache_stats['hits']}, misses={cache_stats['misses']}, "
+                      f"entries={cache_stats['entries']}")
 
         # STEP 5 : mise à jour mémoire + HoF (avec bootstrap si nécessaire)
         self._log('\nSTEP 5: Update memory & Hall of Fame')
@@ -275,6 +287,8 @@ class ClosedLoopAGI:
             adaptive_thresholds = None
         
         current_hof = load_hof_rules()
+        # Codes du HoF pour les tests de diversité (complété à chaque promotion)
+        hof_registry = RuleRegistry.from_rules(current_hof)
         
         # Partie 1: Mise à jour de la méta-mémoire avec toutes les métriques
         for res in evaluated:
@@ -353,7 +367,7 @@ class ClosedLoopAGI:
                     if can_add_profile:
                         # Vérifier la diversité
                         candidate_rule = {'notation': notation, 'born': born, 'survive': survive}
-                        is_diverse, diversity_reason = self._is_diverse_enough(candidate_rule, current_hof)
+                        is_diverse, diversity_reason = self._is_diverse_enough(candidate_rule, hof_registry)
                         
                         if is_diverse:
                             promote = True
@@ -403,6 +417,7 @@ class ClosedLoopAGI:
                 if add_or_update_rule(rule_data):
                     added_rules.append(rule_data)
                     current_hof.append(rule_data)  # Pour les checks de diversité suivants
+                    hof_registry.add(entry_code(rule_data), notation)
 
         # BOOTSTRAP : si HoF vide ET des résultats évalués, promouvoir la meilleure règle
         current_hof = load_hof_rules()
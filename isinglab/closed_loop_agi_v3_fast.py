@@ -7,14 +7,15 @@ Changements vs v2.2 :
 """
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
-import numpy as np
+from typing import Dict, List, Optional, Tuple
 
 from isinglab.meta_learner.dynamic_memory import DynamicMemoryManager
 from isinglab.meta_learner import train_meta_model, CandidateSelector
 from isinglab.rules import load_hof_rules, add_or_update_rule, save_hof_rules
 from isinglab.memory_explorer import MemoryExplorer, parse_notation
-from isinglab.meta_learner.filters import apply_hard_filters
+from isinglab.meta_learner.filters import apply_hard_filters, make_plan
+from isinglab.evaluation_plan import TrajectoryPlan
+from isinglab.eval_cache import resolve_cache
 
 
 class ClosedLoopAGIv3:
@@ -23,6 +24,7 @@ class ClosedLoopAGIv3:
     def __init__(self, config: Dict = None):
         self.config = config or {
             'evaluation_seed': 42,
+            'evaluation_cache': None,  # Dossier du cache persistant des évaluations (None : désactivé)
             'hof_max_size': 25,
             'adaptive_thresholds': True,
             'hof_percentiles': {
@@ -41,7 +43,8 @@ class ClosedLoopAGIv3:
         self.meta_memory: List[Dict] = []
         self.meta_model = None
         self.selector = None
-        self.explorer = MemoryExplorer(output_dir='results/scans')
+        self.explorer = MemoryExplorer(output_dir='results/scans',
+                                       cache=self.config.get('evaluation_cache'))
         
         Path('logs').mkdir(parents=True, exist_ok=True)
         self.log_file = Path('logs') / f"agi_v3_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
@@ -74,7 +77,7 @@ class ClosedLoopAGIv3:
         
         return False, "Valid"
     
-    def evaluate_candidate_fast(self, rule: Dict) -> Dict:
+    def evaluate_candidate_fast(self, rule: Dict, plan: Optional[TrajectoryPlan] = None) -> Dict:
         """
         Évaluation rapide d'un candidat.
         
@@ -83,12 +86,11 @@ class ClosedLoopAGIv3:
         - steps = 50
         - n_patterns = 3, n_trials = 2, n_samples = 3
         
-        + Capture grille finale pour richness
+        + Capture grille finale pour richness (trajectoire lue dans `plan`,
+        le TrajectoryPlan déjà utilisé par les filtres durs du candidat)
         """
         from isinglab.metrics.functional import (
-            compute_memory_capacity,
-            compute_robustness_to_noise,
-            compute_basin_size,
+            compute_functional_batch,
             compute_functional_score
         )
         
@@ -108,17 +110,21 @@ class ClosedLoopAGIv3:
             metrics['source'] = rule.get('source', 'unknown')
             metrics['timestamp'] = datetime.now().isoformat()
             
+            # Grille finale pour richness et patterns fonctionnels : une
+            # seule pile 16×16 dans le plan du candidat
+            if plan is None:
+                plan = TrajectoryPlan(born, survive)
+            final_key = plan.seeded_initial(grid_size, seed)
+            plan.request(final_key, steps)
+            
             # Métriques fonctionnelles (mode fast)
-            rule_func = self.explorer._create_rule_function(born, survive)
             
-            capacity_result = compute_memory_capacity(
-                rule_func, grid_size=(16, 16), n_patterns=3, steps=20
-            )
-            robustness_result = compute_robustness_to_noise(
-                rule_func, grid_size=(16, 16), noise_level=0.1, n_trials=2, steps=20
-            )
-            basin_result = compute_basin_size(
-                rule_func, grid_size=(16, 16), n_samples=3, steps=15
+            stack_func = self.explorer._create_rule_function(born, survive, stack=True)
+            
+            capacity_result, robustness_result, basin_result = compute_functional_batch(
+                stack_func, grid_size=(16, 16), n_patterns=3, n_trials=2, n_samples=3,
+                noise_level=0.1, capacity_steps=20, robustness_steps=20, basin_steps=15,
+                seed=seed, plan=plan
             )
             
             metrics['capacity_score'] = capacity_result['capacity_score']
@@ -130,10 +136,7 @@ class ClosedLoopAGIv3:
             )
             
             # Capturer grille finale pour richness
-            np.random.seed(seed)
-            grid = (np.random.rand(*grid_size) < 0.3).astype(int)
-            for _ in range(steps):
-                grid = rule_func(grid)
+            grid = plan.state(final_key, steps).copy()
             
             metrics['grid_final'] = grid
             metrics['pattern_richness'] = self._compute_pattern_richness(grid)
@@ -165,6 +168,58 @@ class ClosedLoopAGIv3:
         max_patterns = ((h // window_size) * (w // window_size))
         return len(patterns) / max_patterns if max_patterns > 0 else 0.0
     
+    def _screen_candidate(self, cand: Dict) -> Tuple[Dict, Optional[str]]:
+        """
+        Filtres durs puis évaluation rapide d'un candidat.
+        
+        Returns:
+            (résultat, raison du blocage par les filtres durs ou None). Avec un
+            cache d'évaluation (config 'evaluation_cache'), le couple est relu
+            pour une règle déjà examinée : ni filtres ni simulation.
+        """
+        notation = cand.get('notation')
+        born, survive = cand.get('born'), cand.get('survive')
+        if born is None or survive is None:
+            born, survive = parse_notation(notation)
+        
+        cache = resolve_cache(self.explorer.cache)
+        key = None
+        if cache is not None:
+            key = self.explorer.candidate_key(born, survive, (16, 16), 50,
+                                              self.config['evaluation_seed'],
+                                              kind='screen_candidate_v3')
+            cached = cache.get(key)
+            if cached is not None:
+                result, filter_reason = dict(cached[0]), cached[1]
+                result.update(notation=notation, source=cand.get('source', 'unknown'),
+                              timestamp=datetime.now().isoformat())
+                return result, filter_reason
+        
+        # FILTRE DUR AVANT ÉVALUATION COMPLÈTE (filters.py)
+        # Un plan par candidat : trajectoires partagées filtres / évaluation
+        plan = make_plan(notation)
+        passed_hard_filters, filter_reason = apply_hard_filters(notation, plan=plan)
+        
+        if not passed_hard_filters:
+            result = {
+                'notation': notation,
+                'born': cand.get('born'),
+                'survive': cand.get('survive'),
+                'source': cand.get('source', 'unknown'),
+                'trivial': True,
+                'trivial_reason': f"Hard filter: {filter_reason}",
+                'functional_score': 0.0,
+                'timestamp': datetime.now().isoformat()
+            }
+        else:
+            # Évaluation complète si filtres passés
+            result = self.evaluate_candidate_fast(cand, plan=plan)
+            filter_reason = None
+        
+        if key is not None and 'error' not in result:
+            cache[key] = (dict(result), filter_reason)
+        return result, filter_reason
+    
     def discover_rules(self, num_iterations: int = 50, batch_size: int = 4,
                       strategy: str = 'mixed', grid_size=(16, 16), steps=50):
         """
@@ -177,7 +232,8 @@ class ClosedLoopAGIv3:
         """
         # Charger mémoire existante
         self.aggregator.aggregate_memory()
-        self.meta_memory = self.aggregator.memory_rules
+        # Copie : les résultats sont ajoutés à la mémoire via add_or_update_rule
+        self.meta_memory = list(self.aggregator.memory_rules)
         
         # Initialiser selector
         if len(self.meta_memory) >= 10:
@@ -211,30 +267,14 @@ class ClosedLoopAGIv3:
             # 2. Évaluer (fast mode)
             results = []
             for cand in candidates:
-                notation = cand.get('notation')
+                result, filter_reason = self._screen_candidate(cand)
                 
-                # FILTRE DUR AVANT ÉVALUATION COMPLÈTE (filters.py)
-                passed_hard_filters, filter_reason = apply_hard_filters(notation)
-                
-                if not passed_hard_filters:
-                    self._log(f"  [HARD_FILTER] {notation} — BLOCKED: {filter_reason}")
+                if filter_reason is not None:
+                    self._log(f"  [HARD_FILTER] {result['notation']} — BLOCKED: {filter_reason}")
                     # Skip évaluation complète, marqué comme rejeté
-                    result = {
-                        'notation': notation,
-                        'born': cand.get('born'),
-                        'survive': cand.get('survive'),
-                        'source': cand.get('source', 'unknown'),
-                        'trivial': True,
-                        'trivial_reason': f"Hard filter: {filter_reason}",
-                        'functional_score': 0.0,
-                        'timestamp': datetime.now().isoformat()
-                    }
                     results.append(result)
                     continue
                 
-                # Évaluation complète si filtres passés
-                result = self.evaluate_candidate_fast(cand)
-                
                 # Appliquer filtres légers complémentaires (richness)
                 is_trivial, reason = self._is_trivial_rule(result)
                 result['trivial'] = is_trivial
@@ -2,6 +2,7 @@
 
 from .holonomy import (
     HolonomyPath,
+    HolonomySchedule,
     StrokeLibrary,
     generate_linear_ramp_path,
     generate_smooth_sigmoid_path,
@@ -12,11 +13,13 @@ from .holonomy import (
 from .optimizers import (
     GridSearchOptimizer,
     RandomSearchOptimizer,
+    BayesianOptimizer,
     OptimizationResult
 )
 
 __all__ = [
     'HolonomyPath',
+    'HolonomySchedule',
     'StrokeLibrary',
     'generate_linear_ramp_path',
     'generate_smooth_sigmoid_path',
@@ -25,6 +28,7 @@ __all__ = [
     'generate_adaptive_loop_path',
     'GridSearchOptimizer',
     'RandomSearchOptimizer',
+    'BayesianOptimizer',
     'OptimizationResult'
 ]
 
@@ -15,6 +15,8 @@ Application phénoménologique :
     - Stroke "dmt_chaos" : boucle complexe → fragmentation
 """
 
+import hashlib
+import json
 import numpy as np
 from typing import List, Tuple, Dict, Optional, Callable
 from dataclasses import dataclass
@@ -43,6 +45,34 @@ class PathPoint:
     d_params: Optional[Dict[str, float]] = None
 
 
+@dataclass
+class HolonomySchedule:
+    """
+    Paramètres d'un HolonomyPath précalculés à une suite de temps.
+    
+    values[key][k] vaut path.interpolate(times[k])[key], ou NaN si la clé
+    est absente du dictionnaire interpolé à ce temps.
+    """
+    
+    times: np.ndarray
+    values: Dict[str, np.ndarray]
+    
+    def get(self, key: str, default: float) -> np.ndarray:
+        """Valeurs de `key` à chaque temps (default là où la clé est absente)."""
+        values = self.values.get(key)
+        if values is None:
+            return np.full(len(self.times), default, dtype=float)
+        return np.where(np.isnan(values), default, values)
+    
+    def params_at(self, index: int) -> Dict[str, float]:
+        """Dictionnaire des paramètres au temps times[index] (comme interpolate)."""
+        return {
+            key: float(values[index])
+            for key, values in self.values.items()
+            if not np.isnan(values[index])
+        }
+
+
 class HolonomyPath:
     """
     Trajectoire dans l'espace des paramètres.
@@ -138,6 +168,77 @@ class HolonomyPath:
         
         return self.points[-1].params.copy()
     
+    def compile_schedule(self, times: np.ndarray) -> HolonomySchedule:
+        """
+        Interpole la trajectoire à tous les temps d'un coup.
+        
+        Version vectorisée de interpolate() (même wrap dans [0, 1], mêmes
+        segments et même formule d'interpolation) : une simulation lit ses
+        paramètres dans des tableaux au lieu d'interpoler à chaque step.
+        
+        Args:
+            times: Temps normalisés (T,)
+            
+        Returns:
+            HolonomySchedule de longueur T
+        """
+        times = np.asarray(times, dtype=float)
+        keys = list(dict.fromkeys(key for point in self.points for key in point.params))
+        values = {key: np.full(len(times), np.nan) for key in keys}
+        if not self.points:
+            return HolonomySchedule(times=times, values=values)
+        
+        t = times % 1.0
+        point_t = np.array([point.t for point in self.points])
+        before = t <= point_t[0]
+        after = ~before & (t >= point_t[-1])
+        inside = ~before & ~after
+        
+        # Segment encadrant : premier i tel que t_i <= t <= t_{i+1}
+        segment = np.searchsorted(point_t[1:], t[inside], side='left')
+        t1 = point_t[segment]
+        t2 = point_t[segment + 1]
+        alpha = (t[inside] - t1) / (t2 - t1 + 1e-10)
+        
+        for key in keys:
+            start = np.array([point.params.get(key, np.nan) for point in self.points])
+            end = np.array([
+                self.points[i + 1].params.get(key, start[i]) if i + 1 < len(self.points) else np.nan
+                for i in range(len(self.points))
+            ])
+            v1 = start[segment]
+            v2 = end[segment]
+            values[key][inside] = v1 + alpha * (v2 - v1)
+            values[key][before] = start[0]
+            values[key][after] = start[-1]
+        
+        return HolonomySchedule(times=times, values=values)
+    
+    def cache_key(self, settings: Optional[Dict] = None) -> str:
+        """
+        Empreinte canonique de la trajectoire (et des réglages de simulation).
+        
+        Deux paths de mêmes points (temps et paramètres, quel que soit
+        l'ordre des clés) donnent la même clé ; le nom et la description
+        n'y entrent pas.
+        
+        Args:
+            settings: Réglages qui influencent le coût (grille, seed...)
+            
+        Returns:
+            Hash SHA-256 hexadécimal
+        """
+        payload = {
+            'space': ParameterSpace(self.space).value,
+            'points': [
+                [float(point.t), sorted((key, float(value)) for key, value in point.params.items())]
+                for point in self.points
+            ],
+            'settings': settings or {}
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=repr)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+    
     def is_closed_loop(self, tolerance: float = 1e-3) -> bool:
         """
         Vérifie si la trajectoire forme une boucle fermée.
@@ -6,9 +6,16 @@ paramètres de HolonomyPath (k_start, k_end, duration, etc.) qui minimisent
 un coût tout en respectant les contraintes physiques.
 """
 
+import abc
+import itertools
+import multiprocessing
 import numpy as np
-from typing import Dict, List, Tuple, Callable, Optional
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Tuple, Callable, Optional, Iterator, MutableMapping
 from dataclasses import dataclass
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+from scipy.stats import norm
 from tqdm import tqdm
 
 from .holonomy import HolonomyPath, generate_linear_ramp_path, generate_smooth_sigmoid_path
@@ -24,6 +31,7 @@ class OptimizationResult:
     best_cost: float
     all_evaluated: List[Tuple[Dict[str, float], float]]  # (params, cost)
     n_evaluations: int
+    completed: bool = True  # False si la recherche a été interrompue
     
     def __repr__(self):
         return (f"OptimizationResult(best_cost={self.best_cost:.4f}, "
@@ -31,11 +39,320 @@ class OptimizationResult:
                 f"best_params={self.best_params})")
 
 
-class GridSearchOptimizer:
+def atlas_k_end_limit(atlas_profile: Optional[AtlasProfile]) -> float:
+    """
+    Borne supérieure de k_end admise par un profil Atlas (1.2 × K_max sûr).
+    
+    Calculée une fois par profil et par optimisation, et non par candidat.
+    
+    Returns:
+        Limite de k_end (inf sans profil)
+    """
+    if not atlas_profile:
+        return float('inf')
+    
+    from ..data_bridge.atlas_map import AtlasMapper
+    k_max_safe = AtlasMapper()._compute_k_max(atlas_profile.t1_us, atlas_profile.t2_us)
+    return k_max_safe * 1.2
+
+
+def _candidate_path(
+    path_generator: str,
+    params: Dict[str, float],
+    k_end_limit: float,
+    verbose: bool
+) -> Optional[HolonomyPath]:
+    """
+    Génère le path d'un jeu de paramètres.
+    
+    Returns:
+        HolonomyPath, ou None si les contraintes Atlas l'excluent (k_end
+        au-delà de k_end_limit) ou si la génération échoue
+    """
+    try:
+        if path_generator == "linear_ramp":
+            path = generate_linear_ramp_path(
+                k_start=params.get('k_start', 1.0),
+                k_end=params.get('k_end', 2.0),
+                duration=params.get('duration', 1.0),
+                annealing_start=params.get('annealing_start', 0.1),
+                annealing_end=params.get('annealing_end', 0.5)
+            )
+        elif path_generator == "smooth_sigmoid":
+            path = generate_smooth_sigmoid_path(
+                k_start=params.get('k_start', 1.0),
+                k_end=params.get('k_end', 2.0),
+                duration=params.get('duration', 1.0),
+                steepness=params.get('steepness', 5.0)
+            )
+        else:
+            raise ValueError(f"Unknown path generator: {path_generator}")
+        
+        # Skip si K1 trop élevé
+        if params.get('k_end', 0) > k_end_limit:
+            return None
+        
+        return path
+    
+    except Exception as e:
+        if verbose:
+            print(f"Warning: Failed to evaluate {params}: {e}")
+        return None
+
+
+def _evaluate_unit(
+    cost_function: Optional[Callable[[HolonomyPath], float]],
+    batch_cost_function: Optional[Callable[[List[HolonomyPath]], List[float]]],
+    paths: List[HolonomyPath],
+    params_list: List[Dict[str, float]],
+    verbose: bool
+) -> List[Optional[float]]:
+    """
+    Coûts d'une unité de travail (exécutable dans un processus worker).
+    
+    Returns:
+        Un coût par path, None si son évaluation a échoué (un lot en échec
+        est réévalué path par path : seuls les paths fautifs sont perdus)
+    """
+    if batch_cost_function is not None:
+        try:
+            return list(batch_cost_function(paths))
+        except Exception as e:
+            if verbose:
+                print(f"Warning: Failed to evaluate batch of {len(paths)} paths: {e}")
+            if len(paths) == 1:
+                return [None]
+            return [
+                _evaluate_unit(cost_function, batch_cost_function, [path], [params], verbose)[0]
+                for path, params in zip(paths, params_list)
+            ]
+    
+    costs = []
+    for path, params in zip(paths, params_list):
+        try:
+            costs.append(cost_function(path))
+        except Exception as e:
+            if verbose:
+                print(f"Warning: Failed to evaluate {params}: {e}")
+            costs.append(None)
+    return costs
+
+
+class _SearchOptimizer(abc.ABC):
+    """
+    Boucle d'évaluation commune aux optimiseurs : génération des candidats,
+    cache des coûts, évaluation en série, par lots ou dans un pool de
+    processus, et flux ordonné des résultats.
+    """
+    
+    path_generator: str
+    verbose: bool
+    
+    @abc.abstractmethod
+    def _iter_params(self) -> Iterator[Dict[str, float]]:
+        """Jeux de paramètres candidats, dans l'ordre d'évaluation."""
+    
+    def iter_evaluations(
+        self,
+        cost_function: Optional[Callable[[HolonomyPath], float]],
+        atlas_profile: Optional[AtlasProfile] = None,
+        batch_cost_function: Optional[Callable[[List[HolonomyPath]], List[float]]] = None,
+        batch_size: int = 16,
+        workers: Optional[int] = None,
+        cache: Optional[MutableMapping[str, float]] = None,
+        cache_settings: Optional[Dict] = None
+    ) -> Iterator[Tuple[Dict[str, float], float, HolonomyPath]]:
+        """
+        Évalue les candidats et produit les résultats au fil de l'eau.
+        
+        Les résultats sortent dans l'ordre des candidats, quel que soit le
+        mode d'évaluation : interrompre l'itération garde un préfixe exact de
+        la recherche complète.
+        
+        Args:
+            cost_function: Fonction qui prend un HolonomyPath et retourne un coût
+            atlas_profile: Profil Atlas pour valider les contraintes
+            batch_cost_function: Optionnelle, liste de paths -> liste de coûts
+                (ex. simulation en ensemble) ; remplace cost_function, les
+                paths sont évalués par lots de batch_size
+            batch_size: Taille des lots pour batch_cost_function
+            workers: Nombre de processus (None ou 1 : en série). Les fonctions
+                de coût doivent alors être picklables (fonctions de module,
+                functools.partial) ; processus lancés en mode spawn, le script
+                appelant doit protéger son point d'entrée
+                (if __name__ == "__main__")
+            cache: Mapping {clé du path: coût} lu et complété ; un path
+                n'est simulé qu'une fois par clé (déjà en cache, déjà soumis
+                ou répété dans la même unité), son coût est recopié sur les
+                candidats identiques
+            cache_settings: Réglages de simulation inclus dans la clé
+                (voir HolonomyPath.cache_key)
+            
+        Yields:
+            (params, coût, path) des évaluations réussies
+        """
+        k_end_limit = atlas_k_end_limit(atlas_profile)
+        unit_size = batch_size if batch_cost_function is not None else 1
+        units = self._iter_units(k_end_limit, unit_size)
+        
+        n_workers = workers or 1
+        executor = None
+        if n_workers > 1:
+            # spawn : un fork après l'initialisation des threads Numba (TBB)
+            # du parent peut bloquer le processus parent
+            executor = ProcessPoolExecutor(max_workers=n_workers,
+                                           mp_context=multiprocessing.get_context("spawn"))
+        in_flight = deque()
+        # Clés soumises pendant cette recherche -> coût (None tant que non
+        # collecté ou en échec) ; les unités sortent dans l'ordre, la première
+        # occurrence d'une clé est donc collectée avant ses doublons
+        submitted: Dict[str, Optional[float]] = {}
+        try:
+            for unit in units:
+                keys = [path.cache_key(cache_settings) if cache is not None else None
+                        for _, path in unit]
+                todo = []
+                for k, key in enumerate(keys):
+                    if key is None:
+                        todo.append(k)
+                    elif key not in cache and key not in submitted:
+                        submitted[key] = None
+                        todo.append(k)
+                arguments = (cost_function, batch_cost_function,
+                             [unit[k][1] for k in todo], [unit[k][0] for k in todo],
+                             self.verbose)
+                
+                if not todo:
+                    pending = None
+                elif executor is not None:
+                    pending = executor.submit(_evaluate_unit, *arguments)
+                else:
+                    pending = _evaluate_unit(*arguments)
+                in_flight.append((unit, keys, todo, pending))
+                
+                # Fenêtre bornée de travail en cours (2 unités par worker)
+                while len(in_flight) > (2 * n_workers if executor is not None else 0):
+                    yield from self._collect(in_flight.popleft(), cache, submitted)
+            
+            while in_flight:
+                yield from self._collect(in_flight.popleft(), cache, submitted)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _iter_units(self, k_end_limit: float, unit_size: int) -> Iterator[List[Tuple[Dict[str, float], HolonomyPath]]]:
+        """Candidats valides (params, path) regroupés par unités de travail."""
+        unit = []
+        for params in self._iter_params():
+            # Générer le path (None si hors contraintes ou en échec)
+            path = _candidate_path(self.path_generator, params, k_end_limit, self.verbose)
+            if path is None:
+                self._observe(params, None)
+                continue
+            unit.append((params, path))
+            if len(unit) >= unit_size:
+                yield unit
+                unit = []
+        if unit:
+            yield unit
+    
+    def _observe(self, params: Dict[str, float], cost: Optional[float]) -> None:
+        """Coût obtenu pour un candidat (None : exclu ou en échec)."""
+    
+    def _collect(self, entry, cache, submitted) -> Iterator[Tuple[Dict[str, float], float, HolonomyPath]]:
+        """Résultats d'une unité, dans l'ordre, en complétant le cache."""
+        unit, keys, todo, pending = entry
+        costs = {}
+        if pending is not None:
+            evaluated = pending.result() if isinstance(pending, Future) else pending
+            for k, cost in zip(todo, evaluated):
+                costs[k] = cost
+                if keys[k] is not None:
+                    submitted[keys[k]] = cost
+                    if cost is not None:
+                        cache[keys[k]] = cost
+        
+        for k, (params, path) in enumerate(unit):
+            if k in costs:
+                cost = costs[k]
+            elif keys[k] in submitted:
+                cost = submitted[keys[k]]
+            else:
+                cost = cache[keys[k]]
+            self._observe(params, cost)
+            if cost is not None:
+                yield params, cost, path
+    
+    def optimize(
+        self,
+        cost_function: Optional[Callable[[HolonomyPath], float]],
+        atlas_profile: Optional[AtlasProfile] = None,
+        batch_cost_function: Optional[Callable[[List[HolonomyPath]], List[float]]] = None,
+        batch_size: int = 16,
+        workers: Optional[int] = None,
+        cache: Optional[MutableMapping[str, float]] = None,
+        cache_settings: Optional[Dict] = None,
+        on_result: Optional[Callable[[Dict[str, float], float], None]] = None
+    ) -> OptimizationResult:
+        """
+        Exécute l'optimisation.
+        
+        Args:
+            cost_function, atlas_profile, batch_cost_function, batch_size,
+            workers, cache, cache_settings: voir iter_evaluations
+            on_result: Appelée avec (params, coût) après chaque évaluation
+                (suivi ou sauvegarde au fil de l'eau)
+            
+        Returns:
+            OptimizationResult avec le meilleur path trouvé. Une interruption
+            (Ctrl-C) arrête la recherche et renvoie le meilleur résultat
+            obtenu jusque-là (completed=False).
+        """
+        results = []
+        completed = True
+        evaluations = self.iter_evaluations(
+            cost_function,
+            atlas_profile=atlas_profile,
+            batch_cost_function=batch_cost_function,
+            batch_size=batch_size,
+            workers=workers,
+            cache=cache,
+            cache_settings=cache_settings
+        )
+        
+        try:
+            for params, cost, path in evaluations:
+                results.append((params, cost, path))
+                if on_result is not None:
+                    on_result(params, cost)
+        except KeyboardInterrupt:
+            completed = False
+            if self.verbose:
+                print(f"Interrupted after {len(results)} evaluations: returning best so far")
+        finally:
+            evaluations.close()
+        
+        best_params, best_cost, best_path = None, float('inf'), None
+        for params, cost, path in results:
+            if cost < best_cost:
+                best_params, best_cost, best_path = params, cost, path
+        
+        return OptimizationResult(
+            best_path=best_path,
+            best_params=best_params,
+            best_cost=best_cost,
+            all_evaluated=[(params, cost) for params, cost, _ in results],
+            n_evaluations=len(results),
+            completed=completed
+        )
+
+
+class GridSearchOptimizer(_SearchOptimizer):
     """
     Optimiseur par recherche sur grille (Grid Search).
     
-    Simple mais efficace pour espaces de faible dimension.
+    Simple mais efficace pour espaces de faible dimension. Les combinaisons
+    sont parcourues à la volée (produit cartésien non matérialisé).
     """
     
     def __init__(
@@ -54,101 +371,24 @@ class GridSearchOptimizer:
         self.param_ranges = param_ranges
         self.path_generator = path_generator
         self.verbose = verbose
-        
-    def optimize(
-        self,
-        cost_function: Callable[[HolonomyPath], float],
-        atlas_profile: Optional[AtlasProfile] = None
-    ) -> OptimizationResult:
-        """
-        Exécute l'optimisation par grid search.
-        
-        Args:
-            cost_function: Fonction qui prend un HolonomyPath et retourne un coût
-            atlas_profile: Profil Atlas pour valider les contraintes
-            
-        Returns:
-            OptimizationResult avec le meilleur path trouvé
-        """
+    
+    def _iter_params(self) -> Iterator[Dict[str, float]]:
         # Générer la grille
         param_grids = {}
         for param_name, (min_val, max_val, n_points) in self.param_ranges.items():
             param_grids[param_name] = np.linspace(min_val, max_val, n_points)
         
-        # Produit cartésien
         param_names = list(param_grids.keys())
-        param_values_list = list(param_grids.values())
-        
-        # Générer toutes les combinaisons
-        import itertools
-        all_combinations = list(itertools.product(*param_values_list))
-        
-        # Évaluer chaque combinaison
-        results = []
-        best_cost = float('inf')
-        best_path = None
-        best_params = None
+        combinations = itertools.product(*param_grids.values())
+        if self.verbose:
+            total = int(np.prod([len(values) for values in param_grids.values()]))
+            combinations = tqdm(combinations, total=total, desc="Grid Search")
         
-        iterator = tqdm(all_combinations, desc="Grid Search") if self.verbose else all_combinations
-        
-        for combination in iterator:
-            params = dict(zip(param_names, combination))
-            
-            # Générer le path
-            try:
-                if self.path_generator == "linear_ramp":
-                    path = generate_linear_ramp_path(
-                        k_start=params.get('k_start', 1.0),
-                        k_end=params.get('k_end', 2.0),
-                        duration=params.get('duration', 1.0),
-                        annealing_start=params.get('annealing_start', 0.1),
-                        annealing_end=params.get('annealing_end', 0.5)
-                    )
-                elif self.path_generator == "smooth_sigmoid":
-                    path = generate_smooth_sigmoid_path(
-                        k_start=params.get('k_start', 1.0),
-                        k_end=params.get('k_end', 2.0),
-                        duration=params.get('duration', 1.0),
-                        steepness=params.get('steepness', 5.0)
-                    )
-                else:
-                    raise ValueError(f"Unknown path generator: {self.path_generator}")
-                
-                # Valider contraintes si atlas_profile fourni
-                if atlas_profile:
-                    from ..data_bridge.atlas_map import AtlasMapper
-                    mapper = AtlasMapper()
-                    k_max_safe = mapper._compute_k_max(atlas_profile.t1_us, atlas_profile.t2_us)
-                    
-                    # Skip si K1 trop élevé
-                    if params.get('k_end', 0) > k_max_safe * 1.2:
-                        continue
-                
-                # Évaluer le coût
-                cost = cost_function(path)
-                results.append((params, cost))
-                
-                # Mettre à jour le meilleur
-                if cost < best_cost:
-                    best_cost = cost
-                    best_path = path
-                    best_params = params
-                    
-            except Exception as e:
-                if self.verbose:
-                    print(f"Warning: Failed to evaluate {params}: {e}")
-                continue
-        
-        return OptimizationResult(
-            best_path=best_path,
-            best_params=best_params,
-            best_cost=best_cost,
-            all_evaluated=results,
-            n_evaluations=len(results)
-        )
+        for combination in combinations:
+            yield dict(zip(param_names, combination))
 
 
-class RandomSearchOptimizer:
+class RandomSearchOptimizer(_SearchOptimizer):
     """
     Optimiseur par recherche aléatoire.
     
@@ -176,86 +416,229 @@ class RandomSearchOptimizer:
         self.path_generator = path_generator
         self.verbose = verbose
         self.rng = np.random.default_rng(seed)
+    
+    def _iter_params(self) -> Iterator[Dict[str, float]]:
+        samples = range(self.n_samples)
+        if self.verbose:
+            samples = tqdm(samples, desc="Random Search")
         
-    def optimize(
+        for _ in samples:
+            # Échantillonner des paramètres aléatoires
+            params = {}
+            for param_name, (min_val, max_val) in self.param_ranges.items():
+                params[param_name] = self.rng.uniform(min_val, max_val)
+            yield params
+
+
+def _matern52(a: np.ndarray, b: np.ndarray, lengthscale: float) -> np.ndarray:
+    """Kernel de Matérn 5/2 entre deux ensembles de points (n, d) et (m, d)."""
+    dist = np.sqrt(np.sum((a[:, None, :] - b[None, :, :]) ** 2, axis=-1)) / lengthscale
+    scaled = np.sqrt(5.0) * dist
+    return (1.0 + scaled + scaled ** 2 / 3.0) * np.exp(-scaled)
+
+
+class _GaussianProcess:
+    """
+    Processus gaussien minimal sur [0, 1]^d (coûts normalisés).
+    
+    Longueur de corrélation choisie par maximum de vraisemblance marginale
+    sur une grille logarithmique.
+    """
+    
+    LENGTHSCALES = np.geomspace(0.05, 2.0, 12)
+    
+    def __init__(self, x: np.ndarray, y: np.ndarray, noise: float = 1e-6):
+        self.x = x
+        self.y_mean = float(np.mean(y))
+        self.y_std = float(np.std(y)) or 1.0
+        target = (y - self.y_mean) / self.y_std
+        
+        best = None
+        for lengthscale in self.LENGTHSCALES * np.sqrt(x.shape[1]):
+            gram = _matern52(x, x, lengthscale) + noise * np.eye(len(x))
+            try:
+                factor = cho_factor(gram, lower=True)
+            except np.linalg.LinAlgError:
+                continue
+            alpha = cho_solve(factor, target)
+            log_likelihood = -0.5 * target @ alpha - np.sum(np.log(np.diag(factor[0])))
+            if best is None or log_likelihood > best[0]:
+                best = (log_likelihood, lengthscale, factor, alpha)
+        
+        _, self.lengthscale, self.factor, self.alpha = best
+    
+    def predict(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Moyenne et écart-type prédits aux points (m, d)."""
+        cross = _matern52(points, self.x, self.lengthscale)
+        mean = cross @ self.alpha
+        v = solve_triangular(self.factor[0], cross.T, lower=True)
+        variance = np.maximum(1.0 - np.sum(v ** 2, axis=0), 1e-12)
+        return mean * self.y_std + self.y_mean, np.sqrt(variance) * self.y_std
+
+
+def expected_improvement(mean: np.ndarray, std: np.ndarray, best: float) -> np.ndarray:
+    """Amélioration espérée (minimisation) sous une loi normale N(mean, std²)."""
+    improvement = best - mean
+    z = improvement / std
+    return improvement * norm.cdf(z) + std * norm.pdf(z)
+
+
+class BayesianOptimizer(_SearchOptimizer):
+    """
+    Optimiseur bayésien : processus gaussien + amélioration espérée.
+    
+    Pour les coûts chers (une simulation par évaluation). Un plan initial en
+    hypercube latin, puis chaque candidat maximise l'amélioration espérée
+    sous un GP (kernel Matérn 5/2) ajusté aux coûts observés. Les candidats
+    proposés mais pas encore évalués (lots, workers) entrent dans le GP avec
+    leur coût prédit (kriging believer) : les propositions d'un même lot
+    sont ainsi diversifiées.
+    
+    Les régions infaisables (limite Atlas sur k_end, fonction `constraint`)
+    ne sont jamais proposées : un point du plan initial resté infaisable
+    est retiré, et la recherche s'arrête si plus aucun candidat tiré n'est
+    faisable.
+    """
+    
+    def __init__(
         self,
-        cost_function: Callable[[HolonomyPath], float],
-        atlas_profile: Optional[AtlasProfile] = None
-    ) -> OptimizationResult:
+        param_ranges: Dict[str, Tuple[float, float]],
+        n_evaluations: int = 30,
+        n_initial: Optional[int] = None,
+        path_generator: str = "linear_ramp",
+        constraint: Optional[Callable[[Dict[str, float]], bool]] = None,
+        n_candidates: int = 1024,
+        verbose: bool = True,
+        seed: Optional[int] = None
+    ):
         """
-        Exécute l'optimisation par random search.
-        
         Args:
-            cost_function: Fonction de coût
-            atlas_profile: Profil Atlas pour contraintes
-            
-        Returns:
-            OptimizationResult
+            param_ranges: Dict de {param_name: (min, max)}
+            n_evaluations: Budget total d'évaluations
+            n_initial: Taille du plan initial (défaut : max(5, 2 × dimension))
+            path_generator: Type de générateur
+            constraint: Faisabilité d'un jeu de paramètres (False : région
+                infaisable, jamais proposée)
+            n_candidates: Points tirés pour maximiser l'acquisition
+            verbose: Affichage
+            seed: Seed pour reproductibilité
         """
-        results = []
-        best_cost = float('inf')
-        best_path = None
-        best_params = None
+        self.param_ranges = param_ranges
+        self.n_evaluations = n_evaluations
+        self.n_initial = min(n_evaluations, n_initial or max(5, 2 * len(param_ranges)))
+        self.path_generator = path_generator
+        self.constraint = constraint
+        self.n_candidates = n_candidates
+        self.verbose = verbose
+        self.rng = np.random.default_rng(seed)
         
-        iterator = tqdm(range(self.n_samples), desc="Random Search") if self.verbose else range(self.n_samples)
+        self._names = list(param_ranges)
+        self._low = np.array([param_ranges[name][0] for name in self._names], dtype=float)
+        self._high = np.array([param_ranges[name][1] for name in self._names], dtype=float)
+        self._k_end_limit = float('inf')
+    
+    def _to_params(self, x: np.ndarray) -> Dict[str, float]:
+        values = self._low + x * (self._high - self._low)
+        return {name: float(value) for name, value in zip(self._names, values)}
+    
+    def _feasible(self, x: np.ndarray) -> bool:
+        params = self._to_params(x)
+        if params.get('k_end', 0) > self._k_end_limit:
+            return False
+        return self.constraint is None or bool(self.constraint(params))
+    
+    def iter_evaluations(
+        self,
+        cost_function: Optional[Callable[[HolonomyPath], float]],
+        atlas_profile: Optional[AtlasProfile] = None,
+        **kwargs
+    ) -> Iterator[Tuple[Dict[str, float], float, HolonomyPath]]:
+        """Voir _SearchOptimizer.iter_evaluations."""
+        # Limite Atlas connue avant la première proposition
+        self._k_end_limit = atlas_k_end_limit(atlas_profile)
+        return super().iter_evaluations(cost_function, atlas_profile=atlas_profile, **kwargs)
+    
+    def _initial_design(self) -> np.ndarray:
+        """
+        Hypercube latin sur [0, 1]^d ; un point infaisable est retiré au
+        hasard (100 essais), puis abandonné s'il reste infaisable.
+        """
+        n, d = self.n_initial, len(self._names)
+        design = (np.argsort(self.rng.random((n, d)), axis=0) + self.rng.random((n, d))) / n
+        feasible = np.zeros(n, dtype=bool)
+        for k in range(n):
+            for _ in range(100):
+                if self._feasible(design[k]):
+                    feasible[k] = True
+                    break
+                design[k] = self.rng.random(d)
+        if self.verbose and not feasible.all():
+            print(f"Warning: {n - feasible.sum()} infeasible initial points dropped")
+        return design[feasible]
+    
+    def _iter_params(self) -> Iterator[Dict[str, float]]:
+        self._observed_x: List[np.ndarray] = []
+        self._observed_y: List[float] = []
+        self._failed_x: List[np.ndarray] = []
+        self._pending: Dict[int, np.ndarray] = {}
         
-        for _ in iterator:
-            # Échantillonner des paramètres aléatoires
-            params = {}
-            for param_name, (min_val, max_val) in self.param_ranges.items():
-                params[param_name] = self.rng.uniform(min_val, max_val)
-            
-            # Générer le path
-            try:
-                if self.path_generator == "linear_ramp":
-                    path = generate_linear_ramp_path(
-                        k_start=params.get('k_start', 1.0),
-                        k_end=params.get('k_end', 2.0),
-                        duration=params.get('duration', 1.0),
-                        annealing_start=params.get('annealing_start', 0.1),
-                        annealing_end=params.get('annealing_end', 0.5)
-                    )
-                elif self.path_generator == "smooth_sigmoid":
-                    path = generate_smooth_sigmoid_path(
-                        k_start=params.get('k_start', 1.0),
-                        k_end=params.get('k_end', 2.0),
-                        duration=params.get('duration', 1.0),
-                        steepness=params.get('steepness', 5.0)
-                    )
-                else:
-                    raise ValueError(f"Unknown path generator: {self.path_generator}")
-                
-                # Valider contraintes
-                if atlas_profile:
-                    from ..data_bridge.atlas_map import AtlasMapper
-                    mapper = AtlasMapper()
-                    k_max_safe = mapper._compute_k_max(atlas_profile.t1_us, atlas_profile.t2_us)
-                    
-                    if params.get('k_end', 0) > k_max_safe * 1.2:
-                        continue
-                
-                # Évaluer
-                cost = cost_function(path)
-                results.append((params, cost))
-                
-                # Mettre à jour
-                if cost < best_cost:
-                    best_cost = cost
-                    best_path = path
-                    best_params = params
-                    
-            except Exception as e:
+        design = self._initial_design()
+        evaluations = range(self.n_evaluations)
+        if self.verbose:
+            evaluations = tqdm(evaluations, desc="Bayesian Search")
+        
+        for k in evaluations:
+            x = design[k] if k < len(design) else self._propose()
+            if x is None:
                 if self.verbose:
-                    print(f"Warning: Failed to evaluate {params}: {e}")
-                continue
+                    print(f"Warning: no feasible candidate left, search stopped after {k} proposals")
+                return
+            params = self._to_params(x)
+            self._pending[id(params)] = x
+            yield params
+    
+    def _observe(self, params: Dict[str, float], cost: Optional[float]) -> None:
+        x = self._pending.pop(id(params), None)
+        if x is None:
+            return
+        if cost is not None and np.isfinite(cost):
+            self._observed_x.append(x)
+            self._observed_y.append(float(cost))
+        else:
+            self._failed_x.append(x)
+    
+    def _propose(self) -> Optional[np.ndarray]:
+        """Point faisable d'amélioration espérée maximale (None : aucun)."""
+        d = len(self._names)
+        candidates = self.rng.random((self.n_candidates, d))
+        if not self._observed_y:
+            feasible = [x for x in candidates if self._feasible(x)]
+            return feasible[0] if feasible else None
         
-        return OptimizationResult(
-            best_path=best_path,
-            best_params=best_params,
-            best_cost=best_cost,
-            all_evaluated=results,
-            n_evaluations=len(results)
-        )
+        x = np.array(self._observed_x)
+        y = np.array(self._observed_y)
+        # Échecs : pire coût observé
+        if self._failed_x:
+            x = np.vstack([x, self._failed_x])
+            y = np.concatenate([y, np.full(len(self._failed_x), y.max())])
+        
+        gp = _GaussianProcess(x, y)
+        if self._pending:
+            # Kriging believer : propositions en attente au coût prédit
+            pending = np.array(list(self._pending.values()))
+            believed, _ = gp.predict(pending)
+            gp = _GaussianProcess(np.vstack([x, pending]), np.concatenate([y, believed]))
+        
+        # Candidats : uniformes + perturbations locales du meilleur point
+        best = x[int(np.argmin(y))]
+        local = np.clip(best + self.rng.normal(0, 0.05, (self.n_candidates // 4, d)), 0.0, 1.0)
+        candidates = np.vstack([candidates, local])
+        candidates = candidates[[self._feasible(c) for c in candidates]]
+        if len(candidates) == 0:
+            return None
+        
+        mean, std = gp.predict(candidates)
+        return candidates[int(np.argmax(expected_improvement(mean, std, float(np.min(y)))))]
 
 
 def compare_path_generators(
@@ -0,0 +1,261 @@
+"""
+CA Bit-Packed — Moteur Life-like en multi-spin coding (64 cellules par mot uint64).
+
+Chaque ligne de la grille est stockée sur des mots uint64 (bit k du mot m =
+colonne 64*m + k). Les 8 voisins sont obtenus par décalages de bits, comptés
+par un arbre d'additionneurs (half/full adders) bit-sliced, puis la règle B/S
+est appliquée par un circuit booléen généré à partir des ensembles born/survive.
+
+Conditions aux bords : toroïdales (comme step_ca_vectorized).
+"""
+
+import numpy as np
+from typing import Set, Callable, List, Tuple
+
+
+WORD_BITS = 64
+_ONE = np.uint64(1)
+_SHIFT_MSB = np.uint64(WORD_BITS - 1)
+
+
+def pack_grid(grid: np.ndarray) -> np.ndarray:
+    """
+    Compresse une grille 2D (0/1) en mots uint64.
+
+    Args:
+        grid: Grille 2D (0/1) de shape (height, width)
+
+    Returns:
+        Array uint64 de shape (height, ceil(width / 64)), bits de padding à 0
+    """
+    height, width = grid.shape
+    n_words = -(-width // WORD_BITS)
+    padded = np.zeros((height, n_words * WORD_BITS), dtype=np.uint8)
+    padded[:, :width] = grid != 0
+    packed_bytes = np.packbits(padded, axis=1, bitorder='little')
+    return packed_bytes.view('<u8').astype(np.uint64)
+
+
+def unpack_grid(packed: np.ndarray, width: int) -> np.ndarray:
+    """
+    Décompresse des mots uint64 en grille 2D (0/1).
+
+    Args:
+        packed: Array uint64 de shape (height, n_words)
+        width: Largeur réelle de la grille
+
+    Returns:
+        Grille 2D int de shape (height, width)
+    """
+    packed_bytes = packed.astype('<u8').view(np.uint8)
+    bits = np.unpackbits(packed_bytes, axis=1, bitorder='little')
+    return bits[:, :width].astype(int)
+
+
+def _last_word_mask(width: int) -> np.uint64:
+    """Masque des bits valides du dernier mot d'une ligne."""
+    n_valid = width - (-(-width // WORD_BITS) - 1) * WORD_BITS
+    if n_valid == WORD_BITS:
+        return np.uint64(0xFFFFFFFFFFFFFFFF)
+    return np.uint64((1 << n_valid) - 1)
+
+
+def _shift_west(plane: np.ndarray, width: int) -> np.ndarray:
+    """Plan où chaque cellule c contient la cellule c-1 (voisin ouest, toroïdal)."""
+    last_bit = np.uint64((width - 1) % WORD_BITS)
+    carry = np.empty_like(plane)
+    carry[:, 1:] = plane[:, :-1] >> _SHIFT_MSB
+    carry[:, 0] = (plane[:, -1] >> last_bit) & _ONE
+    return (plane << _ONE) | carry
+
+
+def _shift_east(plane: np.ndarray, width: int) -> np.ndarray:
+    """Plan où chaque cellule c contient la cellule c+1 (voisin est, toroïdal)."""
+    last_bit = np.uint64((width - 1) % WORD_BITS)
+    shifted = plane >> _ONE
+    shifted[:, :-1] |= plane[:, 1:] << _SHIFT_MSB
+    shifted[:, -1] |= (plane[:, 0] & _ONE) << last_bit
+    return shifted
+
+
+def _half_adder(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Additionneur 1 bit : (somme, retenue)."""
+    return a ^ b, a & b
+
+
+def _full_adder(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Additionneur complet 1 bit : (somme, retenue)."""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (c & partial)
+
+
+def neighbor_count_bits(packed: np.ndarray, width: int) -> List[np.ndarray]:
+    """
+    Compte les 8 voisins de Moore en arithmétique bit-sliced.
+
+    Args:
+        packed: Grille compressée (height, n_words)
+        width: Largeur réelle de la grille
+
+    Returns:
+        [bit0, bit1, bit2, bit3] : plans binaires du compte (0-8) par cellule
+    """
+    north = np.roll(packed, 1, axis=0)
+    south = np.roll(packed, -1, axis=0)
+    rows = (north, packed, south)
+
+    planes = []
+    for row in rows:
+        planes.append(_shift_west(row, width))
+        planes.append(_shift_east(row, width))
+    planes.append(north)
+    planes.append(south)
+
+    # Niveau 1 : 8 plans de poids 1 -> 3 sommes (poids 1) + 3 retenues (poids 2)
+    s_a, c_a = _full_adder(planes[0], planes[1], planes[2])
+    s_b, c_b = _full_adder(planes[3], planes[4], planes[5])
+    s_c, c_c = _half_adder(planes[6], planes[7])
+
+    # Poids 1
+    bit0, c_ones = _full_adder(s_a, s_b, s_c)
+
+    # Poids 2 : c_a, c_b, c_c, c_ones
+    s_twos, c_twos_a = _full_adder(c_a, c_b, c_c)
+    bit1, c_twos_b = _half_adder(s_twos, c_ones)
+
+    # Poids 4 (et 8)
+    bit2, bit3 = _half_adder(c_twos_a, c_twos_b)
+
+    return [bit0, bit1, bit2, bit3]
+
+
+def _count_terms(counts: Set[int]) -> List[Tuple[int, ...]]:
+    """
+    Génère les termes du circuit : pour chaque compte n, la polarité de chaque bit.
+
+    Le bit3 (compte = 8) n'est testé que pour n in {0, 8} : si bit3 = 1, les
+    bits 0-2 valent 0, donc seul n = 0 pourrait être confondu avec 8.
+    """
+    terms = []
+    for n in sorted(counts):
+        if not 0 <= n <= 8:
+            raise ValueError(f"Neighbor count out of range [0, 8]: {n}")
+        polarity = tuple((n >> k) & 1 for k in range(4))
+        if n in (0, 8):
+            terms.append(polarity)
+        else:
+            terms.append(polarity[:3])
+    return terms
+
+
+def _evaluate_terms(terms: List[Tuple[int, ...]], bits: List[np.ndarray],
+                    inverted: List[np.ndarray], zeros: np.ndarray) -> np.ndarray:
+    """OU des mintermes (ET des bits du compte, directs ou inversés)."""
+    result = zeros
+    for polarity in terms:
+        term = None
+        for k, bit_value in enumerate(polarity):
+            plane = bits[k] if bit_value else inverted[k]
+            term = plane if term is None else term & plane
+        result = result | term
+    return result
+
+
+def compile_rule_circuit(born: Set[int], survive: Set[int]) -> Callable:
+    """
+    Génère le circuit booléen d'une règle Life-like.
+
+    Args:
+        born: Ensemble valeurs naissance
+        survive: Ensemble valeurs survie
+
+    Returns:
+        Fonction (packed, width) -> packed après 1 step
+    """
+    born_terms = _count_terms(set(born))
+    survive_terms = _count_terms(set(survive))
+
+    def circuit(packed: np.ndarray, width: int) -> np.ndarray:
+        bits = neighbor_count_bits(packed, width)
+        inverted = [~b for b in bits]
+        zeros = np.zeros_like(packed)
+
+        born_mask = _evaluate_terms(born_terms, bits, inverted, zeros)
+        survive_mask = _evaluate_terms(survive_terms, bits, inverted, zeros)
+
+        new_packed = (~packed & born_mask) | (packed & survive_mask)
+        # Les bits de padding (B0 les allumerait) restent à 0
+        new_packed[:, -1] &= _last_word_mask(width)
+        return new_packed
+
+    return circuit
+
+
+def step_ca_bitpacked(grid: np.ndarray, born: Set[int], survive: Set[int]) -> np.ndarray:
+    """
+    Évolution CA bit-packed (Life-like rules), même interface que step_ca_vectorized.
+
+    Args:
+        grid: Grille 2D (0/1)
+        born: Ensemble valeurs naissance
+        survive: Ensemble valeurs survie
+
+    Returns:
+        Nouvelle grille après 1 step
+    """
+    circuit = compile_rule_circuit(born, survive)
+    width = grid.shape[1]
+    return unpack_grid(circuit(pack_grid(grid), width), width)
+
+
+def create_rule_function_bitpacked(born: list, survive: list) -> Callable:
+    """
+    Crée fonction règle bit-packed (circuit compilé une seule fois).
+
+    Args:
+        born: Liste valeurs naissance [0-8]
+        survive: Liste valeurs survie [0-8]
+
+    Returns:
+        Fonction grid -> new_grid (même contrat que create_rule_function_vectorized)
+    """
+    circuit = compile_rule_circuit(set(born), set(survive))
+
+    def rule_func(grid):
+        width = grid.shape[1]
+        return unpack_grid(circuit(pack_grid(grid), width), width)
+
+    return rule_func
+
+
+def evolve_ca_bitpacked(grid: np.ndarray, born: Set[int], survive: Set[int],
+                        steps: int) -> np.ndarray:
+    """
+    Évolution CA sur N steps sans décompresser entre les steps.
+
+    Args:
+        grid: Grille initiale
+        born: Ensemble naissance
+        survive: Ensemble survie
+        steps: Nombre de steps
+
+    Returns:
+        Grille finale
+    """
+    circuit = compile_rule_circuit(born, survive)
+    width = grid.shape[1]
+    packed = pack_grid(grid)
+    for _ in range(steps):
+        packed = circuit(packed, width)
+    return unpack_grid(packed, width)
+
+
+__all__ = [
+    'pack_grid',
+    'unpack_grid',
+    'neighbor_count_bits',
+    'compile_rule_circuit',
+    'step_ca_bitpacked',
+    'create_rule_function_bitpacked',
+    'evolve_ca_bitpacked'
+]
@@ -9,6 +9,11 @@ Provides deterministic CA evolution with support for:
 
 import numpy as np
 from typing import Tuple, Optional, Callable
+from .history import HistoryPolicy
+from .rng import SeedLike, make_rng
+
+
+BACKENDS = ("vectorized", "loop")
 
 
 class CAEngine:
@@ -24,7 +29,12 @@ class CAEngine:
         rule: int,
         ca_type: str = "elementary",
         boundary: str = "periodic",
-        seed: Optional[int] = None
+        seed: SeedLike = None,
+        backend: str = "vectorized",
+        history_mode: str = "full",
+        history_size: Optional[int] = None,
+        track_stream: Optional[bool] = None,
+        track_attractor: bool = False
     ):
         """
         Initialize CA engine.
@@ -34,26 +44,49 @@ class CAEngine:
             rule: Rule number (Wolfram encoding for elementary, or custom)
             ca_type: Type of CA ("elementary", "life", "totalistic")
             boundary: Boundary conditions ("periodic", "fixed", "reflect")
-            seed: Random seed for reproducibility
+            seed: Random seed for reproducibility (int, SeedSequence or
+                Generator); the engine draws from its own stream `self.rng`
+            backend: Update implementation ("vectorized" or "loop").
+                Both produce identical grids; "loop" is the per-cell
+                reference implementation.
+            history_mode: Frames kept in `history` ("full", "ring",
+                "strided" or "none", see core.history)
+            history_size: Ring length or stride for "ring" / "strided"
+            track_stream: Feed every state to a StreamingMetrics accumulator
+                (`self.stream`). Defaults to True unless history_mode is "full".
+            track_attractor: Feed every state to a CycleDetector
+                (`self.cycle_detector`); `self.attractor` then reports
+                (transient, period) as soon as a state repeats.
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (expected one of {BACKENDS})")
+        
         self.grid_size = grid_size
         self.rule = rule
         self.ca_type = ca_type
         self.boundary = boundary
         self.seed = seed
+        self.backend = backend
         
-        # Set random seed for reproducibility
-        if seed is not None:
-            np.random.seed(seed)
+        # Own random stream (global np.random in legacy seeding mode)
+        self.rng = make_rng(seed)
         
         # Parse rule
         self._rule_lookup = self._parse_rule(rule, ca_type)
+        self._rule_table_1d, self._birth_table, self._survival_table = \
+            self._build_lookup_arrays(self._rule_lookup)
         
         # Initialize grid
         self.grid = self._initialize_grid()
-        self.history = [self.grid.copy()]
+        self._history_policy = HistoryPolicy(history_mode, history_size)
+        if track_stream is None:
+            track_stream = history_mode != "full"
+        self.track_stream = track_stream
+        self.track_attractor = track_attractor
+        self._start_trajectory()
         
-    def _parse_rule(self, rule: int, ca_type: str) -> dict:
+    @staticmethod
+    def _parse_rule(rule: int, ca_type: str) -> dict:
         """Parse rule number into lookup table."""
         if ca_type == "elementary":
             # Wolfram rule: 8 possible neighborhoods -> 8-bit number
@@ -64,11 +97,12 @@ class CAEngine:
         elif ca_type == "life":
             # Conway's Life or similar: B/S notation encoded
             # For now, simple mapping (extendable)
-            return self._parse_life_rule(rule)
+            return CAEngine._parse_life_rule(rule)
         else:
             raise ValueError(f"Unknown CA type: {ca_type}")
     
-    def _parse_life_rule(self, rule: int) -> dict:
+    @staticmethod
+    def _parse_life_rule(rule: int) -> dict:
         """
         Parse Life-like rule.
         
@@ -88,14 +122,37 @@ class CAEngine:
         
         return {"birth": set(birth), "survival": set(survival)}
     
+    @staticmethod
+    def _build_lookup_arrays(rule_lookup: dict) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert the rule lookup dict into arrays for the vectorized backend.
+        
+        Returns:
+            (table_1d, birth, survival) where table_1d[4*l + 2*c + r] is the
+            next state of a 1D neighborhood and birth[n] / survival[n] give the
+            next state of a dead / live cell with n live Moore neighbors.
+        """
+        table_1d = np.array(
+            [rule_lookup.get(tuple(map(int, f"{i:03b}")), 0) for i in range(8)],
+            dtype=np.int8
+        )
+        birth = np.zeros(9, dtype=np.int8)
+        survival = np.zeros(9, dtype=np.int8)
+        for n in rule_lookup.get("birth", ()):
+            birth[n] = 1
+        for n in rule_lookup.get("survival", ()):
+            survival[n] = 1
+        
+        return table_1d, birth, survival
+    
     def _initialize_grid(self) -> np.ndarray:
         """Initialize grid with random configuration."""
         if len(self.grid_size) == 1:
             # 1D CA
-            grid = np.random.randint(0, 2, size=self.grid_size[0])
+            grid = self.rng.integers(0, 2, size=self.grid_size[0])
         else:
             # 2D CA
-            grid = np.random.randint(0, 2, size=self.grid_size)
+            grid = self.rng.integers(0, 2, size=self.grid_size)
         
         return grid.astype(np.int8)
     
@@ -106,13 +163,19 @@ class CAEngine:
         Returns:
             Updated grid after one step
         """
-        if len(self.grid_size) == 1:
+        if self.backend == "vectorized":
+            if len(self.grid_size) == 1:
+                new_grid = self._step_1d_vectorized()
+            else:
+                new_grid = self._step_2d_vectorized()
+        elif len(self.grid_size) == 1:
             new_grid = self._step_1d()
         else:
             new_grid = self._step_2d()
         
         self.grid = new_grid
-        self.history.append(self.grid.copy())
+        self.t += 1
+        self._record()
         
         return self.grid
     
@@ -175,27 +238,136 @@ class CAEngine:
         
         return new_grid
     
-    def run(self, steps: int) -> list:
+    def _step_1d_vectorized(self) -> np.ndarray:
+        """
+        Evolve 1D elementary CA with a rule-table gather.
+        
+        Each neighborhood is packed into an index 4*left + 2*center + right.
+        Non-periodic boundaries read outside cells as 0, like `_step_1d`.
+        """
+        grid = self.grid
+        if self.boundary == "periodic":
+            left = np.roll(grid, 1)
+            right = np.roll(grid, -1)
+        else:
+            left = np.zeros_like(grid)
+            right = np.zeros_like(grid)
+            left[1:] = grid[:-1]
+            right[:-1] = grid[1:]
+        
+        index = (left.astype(np.intp) << 2) | (grid.astype(np.intp) << 1) | right
+        return self._rule_table_1d[index]
+    
+    def _step_2d_vectorized(self) -> np.ndarray:
+        """
+        Evolve 2D Life-like CA with a neighbor-count stencil.
+        
+        Non-periodic boundaries count outside cells as dead, like `_step_2d`.
+        """
+        if self.ca_type != "life":
+            raise ValueError(f"2D grids require ca_type='life', got: {self.ca_type}")
+        
+        grid = self.grid
+        if self.boundary == "periodic":
+            padded = np.pad(grid, 1, mode="wrap")
+        else:
+            padded = np.pad(grid, 1, mode="constant")
+        
+        h, w = grid.shape
+        neighbors = np.zeros((h, w), dtype=np.intp)
+        for di in range(3):
+            for dj in range(3):
+                if di == 1 and dj == 1:
+                    continue
+                neighbors += padded[di:di + h, dj:dj + w]
+        
+        return np.where(grid == 1, self._survival_table[neighbors], self._birth_table[neighbors])
+    
+    def _start_trajectory(self):
+        """Start a new trajectory from the current state."""
+        self.t = 0
+        self.steps_saved = 0
+        self._frames = self._history_policy.new_frames()
+        self.stream = None
+        if self.track_stream:
+            from ..metrics.streaming import StreamingMetrics
+            self.stream = StreamingMetrics()
+        self.cycle_detector = None
+        if self.track_attractor:
+            from ..metrics.memory import CycleDetector
+            self.cycle_detector = CycleDetector()
+        self._record()
+    
+    @property
+    def history(self) -> list:
+        """Recorded states (see history_mode), oldest first."""
+        return self._history_policy.as_list(self._frames)
+    
+    def _record(self):
+        """Record the current state according to the history policy."""
+        if self.stream is not None:
+            self.stream.update(self.grid)
+        if self.cycle_detector is not None:
+            self.cycle_detector.update(self.grid)
+        self._history_policy.record(self._frames, self.grid, self.t)
+    
+    @property
+    def attractor(self) -> Optional[Tuple[int, int]]:
+        """(transient, period) of the attractor once reached, else None."""
+        if self.cycle_detector is None:
+            return None
+        return self.cycle_detector.cycle
+    
+    def run(self, steps: int, until_attractor: bool = False, max_period: int = 16) -> list:
         """
         Run CA for specified number of steps.
         
         Args:
             steps: Number of time steps to evolve
+            until_attractor: Stop simulating once a fixed point or a cycle of
+                period <= max_period is reached; the remaining steps are
+                replayed from the cycle, so grid, history and stream end up
+                as after a full run. The count of skipped simulation steps
+                is added to `steps_saved`.
+            max_period: Longest period detected with until_attractor
             
         Returns:
-            History of all states (including initial state)
+            History of recorded states (all states including the initial
+            one with the default history_mode="full")
         """
-        for _ in range(steps):
-            self.step()
+        if not until_attractor:
+            for _ in range(steps):
+                self.step()
+            return self.history
+        
+        from ..metrics.memory import ShortCycleDetector
+        detector = ShortCycleDetector(max_period)
+        detector.update(self.grid)
+        
+        for k in range(1, steps + 1):
+            if detector.cycle is not None and self.stream is None \
+                    and self._history_policy.mode == "none":
+                # Nothing records intermediate frames: jump to the last one
+                self.grid = detector.state_at(steps).copy()
+                self.t += steps - k + 1
+                self.steps_saved += steps - k + 1
+                break
+            if detector.cycle is not None:
+                self.grid = detector.state_at(k).copy()
+                self.t += 1
+                self._record()
+                self.steps_saved += 1
+            else:
+                detector.update(self.step())
         
         return self.history
     
-    def reset(self, new_seed: Optional[int] = None):
+    def reset(self, new_seed: SeedLike = None):
         """Reset CA to new initial condition."""
         if new_seed is not None:
             self.seed = new_seed
-            np.random.seed(new_seed)
+            self.rng = make_rng(new_seed)
         
         self.grid = self._initialize_grid()
-        self.history = [self.grid.copy()]
+        self._start_trajectory()
 
@@ -88,6 +88,53 @@ def evolve_ca_vectorized(grid: np.ndarray, born: Set[int], survive: Set[int],
     return current_grid
 
 
+def step_ca_vectorized_stack(stack: np.ndarray, birth_table: np.ndarray,
+                             survival_table: np.ndarray) -> np.ndarray:
+    """
+    Évolution d'une pile de grilles (N, H, W) en une seule passe (toroïdal).
+    
+    Args:
+        stack: Pile de grilles 2D (0/1)
+        birth_table: Table (9,) : 1 si naissance pour ce nombre de voisins
+        survival_table: Table (9,) : 1 si survie pour ce nombre de voisins
+    
+    Returns:
+        Nouvelle pile après 1 step (mêmes grilles que step_ca_vectorized)
+    """
+    # Stencil 3×3 séparable : somme verticale puis horizontale (bords repliés)
+    rows = np.concatenate([stack[..., -1:, :], stack, stack[..., :1, :]], axis=-2)
+    column_sum = rows[..., :-2, :] + rows[..., 1:-1, :] + rows[..., 2:, :]
+    column_sum = np.concatenate([column_sum[..., -1:], column_sum, column_sum[..., :1]], axis=-1)
+    neighbor_count = (column_sum[..., :-2] + column_sum[..., 1:-1] + column_sum[..., 2:]
+                      - stack)
+    
+    # Table unique : index = état * 9 + voisins (naissance puis survie)
+    table = np.concatenate([birth_table, survival_table]).astype(int)
+    return table[stack * 9 + neighbor_count]
+
+
+def create_stack_rule_function_vectorized(born: list, survive: list) -> Callable:
+    """
+    Crée fonction règle sur piles de grilles.
+    
+    Args:
+        born: Liste valeurs naissance [0-8]
+        survive: Liste valeurs survie [0-8]
+    
+    Returns:
+        Fonction stack (N, H, W) -> new_stack
+    """
+    birth_table = np.zeros(9, dtype=np.int8)
+    survival_table = np.zeros(9, dtype=np.int8)
+    birth_table[list(born)] = 1
+    survival_table[list(survive)] = 1
+    
+    def stack_rule_func(stack):
+        return step_ca_vectorized_stack(stack, birth_table, survival_table)
+    
+    return stack_rule_func
+
+
 # Benchmark : comparaison vs Python loops
 def benchmark_ca_implementations(grid_size=(64,64), steps=100, seed=42):
     """
@@ -137,6 +184,8 @@ __all__ = [
     'step_ca_vectorized',
     'create_rule_function_vectorized',
     'evolve_ca_vectorized',
+    'step_ca_vectorized_stack',
+    'create_stack_rule_function_vectorized',
     'benchmark_ca_implementations'
 ]
 
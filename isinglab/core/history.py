@@ -0,0 +1,67 @@
+"""
+History retention policies for the CA and Ising engines.
+
+Engines record every new state through a policy, which decides which of
+those frames are actually kept (read back as the `engine.history` list):
+
+- "full": every frame (default, previous behavior)
+- "ring": only the last `size` frames (a bounded deque: O(1) per step)
+- "strided": every `size`-th frame (t = 0, size, 2*size, ...)
+- "none": no frames
+"""
+
+import numpy as np
+from collections import deque
+from typing import List, Optional, Union
+
+
+HISTORY_MODES = ("full", "ring", "strided", "none")
+
+
+Frames = Union[List[np.ndarray], deque]
+
+
+class HistoryPolicy:
+    """Decides which frames an engine keeps in its history."""
+    
+    def __init__(self, mode: str = "full", size: Optional[int] = None):
+        """
+        Args:
+            mode: Retention mode ("full", "ring", "strided", "none")
+            size: Number of frames kept ("ring") or stride between kept
+                frames ("strided"). Ignored by the other modes.
+        """
+        if mode not in HISTORY_MODES:
+            raise ValueError(f"Unknown history mode: {mode} (expected one of {HISTORY_MODES})")
+        if mode in ("ring", "strided") and (size is None or size < 1):
+            raise ValueError(f"History mode '{mode}' requires a positive history size, got {size}")
+        
+        self.mode = mode
+        self.size = size
+    
+    def new_frames(self) -> Frames:
+        """Empty frame store: a deque bounded to `size` in ring mode, else a list."""
+        if self.mode == "ring":
+            return deque(maxlen=self.size)
+        return []
+    
+    @staticmethod
+    def as_list(frames: Frames) -> List[np.ndarray]:
+        """Frames as a list (the store itself unless it is a ring)."""
+        return list(frames) if isinstance(frames, deque) else frames
+    
+    def record(self, history: Frames, state: np.ndarray, t: int):
+        """
+        Record the state reached at time step t.
+        
+        Args:
+            history: Frame store from new_frames (modified in place)
+            state: Current state (copied if kept)
+            t: Time step of the state (0 = initial condition)
+        """
+        if self.mode in ("full", "ring"):
+            # A ring deque drops its oldest frame by itself
+            history.append(state.copy())
+        elif self.mode == "strided":
+            if t % self.size == 0:
+                history.append(state.copy())
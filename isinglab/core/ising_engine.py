@@ -5,11 +5,17 @@ Provides deterministic/stochastic Ising evolution with:
 - Classical 2D Ising Hamiltonian
 - External field support
 - Glauber/Metropolis dynamics
+- Random-site or checkerboard (red/black sublattice) sweeps
 - Temperature control
 """
 
 import numpy as np
 from typing import Tuple, Optional
+from .history import HistoryPolicy
+from .rng import SeedLike, make_rng
+
+
+UPDATE_MODES = ("random", "checkerboard")
 
 
 class IsingEngine:
@@ -27,7 +33,11 @@ class IsingEngine:
         temperature: float = 1.0,
         dynamics: str = "glauber",
         boundary: str = "periodic",
-        seed: Optional[int] = None
+        seed: SeedLike = None,
+        update: str = "random",
+        history_mode: str = "full",
+        history_size: Optional[int] = None,
+        track_stream: Optional[bool] = None
     ):
         """
         Initialize Ising engine.
@@ -39,8 +49,27 @@ class IsingEngine:
             temperature: Temperature (in units of J/k_B)
             dynamics: Update rule ("glauber" or "metropolis")
             boundary: Boundary conditions ("periodic" or "fixed")
-            seed: Random seed for reproducibility
+            seed: Random seed for reproducibility (int, SeedSequence or
+                Generator); the engine draws from its own stream `self.rng`
+            update: Sweep scheme. "random" performs single-spin-flip attempts
+                at random sites (exact sequential statistics); "checkerboard"
+                updates each sublattice of the bipartite lattice in one
+                vectorized operation.
+            history_mode: Frames kept in `history` ("full", "ring",
+                "strided" or "none", see core.history)
+            history_size: Ring length or stride for "ring" / "strided"
+            track_stream: Feed every state to a StreamingMetrics accumulator
+                (`self.stream`). Defaults to True unless history_mode is "full".
         """
+        if update not in UPDATE_MODES:
+            raise ValueError(f"Unknown update mode: {update} (expected one of {UPDATE_MODES})")
+        if update == "checkerboard" and boundary == "periodic" and \
+                any(n % 2 for n in grid_size):
+            raise ValueError(
+                f"Checkerboard updates with periodic boundaries need even "
+                f"lattice dimensions, got {grid_size}"
+            )
+        
         self.grid_size = grid_size
         self.J = J
         self.h = h
@@ -48,17 +77,26 @@ class IsingEngine:
         self.dynamics = dynamics
         self.boundary = boundary
         self.seed = seed
+        self.update = update
         
-        if seed is not None:
-            np.random.seed(seed)
+        # Acceptance table cache, keyed by the parameters it depends on
+        self._acceptance_key = None
+        self._acceptance = None
+        
+        # Own random stream (global np.random in legacy seeding mode)
+        self.rng = make_rng(seed)
         
         # Initialize spins (+1 or -1)
         self.spins = self._initialize_spins()
-        self.history = [self.spins.copy()]
+        self._history_policy = HistoryPolicy(history_mode, history_size)
+        if track_stream is None:
+            track_stream = history_mode != "full"
+        self.track_stream = track_stream
+        self._start_trajectory()
         
     def _initialize_spins(self) -> np.ndarray:
         """Initialize spin configuration randomly."""
-        return np.random.choice([-1, 1], size=self.grid_size).astype(np.int8)
+        return self.rng.choice([-1, 1], size=self.grid_size).astype(np.int8)
     
     def _local_energy(self, i: int, j: int) -> float:
         """
@@ -93,16 +131,87 @@ class IsingEngine:
         """
         return 2.0 * self._local_energy(i, j)
     
+    def _acceptance_probability(self, dE: np.ndarray) -> np.ndarray:
+        """Flip acceptance probability for energy changes dE."""
+        if self.dynamics == "glauber":
+            # Glauber dynamics: p_accept = 1 / (1 + exp(β * ΔE))
+            if self.temperature > 0:
+                return 1.0 / (1.0 + np.exp(dE / self.temperature))
+            return (dE <= 0).astype(float)
+        elif self.dynamics == "metropolis":
+            # Metropolis: p_accept = min(1, exp(-β * ΔE))
+            if self.temperature > 0:
+                return np.minimum(1.0, np.exp(-dE / self.temperature))
+            return (dE <= 0).astype(float)
+        else:
+            raise ValueError(f"Unknown dynamics: {self.dynamics}")
+    
+    def acceptance_table(self) -> np.ndarray:
+        """
+        Precomputed flip acceptance probabilities.
+        
+        Returns:
+            Array of shape (2, 9) indexed by [(spin + 1) // 2, neighbor_sum + 4].
+            Periodic lattices only reach the 10 entries with even neighbor
+            sums; odd sums occur at the edges of fixed-boundary lattices.
+            The table is rebuilt whenever J, h, temperature or dynamics change.
+        """
+        key = (self.J, self.h, self.temperature, self.dynamics)
+        if self._acceptance_key != key:
+            spin = np.array([-1.0, 1.0])[:, None]
+            neighbor_sum = np.arange(-4, 5, dtype=float)[None, :]
+            # Same convention as _energy_change: ΔE = 2 * H_local
+            dE = 2.0 * (-self.J * spin * neighbor_sum - self.h * spin)
+            self._acceptance = self._acceptance_probability(dE)
+            self._acceptance_key = key
+        return self._acceptance
+    
+    def _neighbor_sum(self) -> np.ndarray:
+        """Sum of the 4 nearest neighbors of every site."""
+        spins = self.spins.astype(np.intp)
+        if self.boundary == "periodic":
+            padded = np.pad(spins, 1, mode="wrap")
+        else:
+            padded = np.pad(spins, 1, mode="constant")
+        
+        return (padded[:-2, 1:-1] + padded[2:, 1:-1]
+                + padded[1:-1, :-2] + padded[1:-1, 2:])
+    
+    def _sublattice_masks(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Boolean masks of the two checkerboard sublattices."""
+        h, w = self.grid_size
+        parity = np.add.outer(np.arange(h), np.arange(w)) % 2
+        return parity == 0, parity == 1
+    
+    def _checkerboard_sweep(self):
+        """Update both sublattices in turn, half the lattice per operation."""
+        table = self.acceptance_table()
+        for mask in self._sublattice_masks():
+            neighbor_sum = self._neighbor_sum()
+            p_accept = table[(self.spins + 1) // 2, neighbor_sum + 4]
+            flip = mask & (self.rng.random(self.grid_size) < p_accept)
+            self.spins[flip] *= -1
+    
     def step(self, n_flips: Optional[int] = None) -> np.ndarray:
         """
         Perform one Monte Carlo sweep (or n_flips attempts).
         
         Args:
-            n_flips: Number of flip attempts (default: grid size)
+            n_flips: Number of flip attempts (default: grid size). Only
+                supported by the "random" update mode; a checkerboard step
+                is always one full sweep.
             
         Returns:
             Updated spin configuration
         """
+        if self.update == "checkerboard":
+            if n_flips is not None:
+                raise ValueError("n_flips is only supported with update='random'")
+            self._checkerboard_sweep()
+            self.t += 1
+            self._record()
+            return self.spins
+        
         if n_flips is None:
             n_flips = self.spins.size
         
@@ -110,8 +219,8 @@ class IsingEngine:
         
         for _ in range(n_flips):
             # Random site
-            i = np.random.randint(h)
-            j = np.random.randint(w)
+            i = self.rng.integers(h)
+            j = self.rng.integers(w)
             
             # Compute energy change
             dE = self._energy_change(i, j)
@@ -133,10 +242,11 @@ class IsingEngine:
                 raise ValueError(f"Unknown dynamics: {self.dynamics}")
             
             # Flip spin if accepted
-            if np.random.rand() < p_accept:
+            if self.rng.random() < p_accept:
                 self.spins[i, j] *= -1
         
-        self.history.append(self.spins.copy())
+        self.t += 1
+        self._record()
         return self.spins
     
     def total_energy(self) -> float:
@@ -168,6 +278,27 @@ class IsingEngine:
         """Compute total magnetization."""
         return np.sum(self.spins) / self.spins.size
     
+    def _start_trajectory(self):
+        """Start a new trajectory from the current state."""
+        self.t = 0
+        self._frames = self._history_policy.new_frames()
+        self.stream = None
+        if self.track_stream:
+            from ..metrics.streaming import StreamingMetrics
+            self.stream = StreamingMetrics()
+        self._record()
+    
+    @property
+    def history(self) -> list:
+        """Recorded states (see history_mode), oldest first."""
+        return self._history_policy.as_list(self._frames)
+    
+    def _record(self):
+        """Record the current state according to the history policy."""
+        if self.stream is not None:
+            self.stream.update(self.spins)
+        self._history_policy.record(self._frames, self.spins, self.t)
+    
     def run(self, steps: int) -> list:
         """
         Run Ising dynamics for specified number of steps.
@@ -176,19 +307,19 @@ class IsingEngine:
             steps: Number of Monte Carlo sweeps
             
         Returns:
-            History of spin configurations
+            History of recorded spin configurations (see history_mode)
         """
         for _ in range(steps):
             self.step()
         
         return self.history
     
-    def reset(self, new_seed: Optional[int] = None):
+    def reset(self, new_seed: SeedLike = None):
         """Reset to new initial spin configuration."""
         if new_seed is not None:
             self.seed = new_seed
-            np.random.seed(new_seed)
+            self.rng = make_rng(new_seed)
         
         self.spins = self._initialize_spins()
-        self.history = [self.spins.copy()]
+        self._start_trajectory()
 
@@ -0,0 +1,125 @@
+"""
+Random number streams for the engines and metrics.
+
+Every engine and metric draws from its own np.random.Generator, built from
+a seed or from a SeedSequence child (SeedSequence.spawn). Streams are
+independent and reproducible, and no global state is touched, so
+evaluations can run concurrently in threads or as batches.
+
+The previous behavior (np.random.seed on the global state, then draws from
+the np.random functions) is kept behind a compatibility flag:
+
+    >>> from isinglab.core.rng import set_legacy_seeding
+    >>> set_legacy_seeding(True)   # same numbers as before Generator streams
+"""
+
+import numpy as np
+from typing import List, Optional, Union
+
+
+SeedLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+_LEGACY_SEEDING = False
+
+
+def set_legacy_seeding(enabled: bool) -> bool:
+    """
+    Switch between Generator streams (default) and global np.random seeding.
+
+    Args:
+        enabled: True to reproduce results of the global-seed implementation
+
+    Returns:
+        Previous setting
+    """
+    global _LEGACY_SEEDING
+    previous = _LEGACY_SEEDING
+    _LEGACY_SEEDING = bool(enabled)
+    return previous
+
+
+def legacy_seeding() -> bool:
+    """Whether global np.random seeding is active."""
+    return _LEGACY_SEEDING
+
+
+class LegacyRandom:
+    """
+    Generator-like facade over the global np.random functions.
+
+    Seeds the global state on construction (when a seed is given) and maps
+    integers / random / choice onto randint / random_sample / choice, which
+    draw exactly the numbers the global-seed implementation drew.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is not None:
+            np.random.seed(seed)
+
+    def integers(self, low, high=None, size=None):
+        return np.random.randint(low, high, size)
+
+    def random(self, size=None):
+        return np.random.random_sample(size)
+
+    def choice(self, a, size=None, replace=True):
+        return np.random.choice(a, size, replace)
+
+
+def make_rng(seed: SeedLike = None) -> Union[np.random.Generator, LegacyRandom]:
+    """
+    Random stream for one engine or metric.
+
+    Args:
+        seed: int, SeedSequence, Generator or None (fresh OS entropy)
+
+    Returns:
+        np.random.Generator, or a LegacyRandom facade in legacy mode (int or
+        None seeds only; SeedSequence/Generator seeds always get a Generator)
+    """
+    if _LEGACY_SEEDING and (seed is None or isinstance(seed, (int, np.integer))):
+        return LegacyRandom(seed)
+    return np.random.default_rng(seed)
+
+
+def spawn_seeds(seed: SeedLike, n: int) -> List[np.random.SeedSequence]:
+    """
+    n independent child seeds of `seed` (the first n children that
+    SeedSequence.spawn gives).
+
+    Unlike SeedSequence.spawn, the parent is left untouched: the same seed
+    always yields the same children. Children of an int seed are distinct
+    from the stream of the int itself, so `make_rng(seed)` and
+    `make_rng(spawn_seeds(seed, k)[i])` never overlap.
+    """
+    if isinstance(seed, np.random.Generator):
+        seed = seed.bit_generator.seed_seq
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [
+        np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (i,),
+                               pool_size=seed.pool_size)
+        for i in range(n)
+    ]
+
+
+def spawn_rngs(seed: SeedLike, n: int) -> List[Union[np.random.Generator, LegacyRandom]]:
+    """
+    n independent random streams derived from `seed`.
+
+    In legacy mode, returns n references to one global-state stream seeded
+    once, so draws happen in the same order as the sequential implementation.
+    """
+    if _LEGACY_SEEDING and (seed is None or isinstance(seed, (int, np.integer))):
+        return [LegacyRandom(seed)] * n
+    return [np.random.default_rng(child) for child in spawn_seeds(seed, n)]
+
+
+__all__ = [
+    'set_legacy_seeding',
+    'legacy_seeding',
+    'LegacyRandom',
+    'make_rng',
+    'spawn_seeds',
+    'spawn_rngs'
+]
@@ -0,0 +1,271 @@
+"""
+Persistent, content-addressed cache of evaluation results.
+
+Each result is pickled to its own file, named by the SHA-256 of the
+canonical JSON of everything the result depends on (rule, CA type, grid
+size, steps, seed, boundary, options and METRIC_SUITE_VERSION). Equal
+settings give equal keys, across processes and sessions, so repeated
+campaigns read known rules back instead of simulating them.
+
+Writers go through a temporary file in the target directory and os.replace,
+which is atomic: concurrent writers of one key (same content by
+construction) never leave a partial file, and readers see either no entry
+or a complete one. Reads refresh the file mtime; past max_entries or
+max_bytes, the least recently used files are removed.
+
+    >>> from isinglab.eval_cache import EvaluationCache, set_default_cache
+    >>> set_default_cache(EvaluationCache("results/cache"))
+    >>> evaluate_rule(rule=110, grid_size=64, steps=100, seed=1)  # simulated
+    >>> evaluate_rule(rule=110, grid_size=64, steps=100, seed=1)  # read back
+"""
+
+import os
+import json
+import pickle
+import hashlib
+import tempfile
+from pathlib import Path
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+# Bump whenever a metric changes: older entries are then never read again
+# (and age out of the LRU)
+METRIC_SUITE_VERSION = 1
+
+_DEFAULT_CACHE: Optional[MutableMapping] = None
+
+# Evictions go down to this fraction of the limits, so that a full cache
+# is not rescanned on every write
+_LOW_WATER = 0.9
+
+
+def cache_key(**fields) -> str:
+    """
+    Content address of a result: SHA-256 of the canonical JSON of `fields`.
+
+    Tuples and lists, numpy scalars and arrays, and sets (sorted) are
+    normalized, so equal settings always give the same key.
+    """
+    payload = json.dumps(fields, sort_keys=True, separators=(',', ':'), default=_jsonable)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _jsonable(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
+
+
+class EvaluationCache(MutableMapping):
+    """
+    On-disk mapping {key: result}, shared by processes and sessions.
+
+    Keys are the hex digests of `cache_key`; values are any picklable
+    object. `get` and item access count hits and misses (`in` does not).
+    Counters are per instance (per process).
+
+    Attributes:
+        directory: Root directory of the cache files
+        max_entries: Maximum number of entries (None: unbounded)
+        max_bytes: Maximum total size in bytes (None: unbounded)
+        hits, misses, writes, evictions: Counters
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = "results/cache",
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        # Estimated (entries, bytes), scanned on the first bounded write
+        self._usage: Optional[List[int]] = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    def __getitem__(self, key: str) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            raise KeyError(key) from None
+        except (EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            # Unreadable entry (e.g. written by an incompatible version)
+            self.misses += 1
+            self._remove(path)
+            raise KeyError(key) from None
+
+        self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        existed = path.exists()
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{key[:8]}-", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            size = os.path.getsize(tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            self._remove(Path(tmp))
+            raise
+
+        self.writes += 1
+        if self._usage is not None:
+            self._usage[0] += 0 if existed else 1
+            self._usage[1] += size
+        self._evict_if_needed()
+
+    def __delitem__(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self._path(key).exists()
+
+    def __iter__(self) -> Iterator[str]:
+        for _, _, path in self._entries():
+            yield path.stem
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            self._remove(path)
+        self._usage = None
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Counters, hit rate and current size of the cache."""
+        entries = self._entries()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries)
+        }
+
+    def _entries(self) -> List[Tuple[int, int, Path]]:
+        """(mtime_ns, size, path) of every entry, oldest first."""
+        entries = []
+        if not self.directory.exists():
+            return entries
+        for path in self.directory.glob('*/*.pkl'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # Evicted by another process
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        if self.max_entries is None and self.max_bytes is None:
+            return
+        if self._usage is None:
+            entries = self._entries()
+            self._usage = [len(entries), sum(size for _, size, _ in entries)]
+        if not self._over_limits(*self._usage, scale=1.0):
+            return
+
+        # Other processes also write: rescan, then drop the oldest entries
+        entries = self._entries()
+        n_entries, n_bytes = len(entries), sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if not self._over_limits(n_entries, n_bytes, scale=_LOW_WATER):
+                break
+            if self._remove(path):
+                self.evictions += 1
+            n_entries -= 1
+            n_bytes -= size
+        self._usage = [n_entries, n_bytes]
+
+    def _over_limits(self, n_entries: int, n_bytes: int, scale: float) -> bool:
+        return ((self.max_entries is not None and n_entries > int(self.max_entries * scale))
+                or (self.max_bytes is not None and n_bytes > int(self.max_bytes * scale)))
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+
+def set_default_cache(cache: Optional[MutableMapping]) -> Optional[MutableMapping]:
+    """
+    Cache used by evaluate_rule and MemoryExplorer when none is given.
+
+    Args:
+        cache: EvaluationCache (or any mapping), or None to disable
+
+    Returns:
+        Previous default cache
+    """
+    global _DEFAULT_CACHE
+    previous = _DEFAULT_CACHE
+    _DEFAULT_CACHE = cache
+    return previous
+
+
+def default_cache() -> Optional[MutableMapping]:
+    """Current default cache (None: disabled)."""
+    return _DEFAULT_CACHE
+
+
+def resolve_cache(cache: Union[None, bool, str, Path, MutableMapping]) -> Optional[MutableMapping]:
+    """
+    Cache designated by a `cache` argument.
+
+    None gives the default cache, False disables caching, a path opens an
+    EvaluationCache in that directory; mappings are used as is.
+    """
+    if cache is None:
+        return _DEFAULT_CACHE
+    if cache is False:
+        return None
+    if isinstance(cache, (str, Path)):
+        return EvaluationCache(cache)
+    return cache
+
+
+__all__ = [
+    'METRIC_SUITE_VERSION',
+    'cache_key',
+    'EvaluationCache',
+    'set_default_cache',
+    'default_cache',
+    'resolve_cache'
+]
@@ -0,0 +1,157 @@
+"""
+Plan d'évaluation — chaque trajectoire d'une règle n'est simulée qu'une fois.
+
+Les consommateurs (filtres durs, densité finale, grille finale de v3, tests
+fonctionnels capacity / robustness / basin) déclarent les trajectoires dont
+ils ont besoin : un état initial (grille aléatoire seedée, ou grille
+explicite) et un nombre de steps. Le plan déduplique les demandes,
+puis simule toutes les trajectoires distinctes d'une même taille de grille
+en une seule pile (N, H, W) jusqu'au plus grand nombre de steps demandé.
+Les échantillons ayant atteint un point fixe sont retirés de la pile : leurs
+états ultérieurs sont connus.
+
+Les états initiaux sont tirés de make_rng(seed) (core.rng) : l'état global
+np.random n'est pas touché. En mode legacy (set_legacy_seeding), ils sont
+tirés comme avant (np.random.seed(seed) puis np.random.rand), dans l'ordre
+des demandes : l'état global après le plan est le même qu'après les
+simulations séquentielles.
+
+Usage:
+    >>> plan = TrajectoryPlan([3], [2, 3])
+    >>> key = plan.seeded_initial((32, 32), seed=42)
+    >>> plan.request(key, 50)
+    >>> plan.state(key, 50).mean()
+"""
+
+import numpy as np
+from typing import Dict, Hashable, List, Tuple
+
+from .core.ca_vectorized import create_stack_rule_function_vectorized
+from .core.rng import legacy_seeding, make_rng
+
+
+class TrajectoryPlan:
+    """
+    Trajectoires partagées d'une règle Life-like (bords toroïdaux).
+
+    Attributes:
+        n_requests: Nombre de demandes (key, steps) reçues
+        n_simulated: Steps de grille effectivement simulés
+        steps_run: Steps simulés par trajectoire {key: steps}
+    """
+
+    def __init__(self, born: List[int], survive: List[int]):
+        self.born = list(born)
+        self.survive = list(survive)
+        self._stack_func = create_stack_rule_function_vectorized(born, survive)
+
+        self._initials: Dict[Hashable, np.ndarray] = {}
+        self._pending: Dict[Hashable, set] = {}
+        self._states: Dict[Tuple[Hashable, int], np.ndarray] = {}
+        self.n_requests = 0
+        self.n_simulated = 0
+        self.steps_run: Dict[Hashable, int] = {}
+
+    def seeded_initial(self, grid_size: Tuple[int, int], seed: int,
+                       density: float = 0.3) -> Hashable:
+        """
+        Clé de la grille initiale aléatoire seedée (trajectoire simulée une seule fois).
+
+        Args:
+            grid_size: Taille (H, W)
+            seed: Seed du tirage (make_rng)
+            density: Probabilité d'une cellule vivante
+
+        Returns:
+            Clé à passer à request() / state()
+        """
+        key = ('seeded', tuple(grid_size), seed, density)
+        # En mode legacy, tirage refait à chaque appel (bon marché) : l'état
+        # global np.random suit exactement les appels séquentiels
+        if key not in self._initials or legacy_seeding():
+            grid = (make_rng(seed).random(tuple(grid_size)) < density).astype(int)
+            self._initials.setdefault(key, grid)
+        return key
+
+    def initial(self, grid: np.ndarray) -> Hashable:
+        """
+        Clé d'une grille initiale explicite (même contenu, même trajectoire).
+
+        Args:
+            grid: Grille (H, W) de 0/1
+
+        Returns:
+            Clé à passer à request() / state()
+        """
+        grid = np.asarray(grid, dtype=int)
+        key = ('grid', grid.shape, grid.tobytes())
+        self._initials.setdefault(key, grid.copy())
+        return key
+
+    def request(self, key: Hashable, steps: int):
+        """Déclare le besoin de l'état au step `steps` de la trajectoire `key`."""
+        self.n_requests += 1
+        if (key, steps) not in self._states:
+            self._pending.setdefault(key, set()).add(steps)
+
+    def state(self, key: Hashable, steps: int) -> np.ndarray:
+        """
+        État au step `steps` de la trajectoire `key` (simule si nécessaire).
+
+        Returns:
+            Grille (H, W) ; ne pas modifier en place (partagée)
+        """
+        if (key, steps) not in self._states:
+            if steps not in self._pending.get(key, ()):
+                self.request(key, steps)
+            self.run()
+        return self._states[(key, steps)]
+
+    def run(self):
+        """Simule les demandes en attente, une pile par taille de grille."""
+        by_shape: Dict[Tuple[int, ...], List[Hashable]] = {}
+        for key in self._pending:
+            by_shape.setdefault(self._initials[key].shape, []).append(key)
+
+        for keys in by_shape.values():
+            self._run_stack(keys)
+        self._pending = {}
+
+    def _run_stack(self, keys: List[Hashable]):
+        """Évolue une pile de trajectoires jusqu'à leur plus grand step demandé."""
+        wanted = [sorted(self._pending[key]) for key in keys]
+        horizons = np.array([steps[-1] for steps in wanted])
+        current = np.stack([self._initials[key] for key in keys])
+        converged = np.zeros(len(keys), dtype=bool)
+
+        self._record(keys, wanted, current, np.arange(len(keys)), 0)
+
+        for t in range(int(horizons.max())):
+            active = np.flatnonzero(~converged & (t < horizons))
+            if len(active) == 0:
+                break
+
+            next_states = self._stack_func(current[active])
+            self.n_simulated += len(active)
+            for k in active:
+                self.steps_run[keys[k]] = self.steps_run.get(keys[k], 0) + 1
+            is_fixed = np.all(next_states == current[active], axis=(1, 2))
+            current[active] = next_states
+
+            self._record(keys, wanted, current, active, t + 1)
+
+            # Point fixe : tous les steps demandés restants valent cet état
+            for k in active[is_fixed]:
+                converged[k] = True
+                for steps in wanted[k]:
+                    if steps > t + 1:
+                        self._states[(keys[k], steps)] = current[k].copy()
+
+    def _record(self, keys, wanted, current, active, t):
+        """Mémorise les états des échantillons actifs demandés au step t."""
+        for k in active:
+            if t in wanted[k]:
+                self._states[(keys[k], t)] = current[k].copy()
+
+
+__all__ = ['TrajectoryPlan']
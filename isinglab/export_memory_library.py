@@ -14,6 +14,7 @@ from datetime import datetime
 from typing import Dict, List
 
 from .metrics.functional import infer_module_profile
+from .rules.store import load_rules
 
 
 def load_meta_memory(path: str = 'results/meta_memory.json') -> List[Dict]:
@@ -23,9 +24,7 @@ def load_meta_memory(path: str = 'results/meta_memory.json') -> List[Dict]:
         print(f"[WARN] {path} n'existe pas.")
         return []
     
-    with open(meta_path, encoding='utf-8') as fh:
-        data = json.load(fh)
-    return data.get('rules', [])
+    return load_rules(meta_path)
 
 
 def load_hof_rules(path: str = 'isinglab/rules/hof_rules.json') -> List[Dict]:
@@ -35,9 +34,7 @@ def load_hof_rules(path: str = 'isinglab/rules/hof_rules.json') -> List[Dict]:
         print(f"[WARN] {path} n'existe pas.")
         return []
     
-    with open(hof_path, encoding='utf-8') as fh:
-        data = json.load(fh)
-    return data.get('rules', [])
+    return load_rules(hof_path)
 
 
 def compute_diversity_signature(born: List, survive: List) -> str:
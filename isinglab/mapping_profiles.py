@@ -158,24 +158,56 @@ def get_target_profile_for_system(
     return profile
 
 
-def suggest_ca_rules_for_profile(profile: Dict, n_suggestions: int = 10) -> List[int]:
+def suggest_ca_rules_for_profile(
+    profile: Dict,
+    n_suggestions: int = 10,
+    ca_type: str = "elementary",
+    atlas=None
+) -> List[int]:
     """
-    Suggest CA rules to explore based on target profile (HEURISTIC).
+    Suggest CA rules to explore based on target profile.
     
-    ⚠️ This is a PLACEHOLDER heuristic. In practice, you would:
-        1. Pre-compute metrics for all 256 elementary rules
-        2. Filter by target metric ranges
-        3. Return top matches
+    With a rule atlas (see isinglab.rule_atlas: metrics precomputed for
+    every rule), returns the rules whose metrics fall in the profile's
+    target ranges, closest to the range midpoints first. If too few rules
+    match, the nearest rules outside the ranges complete the list.
     
-    For now, returns random suggestions based on regime hints.
+    Without an atlas, falls back to a HEURISTIC: random samples of
+    elementary rules known for the suggested regimes. Other rule families
+    have no heuristic and need an atlas.
     
     Args:
         profile: Target profile dict (from get_target_profile_for_system)
         n_suggestions: Number of rules to suggest
+        ca_type: Rule family ("elementary", "life")
+        atlas: RuleAtlas to query. None opens the default atlas of
+            `ca_type` if it was built; False forces the heuristic
         
     Returns:
         List of suggested rule numbers
+        
+    Raises:
+        ValueError: No usable atlas and `ca_type` is not "elementary"
     """
+    if atlas is None:
+        from .rule_atlas import load_atlas
+        atlas = load_atlas(ca_type)
+    
+    if atlas is not None and atlas is not False and atlas.n_evaluated:
+        ranges = profile.get("target_metrics", {})
+        targets = {metric: (low + high) / 2.0 for metric, (low, high) in ranges.items()}
+        suggestions = atlas.nearest(targets, k=n_suggestions, ranges=ranges).tolist()
+        if len(suggestions) < n_suggestions:
+            nearest = atlas.nearest(targets, k=2 * n_suggestions).tolist()
+            suggestions += [rule for rule in nearest if rule not in suggestions]
+        return suggestions[:n_suggestions]
+    
+    if ca_type != "elementary":
+        raise ValueError(
+            f"No rule heuristic for ca_type={ca_type!r}: build its rule atlas "
+            f"(python -m isinglab.rule_atlas --ca-type {ca_type}) or pass the rules to explore"
+        )
+    
     regimes = profile.get("suggested_regimes", [])
     
     # Heuristic rule suggestions (based on known CA behaviors)
@@ -9,11 +9,11 @@ import pandas as pd
 import numpy as np
 
 from .api import evaluate_rule
+from .core.rng import legacy_seeding
+from .eval_cache import METRIC_SUITE_VERSION, cache_key, resolve_cache
 from .rules import add_or_update_rule
 from .metrics.functional import (
-    compute_memory_capacity,
-    compute_robustness_to_noise,
-    compute_basin_size,
+    compute_functional_batch,
     compute_functional_score
 )
 
@@ -41,9 +41,17 @@ def life_rule_to_int(born: List[int], survive: List[int]) -> int:
 class MemoryExplorer:
     """Helper class to explore CA rules and record metrics."""
 
-    def __init__(self, output_dir: str = "results/scans"):
+    def __init__(self, output_dir: str = "results/scans", cache=None):
+        """
+        Args:
+            output_dir: Dossier des résultats
+            cache: Cache persistant des évaluations (voir isinglab.eval_cache) :
+                None = cache par défaut, False = désactivé, chemin = dossier
+                d'un EvaluationCache
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = resolve_cache(cache) if isinstance(cache, (str, Path)) else cache
 
     def _log(self, message: str):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -97,26 +105,36 @@ class MemoryExplorer:
         self._log(f"Generated {len(neighbors)} neighbors of {base_rule}")
         return neighbors
 
-    def _evaluate_life_rule(self, notation: str, born: List[int], survive: List[int], grid_size: Tuple[int, int], steps: int, seed: int) -> Dict:
+    def _evaluate_life_rule(self, notation: str, born: List[int], survive: List[int], grid_size: Tuple[int, int], steps: int, seed: int, cache=None) -> Dict:
         rule_int = life_rule_to_int(born, survive)
         metrics = evaluate_rule(
             rule=rule_int,
             grid_size=grid_size,
             steps=steps,
             seed=seed,
-            ca_type='life'
+            ca_type='life',
+            cache=self.cache if cache is None else cache
         )
         metrics['notation'] = notation
         metrics['born'] = born
         metrics['survive'] = survive
         return metrics
 
-    def _create_rule_function(self, born: List[int], survive: List[int], vectorized=True):
+    def _create_rule_function(self, born: List[int], survive: List[int], vectorized=True,
+                              bitpacked=False, stack=False):
         """Crée une fonction CA à partir de born/survive pour les tests fonctionnels."""
         born_set = set(born)
         survive_set = set(survive)
         
-        if vectorized:
+        if stack:
+            # Version pile (N, H, W) pour compute_functional_batch
+            from isinglab.core.ca_vectorized import create_stack_rule_function_vectorized
+            return create_stack_rule_function_vectorized(born, survive)
+        elif bitpacked:
+            # Version bit-packed (64 cellules par mot uint64)
+            from isinglab.core.ca_bitpacked import create_rule_function_bitpacked
+            return create_rule_function_bitpacked(born, survive)
+        elif vectorized:
             # Version vectorisée (gain 29×)
             from isinglab.core.ca_vectorized import step_ca_vectorized
             
@@ -161,25 +179,54 @@ class MemoryExplorer:
         seed: int = 42,
         compute_functional: bool = True
     ) -> Dict:
+        """
+        Métriques de base (+ fonctionnelles) d'une règle Life-like.
+        
+        Avec un cache d'évaluation, une règle déjà évaluée (même règle,
+        quelle que soit sa notation, mêmes réglages) est relue sans
+        simulation ; seuls notation, source et timestamp sont renouvelés.
+        Les métriques fonctionnelles tirent dans un flux issu de `seed` :
+        une règle réévaluée retrouve les mêmes patterns. Les erreurs ne sont
+        pas mises en cache. Seul le résultat complet est mis en cache :
+        l'évaluation de base n'est pas stockée une seconde fois.
+        """
         notation = rule.get('notation')
         born = rule.get('born')
         survive = rule.get('survive')
         if born is None or survive is None:
             born, survive = parse_notation(notation)
+        
+        cache = resolve_cache(self.cache)
+        key = None
+        if cache is not None:
+            key = self.candidate_key(born, survive, grid_size, steps, seed,
+                                     kind='evaluate_candidate',
+                                     compute_functional=compute_functional)
+            cached = cache.get(key)
+            if cached is not None:
+                cached = dict(cached)
+                cached.update(notation=notation, born=born, survive=survive,
+                              source=rule.get('source', 'unknown'),
+                              timestamp=datetime.now().isoformat())
+                return cached
         try:
             # Métriques de base
-            metrics = self._evaluate_life_rule(notation, born, survive, grid_size, steps, seed)
+            metrics = self._evaluate_life_rule(notation, born, survive, grid_size, steps, seed,
+                                               cache=False)
             metrics['source'] = rule.get('source', 'unknown')
             metrics['timestamp'] = datetime.now().isoformat()
             
             # v2.1: Métriques fonctionnelles
             if compute_functional:
-                rule_func = self._create_rule_function(born, survive)
+                stack_func = self._create_rule_function(born, survive, stack=True)
                 
-                # Tests fonctionnels (plus légers que l'évaluation complète)
-                capacity_result = compute_memory_capacity(rule_func, grid_size=(16, 16), n_patterns=5, steps=30)
-                robustness_result = compute_robustness_to_noise(rule_func, grid_size=(16, 16), noise_level=0.1, n_trials=3, steps=30)
-                basin_result = compute_basin_size(rule_func, grid_size=(16, 16), n_samples=5, steps=20)
+                # Tests fonctionnels (plus légers que l'évaluation complète),
+                # patterns et essais évolués en une seule pile
+                capacity_result, robustness_result, basin_result = compute_functional_batch(
+                    stack_func, grid_size=(16, 16), n_patterns=5, n_trials=3, n_samples=5,
+                    noise_level=0.1, capacity_steps=30, robustness_steps=30, basin_steps=20,
+                    seed=seed
+                )
                 
                 # Stocker résultats
                 metrics['capacity_score'] = capacity_result['capacity_score']
@@ -192,6 +239,8 @@ class MemoryExplorer:
                     capacity_result, robustness_result, basin_result
                 )
             
+            if key is not None:
+                cache[key] = dict(metrics)
             return metrics
         except Exception as exc:
             self._log(f"Error evaluating {notation}: {exc}")
@@ -204,6 +253,16 @@ class MemoryExplorer:
                 'timestamp': datetime.now().isoformat()
             }
 
+    @staticmethod
+    def candidate_key(born: List[int], survive: List[int], grid_size: Tuple[int, int],
+                      steps: int, seed: int, kind: str, **options) -> str:
+        """Clé de cache d'une évaluation de candidat (règle B/S canonique)."""
+        return cache_key(
+            kind=kind, rule=life_rule_to_int(born, survive), grid_size=tuple(grid_size),
+            steps=steps, seed=seed, legacy_seeding=legacy_seeding(),
+            version=METRIC_SUITE_VERSION, **options
+        )
+
     def grid_sweep(self, rule: Dict, grid_sizes: List[Tuple[int, int]] = None,
                    steps: int = 100, seed: int = 42) -> Dict:
         """
@@ -1,16 +1,21 @@
 """Meta-learner components used by ClosedLoopAGI."""
 
 from .memory_aggregator import MemoryAggregator
-from .feature_engineering import extract_rule_features, features_to_vector, extract_dataset_features
+from .feature_engineering import (
+    extract_rule_features, features_to_vector, extract_feature_matrix, extract_dataset_features
+)
 from .meta_model import MetaModel, train_meta_model
 from .selector import CandidateSelector
+from .rule_registry import RuleRegistry
 
 __all__ = [
     'MemoryAggregator',
     'extract_rule_features',
     'features_to_vector',
+    'extract_feature_matrix',
     'extract_dataset_features',
     'MetaModel',
     'train_meta_model',
     'CandidateSelector',
+    'RuleRegistry',
 ]
@@ -4,13 +4,12 @@ Gère la mémoire dynamique avec HoF pendant la découverte.
 Compatible avec l'API attendue par ClosedLoopAGIv3.
 """
 
-import json
 from pathlib import Path
 from typing import List, Dict
-from datetime import datetime
 import numpy as np
 
 from isinglab.rules import load_hof_rules, add_or_update_rule, save_hof_rules
+from isinglab.rules.store import RuleStore
 
 
 def convert_numpy_types(obj):
@@ -39,7 +38,9 @@ class DynamicMemoryManager:
     def __init__(self, memory_path='results/agi_memory.json', hof_path='isinglab/rules/hof_rules.json'):
         self.memory_path = Path(memory_path)
         self.hof_path = Path(hof_path)
-        self.memory_rules: List[Dict] = []
+        # Mémoire indexée par notation, persistée par journal (isinglab.rules.store)
+        self._store = RuleStore(self.memory_path, autoload=False)
+        self.memory_rules: List[Dict] = self._store.rules
         self.hof_rules: List[Dict] = []
         self.hof_config = {
             'max_size': 25,
@@ -51,36 +52,20 @@ class DynamicMemoryManager:
     
     def aggregate_memory(self):
         """Charge la mémoire existante + HoF."""
-        # Charger mémoire
-        if self.memory_path.exists():
-            with open(self.memory_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.memory_rules = data.get('rules', [])
-        else:
-            self.memory_rules = []
+        # Charger mémoire (snapshot + journal)
+        self._store.load()
+        self.memory_rules = self._store.rules
         
         # Charger HoF
         self.hof_rules = load_hof_rules()
     
     def add_or_update_rule(self, rule: Dict):
         """Ajoute ou met à jour une règle dans la mémoire."""
-        notation = rule.get('notation')
-        if not notation:
+        if not rule.get('notation'):
             return
         
-        # Chercher si existe
-        existing_idx = None
-        for i, r in enumerate(self.memory_rules):
-            if r.get('notation') == notation:
-                existing_idx = i
-                break
-        
-        if existing_idx is not None:
-            # Mise à jour
-            self.memory_rules[existing_idx].update(rule)
-        else:
-            # Ajout
-            self.memory_rules.append(rule)
+        # Index par notation : mise à jour ou ajout en O(1)
+        self._store.upsert(rule)
     
     def update_hof(self):
         """Met à jour le Hall of Fame basé sur les règles en mémoire."""
@@ -102,34 +87,19 @@ class DynamicMemoryManager:
         self.hof_rules = candidates_sorted[:max_size]
     
     def save_memory(self):
-        """Sauvegarde la mémoire (convertit types NumPy)."""
-        self.memory_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        data = {
-            'meta': {
-                'updated': datetime.now().isoformat(),
-                'count': len(self.memory_rules)
-            },
-            'rules': convert_numpy_types(self.memory_rules)
-        }
+        """
+        Sauvegarde la mémoire (convertit types NumPy).
         
-        with open(self.memory_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        Seules les règles ajoutées ou modifiées depuis la dernière sauvegarde
+        sont écrites (journal append-only, compacté périodiquement).
+        """
+        self.memory_path.parent.mkdir(parents=True, exist_ok=True)
+        self._store.flush()
     
     def save_hof(self):
-        """Sauvegarde le HoF (convertit types NumPy)."""
-        # Convertir en format HoF
-        hof_data = {
-            'meta': {
-                'updated': datetime.now().isoformat(),
-                'count': len(self.hof_rules)
-            },
-            'rules': convert_numpy_types(self.hof_rules)
-        }
-        
-        self.hof_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.hof_path, 'w', encoding='utf-8') as f:
-            json.dump(hof_data, f, indent=2)
+        """Sauvegarde le HoF (convertit types NumPy), par écriture atomique."""
+        with RuleStore(self.hof_path, autoload=False) as store:
+            store.replace(convert_numpy_types(self.hof_rules))
 
 
 __all__ = ['DynamicMemoryManager']
@@ -73,6 +73,51 @@ def features_to_vector(features: Dict[str, float]) -> np.ndarray:
     return np.array([features.get(name, 0.0) for name in FEATURE_NAMES], dtype=float)
 
 
+def extract_feature_matrix(codes: np.ndarray) -> np.ndarray:
+    """
+    Feature matrix (N, len(FEATURE_NAMES)) of N rules given as 18-bit codes.
+
+    Bits 0-8 are the birth counts and bits 9-17 the survival counts (the
+    rule_registry encoding). Rows equal features_to_vector(extract_rule_features(...))
+    for the same rules, without building one dict per rule.
+    """
+    codes = np.asarray(codes, dtype=np.int64).reshape(-1)
+    bits = (codes[:, None] >> np.arange(18)) & 1
+    born, survive = bits[:, :9].astype(float), bits[:, 9:].astype(float)
+    counts = np.arange(9)
+
+    born_count = born.sum(axis=1)
+    survive_count = survive.sum(axis=1)
+    has_born = born_count > 0
+    has_survive = survive_count > 0
+    safe_born = np.where(has_born, born_count, 1.0)
+    safe_survive = np.where(has_survive, survive_count, 1.0)
+
+    def value_range(mask, present):
+        low = np.argmax(mask, axis=1)
+        high = 8 - np.argmax(mask[:, ::-1], axis=1)
+        return np.where(present, high - low, 0)
+
+    born_parity = (born @ (counts % 2)) / safe_born
+    survive_parity = (survive @ (counts % 2)) / safe_survive
+    parity_alignment = np.where(has_born & has_survive,
+                                1.0 - np.abs(born_parity - survive_parity), 0.0)
+
+    matrix = np.empty((len(codes), len(FEATURE_NAMES)))
+    matrix[:, 0] = born_count
+    matrix[:, 1] = survive_count
+    matrix[:, 2] = born_count / 9.0
+    matrix[:, 3] = survive_count / 9.0
+    matrix[:, 4] = (born_count + survive_count) / 18.0
+    matrix[:, 5] = (born * survive).sum(axis=1) / 9.0
+    matrix[:, 6] = value_range(born, has_born) / 8.0
+    matrix[:, 7] = value_range(survive, has_survive) / 8.0
+    matrix[:, 8] = parity_alignment
+    matrix[:, 9] = np.where(has_born, born[:, :3].sum(axis=1) / safe_born, 0.0)
+    matrix[:, 10] = np.where(has_survive, survive[:, 5:].sum(axis=1) / safe_survive, 0.0)
+    return matrix
+
+
 def extract_dataset_features(meta_memory: List[Dict]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
     X: List[np.ndarray] = []
     y: List[int] = []
@@ -113,5 +158,6 @@ __all__ = [
     'FEATURE_NAMES',
     'extract_rule_features',
     'features_to_vector',
+    'extract_feature_matrix',
     'extract_dataset_features'
 ]
@@ -5,28 +5,48 @@ Rejette rules triviales AVANT promotion HoF.
 """
 
 import numpy as np
-from typing import Tuple
+from typing import List, Optional, Tuple
 from isinglab.core.rule_ops import parse_notation
-from isinglab.core.ca_vectorized import evolve_ca_vectorized
+from isinglab.evaluation_plan import TrajectoryPlan
 
 
-def quick_density_test(notation: str, grid_size=(32, 32), steps=50, seed=42) -> float:
+def make_plan(notation: str) -> TrajectoryPlan:
+    """Plan de trajectoires partagé par les filtres d'une même règle."""
+    born, survive = parse_notation(notation)
+    return TrajectoryPlan(born, survive)
+
+
+def quick_density_test(notation: str, grid_size=(32, 32), steps=50, seed=42,
+                       plan: Optional[TrajectoryPlan] = None) -> float:
     """
     Test rapide densité finale d'une règle.
     
+    plan : TrajectoryPlan de la règle, pour réutiliser une trajectoire déjà
+    simulée (même grid_size, steps, seed).
+    
     Returns: final_density (0-1)
     """
-    born, survive = parse_notation(notation)
-    
-    np.random.seed(seed)
-    grid = (np.random.rand(*grid_size) < 0.3).astype(int)
+    if plan is None:
+        plan = make_plan(notation)
     
-    grid_final = evolve_ca_vectorized(grid, set(born), set(survive), steps)
+    key = plan.seeded_initial(grid_size, seed)
+    return plan.state(key, steps).mean()
+
+
+def _final_densities(notation: str, n_tests: int,
+                     plan: Optional[TrajectoryPlan] = None) -> List[float]:
+    """Densités finales des seeds 42..42+n_tests-1, simulées en une pile."""
+    if plan is None:
+        plan = make_plan(notation)
     
-    return grid_final.mean()
+    keys = [plan.seeded_initial((32, 32), 42 + i) for i in range(n_tests)]
+    for key in keys:
+        plan.request(key, 50)
+    return [plan.state(key, 50).mean() for key in keys]
 
 
-def is_quasi_death_rule(notation: str, threshold=0.05, n_tests=2) -> Tuple[bool, str]:
+def is_quasi_death_rule(notation: str, threshold=0.05, n_tests=2,
+                        plan: Optional[TrajectoryPlan] = None) -> Tuple[bool, str]:
     """
     Détecte quasi-death rules (convergence vers vide).
     
@@ -34,15 +54,12 @@ def is_quasi_death_rule(notation: str, threshold=0.05, n_tests=2) -> Tuple[bool,
         notation: Règle à tester
         threshold: Densité minimale acceptable
         n_tests: Nombre de tests avec seeds différents
+        plan: TrajectoryPlan partagé (trajectoires communes aux filtres)
     
     Returns:
         (is_trivial, reason)
     """
-    densities = []
-    
-    for i in range(n_tests):
-        density = quick_density_test(notation, seed=42+i)
-        densities.append(density)
+    densities = _final_densities(notation, n_tests, plan)
     
     avg_density = np.mean(densities)
     
@@ -52,18 +69,15 @@ def is_quasi_death_rule(notation: str, threshold=0.05, n_tests=2) -> Tuple[bool,
     return False, "Pass"
 
 
-def is_saturation_rule(notation: str, threshold=0.95, n_tests=2) -> Tuple[bool, str]:
+def is_saturation_rule(notation: str, threshold=0.95, n_tests=2,
+                       plan: Optional[TrajectoryPlan] = None) -> Tuple[bool, str]:
     """
     Détecte saturation rules (convergence vers plein).
     
     Returns:
         (is_trivial, reason)
     """
-    densities = []
-    
-    for i in range(n_tests):
-        density = quick_density_test(notation, seed=42+i)
-        densities.append(density)
+    densities = _final_densities(notation, n_tests, plan)
     
     avg_density = np.mean(densities)
     
@@ -73,22 +87,29 @@ def is_saturation_rule(notation: str, threshold=0.95, n_tests=2) -> Tuple[bool,
     return False, "Pass"
 
 
-def apply_hard_filters(notation: str) -> Tuple[bool, str]:
+def apply_hard_filters(notation: str, plan: Optional[TrajectoryPlan] = None) -> Tuple[bool, str]:
     """
     Applique tous les filtres durs.
     
+    Les deux filtres lisent les mêmes trajectoires (seeds 42, 43), simulées
+    une seule fois via un TrajectoryPlan (celui passé en argument, ou un plan
+    propre à l'appel).
+    
     Returns:
         (pass_filters, reason)
         
     Usage dans selector AVANT évaluation complète.
     """
+    if plan is None:
+        plan = make_plan(notation)
+    
     # Filtre 1: Quasi-death
-    is_death, reason = is_quasi_death_rule(notation, threshold=0.05, n_tests=2)
+    is_death, reason = is_quasi_death_rule(notation, threshold=0.05, n_tests=2, plan=plan)
     if is_death:
         return False, reason
     
     # Filtre 2: Saturation
-    is_sat, reason = is_saturation_rule(notation, threshold=0.95, n_tests=2)
+    is_sat, reason = is_saturation_rule(notation, threshold=0.95, n_tests=2, plan=plan)
     if is_sat:
         return False, reason
     
@@ -97,6 +118,7 @@ def apply_hard_filters(notation: str) -> Tuple[bool, str]:
 
 
 __all__ = [
+    'make_plan',
     'quick_density_test',
     'is_quasi_death_rule',
     'is_saturation_rule',
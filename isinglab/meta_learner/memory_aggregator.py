@@ -7,6 +7,8 @@ from typing import List, Dict
 
 import pandas as pd
 
+from ..rules.store import RuleStore, load_rules
+
 
 class MemoryAggregator:
     """Collecte Hall of Fame, logs d'exploration et méta-mémoire consolidée."""
@@ -21,6 +23,8 @@ class MemoryAggregator:
         self.scans_dir = Path(scans_dir)
         self.output_path = Path(output_path)
         self.meta_memory: List[Dict] = []
+        # Méta-mémoire persistée par journal (voir isinglab.rules.store)
+        self.store = RuleStore(self.output_path, autoload=False)
 
     # ------------------------------------------------------------------
     # Chargement des sources
@@ -28,9 +32,7 @@ class MemoryAggregator:
     def load_hall_of_fame(self) -> List[Dict]:
         if not self.hof_path.exists():
             return []
-        with open(self.hof_path, encoding='utf-8') as fh:
-            data = json.load(fh)
-        return data.get('rules', [])
+        return load_rules(self.hof_path)
 
     def load_exploration_logs(self) -> List[Dict]:
         if not self.scans_dir.exists():
@@ -100,31 +102,30 @@ class MemoryAggregator:
         if not self.output_path.exists():
             return []
         try:
-            with open(self.output_path, encoding='utf-8') as fh:
-                payload = json.load(fh)
-            return payload.get('rules', [])
+            self.store.refresh()
         except Exception:
             return []
+        return list(self.store.rules)
 
     def aggregate(self) -> List[Dict]:
         """Agrège toutes les sources : meta_memory existant + HoF + exploration logs."""
         self.meta_memory = []
-        seen = set()
+        seen = {}
 
         # 1. Charger PRIORITAIREMENT la méta-mémoire existante
         for entry in self.load_existing_meta_memory():
             self.meta_memory.append(entry)
-            seen.add(entry['notation'])
+            seen.setdefault(entry['notation'], entry)
 
         # 2. Enrichir avec le Hall of Fame
         for entry in self.load_hall_of_fame():
             normalized = self.normalize_rule_entry(entry, 'hall_of_fame')
             if normalized['notation'] not in seen:
                 self.meta_memory.append(normalized)
-                seen.add(normalized['notation'])
+                seen[normalized['notation']] = normalized
             else:
                 # enrichir l'existant
-                existing = next((r for r in self.meta_memory if r['notation'] == normalized['notation']), None)
+                existing = seen[normalized['notation']]
                 if existing:
                     existing['scores'].update(normalized['scores'])
                     existing['labels'] = sorted(set(existing['labels']) | set(normalized['labels']))
@@ -137,10 +138,10 @@ class MemoryAggregator:
             normalized = self.normalize_rule_entry(entry, 'exploration_log')
             if normalized['notation'] not in seen:
                 self.meta_memory.append(normalized)
-                seen.add(normalized['notation'])
+                seen[normalized['notation']] = normalized
             else:
                 # enrichir l'existant avec nouveaux scores
-                existing = next((r for r in self.meta_memory if r['notation'] == normalized['notation']), None)
+                existing = seen[normalized['notation']]
                 if existing:
                     existing['scores'].update(normalized['scores'])
                     existing['labels'] = sorted(set(existing['labels']) | set(normalized['labels']))
@@ -151,16 +152,8 @@ class MemoryAggregator:
     # Persistance & stats
     # ------------------------------------------------------------------
     def save(self):
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {
-            'meta': {
-                'updated': datetime.now().isoformat(),
-                'count': len(self.meta_memory)
-            },
-            'rules': self.meta_memory
-        }
-        with open(self.output_path, 'w', encoding='utf-8') as fh:
-            json.dump(payload, fh, indent=2)
+        """Persiste la méta-mémoire : seules les règles modifiées sont écrites (journal)."""
+        self.store.sync(self.meta_memory)
 
     def get_statistics(self) -> Dict:
         labels_count: Dict[str, int] = {}
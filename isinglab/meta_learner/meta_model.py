@@ -9,7 +9,9 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score
 from sklearn.model_selection import train_test_split
 
-from .feature_engineering import extract_rule_features, features_to_vector, extract_dataset_features
+from .feature_engineering import (
+    extract_rule_features, features_to_vector, extract_feature_matrix, extract_dataset_features
+)
 
 
 class MetaModel:
@@ -56,6 +58,15 @@ class MetaModel:
         vector = features_to_vector(features).reshape(1, -1)
         return float(self.model.predict_proba(vector)[0, 1])
 
+    def predict_proba_batch(self, codes: np.ndarray) -> np.ndarray:
+        """Probabilities for N rules given as 18-bit codes, in one predict call."""
+        codes = np.asarray(codes, dtype=np.int64).reshape(-1)
+        if not self.is_trained:
+            return np.full(len(codes), 0.5)
+        if len(codes) == 0:
+            return np.empty(0)
+        return self.model.predict_proba(extract_feature_matrix(codes))[:, 1]
+
     def save(self, path: str = 'results/meta_model.json'):
         if not self.is_trained:
             return
@@ -8,6 +8,8 @@ non-dominées sur plusieurs objectifs.
 from typing import List, Dict, Tuple
 import numpy as np
 
+from .rule_registry import rule_code, hamming_distances
+
 
 def dominates(rule_a: Dict, rule_b: Dict, objectives: List[str]) -> bool:
     """
@@ -37,26 +39,29 @@ def pareto_front(rules: List[Dict], objectives: List[str]) -> List[Dict]:
     """
     Calcule le front de Pareto : ensemble des règles non-dominées.
     
-    Une règle est non-dominée si aucune autre règle ne la domine.
+    Une règle est non-dominée si aucune autre règle ne la domine. Les
+    objectifs sont comparés en bloc sur une matrice (n_règles, n_objectifs).
     """
     if not rules:
         return []
     
-    pareto_set = []
-    
-    for rule_a in rules:
-        is_dominated = False
-        for rule_b in rules:
-            if rule_a is rule_b:
-                continue
-            if dominates(rule_b, rule_a, objectives):
-                is_dominated = True
-                break
-        
-        if not is_dominated:
-            pareto_set.append(rule_a)
+    values = _objective_matrix(rules, objectives)
+    dominated = np.zeros(len(rules), dtype=bool)
+    # dominated[i] : une règle j >= i partout et > i quelque part (par blocs
+    # de règles i, mémoire O(n × bloc))
+    for start in range(0, len(rules), 256):
+        block = values[None, start:start + 256, :]
+        geq = np.all(values[:, None, :] >= block, axis=2)
+        gt = np.any(values[:, None, :] > block, axis=2)
+        dominated[start:start + 256] = np.any(geq & gt, axis=0)
     
-    return pareto_set
+    return [rule for rule, is_dominated in zip(rules, dominated) if not is_dominated]
+
+
+def _objective_matrix(rules: List[Dict], objectives: List[str]) -> np.ndarray:
+    """Valeurs des objectifs (0 si absent), une ligne par règle."""
+    return np.array([[rule.get(obj, 0) for obj in objectives] for rule in rules],
+                    dtype=float).reshape(len(rules), len(objectives))
 
 
 def select_pareto_hof(candidates: List[Dict], current_hof: List[Dict],
@@ -88,25 +93,25 @@ def select_pareto_hof(candidates: List[Dict], current_hof: List[Dict],
         composite_scores.sort(key=lambda x: x[0], reverse=True)
         pareto_rules = [rule for _, rule in composite_scores[:max_size]]
     
-    # Appliquer diversité (distance Hamming)
-    diverse_rules = []
-    for rule in pareto_rules:
-        # Vérifier distance avec règles déjà dans diverse_rules
-        is_diverse = True
-        for existing in diverse_rules:
-            dist = compute_hamming_distance(rule, existing)
-            if dist < diversity_threshold:
-                # Garder la meilleure des deux
-                composite_rule = sum(rule.get(obj, 0) for obj in objectives) / len(objectives)
-                composite_existing = sum(existing.get(obj, 0) for obj in objectives) / len(objectives)
-                if composite_rule > composite_existing:
-                    diverse_rules.remove(existing)
-                    diverse_rules.append(rule)
-                is_diverse = False
-                break
-        
-        if is_diverse:
-            diverse_rules.append(rule)
+    # Appliquer diversité (distance Hamming entre codes 18 bits, matrice
+    # calculée une fois)
+    codes = np.array([_rule_code(rule) for rule in pareto_rules], dtype=np.int64)
+    distances = hamming_distances(codes[:, None], codes[None, :])
+    composites = _objective_matrix(pareto_rules, objectives).mean(axis=1) if pareto_rules else []
+    
+    diverse = []  # Indices dans pareto_rules, dans l'ordre de diverse_rules
+    for i in range(len(pareto_rules)):
+        # Première règle retenue trop proche
+        close = np.flatnonzero(distances[i, diverse] < diversity_threshold) if diverse else []
+        if len(close):
+            existing = diverse[close[0]]
+            # Garder la meilleure des deux
+            if composites[i] > composites[existing]:
+                diverse.remove(existing)
+                diverse.append(i)
+        else:
+            diverse.append(i)
+    diverse_rules = [pareto_rules[i] for i in diverse]
     
     # Déterminer promoted et removed
     current_notations = {r.get('notation') for r in current_hof}
@@ -120,13 +125,12 @@ def select_pareto_hof(candidates: List[Dict], current_hof: List[Dict],
 
 def compute_hamming_distance(rule1: Dict, rule2: Dict) -> int:
     """Calcule distance de Hamming entre born/survive."""
-    born1 = set(rule1.get('born', []))
-    born2 = set(rule2.get('born', []))
-    survive1 = set(rule1.get('survive', []))
-    survive2 = set(rule2.get('survive', []))
-    
-    dist = len(born1 ^ born2) + len(survive1 ^ survive2)
-    return dist
+    return int(hamming_distances(_rule_code(rule1), _rule_code(rule2)))
+
+
+def _rule_code(rule: Dict) -> int:
+    """Code 18 bits des listes born/survive (absentes : vides)."""
+    return rule_code(rule.get('born', []), rule.get('survive', []))
 
 
 __all__ = ['pareto_front', 'select_pareto_hof', 'dominates']
@@ -0,0 +1,253 @@
+"""
+Registre compact des règles Life-like : codes 18 bits + métriques en colonnes.
+
+Une règle B/S est un entier 18 bits (même encodage que life_rule_to_int) :
+bits 0-8 = naissance, bits 9-17 = survie. La distance de Hamming entre deux
+règles (nombre de chiffres B/S différents) est le popcount du XOR de leurs
+codes, et les voisins à distance 1 sont les 18 XOR d'un seul bit : comparer
+une règle à tout un HoF ou générer son voisinage devient une opération sur
+tableaux, sans reparser de notation.
+
+Usage:
+    >>> registry = RuleRegistry.from_rules(hof_rules, metrics=['edge_score'])
+    >>> registry.distances(notation_code('B36/S23'))
+    >>> registry.column('edge_score')
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+N_BITS = 18
+SURVIVE_SHIFT = 9
+BORN_MASK = (1 << SURVIVE_SHIFT) - 1
+
+# Popcount des entiers 9 bits (un code = deux moitiés)
+_POPCOUNT9 = np.array([bin(k).count('1') for k in range(1 << SURVIVE_SHIFT)], dtype=np.int8)
+
+
+def rule_code(born: Iterable[int], survive: Iterable[int]) -> int:
+    """Code 18 bits d'une règle (bits 0-8 naissance, 9-17 survie)."""
+    code = 0
+    for shift, counts in ((0, born), (SURVIVE_SHIFT, survive)):
+        for count in counts:
+            if not 0 <= int(count) < SURVIVE_SHIFT:
+                raise ValueError(f"Neighbor count out of range: {count}")
+            code |= 1 << (shift + int(count))
+    return code
+
+
+@lru_cache(maxsize=1 << 16)
+def notation_code(notation: str) -> int:
+    """Code 18 bits d'une notation B.../S... (ValueError si invalide)."""
+    if '/' not in notation:
+        raise ValueError(f"Invalid Life-like notation: {notation}")
+    born_part, survive_part = notation.split('/', 1)
+    return rule_code((int(ch) for ch in born_part if ch.isdigit()),
+                     (int(ch) for ch in survive_part if ch.isdigit()))
+
+
+def entry_code(entry: Dict) -> int:
+    """Code d'une entrée mémoire / HoF : born + survive si présents, sinon la notation."""
+    born, survive = entry.get('born'), entry.get('survive')
+    if born is not None and survive is not None:
+        return rule_code(born, survive)
+    return notation_code(entry['notation'])
+
+
+def code_lists(code: int) -> Tuple[List[int], List[int]]:
+    """Listes (born, survive) triées d'un code."""
+    code = int(code)
+    born = [b for b in range(SURVIVE_SHIFT) if code >> b & 1]
+    survive = [s for s in range(SURVIVE_SHIFT) if code >> (SURVIVE_SHIFT + s) & 1]
+    return born, survive
+
+
+def code_notation(code: int) -> str:
+    """Notation canonique (chiffres triés) d'un code."""
+    born, survive = code_lists(code)
+    return f"B{''.join(map(str, born))}/S{''.join(map(str, survive))}"
+
+
+def popcount(codes: np.ndarray) -> np.ndarray:
+    """Nombre de bits à 1 de codes 18 bits (tableau d'entiers)."""
+    codes = np.asarray(codes)
+    return _POPCOUNT9[codes & BORN_MASK] + _POPCOUNT9[(codes >> SURVIVE_SHIFT) & BORN_MASK]
+
+
+def hamming_distances(code: Union[int, np.ndarray], codes: np.ndarray) -> np.ndarray:
+    """Distances de Hamming (popcount du XOR), diffusées entre `code` et `codes`."""
+    return popcount(np.bitwise_xor(code, codes))
+
+
+def neighbor_codes(code: int, keep_nonempty: bool = True) -> np.ndarray:
+    """
+    Règles à distance 1 : un chiffre B ou S ajouté ou retiré.
+
+    Args:
+        code: Code de la règle
+        keep_nonempty: Ne pas retirer le dernier chiffre B (ni le dernier S)
+
+    Returns:
+        Codes dans l'ordre des bits (B0..B8 puis S0..S8)
+    """
+    bits = np.int64(1) << np.arange(N_BITS, dtype=np.int64)
+    neighbors = np.int64(code) ^ bits
+    if keep_nonempty:
+        born_count = int(popcount(np.int64(code) & BORN_MASK))
+        survive_count = int(popcount(np.int64(code) >> SURVIVE_SHIFT))
+        removes = (np.int64(code) & bits) != 0
+        last = np.where(np.arange(N_BITS) < SURVIVE_SHIFT, born_count <= 1, survive_count <= 1)
+        neighbors = neighbors[~(removes & last)]
+    return neighbors
+
+
+class RuleRegistry:
+    """
+    Règles indexées par code, métriques en colonnes NumPy.
+
+    Attributes:
+        codes: Codes 18 bits, une ligne par règle (vue sur n lignes)
+        notations: Notation de chaque ligne (telle qu'ajoutée)
+    """
+
+    def __init__(self, metrics: Sequence[str] = (), capacity: int = 64):
+        """
+        Args:
+            metrics: Noms des colonnes de métriques (float64, NaN si absent)
+            capacity: Lignes allouées d'avance (doublées au besoin)
+        """
+        self._n = 0
+        self._codes = np.zeros(capacity, dtype=np.int64)
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.full(capacity, np.nan) for name in metrics
+        }
+        self._row: Dict[int, int] = {}
+        self.notations: List[str] = []
+
+    @classmethod
+    def from_rules(cls, rules: Iterable[Dict], metrics: Sequence[str] = ()) -> 'RuleRegistry':
+        """
+        Registre d'entrées mémoire / HoF (dicts avec notation ou born/survive).
+
+        Les métriques sont lues au premier niveau de l'entrée, puis dans
+        entry['scores'] ou entry['metadata']. Une notation invalide est
+        ignorée ; une règle répétée garde sa première ligne et ses dernières
+        valeurs.
+        """
+        rules = list(rules)
+        registry = cls(metrics, capacity=max(len(rules), 1))
+        for entry in rules:
+            try:
+                code = entry_code(entry)
+            except (KeyError, ValueError):
+                continue
+            values = {}
+            for name in metrics:
+                value = _metric_value(entry, name)
+                if value is not None:
+                    values[name] = value
+            registry.add(code, entry.get('notation') or code_notation(code), **values)
+        return registry
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __contains__(self, code: int) -> bool:
+        return int(code) in self._row
+
+    @property
+    def codes(self) -> np.ndarray:
+        return self._codes[:self._n]
+
+    def row(self, code: int) -> Optional[int]:
+        """Ligne d'un code (None si absent)."""
+        return self._row.get(int(code))
+
+    def rows(self, codes: np.ndarray) -> np.ndarray:
+        """Lignes d'un tableau de codes (-1 pour les codes absents)."""
+        codes = np.asarray(codes, dtype=np.int64)
+        if self._n == 0:
+            return np.full(codes.shape, -1, dtype=np.int64)
+        order = np.argsort(self.codes)
+        position = np.minimum(np.searchsorted(self.codes[order], codes), self._n - 1)
+        return np.where(self.codes[order][position] == codes, order[position], -1)
+
+    def column(self, name: str) -> np.ndarray:
+        """Colonne d'une métrique (vue sur n lignes)."""
+        return self._columns[name][:self._n]
+
+    def add(self, code: int, notation: Optional[str] = None, **metrics: float) -> int:
+        """
+        Ajoute une règle, ou met à jour ses métriques si déjà présente.
+
+        Returns:
+            Ligne de la règle
+        """
+        code = int(code)
+        row = self._row.get(code)
+        if row is None:
+            if self._n == len(self._codes):
+                self._grow()
+            row = self._n
+            self._n += 1
+            self._codes[row] = code
+            self._row[code] = row
+            self.notations.append(notation or code_notation(code))
+        for name, value in metrics.items():
+            if name not in self._columns:
+                self._columns[name] = np.full(len(self._codes), np.nan)
+            self._columns[name][row] = value
+        return row
+
+    def _grow(self):
+        capacity = 2 * len(self._codes)
+        codes = np.zeros(capacity, dtype=np.int64)
+        codes[:self._n] = self._codes[:self._n]
+        self._codes = codes
+        for name, column in self._columns.items():
+            grown = np.full(capacity, np.nan)
+            grown[:self._n] = column[:self._n]
+            self._columns[name] = grown
+
+    def distances(self, code: Union[int, np.ndarray]) -> np.ndarray:
+        """
+        Distances de Hamming à toutes les règles.
+
+        Args:
+            code: Un code -> (n,) ; tableau de m codes -> (m, n)
+        """
+        if np.ndim(code) == 0:
+            return hamming_distances(int(code), self.codes)
+        return hamming_distances(np.asarray(code)[:, None], self.codes[None, :])
+
+    def nearest(self, code: int) -> Tuple[int, int]:
+        """(ligne, distance) de la règle la plus proche (première en cas d'égalité)."""
+        if self._n == 0:
+            raise ValueError("Empty registry")
+        distances = self.distances(code)
+        row = int(np.argmin(distances))
+        return row, int(distances[row])
+
+
+def _metric_value(entry: Dict, name: str) -> Optional[float]:
+    for source in (entry, entry.get('scores') or {}, entry.get('metadata') or {}):
+        value = source.get(name)
+        if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+            return float(value)
+    return None
+
+
+__all__ = [
+    'RuleRegistry',
+    'rule_code',
+    'notation_code',
+    'entry_code',
+    'code_lists',
+    'code_notation',
+    'popcount',
+    'hamming_distances',
+    'neighbor_codes'
+]
@@ -6,7 +6,11 @@ from typing import Dict, List, Tuple
 from pathlib import Path
 import json
 
-from isinglab.memory_explorer import parse_notation
+import numpy as np
+
+from .rule_registry import (
+    RuleRegistry, rule_code, notation_code, code_lists, code_notation, neighbor_codes
+)
 
 
 class BanditArm:
@@ -215,86 +219,88 @@ class CandidateSelector:
         Construit un pool de candidats avec pénalisation des règles déjà testées.
         Évite les boucles stériles en favorisant de nouvelles règles.
         """
-        # Construire un index des règles déjà évaluées avec leur fréquence
-        evaluated_counts = {}
-        for entry in self.meta_memory:
-            notation = entry.get('notation')
-            times = entry.get('metadata', {}).get('times_evaluated', 0)
-            if notation:
-                evaluated_counts[notation] = times
+        # Index des règles déjà évaluées (codes 18 bits) avec leur fréquence
+        registry = RuleRegistry.from_rules(self.meta_memory, metrics=['times_evaluated'])
+        times_evaluated = np.append(np.nan_to_num(registry.column('times_evaluated')), 0)  # [-1] : règle absente
         
         base_rules = [entry for entry in self.meta_memory if entry.get('notation')]
         # Trier pour favoriser les règles peu évaluées ou jamais vues
         base_rules.sort(key=lambda e: e.get('metadata', {}).get('times_evaluated', 0))
-        
-        pool: List[Dict] = []
-        seen = set()
-
+        base_codes = []
         for entry in base_rules:
-            notation = entry.get('notation')
             try:
-                born, survive = parse_notation(notation)
+                base_codes.append(notation_code(entry['notation']))
             except ValueError:
                 continue
-            mutations = self._mutate_rule(born, survive)
-            for born_mut, survive_mut in mutations:
-                candidate_notation = f"B{''.join(map(str, born_mut))}/S{''.join(map(str, survive_mut))}"
-                if candidate_notation in seen:
-                    continue
-                
-                # Prédiction du méta-modèle (si disponible)
-                if self.meta_model:
-                    score = self.meta_model.predict_proba(
-                        notation=candidate_notation,
-                        born=born_mut,
-                        survive=survive_mut
-                    )
-                else:
-                    score = 0.5  # Score neutre si pas de modèle
-                
-                # Pénalisation si déjà évalué plusieurs fois
-                penalty_factor = 0.15  # 15% de pénalité par évaluation
-                times_eval = evaluated_counts.get(candidate_notation, 0)
-                adjusted_score = score * (1.0 - penalty_factor * times_eval)
-                
-                pool.append({
-                    'notation': candidate_notation,
-                    'born': born_mut,
-                    'survive': survive_mut,
-                    'score': adjusted_score,
-                    'raw_score': score,
-                    'times_evaluated': times_eval,
-                    'source': 'meta_model'
-                })
-                seen.add(candidate_notation)
-                if len(pool) >= pool_size:
-                    return pool
-        # fallback random completions
-        while len(pool) < pool_size:
+        
+        # Toutes les mutations à distance 1 (un chiffre B/S ajouté ou retiré),
+        # dédupliquées par code en gardant la première occurrence
+        if base_codes:
+            mutations = np.concatenate([neighbor_codes(code) for code in base_codes])
+            _, first = np.unique(mutations, return_index=True)
+            codes = mutations[np.sort(first)][:pool_size]
+        else:
+            codes = np.empty(0, dtype=np.int64)
+        
+        # Prédiction du méta-modèle en un seul appel, puis pénalisation si
+        # déjà évalué plusieurs fois (15% par évaluation)
+        scores = self._score_codes(codes)
+        penalty_factor = 0.15
+        times = times_evaluated[registry.rows(codes)].astype(int).tolist()
+        
+        pool: List[Dict] = []
+        seen = set()
+        for code, score, times_eval in zip(codes.tolist(), scores, times):
+            born_mut, survive_mut = code_lists(code)
+            pool.append({
+                'notation': code_notation(code),
+                'born': born_mut,
+                'survive': survive_mut,
+                'score': score * (1.0 - penalty_factor * times_eval),
+                'raw_score': score,
+                'times_evaluated': times_eval,
+                'source': 'meta_model'
+            })
+            seen.add(code)
+        
+        # fallback random completions (scorées ensemble)
+        fill = []
+        while len(pool) + len(fill) < pool_size:
             born_mut = sorted(random.sample(range(9), random.randint(1, 4)))
             survive_mut = sorted(random.sample(range(9), random.randint(1, 4)))
-            candidate_notation = f"B{''.join(map(str, born_mut))}/S{''.join(map(str, survive_mut))}"
-            if candidate_notation in seen:
+            candidate_code = rule_code(born_mut, survive_mut)
+            if candidate_code in seen:
                 continue
-            # Score via meta_model si disponible, sinon défaut
-            if self.meta_model:
-                score = self.meta_model.predict_proba(
-                    notation=candidate_notation,
-                    born=born_mut,
-                    survive=survive_mut
-                )
-            else:
-                score = 0.5  # Score neutre si pas de modèle
+            fill.append(candidate_code)
+            seen.add(candidate_code)
+        for code, score in zip(fill, self._score_codes(np.array(fill, dtype=np.int64))):
+            born_mut, survive_mut = code_lists(code)
             pool.append({
-                'notation': candidate_notation,
+                'notation': code_notation(code),
                 'born': born_mut,
                 'survive': survive_mut,
                 'score': score,
                 'source': 'random_fill'
             })
-            seen.add(candidate_notation)
         return pool
 
+    def _score_codes(self, codes: np.ndarray) -> List[float]:
+        """
+        Scores du méta-modèle pour un lot de codes (0.5 si pas de modèle).
+        Les modèles sans predict_proba_batch sont appelés règle par règle.
+        """
+        if not self.meta_model:
+            return [0.5] * len(codes)
+        if hasattr(self.meta_model, 'predict_proba_batch'):
+            return np.asarray(self.meta_model.predict_proba_batch(codes), dtype=float).tolist()
+        scores = []
+        for code in np.asarray(codes).tolist():
+            born, survive = code_lists(code)
+            scores.append(float(self.meta_model.predict_proba(
+                notation=code_notation(code), born=born, survive=survive
+            )))
+        return scores
+
     def _generate_stable_biased_candidates(self, count: int) -> List[Dict]:
         """
         v2.2: Génère des candidats biaisés vers stabilité/mémoire.
@@ -1,19 +1,24 @@
 """Quantitative metrics for CA and Ising systems."""
 
-from .entropy import shannon_entropy, spatial_entropy
+from .entropy import shannon_entropy, spatial_entropy, spatial_entropy_frames
 from .sensitivity import lyapunov_exponent, hamming_sensitivity
-from .memory import memory_score, attractor_analysis
+from .memory import memory_score, attractor_analysis, CycleDetector
 from .edge_score import edge_of_chaos_score, composite_edge_metric, lambda_parameter_estimate
+from .streaming import StreamingMetrics, composite_edge_metric_from_stream
 
 __all__ = [
     "shannon_entropy",
     "spatial_entropy",
+    "spatial_entropy_frames",
     "lyapunov_exponent",
     "hamming_sensitivity",
     "memory_score",
     "attractor_analysis",
+    "CycleDetector",
     "edge_of_chaos_score",
     "composite_edge_metric",
     "lambda_parameter_estimate",
+    "StreamingMetrics",
+    "composite_edge_metric_from_stream",
 ]
 
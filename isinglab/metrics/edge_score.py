@@ -51,8 +51,30 @@ def edge_of_chaos_score(
     if not history or len(history) < 2:
         return 0.0
     
+    return edge_score_from_state(
+        history[-1], sensitivity, memory,
+        target_entropy=target_entropy, target_activity=target_activity
+    )
+
+
+def edge_score_from_state(
+    final_state: np.ndarray,
+    sensitivity: float,
+    memory: float,
+    target_entropy: float = 0.5,
+    target_activity: float = 0.3
+) -> float:
+    """
+    Edge-of-chaos score from the final state of a trajectory.
+    
+    `edge_of_chaos_score` only looks at the last state of the history; this
+    form is used when the history is not kept (see metrics.streaming).
+    
+    Returns:
+        Edge score in [0, 1]
+    """
     # 1. Entropy term: peaked at target_entropy
-    entropy = shannon_entropy(history[-1])
+    entropy = shannon_entropy(final_state)
     max_entropy = 1.0  # For binary states
     norm_entropy = entropy / max_entropy if max_entropy > 0 else 0.0
     
@@ -72,7 +94,7 @@ def edge_of_chaos_score(
     memory_term = np.exp(-((memory - target_memory) ** 2) / (2 * 0.25 ** 2))
     
     # 4. Activity term: balanced activity
-    activity = activity_level(history[-1])
+    activity = activity_level(final_state)
     activity_term = np.exp(-((activity - target_activity) ** 2) / (2 * 0.2 ** 2))
     
     # Composite score (geometric mean for balanced criteria)
@@ -86,7 +108,10 @@ def composite_edge_metric(
     evolution_func=None,
     initial_state=None,
     steps: int = 50,
-    seed: int = 42
+    seed: int = 42,
+    batch_evolution_func=None,
+    reference_final=None,
+    spins=None
 ) -> Dict:
     """
     Compute comprehensive edge-of-chaos metrics.
@@ -99,6 +124,13 @@ def composite_edge_metric(
         initial_state: Initial state for sensitivity
         steps: Steps for sensitivity measurement
         seed: Random seed
+        batch_evolution_func: Optional stack evolution function; the
+            sensitivity trajectories are then evolved in one pass
+            (see hamming_sensitivity)
+        reference_final: Known unperturbed state after `steps` sensitivity
+            steps (see hamming_sensitivity)
+        spins: ±1 spin states (Ising) rather than 0/1 bits; guessed from
+            initial_state if None (see hamming_sensitivity)
         
     Returns:
         Dictionary with all metrics:
@@ -138,7 +170,10 @@ def composite_edge_metric(
             evolution_func,
             initial_state,
             steps=steps,
-            seed=seed
+            seed=seed,
+            batch_evolution_func=batch_evolution_func,
+            reference_final=reference_final,
+            spins=spins
         )
     else:
         # Estimate from history variability
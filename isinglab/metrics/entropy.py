@@ -42,7 +42,144 @@ def shannon_entropy(states: Union[np.ndarray, List[np.ndarray]], base: int = 2)
     return float(entropy)
 
 
-def spatial_entropy(state: np.ndarray, block_size: int = 2) -> float:
+# Largest block (in cells) counted from integer codes; bigger blocks use
+# np.unique on the cell windows
+_MAX_CODE_BITS = 32
+
+# Dense (frame, code) count tables are used up to this many counters, or
+# the number of blocks if larger; beyond, only the codes that occur are counted
+_MAX_DENSE_COUNTS = 1 << 16
+
+
+def _block_windows(frames: np.ndarray, block_size: int, n_spatial: int,
+                   wrap: bool) -> np.ndarray:
+    """
+    Cells of every block of a stack of frames.
+    
+    Returns:
+        Array of shape (n_frames, n_blocks, block_size ** n_spatial)
+    """
+    if wrap:
+        pad = [(0, 0)] + [(0, block_size - 1)] * n_spatial
+        frames = np.pad(frames, pad, mode="wrap")
+    axes = tuple(range(1, n_spatial + 1))
+    windows = np.lib.stride_tricks.sliding_window_view(
+        frames, (block_size,) * n_spatial, axis=axes
+    )
+    n_frames = frames.shape[0]
+    return windows.reshape(n_frames, -1, block_size ** n_spatial)
+
+
+def _block_codes(bits: np.ndarray, block_size: int, n_spatial: int, wrap: bool) -> np.ndarray:
+    """
+    Integer code of every block of a stack of 0/1 frames, built from shifted
+    bit planes (one shift-or per cell of the block).
+    
+    Returns:
+        int64 array of shape (n_frames, n_blocks)
+    """
+    if wrap:
+        pad = [(0, 0)] + [(0, block_size - 1)] * n_spatial
+        bits = np.pad(bits, pad, mode="wrap")
+    
+    out_shape = [n - block_size + 1 for n in bits.shape[1:]]
+    codes = np.zeros((bits.shape[0],) + tuple(out_shape), dtype=np.int64)
+    for shift, offset in enumerate(np.ndindex(*(block_size,) * n_spatial)):
+        window = tuple(slice(o, o + n) for o, n in zip(offset, out_shape))
+        codes |= bits[(slice(None),) + window].astype(np.int64) << shift
+    return codes.reshape(bits.shape[0], -1)
+
+
+def _block_entropies(counts: np.ndarray, n_blocks: int, max_blocks: int) -> np.ndarray:
+    """Normalized block entropy of each row of a (n_frames, n_patterns) count table."""
+    p = counts / n_blocks
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(counts > 0, p * np.log2(np.where(counts > 0, p, 1.0)), 0.0)
+    entropy = -terms.sum(axis=1)
+    unique = (counts > 0).sum(axis=1)
+    
+    # Normalize by maximum entropy
+    max_entropy = np.log2(min(max_blocks, n_blocks))
+    if max_entropy <= 0:
+        return np.zeros(len(counts))
+    return np.where(unique <= 1, 0.0, entropy / max_entropy)
+
+
+def _sparse_block_entropies(frame: np.ndarray, counts: np.ndarray, n_frames: int,
+                            n_blocks: int, max_blocks: int) -> np.ndarray:
+    """_block_entropies from the (frame, count) of each pattern that occurs."""
+    p = counts / n_blocks
+    entropy = -np.bincount(frame, weights=p * np.log2(p), minlength=n_frames)
+    unique = np.bincount(frame, minlength=n_frames)
+    
+    max_entropy = np.log2(min(max_blocks, n_blocks))
+    if max_entropy <= 0:
+        return np.zeros(n_frames)
+    return np.where(unique <= 1, 0.0, entropy / max_entropy)
+
+
+def spatial_entropy_frames(frames: Union[np.ndarray, List[np.ndarray]],
+                           block_size: int = 2, wrap: bool = False) -> np.ndarray:
+    """
+    Spatial entropy of every frame of a stack, in one vectorized pass.
+    
+    Each block (sliding window of block_size cells in 1D, block_size x
+    block_size in 2D) is encoded as an integer from shifted bit planes and
+    the codes of all frames are counted at once: with a single np.bincount
+    while the (frame, code) table stays small, else with np.unique over the
+    codes that occur (4x4 blocks have 65536 possible codes). Grids that are
+    not 0/1 or ±1 fall back to counting distinct blocks with np.unique.
+    
+    Args:
+        frames: Stack of shape (T, width) or (T, height, width), or a list
+            of equally-shaped states
+        block_size: Block edge length
+        wrap: Also count blocks that wrap around periodic boundaries
+        
+    Returns:
+        Array of T spatial entropies (same values as `spatial_entropy`)
+    """
+    frames = np.asarray(frames)
+    n_frames = frames.shape[0]
+    n_spatial = frames.ndim - 1
+    if n_spatial not in (1, 2):
+        raise ValueError(f"Expected a stack of 1D or 2D frames, got shape {frames.shape}")
+    
+    sizes = frames.shape[1:]
+    if wrap:
+        n_blocks = int(np.prod(sizes))
+    else:
+        n_blocks = int(np.prod([max(0, n - block_size + 1) for n in sizes]))
+    if n_frames == 0 or n_blocks == 0:
+        return np.zeros(n_frames)
+    
+    # Maximum possible distinct blocks, block_size ** 2 cells in 1D as well
+    max_blocks = 2 ** (block_size ** 2)
+    n_cells = block_size ** n_spatial
+    
+    binary = np.all((frames == 0) | (frames == 1))
+    spins = not binary and np.all((frames == -1) | (frames == 1))
+    
+    if (binary or spins) and n_cells <= _MAX_CODE_BITS:
+        codes = _block_codes(frames > 0, block_size, n_spatial, wrap)
+        n_codes = 1 << n_cells
+        keys = (codes + (np.arange(n_frames, dtype=np.int64) << n_cells)[:, None]).ravel()
+        if n_frames * n_codes <= max(_MAX_DENSE_COUNTS, len(keys)):
+            counts = np.bincount(keys, minlength=n_frames * n_codes)
+            return _block_entropies(counts.reshape(n_frames, n_codes), n_blocks, max_blocks)
+        keys, counts = np.unique(keys, return_counts=True)
+        return _sparse_block_entropies(keys >> n_cells, counts, n_frames, n_blocks, max_blocks)
+    
+    # Generic values or large blocks: count distinct blocks per frame
+    windows = _block_windows(frames, block_size, n_spatial, wrap)
+    entropies = np.zeros(n_frames)
+    for t in range(n_frames):
+        _, counts = np.unique(windows[t], axis=0, return_counts=True)
+        entropies[t] = _block_entropies(counts[None], n_blocks, max_blocks)[0]
+    return entropies
+
+
+def spatial_entropy(state: np.ndarray, block_size: int = 2, wrap: bool = False) -> float:
     """
     Compute spatial entropy using block patterns.
     
@@ -50,51 +187,15 @@ def spatial_entropy(state: np.ndarray, block_size: int = 2) -> float:
     Higher values indicate more complex spatial structure.
     
     Args:
-        state: 2D grid state
-        block_size: Size of blocks to analyze (e.g., 2 for 2x2)
+        state: 1D or 2D grid state
+        block_size: Size of blocks to analyze (e.g., 2 for 2x2; sliding
+            windows of block_size cells in 1D)
+        wrap: Also count blocks that wrap around periodic boundaries
         
     Returns:
         Spatial entropy (normalized by max possible)
     """
-    if state.ndim == 1:
-        # 1D case: use sliding windows
-        blocks = []
-        for i in range(len(state) - block_size + 1):
-            block = tuple(state[i:i+block_size])
-            blocks.append(block)
-    else:
-        # 2D case: extract all blocks
-        h, w = state.shape
-        blocks = []
-        for i in range(h - block_size + 1):
-            for j in range(w - block_size + 1):
-                block = tuple(state[i:i+block_size, j:j+block_size].flatten())
-                blocks.append(block)
-    
-    if not blocks:
-        return 0.0
-    
-    # Count unique blocks
-    unique_blocks = len(set(blocks))
-    max_blocks = 2 ** (block_size ** 2)  # Maximum possible distinct blocks
-    
-    # Normalized entropy
-    if unique_blocks <= 1:
-        return 0.0
-    
-    # Compute entropy of block distribution
-    block_counts = {}
-    for block in blocks:
-        block_counts[block] = block_counts.get(block, 0) + 1
-    
-    total = len(blocks)
-    probabilities = [count / total for count in block_counts.values()]
-    entropy = -np.sum([p * np.log2(p) for p in probabilities])
-    
-    # Normalize by maximum entropy
-    max_entropy = np.log2(min(max_blocks, len(blocks)))
-    
-    return entropy / max_entropy if max_entropy > 0 else 0.0
+    return float(spatial_entropy_frames(state[None], block_size, wrap)[0])
 
 
 def temporal_entropy(history: List[np.ndarray], lag: int = 1) -> float:
@@ -102,6 +203,9 @@ def temporal_entropy(history: List[np.ndarray], lag: int = 1) -> float:
     Compute temporal entropy (predictability over time).
     
     Measures how predictable the next state is given current state.
+    Each frame is hashed once (memory.state_digest) and the
+    (digest_t, digest_t+lag) pairs are counted, so the cost no longer
+    scales with grid size times history length.
     
     Args:
         history: Sequence of states
@@ -110,26 +214,21 @@ def temporal_entropy(history: List[np.ndarray], lag: int = 1) -> float:
     Returns:
         Temporal entropy (bits)
     """
+    from .memory import state_digest
+    
     if len(history) < lag + 1:
         return 0.0
     
-    # Flatten states and create lag sequences
-    transitions = []
-    for i in range(len(history) - lag):
-        current = tuple(history[i].flatten())
-        next_state = tuple(history[i + lag].flatten())
-        transitions.append((current, next_state))
-    
-    if not transitions:
-        return 0.0
+    digests = [state_digest(state) for state in history]
     
     # Count transitions
     transition_counts = {}
-    for trans in transitions:
+    for i in range(len(history) - lag):
+        trans = (digests[i], digests[i + lag])
         transition_counts[trans] = transition_counts.get(trans, 0) + 1
     
     # Compute entropy
-    total = len(transitions)
+    total = len(history) - lag
     probabilities = [count / total for count in transition_counts.values()]
     entropy = -np.sum([p * np.log2(p) for p in probabilities if p > 0])
     
@@ -10,9 +10,13 @@ Au lieu de mesurer des propriétés "esthétiques", on teste des capacités conc
 import numpy as np
 from typing import Dict, List, Tuple
 
+from .memory import run_until_attractor
+from ..core.rng import SeedLike, LegacyRandom, make_rng
+
 
 def compute_memory_capacity(rule_function, grid_size: Tuple[int, int] = (32, 32), 
-                            n_patterns: int = 10, steps: int = 50) -> Dict:
+                            n_patterns: int = 10, steps: int = 50,
+                            until_attractor: bool = True) -> Dict:
     """
     Test de capacité mémoire : combien de patterns distincts peuvent être stockés/rappelés ?
     
@@ -20,10 +24,15 @@ def compute_memory_capacity(rule_function, grid_size: Tuple[int, int] = (32, 32)
     - Générer n_patterns aléatoires
     - Pour chaque pattern : initialiser, faire évoluer, mesurer stabilité
     - Capacity score = fraction de patterns qui se stabilisent en états distincts
+    
+    Avec until_attractor=True, l'évolution s'arrête dès qu'un point fixe ou un
+    cycle court est atteint (résultats identiques, 'steps_saved' compte les
+    steps non simulés).
     """
     height, width = grid_size
     stable_patterns = 0
     distinct_finals = []
+    steps_saved = 0
     
     for i in range(n_patterns):
         # Pattern aléatoire (densité 0.3)
@@ -31,18 +40,28 @@ def compute_memory_capacity(rule_function, grid_size: Tuple[int, int] = (32, 32)
         state = pattern.astype(int)
         
         # Évolution
-        for step in range(steps):
-            state = rule_function(state)
+        period = None
+        if until_attractor:
+            run = run_until_attractor(rule_function, state, steps)
+            state, period = run['final_state'], run['period']
+            steps_saved += run['steps_saved']
+        else:
+            for step in range(steps):
+                state = rule_function(state)
         
         # Vérifier stabilité (derniers 5 steps identiques)
-        is_stable = True
         final_state = state.copy()
-        for _ in range(5):
-            next_state = rule_function(state)
-            if not np.array_equal(next_state, state):
-                is_stable = False
-                break
-            state = next_state
+        if period is not None:
+            # Attracteur connu : stable ssi point fixe
+            is_stable = period == 1
+        else:
+            is_stable = True
+            for _ in range(5):
+                next_state = rule_function(state)
+                if not np.array_equal(next_state, state):
+                    is_stable = False
+                    break
+                state = next_state
         
         if is_stable:
             # Vérifier que c'est distinct des autres
@@ -62,13 +81,14 @@ def compute_memory_capacity(rule_function, grid_size: Tuple[int, int] = (32, 32)
         'capacity_score': capacity_score,
         'stable_patterns': stable_patterns,
         'total_patterns': n_patterns,
-        'distinct_finals': len(distinct_finals)
+        'distinct_finals': len(distinct_finals),
+        'steps_saved': steps_saved
     }
 
 
 def compute_robustness_to_noise(rule_function, grid_size: Tuple[int, int] = (32, 32),
                                  noise_level: float = 0.1, n_trials: int = 5, 
-                                 steps: int = 50) -> Dict:
+                                 steps: int = 50, until_attractor: bool = True) -> Dict:
     """
     Test de robustesse au bruit : le pattern se stabilise-t-il malgré du bruit initial ?
     
@@ -76,9 +96,12 @@ def compute_robustness_to_noise(rule_function, grid_size: Tuple[int, int] = (32,
     - Pattern de référence stable
     - Ajouter noise_level% de bruit
     - Mesurer si le système revient vers un état stable
+    
+    until_attractor : arrêt anticipé sur attracteur (voir compute_memory_capacity).
     """
     height, width = grid_size
     robustness_scores = []
+    steps_saved = 0
     
     for trial in range(n_trials):
         # Pattern de base (damier ou autre structure)
@@ -95,18 +118,27 @@ def compute_robustness_to_noise(rule_function, grid_size: Tuple[int, int] = (32,
         
         # Évoluer
         state = noisy.copy()
-        for step in range(steps):
-            state = rule_function(state)
+        period = None
+        if until_attractor:
+            run = run_until_attractor(rule_function, state, steps)
+            state, period = run['final_state'], run['period']
+            steps_saved += run['steps_saved']
+        else:
+            for step in range(steps):
+                state = rule_function(state)
         
         # Mesurer similarité avec le pattern de base ou un état stable
         # Ici on mesure juste la stabilité atteinte
-        stability = 0
-        final_state = state.copy()
-        for _ in range(5):
-            next_state = rule_function(state)
-            if np.array_equal(next_state, state):
-                stability += 1
-            state = next_state
+        if period is not None:
+            # Sur un cycle de période > 1, deux états successifs diffèrent toujours
+            stability = 5 if period == 1 else 0
+        else:
+            stability = 0
+            for _ in range(5):
+                next_state = rule_function(state)
+                if np.array_equal(next_state, state):
+                    stability += 1
+                state = next_state
         
         robustness = stability / 5  # 1.0 si parfaitement stable
         robustness_scores.append(robustness)
@@ -116,12 +148,14 @@ def compute_robustness_to_noise(rule_function, grid_size: Tuple[int, int] = (32,
     return {
         'robustness_score': avg_robustness,
         'noise_level': noise_level,
-        'n_trials': n_trials
+        'n_trials': n_trials,
+        'steps_saved': steps_saved
     }
 
 
 def compute_basin_size(rule_function, grid_size: Tuple[int, int] = (32, 32),
-                        n_samples: int = 10, steps: int = 30) -> Dict:
+                        n_samples: int = 10, steps: int = 30,
+                        until_attractor: bool = True) -> Dict:
     """
     Test de taille des bassins d'attraction.
     
@@ -130,9 +164,12 @@ def compute_basin_size(rule_function, grid_size: Tuple[int, int] = (32, 32),
     - Bassins trop grands → comportement écrasant, pas de diversité
     
     Mesure : fraction de patterns aléatoires qui convergent vers le même attracteur.
+    
+    until_attractor : arrêt anticipé sur attracteur (voir compute_memory_capacity).
     """
     height, width = grid_size
     attractors = []
+    steps_saved = 0
     
     for sample in range(n_samples):
         # Pattern aléatoire
@@ -140,11 +177,17 @@ def compute_basin_size(rule_function, grid_size: Tuple[int, int] = (32, 32),
         state = pattern.astype(int)
         
         # Évoluer jusqu'à stabilité ou max steps
-        for step in range(steps):
-            next_state = rule_function(state)
-            if np.array_equal(next_state, state):
-                break
-            state = next_state
+        if until_attractor:
+            # Point fixe : même état final ; cycle : état au step `steps`
+            run = run_until_attractor(rule_function, state, steps)
+            state = run['final_state']
+            steps_saved += run['steps_saved']
+        else:
+            for step in range(steps):
+                next_state = rule_function(state)
+                if np.array_equal(next_state, state):
+                    break
+                state = next_state
         
         # Hash de l'attracteur final
         attractor_hash = hash(state.tobytes())
@@ -166,8 +209,232 @@ def compute_basin_size(rule_function, grid_size: Tuple[int, int] = (32, 32),
         'basin_score': basin_score,
         'basin_diversity': basin_diversity,
         'unique_attractors': unique_attractors,
-        'n_samples': n_samples
+        'n_samples': n_samples,
+        'steps_saved': steps_saved
+    }
+
+
+def evolve_stack_to_fixed_points(stack_rule_function, stack: np.ndarray,
+                                 horizons: np.ndarray, report_steps: np.ndarray) -> Dict:
+    """
+    Évolue une pile d'échantillons (N, H, W) en retirant les convergés.
+    
+    Chaque step n'évolue que l'ensemble actif (échantillons non convergés
+    et sous leur horizon). Un échantillon converge au premier t où
+    S_{t+1} == S_t (masque vectorisé par échantillon) : S_t est un point
+    fixe, la suite de sa trajectoire est connue.
+    
+    Args:
+        stack_rule_function: Fonction stack -> new_stack
+        stack: États initiaux (N, H, W)
+        horizons: Nombre max de steps simulés par échantillon
+        report_steps: Step dont l'état est rapporté par échantillon
+            (<= horizon)
+    
+    Returns:
+        Dict avec 'states' (état au report_step), 'fixed_index' (t du
+        point fixe, -1 si non atteint avant l'horizon), 'steps_run' (steps
+        simulés par échantillon) et 'steps_saved' (steps non simulés, tous
+        échantillons confondus)
+    """
+    n_samples = len(stack)
+    current = stack.copy()
+    reported = stack.copy()
+    fixed_index = np.full(n_samples, -1)
+    converged = np.zeros(n_samples, dtype=bool)
+    steps_run = np.zeros(n_samples, dtype=int)
+    
+    for t in range(int(horizons.max()) if n_samples else 0):
+        active = np.flatnonzero(~converged & (t < horizons))
+        if len(active) == 0:
+            break
+        
+        next_states = stack_rule_function(current[active])
+        steps_run[active] += 1
+        is_fixed = np.all(next_states == current[active], axis=tuple(range(1, current.ndim)))
+        
+        fixed_index[active[is_fixed]] = t
+        converged[active[is_fixed]] = True
+        current[active] = next_states
+        
+        # Un point fixe atteint avant report_step y est encore
+        report = active[~is_fixed & (report_steps[active] == t + 1)]
+        reported[report] = current[report]
+    
+    # Convergés avant leur report_step : l'état courant est le point fixe
+    early = converged & (fixed_index < report_steps)
+    reported[early] = current[early]
+    
+    return {
+        'states': reported,
+        'fixed_index': fixed_index,
+        'steps_run': steps_run,
+        'steps_saved': int(horizons.sum() - steps_run.sum())
+    }
+
+
+def _plan_fixed_points(plan, patterns: List[np.ndarray], horizons: np.ndarray,
+                       report_steps: np.ndarray) -> Dict:
+    """
+    Équivalent de evolve_stack_to_fixed_points lu dans un TrajectoryPlan.
+    
+    Chaque pattern est une trajectoire du plan, demandée aux steps
+    report_step..horizon. 'fixed_index' est le premier t de
+    [report_step, horizon) où S_{t+1} == S_t (report_step si le point fixe
+    est atteint plus tôt, -1 sinon) : c'est tout ce qu'en lisent capacity et
+    robustness. 'steps_run' compte une trajectoire répétée une seule fois.
+    """
+    keys = [plan.initial(pattern) for pattern in patterns]
+    for key, report, horizon in zip(keys, report_steps, horizons):
+        for t in range(report, horizon + 1):
+            plan.request(key, t)
+    before = dict(plan.steps_run)
+    plan.run()
+    
+    states = np.stack([plan.state(key, report) for key, report in zip(keys, report_steps)])
+    fixed_index = np.full(len(keys), -1)
+    steps_run = np.zeros(len(keys), dtype=int)
+    counted = set()
+    for k, (key, report, horizon) in enumerate(zip(keys, report_steps, horizons)):
+        for t in range(report, horizon):
+            if np.array_equal(plan.state(key, t + 1), plan.state(key, t)):
+                fixed_index[k] = t
+                break
+        if key not in counted:
+            counted.add(key)
+            steps_run[k] = plan.steps_run.get(key, 0) - before.get(key, 0)
+    
+    return {'states': states, 'fixed_index': fixed_index, 'steps_run': steps_run}
+
+
+def compute_functional_batch(stack_rule_function, grid_size: Tuple[int, int] = (16, 16),
+                             n_patterns: int = 5, n_trials: int = 3, n_samples: int = 5,
+                             noise_level: float = 0.1, capacity_steps: int = 30,
+                             robustness_steps: int = 30, basin_steps: int = 20,
+                             seed: SeedLike = None, plan=None) -> Tuple[Dict, Dict, Dict]:
+    """
+    Capacity, robustness et basin d'une règle en une seule pile (N, H, W).
+    
+    Les patterns des trois tests sont tirés dans le même ordre que des
+    appels successifs à compute_memory_capacity, compute_robustness_to_noise
+    et compute_basin_size, puis évolués ensemble par
+    evolve_stack_to_fixed_points. Avec seed=None (état global np.random),
+    résultats identiques aux trois appels.
+    
+    Args:
+        stack_rule_function: Fonction stack -> new_stack (ex.
+            core.ca_vectorized.create_stack_rule_function_vectorized)
+        grid_size: Taille de grille
+        n_patterns, capacity_steps: Paramètres de compute_memory_capacity
+        n_trials, noise_level, robustness_steps: Paramètres de
+            compute_robustness_to_noise
+        n_samples, basin_steps: Paramètres de compute_basin_size
+        seed: Flux des tirages (int, SeedSequence ou np.random.Generator,
+            cf. core.rng) ; None = état global np.random
+        plan: TrajectoryPlan de la même règle (optionnel) : les patterns y
+            sont demandés comme trajectoires et simulés dans la pile des
+            autres consommateurs du plan (stack_rule_function est alors
+            ignorée). Résultats identiques.
+    
+    Returns:
+        (capacity_result, robustness_result, basin_result) ; le
+        'steps_saved' de chaque résultat ne compte que ses propres
+        échantillons (la somme des trois est le total de la pile)
+    """
+    height, width = grid_size
+    rng = LegacyRandom() if seed is None else make_rng(seed)
+    
+    # Tirages dans l'ordre des appels séquentiels
+    capacity_patterns = [(rng.random((height, width)) < 0.3).astype(int)
+                         for _ in range(n_patterns)]
+    
+    noisy_patterns = []
+    for trial in range(n_trials):
+        noisy = np.zeros((height, width), dtype=int)
+        noisy[::2, ::2] = 1
+        noisy[1::2, 1::2] = 1
+        n_flips = int(height * width * noise_level)
+        for _ in range(n_flips):
+            i, j = rng.integers(0, height), rng.integers(0, width)
+            noisy[i, j] = 1 - noisy[i, j]
+        noisy_patterns.append(noisy)
+    
+    basin_patterns = [(rng.random((height, width)) < 0.3).astype(int)
+                      for _ in range(n_samples)]
+    
+    patterns = capacity_patterns + noisy_patterns + basin_patterns
+    if not patterns:
+        return (compute_memory_capacity(stack_rule_function, grid_size, 0, capacity_steps),
+                compute_robustness_to_noise(stack_rule_function, grid_size, noise_level, 0,
+                                            robustness_steps),
+                compute_basin_size(stack_rule_function, grid_size, 0, basin_steps))
+    
+    # Horizons : stabilité testée 1 step (capacity) ou 5 steps (robustness)
+    # après l'évolution ; basin s'arrête au point fixe ou à basin_steps
+    horizons = np.array([capacity_steps + 1] * n_patterns
+                        + [robustness_steps + 5] * n_trials
+                        + [basin_steps] * n_samples)
+    report_steps = np.array([capacity_steps] * n_patterns
+                            + [robustness_steps] * n_trials
+                            + [basin_steps] * n_samples)
+    
+    if plan is None:
+        run = evolve_stack_to_fixed_points(stack_rule_function, np.stack(patterns),
+                                           horizons, report_steps)
+    else:
+        run = _plan_fixed_points(plan, patterns, horizons, report_steps)
+    states, fixed_index = run['states'], run['fixed_index']
+    saved = horizons - run['steps_run']
+    
+    # Capacity : stable ssi l'état au step `steps` est un point fixe
+    stable_patterns = 0
+    distinct_finals = []
+    for k in range(n_patterns):
+        if 0 <= fixed_index[k] <= capacity_steps:
+            final_hash = hash(states[k].tobytes())
+            if final_hash not in distinct_finals:
+                distinct_finals.append(final_hash)
+                stable_patterns += 1
+    
+    # Robustness : nombre de steps t in [steps, steps + 5) avec S_{t+1} == S_t
+    robustness_scores = []
+    for k in range(n_patterns, n_patterns + n_trials):
+        f = fixed_index[k]
+        stability = 0 if f < 0 else robustness_steps + 5 - max(f, robustness_steps)
+        robustness_scores.append(stability / 5)
+    
+    # Basin : hash de l'état final (point fixe ou état au step basin_steps)
+    attractors = [hash(states[k].tobytes()) for k in range(n_patterns + n_trials, len(patterns))]
+    unique_attractors = len(set(attractors))
+    basin_diversity = unique_attractors / n_samples if n_samples > 0 else 0
+    if basin_diversity < 0.2:
+        basin_score = basin_diversity * 2
+    elif basin_diversity > 0.8:
+        basin_score = (1.0 - basin_diversity) * 5
+    else:
+        basin_score = basin_diversity
+    
+    capacity_result = {
+        'capacity_score': stable_patterns / n_patterns if n_patterns > 0 else 0,
+        'stable_patterns': stable_patterns,
+        'total_patterns': n_patterns,
+        'distinct_finals': len(distinct_finals),
+        'steps_saved': int(saved[:n_patterns].sum())
+    }
+    robustness_result = {
+        'robustness_score': np.mean(robustness_scores),
+        'noise_level': noise_level,
+        'n_trials': n_trials,
+        'steps_saved': int(saved[n_patterns:n_patterns + n_trials].sum())
+    }
+    basin_result = {
+        'basin_score': basin_score,
+        'basin_diversity': basin_diversity,
+        'unique_attractors': unique_attractors,
+        'n_samples': n_samples,
+        'steps_saved': int(saved[n_patterns + n_trials:].sum())
     }
+    return capacity_result, robustness_result, basin_result
 
 
 def compute_functional_score(capacity_result: Dict, robustness_result: Dict, 
@@ -340,6 +607,8 @@ __all__ = [
     'compute_memory_capacity',
     'compute_robustness_to_noise',
     'compute_basin_size',
+    'evolve_stack_to_fixed_points',
+    'compute_functional_batch',
     'compute_functional_score',
     'infer_module_profile',
     'compute_life_pattern_capacity'
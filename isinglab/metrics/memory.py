@@ -7,9 +7,224 @@ Quantifies memory-like behavior through:
 - Return-time statistics
 """
 
+import hashlib
 import numpy as np
 from typing import List, Dict, Tuple, Optional
-from collections import defaultdict
+from collections import defaultdict, deque
+
+
+def state_digest(state: np.ndarray) -> bytes:
+    """
+    Compact digest of a state's contents (shape, dtype and bytes).
+    
+    Equal states give equal digests; use it in place of tuple(state.flatten())
+    when states are large or must be kept for a long trajectory.
+    """
+    state = np.ascontiguousarray(state)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{state.dtype.str}{state.shape}".encode())
+    h.update(state.tobytes())
+    return h.digest()
+
+
+class CycleDetector:
+    """
+    Online attractor detector.
+    
+    Each state is hashed once; a dict maps digests to the index where the
+    state was first seen. The first time a state repeats, the transient
+    (index of its first occurrence) and the period are known. For
+    deterministic dynamics the trajectory stays on that cycle, so a
+    simulation can stop as soon as `update` reports it.
+    
+    Example:
+        >>> detector = CycleDetector()
+        >>> for t in range(max_steps):
+        ...     if detector.update(state) is not None:
+        ...         break
+        ...     state = rule(state)
+    """
+    
+    def __init__(self, verify: bool = True):
+        """
+        Args:
+            verify: Confirm digest matches with a byte compare. Keeps the raw
+                bytes of every distinct state; with verify=False only the
+                128-bit digests are kept (bounded memory, collisions are
+                astronomically unlikely).
+        """
+        self.verify = verify
+        self.n_states = 0
+        self.cycle: Optional[Tuple[int, int]] = None
+        self._seen: Dict[bytes, List[Tuple[int, Optional[bytes]]]] = {}
+    
+    def update(self, state: np.ndarray) -> Optional[Tuple[int, int]]:
+        """
+        Feed the next state of the trajectory.
+        
+        Returns:
+            (transient, period) once a state has repeated, None before
+        """
+        t = self.n_states
+        self.n_states += 1
+        if self.cycle is not None:
+            return self.cycle
+        
+        data = np.ascontiguousarray(state).tobytes() if self.verify else None
+        bucket = self._seen.setdefault(state_digest(state), [])
+        for first_index, first_data in bucket:
+            if first_data == data:
+                self.cycle = (first_index, t - first_index)
+                return self.cycle
+        
+        # New state (or a digest collision with a different state)
+        bucket.append((t, data))
+        return None
+    
+    @property
+    def n_unique_states(self) -> int:
+        """Number of distinct states seen before the first repeat."""
+        return sum(len(bucket) for bucket in self._seen.values())
+
+
+class ShortCycleDetector:
+    """
+    Online detector for fixed points and short cycles.
+    
+    Only the last `max_period` states are kept, so memory stays bounded
+    however long the trajectory. Once a state repeats within that window,
+    the cycle states are known and any later state can be read off the
+    cycle with `state_at` instead of being simulated.
+    """
+    
+    def __init__(self, max_period: int = 16):
+        """
+        Args:
+            max_period: Longest period detected (size of the state window)
+        """
+        if max_period < 1:
+            raise ValueError(f"max_period must be >= 1, got: {max_period}")
+        self.max_period = max_period
+        self.n_states = 0
+        self.cycle: Optional[Tuple[int, int]] = None
+        self.cycle_states: List[np.ndarray] = []
+        self._window = deque()
+        self._index: Dict[bytes, int] = {}
+    
+    def update(self, state: np.ndarray) -> Optional[Tuple[int, int]]:
+        """
+        Feed the next state of the trajectory (kept by reference).
+        
+        Returns:
+            (transient, period) once a state has repeated, None before
+        """
+        t = self.n_states
+        self.n_states += 1
+        if self.cycle is not None:
+            return self.cycle
+        
+        digest = state_digest(state)
+        s = self._index.get(digest)
+        if s is not None:
+            start = self._window[0][0]
+            if np.array_equal(self._window[s - start][2], state):
+                self.cycle = (s, t - s)
+                # States s+1..t: one full turn of the cycle, ending on the repeat
+                self.cycle_states = [w[2] for w in self._window if w[0] > s] + [state]
+                return self.cycle
+        
+        self._window.append((t, digest, state))
+        self._index[digest] = t
+        if len(self._window) > self.max_period:
+            old_t, old_digest, _ = self._window.popleft()
+            if self._index.get(old_digest) == old_t:
+                del self._index[old_digest]
+        return None
+    
+    def state_at(self, t: int) -> np.ndarray:
+        """State at time t (t > transient), read off the detected cycle."""
+        if self.cycle is None:
+            raise ValueError("No cycle detected yet")
+        transient, period = self.cycle
+        if t <= transient:
+            raise ValueError(f"t={t} is in the transient (<= {transient})")
+        return self.cycle_states[(t - transient - 1) % period]
+
+
+def run_until_attractor(
+    rule_function,
+    state: np.ndarray,
+    steps: int,
+    max_period: int = 16
+) -> Dict:
+    """
+    Evolve a rule function for `steps` steps, stopping early on an attractor.
+    
+    As soon as a fixed point or a cycle of period <= max_period is reached,
+    the remaining steps are read off the cycle instead of simulated. The
+    returned state is the one a plain `steps`-step loop would give.
+    
+    Args:
+        rule_function: Function grid -> new_grid
+        state: Initial state
+        steps: Step budget
+        max_period: Longest period detected
+        
+    Returns:
+        Dict with final_state, transient, period (None if no attractor was
+        reached), steps_run (simulated) and steps_saved
+    """
+    detector = ShortCycleDetector(max_period)
+    detector.update(state)
+    
+    steps_run = 0
+    while steps_run < steps and detector.cycle is None:
+        state = rule_function(state)
+        steps_run += 1
+        detector.update(state)
+    
+    transient, period = detector.cycle if detector.cycle is not None else (None, None)
+    if steps_run < steps:
+        state = detector.state_at(steps)
+    
+    return {
+        'final_state': state,
+        'transient': transient,
+        'period': period,
+        'steps_run': steps_run,
+        'steps_saved': steps - steps_run
+    }
+
+
+def first_occurrences(history: List[np.ndarray], digests: Optional[List[bytes]] = None) -> List[int]:
+    """
+    Index of the first occurrence of every state of a history.
+    
+    States are compared by digest, confirmed by a byte compare.
+    
+    Args:
+        history: Sequence of states
+        digests: Precomputed `state_digest` of each state (optional)
+        
+    Returns:
+        first[t] = smallest s with history[s] == history[t]
+    """
+    if digests is None:
+        digests = [state_digest(state) for state in history]
+    
+    seen: Dict[bytes, List[int]] = {}
+    first = []
+    for t, digest in enumerate(digests):
+        bucket = seen.setdefault(digest, [])
+        for s in bucket:
+            if np.array_equal(history[s], history[t]):
+                first.append(s)
+                break
+        else:
+            bucket.append(t)
+            first.append(t)
+    
+    return first
 
 
 def detect_cycle(history: List[np.ndarray], max_period: int = 100) -> Optional[Tuple[int, int]]:
@@ -28,35 +243,54 @@ def detect_cycle(history: List[np.ndarray], max_period: int = 100) -> Optional[T
     if n < 2:
         return None
     
-    # Convert states to hashable tuples for comparison
-    state_hashes = [tuple(state.flatten()) for state in history]
+    # Hash every state once; digest matches are confirmed on the states
+    digests = [state_digest(state) for state in history]
+    
+    return detect_cycle_in_keys(digests, n, max_period, states=history)
+
+
+def detect_cycle_in_keys(
+    keys,
+    n: int,
+    max_period: int = 100,
+    states: Optional[List[np.ndarray]] = None
+) -> Optional[Tuple[int, int]]:
+    """
+    Cycle detection on hashable state keys.
+    
+    Finds the smallest period p <= min(max_period, n // 2) such that the
+    last 2 * p states repeat with period p, and reports (n - 2 * p, p).
+    Only the last 2 * max_period states are ever compared, so `keys` may
+    hold just the trailing states of a longer trajectory.
+    
+    Args:
+        keys: Hashable keys (e.g. digests) of the last len(keys) states
+        n: Total number of states in the trajectory
+        max_period: Maximum cycle period to check
+        states: Full state list, used to confirm key matches byte for byte
+        
+    Returns:
+        (transient_length, period) if cycle found, None otherwise
+    """
+    if n < 2:
+        return None
+    
+    start = n - len(keys)
+    
+    def same(i, j):
+        if keys[i - start] != keys[j - start]:
+            return False
+        return states is None or np.array_equal(states[i], states[j])
     
-    # Check for cycles starting from the end
+    last = n - 1
     for period in range(1, min(max_period, n // 2) + 1):
-        # Check if last 'period' states repeat
-        is_cycle = True
-        for offset in range(period):
-            if n - 1 - offset < period:
-                is_cycle = False
-                break
-            
-            idx1 = n - 1 - offset
-            idx2 = n - 1 - offset - period
-            
-            if state_hashes[idx1] != state_hashes[idx2]:
-                is_cycle = False
-                break
+        # Only periods where the last state recurs can be cycles
+        if not same(last, last - period):
+            continue
         
-        if is_cycle:
-            # Found cycle, now find when it started (transient)
-            transient = n - 2 * period
-            
-            # Verify cycle is stable
-            for i in range(transient, n - period):
-                if state_hashes[i] != state_hashes[i + period]:
-                    break
-            else:
-                return (transient, period)
+        # The last 2 * period states must repeat with this period
+        if all(same(i, i + period) for i in range(n - 2 * period, n - period - 1)):
+            return (n - 2 * period, period)
     
     return None
 
@@ -81,24 +315,53 @@ def attractor_analysis(history: List[np.ndarray], max_period: int = 100) -> Dict
         - transient: Length of transient behavior
         - stability: Measure of attractor stability
     """
+    if len(history) < 2:
+        return classify_attractor([], len(history), 0, max_period)
+    
+    # Count unique states (each state hashed once)
+    digests = [state_digest(state) for state in history]
+    first = first_occurrences(history, digests)
+    unique_states = sum(1 for t, s in enumerate(first) if s == t)
+    
+    return classify_attractor(digests, len(history), unique_states, max_period, states=history)
+
+
+def classify_attractor(
+    keys,
+    n: int,
+    unique_states: int,
+    max_period: int = 100,
+    states: Optional[List[np.ndarray]] = None
+) -> Dict:
+    """
+    Attractor classification from hashable state keys.
+    
+    Args:
+        keys: Hashable keys of the trailing states (at least 2 * max_period,
+            or all of them for shorter trajectories)
+        n: Total number of states in the trajectory
+        unique_states: Number of distinct states in the whole trajectory
+        max_period: Maximum cycle period to check
+        states: Full state list, used to confirm key matches (optional)
+        
+    Returns:
+        Same dictionary as `attractor_analysis`
+    """
     result = {
         "type": "unknown",
         "period": 0,
-        "transient": len(history),
+        "transient": n,
         "stability": 0.0,
         "n_unique_states": 0
     }
     
-    if len(history) < 2:
+    if n < 2:
         return result
     
-    # Count unique states
-    state_hashes = [tuple(state.flatten()) for state in history]
-    unique_states = len(set(state_hashes))
     result["n_unique_states"] = unique_states
     
     # Detect cycle
-    cycle_info = detect_cycle(history, max_period)
+    cycle_info = detect_cycle_in_keys(keys, n, max_period, states=states)
     
     if cycle_info is not None:
         transient, period = cycle_info
@@ -111,14 +374,14 @@ def attractor_analysis(history: List[np.ndarray], max_period: int = 100) -> Dict
             result["type"] = "cycle"
         
         # Stability: how much of trajectory is in attractor
-        result["stability"] = 1.0 - (transient / len(history))
+        result["stability"] = 1.0 - (transient / n)
     else:
         # No cycle detected
         if unique_states == 1:
             result["type"] = "fixed"
             result["period"] = 1
             result["stability"] = 1.0
-        elif unique_states < len(history) * 0.5:
+        elif unique_states < n * 0.5:
             # Many repeated states but no clear cycle
             result["type"] = "quasi-periodic"
             result["stability"] = 0.5
@@ -155,6 +418,24 @@ def memory_score(history: List[np.ndarray], max_period: int = 100) -> float:
     
     analysis = attractor_analysis(history, max_period)
     
+    return memory_score_from_analysis(analysis, len(history), max_period)
+
+
+def memory_score_from_analysis(analysis: Dict, n: int, max_period: int = 100) -> float:
+    """
+    Memory score from a precomputed attractor analysis.
+    
+    Args:
+        analysis: Output of `attractor_analysis` / `classify_attractor`
+        n: Number of states in the trajectory
+        max_period: Maximum cycle period used for the analysis
+        
+    Returns:
+        Memory score in [0, 1]
+    """
+    if n < 2:
+        return 0.0
+    
     # Base score from stability
     stability = analysis["stability"]
     
@@ -167,7 +448,7 @@ def memory_score(history: List[np.ndarray], max_period: int = 100) -> float:
     
     # Reward quick convergence
     transient = analysis["transient"]
-    convergence_factor = 1.0 - min(transient / len(history), 1.0)
+    convergence_factor = 1.0 - min(transient / n, 1.0)
     
     # Composite score
     memory = stability * (1.0 - period_penalty * 0.5) * (0.5 + 0.5 * convergence_factor)
@@ -197,21 +478,10 @@ def return_time_statistics(history: List[np.ndarray]) -> Dict:
             "recurrence_rate": 0.0
         }
     
-    # Hash states
-    state_hashes = [tuple(state.flatten()) for state in history]
-    
-    # Track first occurrence of each state
-    first_occurrence = {}
-    return_times = []
-    
-    for t, state_hash in enumerate(state_hashes):
-        if state_hash in first_occurrence:
-            # Recurrence detected
-            first_t = first_occurrence[state_hash]
-            return_time = t - first_t
-            return_times.append(return_time)
-        else:
-            first_occurrence[state_hash] = t
+    # First occurrence of each state (digest-based)
+    return_times = [
+        t - first_t for t, first_t in enumerate(first_occurrences(history)) if first_t != t
+    ]
     
     if return_times:
         mean_rt = np.mean(return_times)
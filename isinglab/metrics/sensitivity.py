@@ -5,7 +5,9 @@ Quantifies sensitivity to initial conditions - a hallmark of chaos.
 """
 
 import numpy as np
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Union
+
+from ..core.rng import SeedLike, make_rng, spawn_rngs
 
 
 def hamming_distance(state1: np.ndarray, state2: np.ndarray) -> float:
@@ -21,13 +23,64 @@ def hamming_distance(state1: np.ndarray, state2: np.ndarray) -> float:
     return np.mean(state1 != state2)
 
 
+def flip_values(values: np.ndarray, spins: bool) -> np.ndarray:
+    """Flipped cell values: -s for ±1 spins, 1 - b for 0/1 bits."""
+    return -values if spins else 1 - values
+
+
+def _is_spin_state(state: np.ndarray) -> bool:
+    """
+    Fallback guess when the caller does not say: ±1 spin grids hold
+    negative values, CA grids are 0/1. An all-+1 spin grid is misread as
+    bits, so callers that know the model should pass `spins` explicitly.
+    """
+    return bool(np.any(state < 0))
+
+
+def perturb_states(
+    initial_state: np.ndarray,
+    n_flips: int,
+    rngs: List,
+    spins: Optional[bool] = None
+) -> np.ndarray:
+    """
+    Stack of perturbed copies of a state, one per random stream.
+    
+    Each copy gets n_flips distinct cells flipped, drawn from its own
+    stream; all flips are applied with a single fancy-indexing assignment.
+    
+    Args:
+        initial_state: State to perturb
+        n_flips: Cells flipped per copy
+        rngs: One random stream per copy (see core.rng.spawn_rngs)
+        spins: ±1 spin values (auto-detected from negative values if None)
+        
+    Returns:
+        Array of shape (len(rngs),) + initial_state.shape
+    """
+    if spins is None:
+        spins = _is_spin_state(initial_state)
+    
+    flat = np.repeat(initial_state.reshape(1, -1), len(rngs), axis=0)
+    if len(rngs) == 0:
+        return flat.reshape((0,) + initial_state.shape)
+    
+    flip_indices = np.stack([rng.choice(flat.shape[1], n_flips, replace=False) for rng in rngs])
+    rows = np.arange(len(rngs))[:, None]
+    flat[rows, flip_indices] = flip_values(flat[rows, flip_indices], spins)
+    return flat.reshape((len(rngs),) + initial_state.shape)
+
+
 def hamming_sensitivity(
     evolution_func: Callable,
     initial_state: np.ndarray,
     steps: int,
     perturbation: float = 0.01,
     n_samples: int = 5,
-    seed: Optional[int] = None
+    seed: SeedLike = None,
+    batch_evolution_func: Optional[Callable] = None,
+    reference_final: Optional[np.ndarray] = None,
+    spins: Optional[bool] = None
 ) -> float:
     """
     Compute sensitivity to initial conditions via Hamming distance.
@@ -38,31 +91,48 @@ def hamming_sensitivity(
         evolution_func: Function that evolves a state for 'steps' steps
         initial_state: Reference initial condition
         steps: Number of evolution steps
-        perturbation: Fraction of bits to flip (0.01 = 1%)
+        perturbation: Fraction of bits to flip (0.01 = 1%; spins are
+            negated, bits are inverted)
         n_samples: Number of perturbed trajectories to average
-        seed: Random seed
+        seed: Random seed; each sample draws its flips from its own
+            SeedSequence child stream (one global stream in legacy mode)
+        batch_evolution_func: Optional function (stack, steps) -> stack that
+            evolves a stack of states (leading axis) in one pass. When given,
+            the reference and all perturbed states are evolved together;
+            the result is the same as the per-sample path.
+        reference_final: State of the unperturbed trajectory after `steps`
+            when it is already known (e.g. from the evaluated history); the
+            reference run is then not simulated again.
+        spins: ±1 spin values (Ising) rather than 0/1 bits (CA); guessed
+            from the initial state if None
         
     Returns:
         Mean Hamming distance at final time (proxy for sensitivity)
     """
-    if seed is not None:
-        np.random.seed(seed)
+    sample_rngs = spawn_rngs(seed, n_samples)
+    n_flips = max(1, int(initial_state.size * perturbation))
+    if spins is None:
+        spins = _is_spin_state(initial_state)
+    
+    if batch_evolution_func is not None:
+        perturbed = perturb_states(initial_state, n_flips, sample_rngs, spins)
+        if reference_final is None:
+            finals = batch_evolution_func(np.concatenate([initial_state[None], perturbed]), steps)
+            reference_final, finals = finals[0], finals[1:]
+        else:
+            finals = batch_evolution_func(perturbed, steps)
+        distances = np.mean(finals != reference_final[None], axis=tuple(range(1, finals.ndim)))
+        return np.mean(distances)
     
     # Evolve reference trajectory
-    reference_final = evolution_func(initial_state.copy(), steps)
+    if reference_final is None:
+        reference_final = evolution_func(initial_state.copy(), steps)
     
     distances = []
-    for _ in range(n_samples):
-        # Create perturbed initial state
-        perturbed = initial_state.copy()
-        n_flips = max(1, int(perturbed.size * perturbation))
-        flat_perturbed = perturbed.flatten()
-        flip_indices = np.random.choice(len(flat_perturbed), n_flips, replace=False)
-        
-        for idx in flip_indices:
-            flat_perturbed[idx] = 1 - flat_perturbed[idx]  # Flip bit
-        
-        perturbed = flat_perturbed.reshape(initial_state.shape)
+    for rng in sample_rngs:
+        # Create perturbed initial state (draws interleave with evolution,
+        # as the legacy global-stream results depend on this order)
+        perturbed = perturb_states(initial_state, n_flips, [rng], spins)[0]
         
         # Evolve perturbed trajectory
         perturbed_final = evolution_func(perturbed, steps)
@@ -80,7 +150,8 @@ def lyapunov_exponent(
     steps: int,
     perturbation: float = 0.01,
     transient: int = 50,
-    seed: Optional[int] = None
+    seed: SeedLike = None,
+    batch_evolution_func: Optional[Callable] = None
 ) -> float:
     """
     Estimate Lyapunov exponent for discrete systems.
@@ -97,44 +168,41 @@ def lyapunov_exponent(
         perturbation: Initial perturbation size
         transient: Steps to skip (transient behavior)
         seed: Random seed
+        batch_evolution_func: Optional function (stack, steps) -> stack; the
+            reference and perturbed states are then advanced together, one
+            call per step instead of two
         
     Returns:
         Estimated Lyapunov exponent
     """
-    if seed is not None:
-        np.random.seed(seed)
+    rng = make_rng(seed)
     
     # Initial perturbation
-    state1 = initial_state.copy()
-    state2 = initial_state.copy()
-    
-    n_flips = max(1, int(state2.size * perturbation))
-    flat_state2 = state2.flatten()
-    flip_indices = np.random.choice(len(flat_state2), n_flips, replace=False)
-    
-    for idx in flip_indices:
-        flat_state2[idx] = 1 - flat_state2[idx]
-    
-    state2 = flat_state2.reshape(initial_state.shape)
+    n_flips = max(1, int(initial_state.size * perturbation))
+    state2 = perturb_states(initial_state, n_flips, [rng])[0]
+    pair = np.stack([initial_state, state2])
     
-    d0 = hamming_distance(state1, state2)
+    d0 = hamming_distance(pair[0], pair[1])
     
     if d0 == 0:
         return 0.0
     
+    if batch_evolution_func is not None:
+        advance = lambda states: batch_evolution_func(states, 1)
+    else:
+        advance = lambda states: np.stack([evolution_func(state, 1) for state in states])
+    
     # Skip transient
     for _ in range(transient):
-        state1 = evolution_func(state1, 1)
-        state2 = evolution_func(state2, 1)
+        pair = advance(pair)
     
     # Measure divergence
     log_divergences = []
     
     for t in range(1, steps + 1):
-        state1 = evolution_func(state1, 1)
-        state2 = evolution_func(state2, 1)
+        pair = advance(pair)
         
-        dt = hamming_distance(state1, state2)
+        dt = hamming_distance(pair[0], pair[1])
         
         if dt > 0:
             log_div = np.log(dt / d0)
@@ -153,7 +221,11 @@ def mutual_information(history: List[np.ndarray], lag: int = 1) -> float:
     """
     Compute mutual information between states at time t and t+lag.
     
-    Measures predictability and memory in the dynamics.
+    Measures predictability and memory in the dynamics. Whole states are
+    the symbols: each frame is hashed once (memory.state_digest) and
+    (digest_t, digest_t+lag) pairs are counted. On large grids nearly every
+    state is unique, so see `local_mutual_information` for a per-cell
+    estimate.
     
     Args:
         history: Sequence of states
@@ -162,20 +234,20 @@ def mutual_information(history: List[np.ndarray], lag: int = 1) -> float:
     Returns:
         Mutual information (bits)
     """
+    from collections import Counter
+    from .memory import state_digest
+    
     if len(history) < lag + 1:
         return 0.0
     
     # Discretize states (use spatial patterns as symbols)
-    def state_to_symbol(state):
-        return tuple(state.flatten())
+    digests = [state_digest(state) for state in history]
     
     # Extract symbol sequences
-    symbols_t = [state_to_symbol(history[i]) for i in range(len(history) - lag)]
-    symbols_t_lag = [state_to_symbol(history[i + lag]) for i in range(len(history) - lag)]
+    symbols_t = digests[:len(history) - lag]
+    symbols_t_lag = digests[lag:]
     
     # Count joint and marginal probabilities
-    from collections import Counter
-    
     joint_counts = Counter(zip(symbols_t, symbols_t_lag))
     counts_t = Counter(symbols_t)
     counts_t_lag = Counter(symbols_t_lag)
@@ -194,3 +266,98 @@ def mutual_information(history: List[np.ndarray], lag: int = 1) -> float:
     
     return mi
 
+
+def local_mutual_information(
+    history: Union[np.ndarray, List[np.ndarray]],
+    lag: int = 1,
+    block_size: int = 1,
+    wrap: bool = False
+) -> np.ndarray:
+    """
+    Mutual information between x_t and x_t+lag at every cell (or block).
+    
+    Each cell (block_size=1) or block (sliding block_size-wide window, as
+    in spatial_entropy) is a symbol sequence over time. The joint
+    histograms of (symbol_t, symbol_t+lag) for all positions are counted
+    together (sparsely: only the pairs that occur), then the MI of every
+    position is computed at once.
+    
+    Args:
+        history: Sequence of equally-shaped 1D or 2D states
+        lag: Time lag
+        block_size: Block edge length (1 = single cells)
+        wrap: Include blocks that wrap around periodic boundaries
+        
+    Returns:
+        MI map (bits) with one value per block position: the grid shape for
+        block_size=1 or wrap=True, else each axis shrunk by block_size - 1
+    """
+    from .entropy import _block_codes
+    
+    frames = np.asarray(history)
+    n_spatial = frames.ndim - 1
+    if n_spatial not in (1, 2):
+        raise ValueError(f"Expected a sequence of 1D or 2D states, got shape {frames.shape}")
+    
+    if np.all((frames == 0) | (frames == 1)) or np.all((frames == -1) | (frames == 1)):
+        bits = frames > 0
+    else:
+        # Generic values: relabel cells 0..k-1, one bit plane per label bit
+        _, labels = np.unique(frames, return_inverse=True)
+        labels = labels.reshape(frames.shape)
+        n_label_bits = max(1, int(labels.max()).bit_length())
+        if n_label_bits * block_size ** n_spatial > 16:
+            raise ValueError("Too many distinct values for the block size")
+        codes = sum(
+            _block_codes((labels >> b) & 1, block_size, n_spatial, wrap) << (b * block_size ** n_spatial)
+            for b in range(n_label_bits)
+        )
+        return _local_mi_from_codes(codes, frames, lag, block_size, n_spatial, wrap,
+                                    1 << (n_label_bits * block_size ** n_spatial))
+    
+    if block_size ** n_spatial > 16:
+        raise ValueError(f"Block of {block_size ** n_spatial} cells is too large for joint histograms")
+    codes = _block_codes(bits, block_size, n_spatial, wrap)
+    return _local_mi_from_codes(codes, frames, lag, block_size, n_spatial, wrap,
+                                1 << block_size ** n_spatial)
+
+
+def _local_mi_from_codes(codes: np.ndarray, frames: np.ndarray, lag: int, block_size: int,
+                         n_spatial: int, wrap: bool, n_codes: int) -> np.ndarray:
+    """Per-position MI from (T, n_positions) symbol codes."""
+    sizes = frames.shape[1:]
+    out_shape = sizes if wrap else tuple(max(0, n - block_size + 1) for n in sizes)
+    n_frames, n_positions = codes.shape
+    n_pairs = n_frames - lag
+    if n_pairs < 1 or n_positions == 0:
+        return np.zeros(out_shape)
+    
+    # Relabel the codes actually used so histograms stay small
+    used, codes = np.unique(codes, return_inverse=True)
+    codes = codes.reshape(n_frames, n_positions)
+    n_codes = len(used)
+    
+    # Sparse joint histogram: only the (position, code_t, code_t+lag)
+    # triples that occur are counted (a dense one has n_positions * n_codes^2
+    # counters, i.e. billions for 3x3 blocks on a 100x100 grid)
+    later = codes[lag:] if lag > 0 else codes
+    position = np.broadcast_to(np.arange(n_positions, dtype=np.int64), later.shape)
+    keys = (position * n_codes + codes[:n_pairs]) * n_codes + later
+    keys, counts = np.unique(keys.ravel(), return_counts=True)
+    p_joint = counts / n_pairs
+    
+    key_position = keys // (n_codes * n_codes)
+    key_t = keys // n_codes          # (position, code_t)
+    key_t_lag = key_position * n_codes + keys % n_codes  # (position, code_t+lag)
+    p_t = _sum_by_key(key_t, p_joint)
+    p_t_lag = _sum_by_key(key_t_lag, p_joint)
+    
+    terms = p_joint * np.log2(p_joint / (p_t * p_t_lag))
+    mi = np.bincount(key_position, weights=terms, minlength=n_positions)
+    return mi.reshape(out_shape)
+
+
+def _sum_by_key(keys: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Sum of `weights` over equal keys, broadcast back to each entry."""
+    _, inverse = np.unique(keys, return_inverse=True)
+    return np.bincount(inverse, weights=weights)[inverse]
@@ -0,0 +1,156 @@
+"""
+Streaming metric accumulators.
+
+Lets the edge-of-chaos metrics be computed from a trajectory without
+keeping every frame: each state is folded into running statistics
+(activity series, per-step differences, state digests for cycle
+detection) as soon as it is produced.
+"""
+
+import numpy as np
+from collections import deque
+from typing import Callable, Dict, List, Optional
+from .entropy import shannon_entropy, spatial_entropy, activity_level
+from .sensitivity import hamming_sensitivity
+from .memory import state_digest, classify_attractor, memory_score_from_analysis
+
+
+class StreamingMetrics:
+    """
+    Incremental accumulator over a state trajectory.
+    
+    Keeps the first and last frames, the activity of every frame, the
+    Hamming difference between consecutive frames, the set of distinct
+    state digests and the digests of the last 2 * max_period frames
+    (all that cycle detection looks at). Memory use is independent of
+    the grid size times trajectory length.
+    """
+    
+    def __init__(self, max_period: int = 100):
+        """
+        Args:
+            max_period: Maximum cycle period for attractor detection
+        """
+        self.max_period = max_period
+        self.n_frames = 0
+        self.first: Optional[np.ndarray] = None
+        self.last: Optional[np.ndarray] = None
+        self.activities: List[float] = []
+        self.diffs: List[float] = []
+        self._unique_digests = set()
+        self._recent_digests = deque(maxlen=2 * max_period)
+    
+    @classmethod
+    def from_history(cls, history: List[np.ndarray], max_period: int = 100) -> "StreamingMetrics":
+        """Build an accumulator from an already recorded history."""
+        stream = cls(max_period=max_period)
+        for state in history:
+            stream.update(state)
+        return stream
+    
+    def update(self, state: np.ndarray):
+        """Fold one new state into the running statistics."""
+        if self.last is None:
+            self.first = state.copy()
+        else:
+            self.diffs.append(np.mean(self.last != state))
+        
+        self.last = state.copy()
+        self.activities.append(activity_level(state))
+        
+        digest = state_digest(state)
+        self._unique_digests.add(digest)
+        self._recent_digests.append(digest)
+        self.n_frames += 1
+    
+    @property
+    def n_unique_states(self) -> int:
+        """Number of distinct states seen so far."""
+        return len(self._unique_digests)
+    
+    def attractor_analysis(self) -> Dict:
+        """Same result as `memory.attractor_analysis` on the full history."""
+        return classify_attractor(
+            list(self._recent_digests), self.n_frames, self.n_unique_states, self.max_period
+        )
+    
+    def memory_score(self) -> float:
+        """Same result as `memory.memory_score` on the full history."""
+        if self.n_frames < 2:
+            return 0.0
+        return memory_score_from_analysis(self.attractor_analysis(), self.n_frames, self.max_period)
+    
+    def lambda_estimate(self) -> float:
+        """Same result as `edge_score.lambda_parameter_estimate` on the full history."""
+        if self.n_frames < 2:
+            return 0.0
+        lambda_est = self.activities[-1] * (1.0 + np.std(self.activities))
+        return float(np.clip(lambda_est, 0.0, 1.0))
+
+
+def composite_edge_metric_from_stream(
+    stream: StreamingMetrics,
+    evolution_func: Optional[Callable] = None,
+    steps: int = 50,
+    seed: int = 42,
+    batch_evolution_func: Optional[Callable] = None,
+    spins: Optional[bool] = None
+) -> Dict:
+    """
+    Compute `composite_edge_metric` from a streaming accumulator.
+    
+    Args:
+        stream: Accumulator fed with every state of the trajectory
+        evolution_func: Optional evolution function for sensitivity calculation
+            (evolved from the first recorded state)
+        steps: Steps for sensitivity measurement
+        seed: Random seed
+        batch_evolution_func: Optional stack evolution function (see
+            hamming_sensitivity)
+        spins: ±1 spin states (Ising) rather than 0/1 bits; guessed from
+            the first state if None
+        
+    Returns:
+        Same dictionary as `composite_edge_metric`
+    """
+    from .edge_score import edge_score_from_state
+    
+    if stream.n_frames < 2:
+        return {
+            "entropy": 0.0,
+            "spatial_entropy": 0.0,
+            "sensitivity": 0.0,
+            "memory_score": 0.0,
+            "edge_score": 0.0,
+            "activity": 0.0,
+            "attractor_type": "unknown",
+            "attractor_period": 0
+        }
+    
+    final_state = stream.last
+    entropy = shannon_entropy(final_state)
+    spatial_ent = spatial_entropy(final_state)
+    memory = stream.memory_score()
+    activity = activity_level(final_state)
+    attractor_info = stream.attractor_analysis()
+    
+    if evolution_func is not None:
+        sensitivity = hamming_sensitivity(evolution_func, stream.first, steps=steps, seed=seed,
+                                          batch_evolution_func=batch_evolution_func, spins=spins)
+    else:
+        # Estimate from history variability
+        sensitivity = np.mean(stream.diffs)
+    
+    edge = edge_score_from_state(final_state, sensitivity=sensitivity, memory=memory)
+    
+    return {
+        "entropy": float(entropy),
+        "spatial_entropy": float(spatial_ent),
+        "sensitivity": float(sensitivity),
+        "memory_score": float(memory),
+        "edge_score": float(edge),
+        "activity": float(activity),
+        "attractor_type": attractor_info["type"],
+        "attractor_period": attractor_info["period"],
+        "attractor_stability": attractor_info["stability"]
+    }
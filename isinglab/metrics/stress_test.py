@@ -10,14 +10,23 @@ from typing import Dict, List, Tuple, Callable
 import json
 from pathlib import Path
 
+from .memory import run_until_attractor
+from ..core.rng import LegacyRandom, make_rng
 
-def create_test_patterns(grid_size: Tuple[int, int]) -> List[np.ndarray]:
-    """Crée un set de patterns de test (pas seulement aléatoires)."""
+
+def create_test_patterns(grid_size: Tuple[int, int], rng=None) -> List[np.ndarray]:
+    """
+    Crée un set de patterns de test (pas seulement aléatoires).
+    
+    rng : générateur (np.random.Generator) ; None = état global np.random.
+    """
+    if rng is None:
+        rng = LegacyRandom()
     h, w = grid_size
     patterns = []
     
     # 1. Random (densité 0.3)
-    patterns.append((np.random.rand(h, w) < 0.3).astype(int))
+    patterns.append((rng.random((h, w)) < 0.3).astype(int))
     
     # 2. Blocs compacts (4x4 blocs)
     blocks = np.zeros((h, w), dtype=int)
@@ -46,17 +55,23 @@ def create_test_patterns(grid_size: Tuple[int, int]) -> List[np.ndarray]:
     return patterns
 
 
-def apply_noise(grid: np.ndarray, noise_prob: float) -> np.ndarray:
-    """Applique du bruit (flips aléatoires) à une grille."""
+def apply_noise(grid: np.ndarray, noise_prob: float, rng=None) -> np.ndarray:
+    """
+    Applique du bruit (flips aléatoires) à une grille.
+    
+    rng : générateur (np.random.Generator) ; None = état global np.random.
+    """
     if noise_prob <= 0:
         return grid.copy()
+    if rng is None:
+        rng = LegacyRandom()
     
     noisy = grid.copy()
     h, w = grid.shape
     n_flips = int(h * w * noise_prob)
     
     for _ in range(n_flips):
-        i, j = np.random.randint(0, h), np.random.randint(0, w)
+        i, j = rng.integers(0, h), rng.integers(0, w)
         noisy[i, j] = 1 - noisy[i, j]
     
     return noisy
@@ -66,7 +81,8 @@ def run_stress_test(rule_function: Callable,
                    grid_sizes: List[Tuple[int, int]] = None,
                    noise_levels: List[float] = None,
                    steps: int = 50,
-                   seed: int = 42) -> Dict:
+                   seed: int = 42,
+                   until_attractor: bool = True) -> Dict:
     """
     Stress-test complet : multi-grille + multi-bruit.
     
@@ -75,7 +91,11 @@ def run_stress_test(rule_function: Callable,
         grid_sizes: Liste de tailles [(h,w), ...]
         noise_levels: Liste de niveaux de bruit [0.0, 0.1, ...]
         steps: Steps d'évolution
-        seed: Random seed
+        seed: Random seed (flux np.random.Generator propre au test ; état
+            global np.random en mode legacy, cf. core.rng)
+        until_attractor: Arrêter chaque évolution dès qu'un point fixe ou un
+            cycle court est atteint (mêmes résultats, steps économisés
+            reportés dans summary['steps_saved'])
     
     Returns:
         Dict structuré avec résultats par grille et par bruit
@@ -86,7 +106,7 @@ def run_stress_test(rule_function: Callable,
     if noise_levels is None:
         noise_levels = [0.0, 0.01, 0.05, 0.1, 0.2, 0.3, 0.4]
     
-    np.random.seed(seed)
+    rng = make_rng(seed)
     
     results = {
         'config': {
@@ -99,29 +119,42 @@ def run_stress_test(rule_function: Callable,
         'by_noise_level': {},
         'summary': {}
     }
+    steps_saved = 0
+    
+    def evolve(state):
+        """Évolue `steps` steps ; renvoie (état final, période ou None)."""
+        nonlocal steps_saved
+        if not until_attractor:
+            for _ in range(steps):
+                state = rule_function(state)
+            return state, None
+        run = run_until_attractor(rule_function, state, steps)
+        steps_saved += run['steps_saved']
+        return run['final_state'], run['period']
     
     # Tests par taille de grille
     for grid_size in grid_sizes:
         size_key = f"{grid_size[0]}x{grid_size[1]}"
-        patterns = create_test_patterns(grid_size)
+        patterns = create_test_patterns(grid_size, rng)
         
         # Tester avec bruit = 0 d'abord
         stable_count = 0
         avg_final_density = []
         
         for pattern in patterns:
-            state = pattern.copy()
-            for _ in range(steps):
-                state = rule_function(state)
+            state, period = evolve(pattern.copy())
             
             # Vérifier stabilité (3 steps identiques)
-            is_stable = True
-            for _ in range(3):
-                next_state = rule_function(state)
-                if not np.array_equal(next_state, state):
-                    is_stable = False
-                    break
-                state = next_state
+            if period is not None:
+                is_stable = period == 1
+            else:
+                is_stable = True
+                for _ in range(3):
+                    next_state = rule_function(state)
+                    if not np.array_equal(next_state, state):
+                        is_stable = False
+                        break
+                    state = next_state
             
             if is_stable:
                 stable_count += 1
@@ -137,7 +170,7 @@ def run_stress_test(rule_function: Callable,
     
     # Tests par niveau de bruit (sur grille 32x32)
     base_grid_size = (32, 32)
-    patterns_base = create_test_patterns(base_grid_size)
+    patterns_base = create_test_patterns(base_grid_size, rng)
     
     for noise_level in noise_levels:
         noise_key = f"noise_{noise_level:.2f}"
@@ -145,12 +178,10 @@ def run_stress_test(rule_function: Callable,
         
         for pattern in patterns_base:
             # Ajouter bruit initial
-            noisy = apply_noise(pattern, noise_level)
+            noisy = apply_noise(pattern, noise_level, rng)
             
             # Évoluer
-            state = noisy.copy()
-            for _ in range(steps):
-                state = rule_function(state)
+            state, _ = evolve(noisy.copy())
             
             # Mesurer "recall" (similarité avec pattern original après évolution)
             # Note : recall parfait difficile, on mesure juste non-explosion
@@ -177,7 +208,8 @@ def run_stress_test(rule_function: Callable,
     results['summary'] = {
         'avg_stability_across_sizes': float(np.mean(size_stabilities)),
         'avg_recall_across_noise': float(np.mean(noise_recalls)),
-        'robustness_score': float(np.mean(noise_recalls))  # Score agrégé
+        'robustness_score': float(np.mean(noise_recalls)),  # Score agrégé
+        'steps_saved': steps_saved
     }
     
     return results
@@ -1,7 +1,14 @@
 """Oscillateur de phase : Kuramoto, XY-Model et dérivés."""
 
-from .kuramoto_xy import KuramotoXYEngine, MultiKernelConfig
-
-__all__ = ['KuramotoXYEngine', 'MultiKernelConfig']
+from .kuramoto_xy import (
+    KuramotoXYEngine,
+    KuramotoXYEnsemble,
+    MultiKernelConfig,
+    coupling_kernel_spectrum,
+    local_order_field
+)
+
+__all__ = ['KuramotoXYEngine', 'KuramotoXYEnsemble', 'MultiKernelConfig', 'coupling_kernel_spectrum',
+           'local_order_field']
 
 
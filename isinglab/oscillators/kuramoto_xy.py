@@ -6,6 +6,8 @@ Architecture:
 - Champ de phase θ(x,y) ∈ [0, 2π)
 - Multi-kernel : K1, K2, K3 avec portées et signes indépendants
 - Support GPU-ready via Numba
+- Couplage direct (Numba, O(R²) par cellule) ou par FFT périodique du champ
+  complexe e^{iθ} (O(log N) par cellule, pour les kernels longue portée)
 
 Équation de base (Kuramoto):
 dθ_i/dt = ω_i + Σ_j K_ij * sin(θ_j - θ_i)
@@ -13,7 +15,7 @@ dθ_i/dt = ω_i + Σ_j K_ij * sin(θ_j - θ_i)
 
 import numpy as np
 from numba import jit, prange
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, List, Sequence
 from dataclasses import dataclass
 
 
@@ -42,6 +44,63 @@ class MultiKernelConfig:
     annealing_rate: float = 0.0  # Réduction progressive du bruit
 
 
+@jit(nopython=True, fastmath=True)
+def _site_coupling(
+    phase: np.ndarray,
+    i: int, j: int,
+    k1_strength: float, k1_range: int, k1_sign: float,
+    k2_strength: float, k2_range: int, k2_sign: float,
+    k3_strength: float, k3_range: int, k3_sign: float
+) -> float:
+    """
+    Couplage normalisé Σ_kernels K * Σ_voisins sin(θ_j - θ_i) / Σ K au site (i, j).
+    """
+    h, w = phase.shape
+    coupling = 0.0
+    norm = 0.0
+    
+    # Kernel 1 : court-range
+    if k1_strength > 0:
+        for di in range(-k1_range, k1_range + 1):
+            for dj in range(-k1_range, k1_range + 1):
+                if di == 0 and dj == 0:
+                    continue
+                ni = (i + di) % h
+                nj = (j + dj) % w
+                delta_phase = phase[ni, nj] - phase[i, j]
+                coupling += k1_sign * k1_strength * np.sin(delta_phase)
+                norm += k1_strength
+    
+    # Kernel 2 : mid-range
+    if k2_strength > 0:
+        for di in range(-k2_range, k2_range + 1):
+            for dj in range(-k2_range, k2_range + 1):
+                dist_sq = di*di + dj*dj
+                if dist_sq <= k2_range * k2_range and dist_sq > k1_range * k1_range:
+                    ni = (i + di) % h
+                    nj = (j + dj) % w
+                    delta_phase = phase[ni, nj] - phase[i, j]
+                    coupling += k2_sign * k2_strength * np.sin(delta_phase)
+                    norm += k2_strength
+    
+    # Kernel 3 : long-range
+    if k3_strength > 0:
+        for di in range(-k3_range, k3_range + 1):
+            for dj in range(-k3_range, k3_range + 1):
+                dist_sq = di*di + dj*dj
+                if dist_sq <= k3_range * k3_range and dist_sq > k2_range * k2_range:
+                    ni = (i + di) % h
+                    nj = (j + dj) % w
+                    delta_phase = phase[ni, nj] - phase[i, j]
+                    coupling += k3_sign * k3_strength * np.sin(delta_phase)
+                    norm += k3_strength
+    
+    # Normalisation
+    if norm > 0:
+        coupling /= norm
+    return coupling
+
+
 @jit(nopython=True, parallel=True, fastmath=True)
 def _kuramoto_step_kernel(
     phase_current: np.ndarray,
@@ -62,53 +121,175 @@ def _kuramoto_step_kernel(
     
     for i in prange(h):
         for j in range(w):
-            coupling = 0.0
-            norm = 0.0
-            
-            # Kernel 1 : court-range
-            if k1_strength > 0:
-                for di in range(-k1_range, k1_range + 1):
-                    for dj in range(-k1_range, k1_range + 1):
-                        if di == 0 and dj == 0:
-                            continue
-                        ni = (i + di) % h
-                        nj = (j + dj) % w
-                        delta_phase = phase_current[ni, nj] - phase_current[i, j]
-                        coupling += k1_sign * k1_strength * np.sin(delta_phase)
-                        norm += k1_strength
-            
-            # Kernel 2 : mid-range
-            if k2_strength > 0:
-                for di in range(-k2_range, k2_range + 1):
-                    for dj in range(-k2_range, k2_range + 1):
-                        dist_sq = di*di + dj*dj
-                        if dist_sq <= k2_range * k2_range and dist_sq > k1_range * k1_range:
-                            ni = (i + di) % h
-                            nj = (j + dj) % w
-                            delta_phase = phase_current[ni, nj] - phase_current[i, j]
-                            coupling += k2_sign * k2_strength * np.sin(delta_phase)
-                            norm += k2_strength
-            
-            # Kernel 3 : long-range
-            if k3_strength > 0:
-                for di in range(-k3_range, k3_range + 1):
-                    for dj in range(-k3_range, k3_range + 1):
-                        dist_sq = di*di + dj*dj
-                        if dist_sq <= k3_range * k3_range and dist_sq > k2_range * k2_range:
-                            ni = (i + di) % h
-                            nj = (j + dj) % w
-                            delta_phase = phase_current[ni, nj] - phase_current[i, j]
-                            coupling += k3_sign * k3_strength * np.sin(delta_phase)
-                            norm += k3_strength
-            
-            # Normalisation et intégration
-            if norm > 0:
-                coupling /= norm
+            coupling = _site_coupling(
+                phase_current, i, j,
+                k1_strength, k1_range, k1_sign,
+                k2_strength, k2_range, k2_sign,
+                k3_strength, k3_range, k3_sign
+            )
             
             dtheta = omega[i, j] + coupling + noise[i, j]
             phase_next[i, j] = (phase_current[i, j] + dt * dtheta) % (2 * np.pi)
 
 
+@jit(nopython=True, parallel=True, fastmath=True)
+def _kuramoto_ensemble_run_kernel(
+    phase_a: np.ndarray,
+    phase_b: np.ndarray,
+    omega: np.ndarray,
+    strengths: np.ndarray,
+    ranges: np.ndarray,
+    signs: np.ndarray,
+    dt: np.ndarray,
+    noise: np.ndarray
+) -> None:
+    """
+    n_steps pas d'un ensemble (B, H, W) en un seul appel Numba.
+    
+    Chaque step est parallélisé sur les paires (membre, ligne) : un ensemble
+    d'un seul membre garde le parallélisme par ligne de _kuramoto_step_kernel.
+    Les buffers alternent : le step s lit phase_a et écrit phase_b si s est
+    pair, l'inverse sinon. noise : (n_steps, B, H, W).
+    """
+    n_steps = noise.shape[0]
+    n_members, h, w = phase_a.shape
+    
+    for s in range(n_steps):
+        for row in prange(n_members * h):
+            b = row // h
+            i = row % h
+            if s % 2 == 0:
+                current = phase_a[b]
+                nxt = phase_b[b]
+            else:
+                current = phase_b[b]
+                nxt = phase_a[b]
+            
+            for j in range(w):
+                coupling = _site_coupling(
+                    current, i, j,
+                    strengths[b, 0], ranges[b, 0], signs[b, 0],
+                    strengths[b, 1], ranges[b, 1], signs[b, 1],
+                    strengths[b, 2], ranges[b, 2], signs[b, 2]
+                )
+                
+                dtheta = omega[b, i, j] + coupling + noise[s, b, i, j]
+                nxt[i, j] = (current[i, j] + dt[b] * dtheta) % (2 * np.pi)
+
+
+def _kernel_offsets(config: MultiKernelConfig):
+    """
+    Voisins (di, dj) et poids signés de chaque kernel actif, comme
+    _kuramoto_step_kernel : K1 carré, K2 et K3 anneaux euclidiens.
+    
+    Returns:
+        Liste de (di, dj, poids signé, strength) par kernel actif
+    """
+    kernels = []
+    
+    if config.k1_strength > 0:
+        r = config.k1_range
+        di, dj = np.mgrid[-r:r + 1, -r:r + 1]
+        mask = (di != 0) | (dj != 0)
+        kernels.append((di[mask], dj[mask], config.k1_sign * config.k1_strength, config.k1_strength))
+    
+    rings = [
+        (config.k2_strength, config.k2_range, config.k2_sign, config.k1_range),
+        (config.k3_strength, config.k3_range, config.k3_sign, config.k2_range),
+    ]
+    for strength, outer, sign, inner in rings:
+        if strength > 0:
+            di, dj = np.mgrid[-outer:outer + 1, -outer:outer + 1]
+            dist_sq = di * di + dj * dj
+            mask = (dist_sq <= outer * outer) & (dist_sq > inner * inner)
+            kernels.append((di[mask], dj[mask], sign * strength, strength))
+    
+    return kernels
+
+
+def coupling_kernel_spectrum(config: MultiKernelConfig, shape: Tuple[int, int]) -> Tuple[np.ndarray, float]:
+    """
+    Transformée de Fourier du kernel de couplage total (périodique).
+    
+    Le kernel W(d) = Σ_k signe_k * K_k * 1[d ∈ anneau_k] est placé en -d
+    (modulo la grille), de sorte que ifft2(fft2(z) * spectre) = Σ_d W(d) z[i+d].
+    
+    Args:
+        config: Configuration des kernels
+        shape: (height, width) de la grille
+    
+    Returns:
+        (spectre complexe (h, w), norme = Σ_k K_k * |anneau_k|)
+    """
+    h, w = shape
+    kernel = np.zeros(shape, dtype=np.float64)
+    norm = 0.0
+    
+    for di, dj, weight, strength in _kernel_offsets(config):
+        # Portées > grille : plusieurs offsets tombent sur la même cellule
+        np.add.at(kernel, ((-di) % h, (-dj) % w), weight)
+        norm += strength * len(di)
+    
+    return np.fft.fft2(kernel), norm
+
+
+def _kuramoto_step_fft(
+    phase_current: np.ndarray,
+    omega: np.ndarray,
+    spectrum: np.ndarray,
+    norm: float,
+    dt: float,
+    noise: np.ndarray
+) -> np.ndarray:
+    """
+    Pas de temps avec le couplage par FFT.
+    
+    sin(θ_j - θ_i) = Im(e^{iθ_j} · e^{-iθ_i}) : le champ complexe e^{iθ} est
+    convolué avec le kernel total, puis multiplié par e^{-iθ_i}. Coût
+    O(log N) par cellule quelle que soit la portée des kernels.
+    
+    Accepte aussi un ensemble (B, H, W) : spectrum (B, H, W), norm et dt
+    de shape (B, 1, 1).
+    """
+    z = np.exp(1j * phase_current.astype(np.float64))
+    coupling = np.imag(np.fft.ifft2(np.fft.fft2(z) * spectrum) * np.conj(z))
+    coupling /= np.where(norm > 0, norm, 1.0)
+    
+    dtheta = omega + coupling + noise
+    return ((phase_current + dt * dtheta) % (2 * np.pi)).astype(np.float32)
+
+
+BACKENDS = ("direct", "fft", "auto")
+
+# Au-delà de ce nombre de voisins (K1 de portée 2), "auto" passe par la FFT
+_AUTO_FFT_MIN_NEIGHBORS = 25
+
+# Pas par bloc de KuramotoXYEnsemble.run : borne le buffer de bruit
+# (n_steps, B, H, W) quel que soit n_steps
+_RUN_CHUNK_STEPS = 64
+
+
+def local_order_field(phase: np.ndarray, radius: int = 3) -> np.ndarray:
+    """
+    Paramètre d'ordre local |<e^{iθ}>| sur une fenêtre (2·radius+1)² périodique.
+    
+    Filtre boîte séparable de e^{iθ} (sommes de décalages np.roll selon
+    chaque axe) au lieu d'une liste de voisins par cellule.
+    
+    Args:
+        phase: Champ de phase (H, W) ou pile (..., H, W)
+        radius: Rayon du voisinage
+        
+    Returns:
+        Champ de cohérence locale r ∈ [0, 1], même shape, float32
+    """
+    z = np.exp(1j * phase)
+    offsets = range(-radius, radius + 1)
+    rows = sum(np.roll(z, -d, axis=-2) for d in offsets)
+    box = sum(np.roll(rows, -d, axis=-1) for d in offsets)
+    return (np.abs(box) / (2 * radius + 1) ** 2).astype(np.float32)
+
+
 class KuramotoXYEngine:
     """
     Moteur principal pour simuler un champ d'oscillateurs de phase.
@@ -128,18 +309,32 @@ class KuramotoXYEngine:
         self,
         shape: Tuple[int, int] = (256, 256),
         config: Optional[MultiKernelConfig] = None,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        backend: str = "auto"
     ):
         """
         Args:
             shape: (height, width) de la grille d'oscillateurs
             config: Configuration des kernels de couplage
             seed: Seed pour reproductibilité
+            backend: Calcul du couplage : "direct" (somme sur les voisins,
+                Numba), "fft" (convolution périodique de e^{iθ}) ou "auto"
+                (FFT dès que les kernels dépassent le voisinage 5×5)
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (expected one of {BACKENDS})")
+        
         self.shape = shape
         self.config = config or MultiKernelConfig()
+        self.backend = backend
         self.rng = np.random.default_rng(seed)
         
+        # Spectre du kernel, recalculé si la config change
+        self._spectrum_key = None
+        self._spectrum = None
+        self._spectrum_norm = 0.0
+        self._auto_fft = False
+        
         # État interne
         self.phase_current = np.zeros(shape, dtype=np.float32)
         self.phase_next = np.zeros(shape, dtype=np.float32)
@@ -174,7 +369,45 @@ class KuramotoXYEngine:
         
         noise = self.rng.normal(0, effective_noise, self.shape).astype(np.float32)
         
-        # Kernel Numba
+        if self._use_fft():
+            self.phase_next = _kuramoto_step_fft(
+                self.phase_current,
+                self.omega,
+                self._spectrum,
+                self._spectrum_norm,
+                self.config.dt,
+                noise
+            )
+        else:
+            # Kernel Numba
+            self._direct_step(noise)
+        
+        # Swap buffers
+        self.phase_current, self.phase_next = self.phase_next, self.phase_current
+        
+        self.t += self.config.dt
+        self.iteration += 1
+    
+    def _use_fft(self) -> bool:
+        """Choisit le backend du step et met à jour le spectre si besoin."""
+        if self.backend == "direct":
+            return False
+        
+        c = self.config
+        key = (tuple(self.shape), c.k1_strength, c.k1_range, c.k1_sign,
+               c.k2_strength, c.k2_range, c.k2_sign, c.k3_strength, c.k3_range, c.k3_sign)
+        if key != self._spectrum_key:
+            if self.backend == "auto":
+                n_neighbors = sum(len(di) for di, _, _, _ in _kernel_offsets(c))
+                self._auto_fft = n_neighbors >= _AUTO_FFT_MIN_NEIGHBORS
+            if self.backend == "fft" or self._auto_fft:
+                self._spectrum, self._spectrum_norm = coupling_kernel_spectrum(c, self.shape)
+            self._spectrum_key = key
+        
+        return self.backend == "fft" or self._auto_fft
+    
+    def _direct_step(self, noise: np.ndarray) -> None:
+        """Couplage par somme directe sur les voisins (kernel Numba)."""
         _kuramoto_step_kernel(
             self.phase_current,
             self.phase_next,
@@ -186,12 +419,6 @@ class KuramotoXYEngine:
             noise
         )
         
-        # Swap buffers
-        self.phase_current, self.phase_next = self.phase_next, self.phase_current
-        
-        self.t += self.config.dt
-        self.iteration += 1
-        
     def get_phase_field(self) -> np.ndarray:
         """Retourne le champ de phase actuel."""
         return self.phase_current.copy()
@@ -219,22 +446,7 @@ class KuramotoXYEngine:
         Returns:
             Champ 2D de cohérence locale r(x,y) ∈ [0, 1]
         """
-        h, w = self.shape
-        order_field = np.zeros(self.shape, dtype=np.float32)
-        
-        for i in range(h):
-            for j in range(w):
-                neighbors = []
-                for di in range(-radius, radius + 1):
-                    for dj in range(-radius, radius + 1):
-                        ni = (i + di) % h
-                        nj = (j + dj) % w
-                        neighbors.append(self.phase_current[ni, nj])
-                
-                z = np.mean(np.exp(1j * np.array(neighbors)))
-                order_field[i, j] = np.abs(z)
-        
-        return order_field
+        return local_order_field(self.phase_current, radius)
     
     def set_coupling_modulation(self, modulation_field: np.ndarray, kernel: str = 'k1') -> None:
         """
@@ -262,3 +474,291 @@ class KuramotoXYEngine:
         }
 
 
+class KuramotoXYEnsemble:
+    """
+    Ensemble de B champs d'oscillateurs (B, H, W) avancés en un seul appel.
+    
+    Chaque membre a sa propre configuration (forces, portées et signes des
+    kernels, dt, bruit, annealing) et son propre flux aléatoire : le membre b
+    suit la même trajectoire qu'un KuramotoXYEngine(shape, configs[b],
+    seeds[b]). Le couplage est calculé pour tout l'ensemble par un kernel
+    Numba parallèle sur les membres, ou par FFT batchée sur (B, H, W).
+    
+    Usage:
+        configs = [MultiKernelConfig(k1_strength=k) for k in (0.5, 1.0, 2.0)]
+        ensemble = KuramotoXYEnsemble(shape=(64, 64), configs=configs, seeds=[1, 2, 3])
+        ensemble.reset()
+        
+        for _ in range(500):
+            ensemble.step()
+        
+        r, psi = ensemble.get_order_parameter()  # (B,), (B,)
+    """
+    
+    def __init__(
+        self,
+        shape: Tuple[int, int],
+        configs: List[MultiKernelConfig],
+        seeds: Optional[Sequence[Optional[int]]] = None,
+        backend: str = "auto"
+    ):
+        """
+        Args:
+            shape: (height, width) de chaque grille
+            configs: Une configuration par membre
+            seeds: Un seed par membre (None : entropie fraîche pour tous)
+            backend: "direct", "fft" ou "auto" (voir KuramotoXYEngine ; en
+                "auto", choisi membre par membre)
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (expected one of {BACKENDS})")
+        if seeds is None:
+            seeds = [None] * len(configs)
+        if len(seeds) != len(configs):
+            raise ValueError(f"Got {len(seeds)} seeds for {len(configs)} configs")
+        
+        self.shape = tuple(shape)
+        self.n_members = len(configs)
+        self.backend = backend
+        self.rngs = [np.random.default_rng(seed) for seed in seeds]
+        
+        full_shape = (self.n_members,) + self.shape
+        self.phase_current = np.zeros(full_shape, dtype=np.float32)
+        self.phase_next = np.zeros(full_shape, dtype=np.float32)
+        self.omega = np.zeros(full_shape, dtype=np.float32)
+        
+        self.t = np.zeros(self.n_members)
+        self.iteration = 0
+        self.set_configs(configs)
+    
+    @property
+    def configs(self) -> List[MultiKernelConfig]:
+        """Configuration courante de chaque membre."""
+        return [
+            MultiKernelConfig(
+                k1_strength=float(self._strengths[b, 0]),
+                k1_range=int(self._ranges[b, 0]),
+                k1_sign=float(self._signs[b, 0]),
+                k2_strength=float(self._strengths[b, 1]),
+                k2_range=int(self._ranges[b, 1]),
+                k2_sign=float(self._signs[b, 1]),
+                k3_strength=float(self._strengths[b, 2]),
+                k3_range=int(self._ranges[b, 2]),
+                k3_sign=float(self._signs[b, 2]),
+                dt=float(self._dt[b]),
+                noise_amplitude=float(self._noise_amplitude[b]),
+                annealing_rate=float(self._annealing_rate[b])
+            )
+            for b in range(self.n_members)
+        ]
+    
+    def set_configs(self, configs: List[MultiKernelConfig]) -> None:
+        """
+        Remplace les configurations (ex. paramètres variant dans le temps).
+        
+        Args:
+            configs: Une configuration par membre
+        """
+        if len(configs) != self.n_members:
+            raise ValueError(f"Expected {self.n_members} configs, got {len(configs)}")
+        
+        self._strengths = np.array([[c.k1_strength, c.k2_strength, c.k3_strength] for c in configs],
+                                   dtype=np.float64).reshape(-1, 3)
+        self._ranges = np.array([[c.k1_range, c.k2_range, c.k3_range] for c in configs],
+                                dtype=np.int64).reshape(-1, 3)
+        self._signs = np.array([[c.k1_sign, c.k2_sign, c.k3_sign] for c in configs],
+                               dtype=np.float64).reshape(-1, 3)
+        self._dt = np.array([c.dt for c in configs], dtype=np.float64)
+        self._noise_amplitude = np.array([c.noise_amplitude for c in configs], dtype=np.float64)
+        self._annealing_rate = np.array([c.annealing_rate for c in configs], dtype=np.float64)
+        self._update_kernels()
+    
+    def set_parameters(
+        self,
+        strengths: Optional[np.ndarray] = None,
+        signs: Optional[np.ndarray] = None,
+        noise_amplitude: Optional[np.ndarray] = None,
+        annealing_rate: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Met à jour en place les paramètres des membres, sans reconstruire de
+        configurations (portées et dt inchangés).
+        
+        Args:
+            strengths: Forces (B, 3) de K1, K2, K3
+            signs: Signes (B, 3) de K1, K2, K3
+            noise_amplitude: Amplitudes de bruit (B,)
+            annealing_rate: Taux d'annealing (B,)
+        """
+        if strengths is not None:
+            self._strengths[:] = strengths
+        if signs is not None:
+            self._signs[:] = signs
+        if noise_amplitude is not None:
+            self._noise_amplitude[:] = noise_amplitude
+        if annealing_rate is not None:
+            self._annealing_rate[:] = annealing_rate
+        self._update_kernels()
+    
+    def _update_kernels(self) -> None:
+        """Backend par membre et spectres FFT, recalculés si les kernels changent."""
+        kernel_key = (self._strengths.tobytes(), self._ranges.tobytes(), self._signs.tobytes())
+        if kernel_key == getattr(self, '_kernel_key', None):
+            return
+        self._kernel_key = kernel_key
+        
+        configs = self.configs
+        if self.backend == "auto":
+            use_fft = np.array([
+                sum(len(di) for di, _, _, _ in _kernel_offsets(c)) >= _AUTO_FFT_MIN_NEIGHBORS
+                for c in configs
+            ], dtype=bool)
+        else:
+            use_fft = np.full(self.n_members, self.backend == "fft")
+        self._fft_members = np.flatnonzero(use_fft)
+        self._direct_members = np.flatnonzero(~use_fft)
+        
+        spectra = [coupling_kernel_spectrum(configs[b], self.shape) for b in self._fft_members]
+        if spectra:
+            self._spectrum = np.stack([spectrum for spectrum, _ in spectra])
+            self._spectrum_norm = np.array([norm for _, norm in spectra]).reshape(-1, 1, 1)
+    
+    def reset(self, initial_phase: Optional[np.ndarray] = None) -> None:
+        """
+        Réinitialise les champs de phase.
+        
+        Args:
+            initial_phase: Conditions initiales (B, H, W). Si None, phase
+                aléatoire uniforme tirée par le flux de chaque membre.
+        """
+        for b, rng in enumerate(self.rngs):
+            if initial_phase is not None:
+                self.phase_current[b] = initial_phase[b].astype(np.float32) % (2 * np.pi)
+            else:
+                self.phase_current[b] = rng.uniform(0, 2 * np.pi, self.shape).astype(np.float32)
+            self.omega[b] = rng.normal(0, 0.1, self.shape).astype(np.float32)
+        
+        self.phase_next = self.phase_current.copy()
+        self.t = np.zeros(self.n_members)
+        self.iteration = 0
+    
+    def step(self) -> None:
+        """Avance tous les membres d'un pas de temps."""
+        self.run(1)
+    
+    def run(self, n_steps: int) -> None:
+        """
+        Avance tous les membres de n_steps pas à paramètres constants.
+        
+        Les pas sont avancés par blocs d'au plus _RUN_CHUNK_STEPS : le bruit
+        d'un bloc est tiré d'un coup par membre (mêmes nombres que des appels
+        à step(), chaque membre ayant son propre flux), puis les membres en
+        couplage direct avancent dans un seul appel Numba ; les membres FFT
+        pas par pas.
+        
+        Args:
+            n_steps: Nombre de pas de temps
+        """
+        while n_steps > 0:
+            block = min(n_steps, _RUN_CHUNK_STEPS)
+            self._run_block(block)
+            n_steps -= block
+    
+    def _run_block(self, n_steps: int) -> None:
+        """Avance tous les membres de n_steps pas, bruit tiré en un buffer."""
+        # Temps de chaque pas, accumulés comme dans step() : (n_steps, B)
+        times = np.empty((n_steps, self.n_members))
+        t = self.t
+        for s in range(n_steps):
+            times[s] = t
+            t = t + self._dt
+        
+        # Bruit de tout l'ensemble dans un seul buffer (n_steps, B, H, W)
+        effective_noise = self._noise_amplitude * np.where(
+            self._annealing_rate > 0, np.exp(-self._annealing_rate * times), 1.0
+        )
+        noise = np.empty((n_steps, self.n_members) + self.shape, dtype=np.float32)
+        for b, rng in enumerate(self.rngs):
+            noise[:, b] = rng.normal(0, effective_noise[:, b].reshape(-1, 1, 1),
+                                     (n_steps,) + self.shape)
+        
+        if len(self._direct_members) == self.n_members:
+            _kuramoto_ensemble_run_kernel(
+                self.phase_current,
+                self.phase_next,
+                self.omega,
+                self._strengths,
+                self._ranges,
+                self._signs,
+                self._dt,
+                noise
+            )
+            if n_steps % 2 == 1:
+                self.phase_current, self.phase_next = self.phase_next, self.phase_current
+        else:
+            direct = self._direct_members
+            if len(direct) > 0:
+                # Ensemble mixte : chaque membre garde le backend qu'aurait
+                # choisi un KuramotoXYEngine seul
+                direct_a = self.phase_current[direct]
+                direct_b = np.empty_like(direct_a)
+                _kuramoto_ensemble_run_kernel(
+                    direct_a,
+                    direct_b,
+                    self.omega[direct],
+                    self._strengths[direct],
+                    self._ranges[direct],
+                    self._signs[direct],
+                    self._dt[direct],
+                    np.ascontiguousarray(noise[:, direct])
+                )
+                direct_final = direct_b if n_steps % 2 == 1 else direct_a
+            
+            for s in range(n_steps):
+                self.phase_current[self._fft_members] = self._fft_step(
+                    self._fft_members, noise[s, self._fft_members]
+                )
+            if len(direct) > 0:
+                self.phase_current[direct] = direct_final
+        
+        self.t = t
+        self.iteration += n_steps
+    
+    def _fft_step(self, members: np.ndarray, noise: np.ndarray) -> np.ndarray:
+        """Pas de temps par FFT batchée des membres `members`."""
+        return _kuramoto_step_fft(
+            self.phase_current[members],
+            self.omega[members],
+            self._spectrum,
+            self._spectrum_norm,
+            self._dt[members].reshape(-1, 1, 1),
+            noise
+        )
+    
+    def get_phase_field(self, copy: bool = True) -> np.ndarray:
+        """
+        Retourne les champs de phase actuels (B, H, W).
+        
+        Args:
+            copy: Si False, vue en lecture seule (invalide après le step suivant)
+        """
+        if copy:
+            return self.phase_current.copy()
+        view = self.phase_current.view()
+        view.flags.writeable = False
+        return view
+    
+    def get_local_order(self, radius: int = 3) -> np.ndarray:
+        """Paramètre d'ordre local de chaque membre (B, H, W)."""
+        return local_order_field(self.phase_current, radius)
+    
+    def get_order_parameter(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Paramètre d'ordre de Kuramoto de chaque membre.
+        
+        Returns:
+            (r, psi) de shape (B,)
+        """
+        z = np.mean(np.exp(1j * self.phase_current), axis=(1, 2))
+        return np.abs(z), np.angle(z)
+
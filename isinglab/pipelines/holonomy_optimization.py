@@ -13,25 +13,46 @@ une cible phénoménologique, sous les contraintes d'un système quantique physi
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, MutableMapping
+from functools import partial
 import json
 from tqdm import tqdm
 
-from ..oscillators import KuramotoXYEngine, MultiKernelConfig
-from ..analysis import detect_vortices
+from ..oscillators import KuramotoXYEnsemble, MultiKernelConfig
+from ..analysis import count_defects
 from ..control.holonomy import (
     HolonomyPath,
     generate_linear_ramp_path,
     generate_smooth_sigmoid_path,
     generate_closed_loop_path
 )
-from ..control.optimizers import GridSearchOptimizer, RandomSearchOptimizer, OptimizationResult
+from ..control.optimizers import (
+    GridSearchOptimizer, RandomSearchOptimizer, BayesianOptimizer, OptimizationResult
+)
 from ..data_bridge.atlas_map import AtlasMapper, AtlasProfile, PhenoParams
 from ..data_bridge.physics_validator import PhysicsValidator
 from ..data_bridge.cost_functions import PhenoState, phenomenology_distance, compute_target_profile
 from .trajectory_cost import compute_trajectory_metrics, TrajectoryMetrics, rank_trajectories
 
 
+def _holonomy_kernel_config(current_params: Dict[str, float]) -> MultiKernelConfig:
+    """Configuration des kernels pour les paramètres interpolés d'un path."""
+    return MultiKernelConfig(
+        k1_strength=current_params.get('k1', 1.0),
+        k1_range=1,
+        k1_sign=1.0,
+        k2_strength=abs(current_params.get('k2', 0.0)),
+        k2_range=3,
+        k2_sign=-1.0 if current_params.get('k2', 0.0) < 0 else 1.0,
+        k3_strength=current_params.get('k3', 0.0),
+        k3_range=7,
+        k3_sign=1.0,
+        dt=0.05,
+        noise_amplitude=current_params.get('noise', 0.1),
+        annealing_rate=current_params.get('annealing', 0.1)
+    )
+
+
 def simulate_with_holonomy_path(
     path: HolonomyPath,
     grid_size: Tuple[int, int] = (64, 64),
@@ -52,80 +73,189 @@ def simulate_with_holonomy_path(
     Returns:
         (state_history, params_history)
     """
-    state_history = []
-    params_history = []
-    
-    # Durée totale de la trajectoire
-    if len(path.points) > 0:
-        total_duration = path.points[-1].t
-    else:
-        total_duration = 1.0
-    
-    total_steps = int(total_duration * steps_per_unit_time)
-    
-    # Initialiser le moteur avec les paramètres initiaux
-    initial_params = path.interpolate(0.0)
+    return simulate_with_holonomy_paths(
+        [path],
+        grid_size=grid_size,
+        steps_per_unit_time=steps_per_unit_time,
+        record_interval=record_interval,
+        seeds=[seed]
+    )[0]
+
+
+def simulate_with_holonomy_paths(
+    paths: List[HolonomyPath],
+    grid_size: Tuple[int, int] = (64, 64),
+    steps_per_unit_time: int = 50,
+    record_interval: int = 5,
+    seeds: Optional[List[int]] = None
+) -> List[Tuple[List[PhenoState], List[Dict[str, float]]]]:
+    """
+    Simule plusieurs trajectoires holonomiques dans un seul KuramotoXYEnsemble.
     
-    engine = None
+    Le membre b suit paths[b] avec le seed seeds[b] : résultats identiques à
+    simulate_with_holonomy_path(paths[b], seed=seeds[b]). Les membres dont
+    le path est plus court cessent d'être enregistrés à leur dernier step.
     
-    for step in range(total_steps):
-        # Temps normalisé actuel
-        t_current = step / steps_per_unit_time
-        
-        # Interpoler les paramètres à ce moment
-        current_params = path.interpolate(t_current)
+    Args:
+        paths: Trajectoires holonomiques
+        grid_size: Taille de la grille
+        steps_per_unit_time: Nombre de steps par unité de temps du path
+        record_interval: Intervalle d'enregistrement
+        seeds: Un seed par path (défaut : 42 pour tous)
         
-        # Créer/mettre à jour le moteur
-        if engine is None or step % 10 == 0:  # Reconfigurer périodiquement
-            kernel_config = MultiKernelConfig(
-                k1_strength=current_params.get('k1', 1.0),
-                k1_range=1,
-                k1_sign=1.0,
-                k2_strength=abs(current_params.get('k2', 0.0)),
-                k2_range=3,
-                k2_sign=-1.0 if current_params.get('k2', 0.0) < 0 else 1.0,
-                k3_strength=current_params.get('k3', 0.0),
-                k3_range=7,
-                k3_sign=1.0,
-                dt=0.05,
-                noise_amplitude=current_params.get('noise', 0.1),
-                annealing_rate=current_params.get('annealing', 0.1)
+    Returns:
+        [(state_history, params_history)] dans l'ordre des paths
+    """
+    if seeds is None:
+        seeds = [42] * len(paths)
+    if not paths:
+        return []
+    
+    total_steps = []
+    for path in paths:
+        total_duration = path.points[-1].t if len(path.points) > 0 else 1.0
+        total_steps.append(int(total_duration * steps_per_unit_time))
+    
+    histories = [([], []) for _ in paths]
+    n_steps = max(total_steps)
+    if n_steps <= 0:
+        return histories
+    
+    # Paramètres de chaque path à chaque step, précalculés
+    times = np.arange(n_steps) / steps_per_unit_time
+    schedules = [path.compile_schedule(times) for path in paths]
+    k1 = np.stack([schedule.get('k1', 1.0) for schedule in schedules], axis=1)
+    k2 = np.stack([schedule.get('k2', 0.0) for schedule in schedules], axis=1)
+    k3 = np.stack([schedule.get('k3', 0.0) for schedule in schedules], axis=1)
+    strengths = np.stack([k1, np.abs(k2), k3], axis=2)
+    signs = np.stack([np.ones_like(k2), np.where(k2 < 0, -1.0, 1.0), np.ones_like(k2)], axis=2)
+    noise = np.stack([schedule.get('noise', 0.1) for schedule in schedules], axis=1)
+    annealing = np.stack([schedule.get('annealing', 0.1) for schedule in schedules], axis=1)
+    
+    ensemble = KuramotoXYEnsemble(
+        shape=grid_size,
+        configs=[_holonomy_kernel_config(schedule.params_at(0)) for schedule in schedules],
+        seeds=seeds
+    )
+    ensemble.reset()
+    
+    step = 0
+    while step < n_steps:
+        # Reconfiguration périodique (en place, tous les 10 steps)
+        if step % 10 == 0:
+            ensemble.set_parameters(
+                strengths=strengths[step],
+                signs=signs[step],
+                noise_amplitude=noise[step],
+                annealing_rate=annealing[step]
             )
-            
-            if engine is None:
-                engine = KuramotoXYEngine(shape=grid_size, config=kernel_config, seed=seed)
-                engine.reset()
-            else:
-                engine.config = kernel_config
         
-        # Step de simulation
-        engine.step()
+        # Avancer jusqu'à la prochaine reconfiguration ou au prochain enregistrement
+        next_record = -(-step // record_interval) * record_interval
+        stop = min((step // 10 + 1) * 10, next_record + 1, n_steps)
+        ensemble.run(stop - step)
+        step = stop
         
-        # Enregistrer
-        if step % record_interval == 0:
-            phase_field = engine.get_phase_field()
-            r, _ = engine.get_order_parameter()
-            defect_metrics = detect_vortices(phase_field, threshold=0.5)
-            
-            state = PhenoState(
-                order_parameter_r=r,
-                defect_density=defect_metrics.defect_density,
-                n_defects=defect_metrics.n_defects,
-                annihilation_rate=0.0,  # Calculé plus tard
-                mean_phase=float(np.mean(phase_field)),
-                std_phase=float(np.std(phase_field))
-            )
+        # Enregistrer (après le step `recorded`)
+        recorded = step - 1
+        if recorded % record_interval == 0:
+            phase_fields = ensemble.get_phase_field(copy=False)
+            r_values, _ = ensemble.get_order_parameter()
+            # Défauts de tous les membres en une passe
+            n_positive, n_negative = count_defects(phase_fields, threshold=0.5)
+            n_defects = n_positive + n_negative
             
-            state_history.append(state)
-            params_history.append(current_params)
+            for b, (state_history, params_history) in enumerate(histories):
+                if recorded >= total_steps[b]:
+                    continue
+                
+                phase_field = phase_fields[b]
+                
+                state = PhenoState(
+                    order_parameter_r=float(r_values[b]),
+                    defect_density=int(n_defects[b]) / phase_field.size,
+                    n_defects=int(n_defects[b]),
+                    annihilation_rate=0.0,  # Calculé plus tard
+                    mean_phase=float(np.mean(phase_field)),
+                    std_phase=float(np.std(phase_field))
+                )
+                
+                state_history.append(state)
+                params_history.append(schedules[b].params_at(recorded))
     
     # Calculer les taux d'annihilation
-    if len(state_history) > 1:
+    for state_history, _ in histories:
         for i in range(1, len(state_history)):
             rate = (state_history[i-1].n_defects - state_history[i].n_defects) / record_interval
             state_history[i].annihilation_rate = rate
     
-    return state_history, params_history
+    return histories
+
+
+def physics_constraint(
+    params: Dict[str, float],
+    phys_profile: AtlasProfile,
+    strict: bool = False
+) -> bool:
+    """
+    Faisabilité physique (PhysicsValidator) d'un jeu de paramètres de path.
+    
+    Valide le point le plus exigeant de la trajectoire : K1 maximal, bruit
+    et annealing de fin de path, tels que simulés.
+    """
+    pheno_params = PhenoParams(
+        k1_strength=max(params.get('k_start', 1.0), params.get('k_end', 2.0)),
+        k2_strength=0.0,
+        k3_strength=0.0,
+        dt=0.05,
+        noise_amplitude=params.get('noise', 0.1),
+        annealing_rate=params.get('annealing_end', 0.1),
+        source_system=phys_profile.system_id,
+        physical_validity=0.0
+    )
+    return PhysicsValidator(strict=strict).validate(pheno_params, phys_profile).is_valid
+
+
+def trajectory_cost(
+    path: HolonomyPath,
+    target_state: PhenoState,
+    phys_profile: AtlasProfile,
+    grid_size: Tuple[int, int] = (64, 64),
+    steps_per_unit_time: int = 50,
+    seed: int = 42
+) -> float:
+    """Coût composite d'une trajectoire (simulation puis métriques)."""
+    return trajectory_costs(
+        [path], target_state, phys_profile,
+        grid_size=grid_size, steps_per_unit_time=steps_per_unit_time, seed=seed
+    )[0]
+
+
+def trajectory_costs(
+    paths: List[HolonomyPath],
+    target_state: PhenoState,
+    phys_profile: AtlasProfile,
+    grid_size: Tuple[int, int] = (64, 64),
+    steps_per_unit_time: int = 50,
+    seed: int = 42
+) -> List[float]:
+    """Coûts d'un lot de trajectoires, simulées en un seul ensemble."""
+    simulations = simulate_with_holonomy_paths(
+        paths,
+        grid_size=grid_size,
+        steps_per_unit_time=steps_per_unit_time,
+        record_interval=5,
+        seeds=[seed] * len(paths)
+    )
+    return [
+        compute_trajectory_metrics(
+            state_history,
+            target_state,
+            params_history,
+            phys_profile
+        ).composite_score
+        for state_history, params_history in simulations
+    ]
 
 
 def optimize_holonomy_path(
@@ -138,7 +268,9 @@ def optimize_holonomy_path(
     grid_size: Tuple[int, int] = (64, 64),
     steps_per_unit_time: int = 50,
     output_dir: Optional[str] = None,
-    seed: int = 42
+    seed: int = 42,
+    workers: Optional[int] = None,
+    cost_cache: Optional[MutableMapping[str, float]] = None
 ) -> Dict:
     """
     Optimise une trajectoire holonomique pour atteindre une cible phénoménologique
@@ -150,13 +282,18 @@ def optimize_holonomy_path(
         target_profile: Profil phéno cible ('uniform', 'fragmented', 'balanced')
         atlas_profile: ID du système physique Atlas (ex: 'NV-298K')
         atlas_mapper: Mapper Atlas (créé si None)
-        optimizer_type: 'random' ou 'grid'
-        n_evaluations: Nombre d'évaluations (samples pour random, points par dim pour grid)
+        optimizer_type: 'random', 'grid' ou 'bayesian'
+        n_evaluations: Nombre d'évaluations (samples pour random et bayesian,
+            n_evaluations ** 0.5 points par dimension pour grid)
         path_generator: 'linear_ramp' ou 'smooth_sigmoid'
         grid_size: Taille de la grille de simulation
         steps_per_unit_time: Résolution temporelle
         output_dir: Répertoire de sortie
         seed: Seed
+        workers: Processus d'évaluation (None : en série)
+        cost_cache: Cache {clé de path: coût} partagé entre optimisations
+            (par défaut, cache propre à l'appel : les paths identiques ne
+            sont simulés qu'une fois)
         
     Returns:
         Dict contenant :
@@ -207,27 +344,16 @@ def optimize_holonomy_path(
             'annealing_end': (0.2, 0.4)
         }
     
-    # 3. Définir la fonction de coût
-    def cost_function(path: HolonomyPath) -> float:
-        """Évalue le coût d'une trajectoire."""
-        # Simuler
-        state_history, params_history = simulate_with_holonomy_path(
-            path,
-            grid_size=grid_size,
-            steps_per_unit_time=steps_per_unit_time,
-            record_interval=5,
-            seed=seed
-        )
-        
-        # Calculer les métriques
-        metrics = compute_trajectory_metrics(
-            state_history,
-            target_state,
-            params_history,
-            phys_profile
-        )
-        
-        return metrics.composite_score
+    # 3. Définir la fonction de coût (picklable pour les workers)
+    cost_settings = dict(
+        target_state=target_state,
+        phys_profile=phys_profile,
+        grid_size=grid_size,
+        steps_per_unit_time=steps_per_unit_time,
+        seed=seed
+    )
+    cost_function = partial(trajectory_cost, **cost_settings)
+    batch_cost_function = partial(trajectory_costs, **cost_settings)
     
     # 4. Créer l'optimiseur
     print(f"\n>> Optimizer: {optimizer_type}, Generator: {path_generator}")
@@ -251,12 +377,37 @@ def optimize_holonomy_path(
             path_generator=path_generator,
             verbose=True
         )
+    elif optimizer_type == 'bayesian':
+        optimizer = BayesianOptimizer(
+            param_ranges=param_ranges,
+            n_evaluations=n_evaluations,
+            path_generator=path_generator,
+            constraint=partial(physics_constraint, phys_profile=phys_profile),
+            verbose=True,
+            seed=seed
+        )
     else:
         raise ValueError(f"Unknown optimizer: {optimizer_type}")
     
     # 5. Optimiser
     print(f"\n>> Starting optimization...")
-    opt_result = optimizer.optimize(cost_function, atlas_profile=phys_profile)
+    opt_result = optimizer.optimize(
+        cost_function,
+        atlas_profile=phys_profile,
+        batch_cost_function=batch_cost_function,
+        # Lots courts pour le bayésien : le modèle se met à jour plus souvent
+        batch_size=4 if optimizer_type == 'bayesian' else 16,
+        workers=workers,
+        cache=cost_cache if cost_cache is not None else {},
+        cache_settings={
+            'target_profile': target_profile,
+            'atlas_profile': atlas_profile,
+            'grid_size': grid_size,
+            'steps_per_unit_time': steps_per_unit_time,
+            'record_interval': 5,
+            'seed': seed
+        }
+    )
     
     print(f"\n>> Optimization complete!")
     print(f"   Best cost: {opt_result.best_cost:.4f}")
@@ -506,52 +657,24 @@ def compare_geometric_vs_dynamic_robustness(
     p3_results = {'clean': None, 'noisy': []}
     p4_results = {'clean': None, 'noisy': []}
     
-    # 4a. Simulation propre (baseline)
-    print(f"\n  Simulating P3 (clean)...")
-    p3_clean_states, p3_clean_params = simulate_with_holonomy_path(
-        p3_path,
+    # 4a. Simulation propre (baseline) + 4b. simulations bruitées (stress test) :
+    # toutes dans un seul ensemble. Pour simplifier, les essais bruités
+    # re-simulent avec un seed différent (bruit intrinsèque différent).
+    trial_seeds = [seed + trial + 1000 for trial in range(n_trials)]
+    print(f"\n  Simulating P3 and P4 (clean + {n_trials} noisy trials, one ensemble)...")
+    runs = simulate_with_holonomy_paths(
+        [p3_path, p4_path] + [p3_path, p4_path] * n_trials,
         grid_size=(64, 64),
         steps_per_unit_time=40,
         record_interval=3,
-        seed=seed
+        seeds=[seed, seed] + [s for s in trial_seeds for _ in range(2)]
     )
-    p3_results['clean'] = p3_clean_states
     
-    print(f"  Simulating P4 (clean)...")
-    p4_clean_states, p4_clean_params = simulate_with_holonomy_path(
-        p4_path,
-        grid_size=(64, 64),
-        steps_per_unit_time=40,
-        record_interval=3,
-        seed=seed
-    )
-    p4_results['clean'] = p4_clean_states
-    
-    # 4b. Simulations bruitées (stress test)
+    p3_results['clean'] = runs[0][0]
+    p4_results['clean'] = runs[1][0]
     for trial in range(n_trials):
-        trial_seed = seed + trial + 1000
-        
-        # P3 bruité
-        # Modifier le noise_amplitude dans la simulation
-        # Pour simplifier, on re-simule avec un seed différent (bruit intrinsèque différent)
-        p3_noisy_states, _ = simulate_with_holonomy_path(
-            p3_path,
-            grid_size=(64, 64),
-            steps_per_unit_time=40,
-            record_interval=3,
-            seed=trial_seed
-        )
-        p3_results['noisy'].append(p3_noisy_states)
-        
-        # P4 bruité
-        p4_noisy_states, _ = simulate_with_holonomy_path(
-            p4_path,
-            grid_size=(64, 64),
-            steps_per_unit_time=40,
-            record_interval=3,
-            seed=trial_seed
-        )
-        p4_results['noisy'].append(p4_noisy_states)
+        p3_results['noisy'].append(runs[2 + 2 * trial][0])
+        p4_results['noisy'].append(runs[3 + 2 * trial][0])
     
     print(f"[OK] Simulations complete")
     
@@ -23,10 +23,11 @@ from tqdm import tqdm
 
 from ..api import evaluate_rule, evaluate_batch
 from ..mapping_profiles import get_target_profile_for_system, suggest_ca_rules_for_profile
+from ..rule_atlas import DEFAULT_PROTOCOLS, load_atlas
 
 # Nouveaux imports pour phase oscillators
-from ..oscillators import KuramotoXYEngine, MultiKernelConfig
-from ..analysis import detect_vortices
+from ..oscillators import KuramotoXYEnsemble, MultiKernelConfig
+from ..analysis import detect_vortices_batch
 from ..control import HolonomyPath, StrokeLibrary
 from ..data_bridge.atlas_map import AtlasMapper, AtlasProfile, PhenoParams
 from ..data_bridge.physics_validator import PhysicsValidator
@@ -43,7 +44,8 @@ def run_regime_search(
     steps: int = 200,
     seeds_per_rule: int = 3,
     base_seed: int = 42,
-    output_dir: Optional[str] = None
+    output_dir: Optional[str] = None,
+    atlas=None
 ) -> Tuple[pd.DataFrame, List[Dict]]:
     """
     Run a regime search based on a target profile.
@@ -62,25 +64,46 @@ def run_regime_search(
         seeds_per_rule: Number of random seeds per rule
         base_seed: Base random seed for reproducibility
         output_dir: If provided, save results to files
+        atlas: RuleAtlas (isinglab.rule_atlas) of precomputed metrics. None
+            opens the default atlas of `ca_type` if it was built; False
+            disables it. The atlas suggests the rule pool, and when its
+            protocol matches these settings (single seed), rules it holds
+            are read back instead of simulated.
         
     Returns:
         (results_df, top_rules):
             - results_df: DataFrame with all evaluated rules and metrics
             - top_rules: List of top rules matching target profile
     """
+    if atlas is None:
+        atlas = load_atlas(ca_type) if ca_type in DEFAULT_PROTOCOLS else False
+    
     # 1. Determine rule pool
     if rule_pool is None:
-        rule_pool = suggest_ca_rules_for_profile(target_profile, n_suggestions=50)
-    
-    # 2. Evaluate all rules
-    results = evaluate_batch(
-        rules=rule_pool,
-        grid_size=grid_size,
-        steps=steps,
-        seed=base_seed,
-        ca_type=ca_type,
-        n_seeds=seeds_per_rule
-    )
+        rule_pool = suggest_ca_rules_for_profile(
+            target_profile, n_suggestions=50, ca_type=ca_type,
+            atlas=atlas if atlas is not None else False
+        )
+    
+    # 2. Evaluate all rules (atlas lookups for the rules it already holds)
+    known = {}
+    if (atlas is not None and atlas is not False and seeds_per_rule == 1
+            and atlas.matches(ca_type, grid_size, steps, base_seed)):
+        known = {record["rule"]: record for record in atlas.records(rule_pool)}
+    missing = [rule for rule in rule_pool if rule not in known]
+    
+    evaluated = []
+    if missing:
+        evaluated = evaluate_batch(
+            rules=missing,
+            grid_size=grid_size,
+            steps=steps,
+            seed=base_seed,
+            ca_type=ca_type,
+            n_seeds=seeds_per_rule
+        )
+    known.update(zip(missing, evaluated))
+    results = [known[rule] for rule in rule_pool]
     
     # 3. Convert to DataFrame
     results_df = pd.DataFrame(results)
@@ -296,7 +319,8 @@ def run_constrained_search(
     record_interval: int = 10,
     use_strokes: bool = True,
     output_dir: Optional[str] = None,
-    seed: int = 42
+    seed: int = 42,
+    ensemble_size: int = 16
 ) -> Dict:
     """
     Recherche de régimes contrainte par la physique quantique.
@@ -324,6 +348,8 @@ def run_constrained_search(
         use_strokes: Si True, teste aussi les strokes holonomiques
         output_dir: Répertoire de sauvegarde (optionnel)
         seed: Seed pour reproductibilité
+        ensemble_size: Nombre de configurations simulées ensemble
+            (KuramotoXYEnsemble) ; chaque membre garde sa propre seed
         
     Returns:
         Dict contenant :
@@ -386,87 +412,100 @@ def run_constrained_search(
     
     print(f"\n🔬 Testing {len(candidates)} parameter configurations...")
     
-    for config_name, params in tqdm(candidates, desc="Simulating"):
-        # 5a. Valider la faisabilité physique
+    # 5a. Valider la faisabilité physique (candidats impossibles ignorés)
+    valid_candidates = []
+    for config_name, params in candidates:
         validation = validator.validate(params, phys_profile)
-        
-        if not validation.is_valid:
-            # Skip si physiquement impossible
-            continue
-        
-        # 5b. Créer le moteur avec ces paramètres
-        kernel_config = MultiKernelConfig(
-            k1_strength=params.k1_strength,
-            k1_range=1,
-            k1_sign=1.0,
-            k2_strength=params.k2_strength,
-            k2_range=3,
-            k2_sign=-1.0 if target_profile == 'fragmented' else 1.0,
-            k3_strength=params.k3_strength,
-            k3_range=7,
-            k3_sign=1.0,
-            dt=params.dt,
-            noise_amplitude=params.noise_amplitude,
-            annealing_rate=params.annealing_rate
-        )
-        
-        engine = KuramotoXYEngine(
+        if validation.is_valid:
+            valid_candidates.append((config_name, params, validation))
+    
+    # 5b. Simuler par lots : un ensemble de moteurs (B, H, W) par lot
+    chunks = [
+        valid_candidates[i:i + ensemble_size]
+        for i in range(0, len(valid_candidates), ensemble_size)
+    ]
+    for chunk in tqdm(chunks, desc="Simulating"):
+        kernel_configs = [
+            MultiKernelConfig(
+                k1_strength=params.k1_strength,
+                k1_range=1,
+                k1_sign=1.0,
+                k2_strength=params.k2_strength,
+                k2_range=3,
+                k2_sign=-1.0 if target_profile == 'fragmented' else 1.0,
+                k3_strength=params.k3_strength,
+                k3_range=7,
+                k3_sign=1.0,
+                dt=params.dt,
+                noise_amplitude=params.noise_amplitude,
+                annealing_rate=params.annealing_rate
+            )
+            for _, params, _ in chunk
+        ]
+        
+        ensemble = KuramotoXYEnsemble(
             shape=grid_size,
-            config=kernel_config,
-            seed=seed + hash(config_name) % 1000
+            configs=kernel_configs,
+            seeds=[seed + hash(config_name) % 1000 for config_name, _, _ in chunk]
         )
         
         # 5c. Simuler
-        engine.reset()
+        ensemble.reset()
         
         phase_history = []
         for step in range(steps_per_run):
-            engine.step()
+            ensemble.step()
             if step % record_interval == 0:
-                phase_history.append(engine.get_phase_field())
+                phase_history.append(ensemble.get_phase_field())
         
-        # 5d. Analyser l'état final
-        final_phase = engine.get_phase_field()
-        r_final, _ = engine.get_order_parameter()
-        defect_metrics = detect_vortices(final_phase, threshold=0.5)
-        
-        # Calculer le taux d'annihilation
+        final_phases = ensemble.get_phase_field()
+        r_finals, _ = ensemble.get_order_parameter()
+        final_defects = detect_vortices_batch(final_phases, threshold=0.5)
         if len(phase_history) > 1:
-            defects_initial = detect_vortices(phase_history[0], threshold=0.5)
-            annihilation_rate = (defects_initial.n_defects - defect_metrics.n_defects) / len(phase_history)
-        else:
-            annihilation_rate = 0.0
-        
-        generated_state = PhenoState(
-            order_parameter_r=r_final,
-            defect_density=defect_metrics.defect_density,
-            n_defects=defect_metrics.n_defects,
-            annihilation_rate=annihilation_rate,
-            mean_phase=float(np.mean(final_phase)),
-            std_phase=float(np.std(final_phase))
-        )
-        
-        # 5e. Calculer la distance à la cible
-        distance = phenomenology_distance(generated_state, target_state)
-        
-        # 5f. Enregistrer
-        result = {
-            'config_name': config_name,
-            'params': params,
-            'generated_state': generated_state,
-            'distance': distance,
-            'validation': validation,
-            'r_final': r_final,
-            'defect_density': defect_metrics.defect_density,
-            'n_defects': defect_metrics.n_defects
-        }
-        results.append(result)
+            initial_defects = detect_vortices_batch(phase_history[0], threshold=0.5)
         
-        # 5g. Mettre à jour le meilleur
-        if distance < best_distance and validation.score > 0.6:
-            best_distance = distance
-            best_params = params
-            best_state = generated_state
+        for b, (config_name, params, validation) in enumerate(chunk):
+            # 5d. Analyser l'état final
+            final_phase = final_phases[b]
+            r_final = r_finals[b]
+            defect_metrics = final_defects[b]
+            
+            # Calculer le taux d'annihilation
+            if len(phase_history) > 1:
+                annihilation_rate = (initial_defects[b].n_defects - defect_metrics.n_defects) / len(phase_history)
+            else:
+                annihilation_rate = 0.0
+            
+            generated_state = PhenoState(
+                order_parameter_r=r_final,
+                defect_density=defect_metrics.defect_density,
+                n_defects=defect_metrics.n_defects,
+                annihilation_rate=annihilation_rate,
+                mean_phase=float(np.mean(final_phase)),
+                std_phase=float(np.std(final_phase))
+            )
+            
+            # 5e. Calculer la distance à la cible
+            distance = phenomenology_distance(generated_state, target_state)
+            
+            # 5f. Enregistrer
+            result = {
+                'config_name': config_name,
+                'params': params,
+                'generated_state': generated_state,
+                'distance': distance,
+                'validation': validation,
+                'r_final': r_final,
+                'defect_density': defect_metrics.defect_density,
+                'n_defects': defect_metrics.n_defects
+            }
+            results.append(result)
+            
+            # 5g. Mettre à jour le meilleur
+            if distance < best_distance and validation.score > 0.6:
+                best_distance = distance
+                best_params = params
+                best_state = generated_state
     
     # 6. Sauvegarder les résultats
     if output_dir:
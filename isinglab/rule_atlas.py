@@ -0,0 +1,483 @@
+"""
+Exhaustive, precomputed atlas of CA rule metrics.
+
+There are only 256 elementary rules and 2^18 = 262,144 Life-like
+(outer-totalistic Moore) rules, so every rule can be evaluated once under
+a fixed protocol (grid size, steps, seed, boundary) and looked up later
+instead of being simulated again. The atlas is a directory of columns, one
+.npy file per metric, indexed by rule number (row r = rule r, the
+CAEngine encoding: bits 0-8 birth, 9-17 survival for Life-like rules):
+
+    results/atlas/life/
+        atlas.json          protocol, seeding mode, metric names, attractor type codes
+        edge_score.npy      float64, NaN until evaluated
+        ...
+        attractor_type.npy  int8 index into ATTRACTOR_TYPES (-1 = none)
+        done.npy            bool, rule evaluated
+
+Columns are opened with numpy memory mapping, so opening an atlas reads
+nothing and a query only touches the columns it filters on. Values are
+exactly those evaluate_rule returns for the same protocol and seeding mode
+(core.rng.set_legacy_seeding; see RuleAtlas.matches).
+
+Builds are resumable: rules are evaluated in chunks, and a chunk is marked
+done only once its metrics are flushed, so an interrupted build continues
+where it stopped.
+
+    >>> from isinglab.rule_atlas import build_atlas, load_atlas
+    >>> build_atlas(ca_type="elementary")  # about a second
+    >>> atlas = load_atlas("elementary")
+    >>> atlas.query({"edge_score": (0.4, 0.7), "memory_score": (0.6, 1.0)})
+    >>> atlas.nearest({"edge_score": 0.55, "entropy": 0.5}, k=10)
+
+Command line (full Life-like atlas, about 25 CPU-minutes):
+
+    python -m isinglab.rule_atlas --ca-type life --workers 4
+"""
+
+import json
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .api import evaluate_batch
+from .core.rng import legacy_seeding
+from .eval_cache import METRIC_SUITE_VERSION
+
+
+ATLAS_DIR = Path("results/atlas")
+
+# Numeric metrics of evaluate_rule, stored as float64 columns
+ATLAS_METRICS = (
+    "edge_score",
+    "memory_score",
+    "entropy",
+    "activity",
+    "sensitivity",
+    "spatial_entropy",
+    "lambda_estimate",
+    "attractor_period",
+    "attractor_stability",
+)
+
+ATTRACTOR_TYPES = ("unknown", "fixed", "cycle", "quasi-periodic", "chaotic")
+
+N_RULES = {"elementary": 1 << 8, "life": 1 << 18}
+
+DEFAULT_PROTOCOLS = {
+    "elementary": {"grid_size": [100], "steps": 200, "seed": 42, "boundary": "periodic"},
+    "life": {"grid_size": [32, 32], "steps": 64, "seed": 42, "boundary": "periodic"},
+}
+
+_META_FILE = "atlas.json"
+
+
+class RuleAtlas:
+    """
+    Read-only view of a built (or partially built) atlas.
+
+    Attributes:
+        path: Atlas directory
+        ca_type: CA type of the rules ("elementary" or "life")
+        protocol: Evaluation settings (grid_size, steps, seed, boundary)
+        legacy_seeding: Whether the rules were evaluated in legacy seeding mode
+        metrics: Names of the float64 metric columns
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path / _META_FILE, encoding="utf-8") as fh:
+            meta = json.load(fh)
+        self.ca_type = meta["ca_type"]
+        self.protocol = meta["protocol"]
+        self.version = meta["version"]
+        self.legacy_seeding = meta.get("legacy_seeding", False)
+        self.metrics = tuple(meta["metrics"])
+        self.attractor_types = tuple(meta["attractor_types"])
+        self._columns = {
+            name: np.load(self.path / f"{name}.npy", mmap_mode="r")
+            for name in self.metrics + ("attractor_type", "done")
+        }
+
+    def __len__(self) -> int:
+        return len(self._columns["done"])
+
+    def __repr__(self) -> str:
+        return (f"RuleAtlas({str(self.path)!r}, ca_type={self.ca_type!r}, "
+                f"evaluated={self.n_evaluated}/{len(self)})")
+
+    @property
+    def done(self) -> np.ndarray:
+        """Mask of the evaluated rules."""
+        return self._columns["done"]
+
+    @property
+    def n_evaluated(self) -> int:
+        return int(np.count_nonzero(self.done))
+
+    def column(self, name: str) -> np.ndarray:
+        """Memory-mapped column of a metric (row = rule number)."""
+        if name not in self._columns:
+            raise KeyError(f"Unknown atlas column: {name}")
+        return self._columns[name]
+
+    def matches(self, ca_type: str, grid_size: Union[int, Tuple[int, ...]], steps: int,
+                seed: int, boundary: str = "periodic") -> bool:
+        """Whether the atlas holds evaluate_rule results for these settings (and seeding mode)."""
+        return (ca_type == self.ca_type
+                and list(_grid_tuple(grid_size)) == list(self.protocol["grid_size"])
+                and steps == self.protocol["steps"]
+                and seed == self.protocol["seed"]
+                and boundary == self.protocol["boundary"]
+                and self.legacy_seeding == legacy_seeding()
+                and self.version == METRIC_SUITE_VERSION)
+
+    def mask(self, ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None) -> np.ndarray:
+        """
+        Mask of the evaluated rules whose metrics lie in `ranges`.
+
+        Args:
+            ranges: {metric: (low, high)}, inclusive; None leaves a side open.
+                Metrics the atlas does not store are ignored.
+        """
+        mask = np.array(self.done)
+        for name, (low, high) in (ranges or {}).items():
+            if name not in self.metrics:
+                continue
+            column = self.column(name)
+            if low is not None:
+                mask &= column >= low
+            if high is not None:
+                mask &= column <= high
+        return mask
+
+    def query(
+        self,
+        ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = True,
+        limit: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Rule numbers matching range filters.
+
+        Args:
+            ranges: {metric: (low, high)} filters (see mask)
+            order_by: Metric to sort by (default: rule number)
+            descending: Sort order for order_by
+            limit: Maximum number of rules returned
+
+        Returns:
+            Array of rule numbers
+        """
+        rules = np.flatnonzero(self.mask(ranges))
+        if order_by is not None:
+            values = self.column(order_by)[rules]
+            order = np.lexsort((rules, -values if descending else values))
+            rules = rules[order]
+        return rules if limit is None else rules[:limit]
+
+    def nearest(
+        self,
+        targets: Dict[str, float],
+        k: int = 10,
+        ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        weights: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """
+        The k rules closest to target metric values.
+
+        Distance is the weighted Euclidean distance over the target metrics
+        (ties broken by rule number), among the rules passing `ranges`.
+
+        Args:
+            targets: {metric: target value}
+            k: Number of rules returned
+            ranges: Optional range filters applied first
+            weights: Per-metric weights (default 1.0)
+
+        Returns:
+            Array of rule numbers, closest first
+        """
+        rules = np.flatnonzero(self.mask(ranges))
+        distances = self.distances(targets, rules, weights)
+        if 0 < k < len(rules):
+            keep = np.argpartition(distances, k - 1)[:k]
+            rules, distances = rules[keep], distances[keep]
+        return rules[np.lexsort((rules, distances))][:k]
+
+    def distances(
+        self,
+        targets: Dict[str, float],
+        rules: Optional[np.ndarray] = None,
+        weights: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """Weighted Euclidean distances of `rules` (default: all) to `targets`."""
+        rules = np.arange(len(self)) if rules is None else np.asarray(rules)
+        squared = np.zeros(len(rules))
+        for name, target in targets.items():
+            if name not in self.metrics:
+                continue
+            weight = 1.0 if weights is None else weights.get(name, 1.0)
+            squared += weight * (self.column(name)[rules] - target) ** 2
+        return np.sqrt(squared)
+
+    def metrics_of(self, rule: int) -> Optional[Dict]:
+        """Metrics of one rule, as evaluate_rule returns them (None if not evaluated)."""
+        records = self.records([rule])
+        return records[0] if records else None
+
+    def records(self, rules: Iterable[int]) -> List[Dict]:
+        """
+        evaluate_rule-style metric dicts of the evaluated rules among `rules`.
+
+        Rules not evaluated yet are skipped. The values are those of the
+        atlas protocol and seeding mode: check matches() before using them
+        in place of evaluate_rule calls.
+        """
+        rules = np.asarray(list(rules), dtype=np.int64)
+        rules = rules[self.done[rules]]
+        values = {name: self.column(name)[rules].tolist() for name in self.metrics}
+        types = self.column("attractor_type")[rules].tolist()
+
+        records = []
+        for i, rule in enumerate(rules.tolist()):
+            record = {name: values[name][i] for name in self.metrics}
+            record["attractor_period"] = int(record["attractor_period"])
+            record["attractor_type"] = self.attractor_types[types[i]]
+            record["rule"] = rule
+            record["grid_size"] = tuple(self.protocol["grid_size"])
+            record["steps"] = self.protocol["steps"]
+            record["seed"] = self.protocol["seed"]
+            records.append(record)
+        return records
+
+
+def _grid_tuple(grid_size: Union[int, Iterable[int]]) -> Tuple[int, ...]:
+    if isinstance(grid_size, (int, np.integer)):
+        return (int(grid_size),)
+    return tuple(int(n) for n in grid_size)
+
+
+def default_atlas_path(ca_type: str) -> Path:
+    return ATLAS_DIR / ca_type
+
+
+def load_atlas(ca_type: str = "life", path: Optional[Union[str, Path]] = None) -> Optional[RuleAtlas]:
+    """Open the atlas of `ca_type` (default location unless `path`); None if not built."""
+    path = Path(path) if path is not None else default_atlas_path(ca_type)
+    if not (path / _META_FILE).exists():
+        return None
+    atlas = RuleAtlas(path)
+    if atlas.ca_type != ca_type:
+        raise ValueError(f"Atlas at {path} holds {atlas.ca_type} rules, not {ca_type}")
+    return atlas
+
+
+def build_atlas(
+    path: Optional[Union[str, Path]] = None,
+    ca_type: str = "life",
+    grid_size: Optional[Union[int, Tuple[int, ...]]] = None,
+    steps: Optional[int] = None,
+    seed: Optional[int] = None,
+    boundary: Optional[str] = None,
+    rules: Optional[Iterable[int]] = None,
+    chunk_size: int = 4096,
+    workers: Optional[int] = None,
+    verbose: bool = False
+) -> RuleAtlas:
+    """
+    Evaluate every rule of `ca_type` and store the metrics as atlas columns.
+
+    Rules already marked done are skipped, so calling this again resumes
+    an interrupted build. An existing atlas built under another protocol
+    is never mixed with new results: a ValueError is raised instead.
+
+    Args:
+        path: Atlas directory (default: results/atlas/<ca_type>)
+        ca_type: "elementary" (256 rules) or "life" (2^18 rules)
+        grid_size, steps, seed, boundary: Protocol (defaults from
+            DEFAULT_PROTOCOLS)
+        rules: Subset of rule numbers to evaluate (default: all)
+        chunk_size: Rules evaluated and flushed together
+        workers: Worker processes (see evaluate_batch)
+        verbose: Print progress
+
+    Returns:
+        The RuleAtlas
+    """
+    if ca_type not in N_RULES:
+        raise ValueError(f"Unknown CA type for an atlas: {ca_type}")
+    protocol = dict(DEFAULT_PROTOCOLS[ca_type])
+    if grid_size is not None:
+        protocol["grid_size"] = list(_grid_tuple(grid_size))
+    for name, value in (("steps", steps), ("seed", seed), ("boundary", boundary)):
+        if value is not None:
+            protocol[name] = value
+
+    path = Path(path) if path is not None else default_atlas_path(ca_type)
+    columns = _open_columns(path, ca_type, protocol)
+    done = columns["done"]
+
+    todo = np.arange(N_RULES[ca_type]) if rules is None else np.unique(np.asarray(list(rules), dtype=np.int64))
+    todo = todo[~done[todo]]
+    type_codes = {name: code for code, name in enumerate(ATTRACTOR_TYPES)}
+
+    for start in range(0, len(todo), chunk_size):
+        chunk = todo[start:start + chunk_size]
+        results = evaluate_batch(
+            chunk.tolist(), grid_size=tuple(protocol["grid_size"]), steps=protocol["steps"],
+            seed=protocol["seed"], ca_type=ca_type, boundary=protocol["boundary"],
+            workers=workers
+        )
+        for name in ATLAS_METRICS:
+            columns[name][chunk] = [result[name] for result in results]
+        columns["attractor_type"][chunk] = [type_codes.get(result["attractor_type"], 0)
+                                            for result in results]
+        # Metrics first, then the done flags: a crash never marks a rule
+        # done without its values
+        for name in ATLAS_METRICS + ("attractor_type",):
+            columns[name].flush()
+        done[chunk] = True
+        done.flush()
+
+        if verbose:
+            print(f"  {min(start + chunk_size, len(todo))}/{len(todo)} rules evaluated")
+
+    del columns
+    return RuleAtlas(path)
+
+
+def _open_columns(path: Path, ca_type: str, protocol: Dict) -> Dict[str, np.memmap]:
+    """Writable memory maps of the atlas columns, created on first use."""
+    meta = {
+        "ca_type": ca_type,
+        "n_rules": N_RULES[ca_type],
+        "protocol": protocol,
+        "version": METRIC_SUITE_VERSION,
+        "legacy_seeding": legacy_seeding(),
+        "metrics": list(ATLAS_METRICS),
+        "attractor_types": list(ATTRACTOR_TYPES),
+    }
+    meta_path = path / _META_FILE
+    n = N_RULES[ca_type]
+
+    if meta_path.exists():
+        with open(meta_path, encoding="utf-8") as fh:
+            existing = json.load(fh)
+        # Atlases written before the seeding mode was recorded used Generator streams
+        existing.setdefault("legacy_seeding", False)
+        if existing != meta:
+            raise ValueError(
+                f"Atlas at {path} was built with another protocol, seeding mode or "
+                f"metric suite ({existing.get('ca_type')}, {existing.get('protocol')}, "
+                f"legacy_seeding={existing['legacy_seeding']}, version "
+                f"{existing.get('version')}); remove it or choose another path"
+            )
+        return {
+            name: np.load(path / f"{name}.npy", mmap_mode="r+")
+            for name in ATLAS_METRICS + ("attractor_type", "done")
+        }
+
+    path.mkdir(parents=True, exist_ok=True)
+    columns = {}
+    for name in ATLAS_METRICS:
+        columns[name] = np.lib.format.open_memmap(path / f"{name}.npy", mode="w+",
+                                                  dtype=np.float64, shape=(n,))
+        columns[name][:] = np.nan
+    columns["attractor_type"] = np.lib.format.open_memmap(
+        path / "attractor_type.npy", mode="w+", dtype=np.int8, shape=(n,))
+    columns["attractor_type"][:] = -1
+    columns["done"] = np.lib.format.open_memmap(path / "done.npy", mode="w+",
+                                                dtype=np.bool_, shape=(n,))
+    for column in columns.values():
+        column.flush()
+    # Written last: a directory without it is not an atlas yet
+    with open(meta_path, "w", encoding="utf-8") as fh:
+        json.dump(meta, fh, indent=2)
+    return columns
+
+
+__all__ = [
+    'RuleAtlas',
+    'ATLAS_METRICS',
+    'ATTRACTOR_TYPES',
+    'DEFAULT_PROTOCOLS',
+    'build_atlas',
+    'load_atlas',
+    'default_atlas_path',
+]
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Build the precomputed atlas of every elementary or Life-like rule"
+    )
+    parser.add_argument(
+        "--ca-type",
+        choices=sorted(N_RULES),
+        default="life",
+        help="Rule family (default: life)"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Atlas directory (default: results/atlas/<ca-type>)"
+    )
+    parser.add_argument(
+        "--grid-size",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Grid size (default: 100 for elementary, 32 32 for life)"
+    )
+    parser.add_argument(
+        "--steps",
+        type=int,
+        default=None,
+        help="Evolution steps (default: 200 for elementary, 64 for life)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed (default: 42)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=4096,
+        help="Rules evaluated between flushes (default: 4096)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: serial)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Build (or resume) an atlas from the command line."""
+    args = parse_args()
+    atlas = build_atlas(
+        path=args.output,
+        ca_type=args.ca_type,
+        grid_size=args.grid_size,
+        steps=args.steps,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        verbose=True
+    )
+    print(atlas)
+
+
+if __name__ == "__main__":
+    main()
+
@@ -1,43 +1,38 @@
 """Hall of Fame rule helpers."""
 
-import json
 from pathlib import Path
 from typing import Dict, List
 
+from .store import RuleStore, load_rules
+
 HOF_PATH = Path(__file__).resolve().parent / 'hof_rules.json'
 
+_HOF_STORE = None
+
+
+def _hof_store() -> RuleStore:
+    """Store of HOF_PATH, reloaded when the files changed on disk."""
+    global _HOF_STORE
+    if _HOF_STORE is None or _HOF_STORE.path != HOF_PATH:
+        _HOF_STORE = RuleStore(HOF_PATH)
+    else:
+        _HOF_STORE.refresh()
+    return _HOF_STORE
+
 
 def load_hof_rules() -> List[Dict]:
-    if not HOF_PATH.exists():
-        return []
-    with open(HOF_PATH, encoding='utf-8') as fh:
-        payload = json.load(fh)
-    return payload.get('rules', [])
+    return load_rules(HOF_PATH)
 
 
 def save_hof_rules(rules: List[Dict]):
-    HOF_PATH.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
-        'meta': {'updated': Path(HOF_PATH).stat().st_mtime if HOF_PATH.exists() else None},
-        'rules': rules
-    }
-    with open(HOF_PATH, 'w', encoding='utf-8') as fh:
-        json.dump(payload, fh, indent=2)
+    _hof_store().replace(rules)
 
 
 def add_or_update_rule(rule: Dict) -> bool:
-    rules = load_hof_rules()
-    notation = rule['notation']
-    updated = False
-    for existing in rules:
-        if existing.get('notation') == notation:
-            existing.update(rule)
-            updated = True
-            break
-    if not updated:
-        rules.append(rule)
-    save_hof_rules(rules)
-    return not updated
-
-
-__all__ = ['load_hof_rules', 'save_hof_rules', 'add_or_update_rule']
+    store = _hof_store()
+    is_new = store.upsert(rule)
+    store.flush()
+    return is_new
+
+
+__all__ = ['load_hof_rules', 'save_hof_rules', 'add_or_update_rule', 'RuleStore', 'load_rules']
@@ -0,0 +1,375 @@
+"""
+Stockage des règles indexé par notation : snapshot JSON + journal append-only.
+
+Le snapshot garde le format historique ({'meta': ..., 'rules': [...]}) et
+reste lisible tel quel. Les mises à jour ne le réécrivent plus : chaque
+upsert remplace la règle en mémoire (index notation -> position, O(1)) et
+flush() ajoute l'enregistrement complet en une ligne JSON au journal
+`<snapshot>.log`. Au chargement, le journal est rejoué sur le snapshot
+(dernière ligne d'une notation gagnante).
+
+Le journal est compacté dans un nouveau snapshot quand il dépasse la taille
+de la mémoire (au moins `min_compact` lignes). Sûreté en cas de crash :
+
+- snapshot et journal vide sont écrits dans un fichier temporaire puis
+  substitués par os.replace (atomique) ;
+- chaque ligne est écrite d'un bloc puis fsync ; une dernière ligne tronquée
+  est ignorée au chargement ;
+- la première ligne du journal porte la génération du snapshot qu'il
+  complète (meta.generation). Un journal d'une autre génération (crash entre
+  les deux substitutions, snapshot réécrit par un autre outil) est ignoré.
+
+Un seul écrivain par fichier ; les lecteurs (load_rules) peuvent lire à tout
+moment. close() (ou la sortie d'un bloc `with`, ou la fin du processus pour
+un store ayant écrit) compacte le journal dans le snapshot et supprime
+`<snapshot>.log` : le snapshot seul porte alors tout le contenu.
+
+Usage:
+    >>> store = RuleStore('results/meta_memory.json')
+    >>> store.upsert({'notation': 'B3/S23', 'scores': {'memory_score': 0.4}})
+    >>> store.flush()
+    >>> load_rules('results/meta_memory.json')
+    >>> store.close()
+"""
+
+import os
+import json
+import uuid
+import atexit
+import weakref
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+
+def _json_default(obj):
+    """Types NumPy -> types Python natifs (sérialisation JSON)."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Stores ayant écrit, fermés (compactés) à la fin du processus
+_OPEN_STORES = weakref.WeakSet()
+
+
+def _dumps(record: Dict, indent: Optional[int] = None) -> str:
+    separators = None if indent else (',', ':')
+    return json.dumps(record, default=_json_default, indent=indent, separators=separators)
+
+
+class RuleStore:
+    """
+    Règles d'un fichier JSON, indexées par notation, persistées par journal.
+
+    Attributes:
+        path: Snapshot JSON
+        log_path: Journal append-only (`<path>.log`)
+        rules: Règles dans l'ordre d'insertion (liste partagée : les
+            modifications en place sont persistées via touch() ou sync())
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        key: str = 'notation',
+        min_compact: int = 256,
+        indent: Optional[int] = 2,
+        autoload: bool = True
+    ):
+        """
+        Args:
+            path: Fichier JSON du snapshot
+            key: Champ identifiant une règle
+            min_compact: Lignes de journal tolérées avant compaction
+                (compaction au-delà de max(min_compact, nombre de règles))
+            indent: Indentation du snapshot
+            autoload: Charger snapshot + journal dès la construction
+        """
+        self.path = Path(path)
+        self.log_path = self.path.with_name(self.path.name + '.log')
+        self.key = key
+        self.min_compact = min_compact
+        self.indent = indent
+
+        self.rules: List[Dict] = []
+        self._index: Dict[str, int] = {}
+        self._persisted: Dict[str, str] = {}
+        self._dirty: set = set()
+        self._generation: Optional[str] = None
+        self._log_lines = 0
+        # Journal utilisable : sa génération est celle du snapshot sur disque
+        self._log_valid = False
+        self._stamp = None
+
+        if autoload:
+            self.load()
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    def load(self):
+        """(Re)charge snapshot + journal ; les modifications non flushées sont perdues."""
+        self.rules = []
+        self._index = {}
+        self._persisted = {}
+        self._dirty = set()
+        self._generation = None
+        self._log_lines = 0
+        self._log_valid = False
+
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as fh:
+                payload = json.load(fh)
+            self.rules = list(payload.get('rules', []))
+            self._generation = (payload.get('meta') or {}).get('generation')
+            for i, rule in enumerate(self.rules):
+                if rule.get(self.key) is not None:
+                    self._index[rule[self.key]] = i
+
+        for record in self._read_log():
+            self._put(record, merge=False)
+
+        for name, i in self._index.items():
+            self._persisted[name] = _dumps(self.rules[i])
+        self._stamp = self._disk_stamp()
+
+    def refresh(self) -> bool:
+        """Recharge si un autre écrivain a modifié les fichiers. Retourne True si rechargé."""
+        if self._disk_stamp() == self._stamp:
+            return False
+        self.load()
+        return True
+
+    def _read_log(self) -> Iterator[Dict]:
+        """Enregistrements du journal, s'il complète le snapshot courant."""
+        if self._generation is None or not self.log_path.exists():
+            return
+        with open(self.log_path, encoding='utf-8') as fh:
+            lines = fh.read().split('\n')
+        try:
+            header = json.loads(lines[0])
+        except (json.JSONDecodeError, IndexError):
+            return
+        if header.get('generation') != self._generation:
+            return
+
+        self._log_valid = True
+        for line in lines[1:]:
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Ligne tronquée par un crash
+            self._log_lines += 1
+            yield record
+
+    def _disk_stamp(self):
+        stamps = []
+        for path in (self.path, self.log_path):
+            try:
+                stat = path.stat()
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def get(self, name: str) -> Optional[Dict]:
+        i = self._index.get(name)
+        return None if i is None else self.rules[i]
+
+    def __contains__(self, name) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.rules)
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+    def upsert(self, rule: Dict, merge: bool = True) -> bool:
+        """
+        Ajoute une règle ou met à jour celle de même notation (O(1)).
+
+        Args:
+            rule: Règle (doit contenir le champ clé)
+            merge: Mettre à jour l'existante (dict.update) plutôt que la remplacer
+
+        Returns:
+            True si la règle est nouvelle
+        """
+        name = rule.get(self.key)
+        if name is None:
+            raise ValueError(f"Rule without '{self.key}'")
+        is_new = self._put(rule, merge)
+        self._dirty.add(name)
+        return is_new
+
+    def _put(self, rule: Dict, merge: bool) -> bool:
+        name = rule.get(self.key)
+        i = self._index.get(name)
+        if i is None:
+            self._index[name] = len(self.rules)
+            self.rules.append(rule)
+            return True
+        if merge:
+            self.rules[i].update(rule)
+        else:
+            self.rules[i] = rule
+        return False
+
+    def touch(self, name: str):
+        """Signale une règle modifiée en place (persistée au prochain flush)."""
+        if name in self._index:
+            self._dirty.add(name)
+
+    def sync(self, rules: List[Dict]):
+        """
+        Aligne le stockage sur une liste de règles puis flush.
+
+        Chaque règle remplace celle de même notation ; seules les règles dont
+        le contenu a changé sont écrites au journal. Les règles absentes de
+        la liste sont conservées.
+        """
+        for rule in rules:
+            if rule.get(self.key) is not None:
+                self.upsert(rule, merge=False)
+        self.flush()
+
+    def replace(self, rules: List[Dict]):
+        """Remplace tout le contenu (compaction immédiate)."""
+        self.rules = list(rules)
+        self._index = {}
+        for i, rule in enumerate(self.rules):
+            if rule.get(self.key) is not None:
+                self._index[rule[self.key]] = i
+        self.compact()
+
+    def flush(self):
+        """Écrit au journal les règles modifiées depuis le dernier flush."""
+        if not self._log_valid:
+            # Pas de journal rattaché au snapshot sur disque : on en repart
+            self.compact()
+            return
+
+        lines = []
+        for name in self._dirty:
+            if name not in self._index:
+                continue
+            line = _dumps(self.rules[self._index[name]])
+            if self._persisted.get(name) != line:
+                lines.append(line)
+                self._persisted[name] = line
+        self._dirty = set()
+
+        if lines:
+            data = ('\n'.join(lines) + '\n').encode('utf-8')
+            fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._log_lines += len(lines)
+            self._stamp = self._disk_stamp()
+            _OPEN_STORES.add(self)
+
+        if self._log_lines > max(self.min_compact, len(self.rules)):
+            self.compact()
+
+    def compact(self):
+        """Réécrit le snapshot avec tout le contenu et vide le journal."""
+        generation = uuid.uuid4().hex
+        payload = {
+            'meta': {
+                'updated': datetime.now().isoformat(),
+                'count': len(self.rules),
+                'generation': generation
+            },
+            'rules': self.rules
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self.path, _dumps(payload, indent=self.indent))
+        _atomic_write(self.log_path, _dumps({'generation': generation}) + '\n')
+
+        self._generation = generation
+        self._log_valid = True
+        self._log_lines = 0
+        self._dirty = set()
+        self._persisted = {name: _dumps(self.rules[i]) for name, i in self._index.items()}
+        self._stamp = self._disk_stamp()
+        _OPEN_STORES.add(self)
+
+    def close(self):
+        """
+        Flush puis compacte : le snapshot porte tout, le journal est supprimé.
+
+        Le store reste utilisable (la prochaine écriture recrée le journal).
+        """
+        _OPEN_STORES.discard(self)
+        if self._dirty or self._log_lines:
+            self.compact()
+            _OPEN_STORES.discard(self)
+        if self._log_valid:
+            try:
+                os.remove(self.log_path)
+            except FileNotFoundError:
+                pass
+            self._log_valid = False
+            self._stamp = self._disk_stamp()
+
+    def __enter__(self) -> 'RuleStore':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+@atexit.register
+def _close_open_stores():
+    """Compacte à la sortie les journaux des stores ayant écrit."""
+    for store in list(_OPEN_STORES):
+        if not store.path.parent.exists():
+            continue  # Répertoire supprimé (fichiers temporaires)
+        try:
+            store.close()
+        except OSError:
+            pass
+
+
+def _atomic_write(path: Path, text: str):
+    """Écrit `text` dans `path` via un fichier temporaire et os.replace."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+            fh.write(text)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def load_rules(path: Union[str, Path], key: str = 'notation') -> List[Dict]:
+    """Règles d'un fichier (snapshot + journal), en lecture seule."""
+    return RuleStore(path, key=key).rules
+
+
+__all__ = ['RuleStore', 'load_rules']
@@ -4,6 +4,7 @@ Command-line tool for scanning CA/Ising rule spaces.
 Usage:
     python -m isinglab.scan_rules --config experiments/scan_default.yaml
     python -m isinglab.scan_rules --rules 0 255 --output outputs/
+    python -m isinglab.scan_rules --rules 0 255 --n-seeds 3 --workers 4
 """
 
 import argparse
@@ -76,6 +77,13 @@ def parse_args():
         help="Number of different initial conditions per rule"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for evaluation (default: serial)"
+    )
+    
     parser.add_argument(
         "--output",
         type=str,
@@ -121,6 +129,7 @@ def main():
         steps = config.get("steps", 200)
         seed = config.get("seed", 42)
         n_seeds = config.get("n_seeds", 1)
+        workers = config.get("workers", args.workers)
         output_dir = config.get("output_dir", "outputs")
         top_n = config.get("top_n", 20)
         metric = config.get("metric", "edge_score")
@@ -137,6 +146,7 @@ def main():
         steps = args.steps
         seed = args.seed
         n_seeds = args.n_seeds
+        workers = args.workers
         output_dir = args.output
         top_n = args.top_n
         metric = args.metric
@@ -156,6 +166,7 @@ def main():
         print(f"  Steps: {steps}")
         print(f"  Seeds per rule: {n_seeds}")
         print(f"  Random seed: {seed}")
+        print(f"  Workers: {workers or 1}")
         print(f"  Output: {output_dir}")
         print("=" * 60)
     
@@ -166,7 +177,8 @@ def main():
             grid_size=grid_size[0] if len(grid_size) == 1 else grid_size[0],
             steps=steps,
             seed=seed,
-            n_seeds=n_seeds
+            n_seeds=n_seeds,
+            workers=workers
         )
     else:
         df = scanner.scan_range(
@@ -175,7 +187,8 @@ def main():
             steps=steps,
             seed=seed,
             ca_type=ca_type,
-            n_seeds=n_seeds
+            n_seeds=n_seeds,
+            workers=workers
         )
     
     # Save results
@@ -48,7 +48,10 @@ class RuleScanner:
         seed: int = 42,
         ca_type: str = "elementary",
         n_seeds: int = 1,
-        filter_func: Optional[Callable] = None
+        filter_func: Optional[Callable] = None,
+        batched: Optional[bool] = None,
+        until_attractor: bool = False,
+        workers: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Scan a range of rules.
@@ -61,6 +64,11 @@ class RuleScanner:
             ca_type: CA type
             n_seeds: Repetitions per rule with different seeds
             filter_func: Optional function to pre-filter rules
+            batched: Evolve rules together (see evaluate_batch; None = auto)
+            until_attractor: Stop trajectories early on attractors and add
+                a steps_saved column (see evaluate_rule)
+            workers: Worker processes (see evaluate_batch; results match
+                the serial scan exactly)
             
         Returns:
             DataFrame with all metrics
@@ -83,7 +91,10 @@ class RuleScanner:
             steps=steps,
             seed=seed,
             ca_type=ca_type,
-            n_seeds=n_seeds
+            n_seeds=n_seeds,
+            batched=batched,
+            until_attractor=until_attractor,
+            workers=workers
         )
         
         # Convert to DataFrame
@@ -91,6 +102,8 @@ class RuleScanner:
         
         if self.verbose:
             print(f"Scan complete. {len(df)} rules evaluated.")
+            if until_attractor and len(df) > 0:
+                print(f"Early termination saved {int(df['steps_saved'].sum())} simulation steps.")
         
         return df
     
@@ -100,7 +113,8 @@ class RuleScanner:
         grid_size: int = 100,
         steps: int = 200,
         seed: int = 42,
-        n_seeds: int = 3
+        n_seeds: int = 3,
+        workers: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Scan elementary CA rules (Wolfram rules 0-255).
@@ -111,6 +125,7 @@ class RuleScanner:
             steps: Evolution steps
             seed: Random seed
             n_seeds: Repetitions per rule
+            workers: Worker processes (None = serial)
             
         Returns:
             DataFrame with metrics
@@ -126,7 +141,8 @@ class RuleScanner:
             steps=steps,
             seed=seed,
             ca_type="elementary",
-            n_seeds=n_seeds
+            n_seeds=n_seeds,
+            workers=workers
         )
     
     def scan_life_like(
@@ -135,7 +151,8 @@ class RuleScanner:
         grid_size: tuple = (100, 100),
         steps: int = 200,
         seed: int = 42,
-        n_seeds: int = 3
+        n_seeds: int = 3,
+        workers: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Scan Life-like CA rules.
@@ -146,6 +163,7 @@ class RuleScanner:
             steps: Evolution steps
             seed: Random seed
             n_seeds: Repetitions per rule
+            workers: Worker processes (None = serial)
             
         Returns:
             DataFrame with metrics
@@ -160,7 +178,8 @@ class RuleScanner:
             steps=steps,
             seed=seed,
             ca_type="life",
-            n_seeds=n_seeds
+            n_seeds=n_seeds,
+            workers=workers
         )
     
     def _generate_life_rules(self, n_samples: int = 100) -> List[int]:
@@ -14,6 +14,8 @@ import os
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
+from .rules.store import load_rules
+
 
 class CAViewerHandler(http.server.SimpleHTTPRequestHandler):
     """Handler pour servir les fichiers statiques + API CA."""
@@ -48,10 +50,8 @@ class CAViewerHandler(http.server.SimpleHTTPRequestHandler):
         if not hof_path.exists():
             return {'rules': []}
         
-        with open(hof_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return data
+        # Snapshot + journal des mises à jour
+        return {'rules': load_rules(hof_path)}
     
     def get_top_memory(self, limit=50):
         """Charge top N règles de meta_memory."""
@@ -59,10 +59,7 @@ class CAViewerHandler(http.server.SimpleHTTPRequestHandler):
         if not memory_path.exists():
             return {'rules': []}
         
-        with open(memory_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        rules = data.get('rules', [])
+        rules = load_rules(memory_path)
         
         # Trier par composite
         def get_composite(r):
@@ -4,12 +4,15 @@ Analyse rapide des découvertes AGI (session interrompue).
 Extrait et classe les règles intéressantes trouvées.
 """
 
-import json
+import sys
 from pathlib import Path
 
-# Charger meta_memory
-meta_memory = json.load(open("results/meta_memory.json"))
-rules = meta_memory["rules"]
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from isinglab.rules.store import load_rules
+
+# Charger meta_memory (snapshot + journal)
+rules = load_rules("results/meta_memory.json")
 
 print("=" * 80)
 print("ANALYSE DÉCOUVERTES AGI (SESSION INTERROMPUE)")
@@ -0,0 +1,116 @@
+"""
+Benchmark Optimiseur Bayésien vs Grid Search vs Random Search (trajectoires holonomiques)
+
+Compare le nombre de simulations (simulate_with_holonomy_paths) nécessaires
+pour atteindre le meilleur coût de la grid search, pour l'optimiseur
+bayésien et la recherche aléatoire au même budget et au même seuil.
+
+Protocole : le couplage des oscillateurs est normalisé par la somme des
+forces des kernels, une rampe K1 seule ne change donc pas la dynamique et
+le coût est plat. Un kernel K2 de fond (BACKGROUND_K2, portée 3) rend le
+rapport K1/K2 significatif : la rampe K1 explorée par les optimiseurs
+déplace alors réellement l'état phénoménologique final.
+"""
+
+import sys
+import time
+from functools import partial
+from pathlib import Path
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from isinglab.control import GridSearchOptimizer, RandomSearchOptimizer, BayesianOptimizer
+from isinglab.control.holonomy import HolonomyPath
+from isinglab.data_bridge.atlas_map import AtlasMapper
+from isinglab.data_bridge.cost_functions import compute_target_profile
+from isinglab.pipelines.holonomy_optimization import trajectory_costs
+
+
+BACKGROUND_K2 = 0.5
+TARGET = 'balanced'
+PROFILE = 'NV-298K'
+BUDGET = 32
+SEEDS = range(10)
+
+
+def with_background(path: HolonomyPath, k2: float) -> HolonomyPath:
+    """Copie du path avec un kernel K2 constant ajouté à chaque point."""
+    background = HolonomyPath(space=path.space, name=path.name, description=path.description)
+    for point in path.points:
+        background.add_point(dict(point.params, k2=k2), t=point.t)
+    return background
+
+
+def background_costs(paths, k2: float, **settings):
+    """Coûts d'un lot de paths simulés sur le kernel K2 de fond (picklable)."""
+    return trajectory_costs([with_background(path, k2) for path in paths], **settings)
+
+
+def evaluations_to_reach(result, threshold: float):
+    """Nombre de simulations avant d'atteindre le seuil (None : jamais)."""
+    running_best = np.minimum.accumulate([cost for _, cost in result.all_evaluated])
+    reached = np.flatnonzero(running_best <= threshold)
+    return int(reached[0]) + 1 if len(reached) else None
+
+
+def main():
+    mapper = AtlasMapper()
+    phys_profile = mapper.get_profile(PROFILE)
+    k_max_safe = mapper._compute_k_max(phys_profile.t1_us, phys_profile.t2_us)
+    
+    batch_cost = partial(
+        background_costs, k2=BACKGROUND_K2,
+        target_state=compute_target_profile(TARGET), phys_profile=phys_profile,
+        grid_size=(16, 16), steps_per_unit_time=200, seed=42
+    )
+    param_ranges = {
+        'k_start': (0.05 * k_max_safe, 0.9 * k_max_safe),
+        'k_end': (0.05 * k_max_safe, 0.9 * k_max_safe),
+        'annealing_start': (0.0, 0.5),
+        'annealing_end': (0.0, 1.0)
+    }
+    search = dict(atlas_profile=phys_profile, batch_cost_function=batch_cost)
+    
+    print("=" * 80)
+    print("BENCHMARK OPTIMISEUR BAYÉSIEN (GP + EI) VS GRID / RANDOM SEARCH")
+    print("=" * 80)
+    print(f"Cible {TARGET}, profil {PROFILE}, K2 de fond {BACKGROUND_K2}, grille 16x16")
+    print()
+    
+    start = time.perf_counter()
+    grid_ranges = {name: (low, high, 4) for name, (low, high) in param_ranges.items()}
+    grid = GridSearchOptimizer(grid_ranges, verbose=False).optimize(None, **search)
+    costs = np.array([cost for _, cost in grid.all_evaluated])
+    print(f"Grid search   : {grid.n_evaluations} simulations, "
+          f"meilleur coût {grid.best_cost:.5f} ({time.perf_counter() - start:.1f}s)")
+    print(f"Surface       : min {costs.min():.5f}, médiane {np.median(costs):.5f}, "
+          f"max {costs.max():.5f}")
+    print()
+    
+    print(f"### Budget {BUDGET} simulations, seuil = optimum de la grille")
+    print("-" * 60)
+    
+    hits = {'bayésien': [], 'aléatoire': []}
+    for seed in SEEDS:
+        bayes = BayesianOptimizer(param_ranges, n_evaluations=BUDGET, verbose=False,
+                                  seed=seed).optimize(None, batch_size=4, **search)
+        random = RandomSearchOptimizer(param_ranges, n_samples=BUDGET, verbose=False,
+                                       seed=seed).optimize(None, **search)
+        hits['bayésien'].append(evaluations_to_reach(bayes, grid.best_cost))
+        hits['aléatoire'].append(evaluations_to_reach(random, grid.best_cost))
+    
+        reached = {name: (f"seuil à l'évaluation {values[-1]}" if values[-1] else "seuil non atteint")
+                   for name, values in hits.items()}
+        print(f"  seed {seed} : bayésien {bayes.best_cost:.5f} ({reached['bayésien']}) | "
+              f"aléatoire {random.best_cost:.5f} ({reached['aléatoire']})")
+    
+    print()
+    for name, values in hits.items():
+        reached = [hit for hit in values if hit is not None]
+        median = f"médiane {np.median(reached):.0f} simulations" if reached else "-"
+        print(f"{name:10s}: optimum grille atteint {len(reached)}/{len(values)} seeds, {median}")
+
+
+if __name__ == "__main__":
+    main()
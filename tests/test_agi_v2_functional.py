@@ -8,9 +8,14 @@ from isinglab.metrics.functional import (
     compute_memory_capacity,
     compute_robustness_to_noise,
     compute_basin_size,
+    compute_functional_batch,
     compute_functional_score,
     infer_module_profile
 )
+from isinglab.core.ca_vectorized import (
+    create_rule_function_vectorized,
+    create_stack_rule_function_vectorized
+)
 from isinglab.meta_learner.pareto import (
     dominates,
     pareto_front,
@@ -58,6 +63,49 @@ def test_basin_size_basic():
     assert 0 <= result['basin_diversity'] <= 1
 
 
+@pytest.mark.parametrize("born,survive", [
+    ([3], [2, 3]),              # Life : oscillateurs et points fixes
+    ([3], []),                  # Meurt vite
+    ([1], [0, 1, 2, 3, 4, 5]),  # Croissance chaotique
+    ([], [0, 1, 2, 3, 4, 5, 6, 7, 8]),  # Identité
+])
+def test_functional_batch_matches_sequential(born, survive):
+    """Pile (N, H, W) : mêmes résultats que les trois tests séquentiels."""
+    rule = create_rule_function_vectorized(born, survive)
+    np.random.seed(3)
+    expected = (
+        compute_memory_capacity(rule, grid_size=(16, 16), n_patterns=5, steps=30),
+        compute_robustness_to_noise(rule, grid_size=(16, 16), noise_level=0.1, n_trials=3, steps=30),
+        compute_basin_size(rule, grid_size=(16, 16), n_samples=5, steps=20)
+    )
+    
+    np.random.seed(3)
+    batched = compute_functional_batch(
+        create_stack_rule_function_vectorized(born, survive), grid_size=(16, 16),
+        n_patterns=5, n_trials=3, n_samples=5, noise_level=0.1,
+        capacity_steps=30, robustness_steps=30, basin_steps=20
+    )
+    
+    for seq, batch in zip(expected, batched):
+        for key in seq:
+            if key != 'steps_saved':
+                assert batch[key] == seq[key], key
+    if survive == list(range(9)):
+        # Identité : un seul step simulé par échantillon, compté dans son test
+        assert [result['steps_saved'] for result in batched] == [5 * 30, 3 * 34, 5 * 19]
+    
+    stack_rule = create_stack_rule_function_vectorized(born, survive)
+    
+    # Flux explicite : reproductible, sans toucher l'état global
+    np.random.seed(3)
+    state = np.random.get_state()[1].copy()
+    seeded = [compute_functional_batch(stack_rule, grid_size=(16, 16), n_patterns=5, n_trials=3,
+                                       n_samples=5, seed=seed)
+              for seed in (7, np.random.default_rng(7))]
+    assert np.array_equal(np.random.get_state()[1], state)
+    assert seeded[0] == seeded[1]
+
+
 def test_compute_functional_score():
     """Test agrégation des scores fonctionnels."""
     capacity_result = {'capacity_score': 0.6}
@@ -3,7 +3,8 @@ Tests for isinglab public API (evaluate_rule, evaluate_batch, quick_scan)
 """
 import pytest
 import numpy as np
-from isinglab.api import evaluate_rule, evaluate_batch, quick_scan
+import pandas as pd
+from isinglab.api import evaluate_rule, evaluate_batch, quick_scan, evaluate_rules_batched
 
 
 def test_evaluate_rule_basic():
@@ -101,6 +102,102 @@ def test_quick_scan():
     assert all("edge_score" in r for r in results)
 
 
+@pytest.mark.parametrize("ca_type,grid_size,rules", [
+    ("elementary", 40, [0, 30, 90, 110, 184, 255]),
+    ("life", (20, 24), [8 | (1 << 11) | (1 << 12), 3, 1 << 17, 12345, 200000]),
+])
+@pytest.mark.parametrize("boundary", ["periodic", "fixed"])
+def test_evaluate_rules_batched_matches_serial(ca_type, grid_size, rules, boundary):
+    """Batched evaluation returns exactly the per-rule evaluate_rule metrics"""
+    batched = evaluate_rules_batched(
+        rules, grid_size=grid_size, steps=30, seed=7,
+        ca_type=ca_type, boundary=boundary, batch_size=4
+    )
+    
+    assert len(batched) == len(rules)
+    for rule, result in zip(rules, batched):
+        expected = evaluate_rule(
+            rule=rule, grid_size=grid_size, steps=30, seed=7,
+            ca_type=ca_type, boundary=boundary
+        )
+        assert result.keys() == expected.keys()
+        for key in expected:
+            assert result[key] == expected[key], f"Rule {rule}: {key} differs"
+
+
+def test_evaluate_batch_batched_flag():
+    """evaluate_batch gives the same averaged results with and without batching"""
+    kwargs = dict(rules=[30, 110], ca_type="elementary", grid_size=30,
+                  steps=30, n_seeds=2, seed=42)
+    serial = evaluate_batch(batched=False, **kwargs)
+    batched = evaluate_batch(batched=True, **kwargs)
+    
+    for a, b in zip(serial, batched):
+        assert a == b
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_evaluate_batch_workers_match_serial(batched):
+    """Process-pool evaluation returns the serial results in the same order"""
+    kwargs = dict(rules=[0, 30, 54, 90, 110, 184], ca_type="elementary", grid_size=30,
+                  steps=30, n_seeds=2, seed=5, batched=batched)
+    serial = evaluate_batch(**kwargs)
+    parallel = evaluate_batch(workers=2, chunk_size=2, **kwargs)
+    
+    assert parallel == serial
+
+
+def test_scanner_workers_dataframe(tmp_path):
+    """RuleScanner merges parallel results into the serial DataFrame"""
+    from isinglab.search import RuleScanner
+    
+    scanner = RuleScanner(output_dir=str(tmp_path), verbose=False)
+    kwargs = dict(rule_subset=list(range(20, 32)), grid_size=24, steps=20, n_seeds=2)
+    serial = scanner.scan_elementary_ca(**kwargs)
+    parallel = scanner.scan_elementary_ca(workers=3, **kwargs)
+    
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+@pytest.mark.parametrize("history_mode,history_size", [
+    ("none", None), ("ring", 5), ("strided", 7)
+])
+def test_evaluate_rule_history_modes(history_mode, history_size):
+    """Streaming metrics match the full-history evaluation"""
+    for kwargs in [
+        dict(rule=110, ca_type="elementary", grid_size=40, steps=60),
+        dict(rule=8 | (1 << 11) | (1 << 12), ca_type="life", grid_size=(20, 20), steps=80),
+    ]:
+        full = evaluate_rule(seed=3, **kwargs)
+        streamed = evaluate_rule(seed=3, history_mode=history_mode,
+                                 history_size=history_size, **kwargs)
+        assert streamed == full
+
+
+@pytest.mark.parametrize("history_mode,history_size", [("full", None), ("ring", 5), ("none", None)])
+def test_evaluate_rule_until_attractor(history_mode, history_size):
+    """Early termination replays the cycle: same metrics, steps_saved reported"""
+    for rule, saves in [(4, True), (110, False)]:
+        kwargs = dict(rule=rule, ca_type="elementary", grid_size=40, steps=80, seed=3,
+                      history_mode=history_mode, history_size=history_size)
+        full = evaluate_rule(**kwargs)
+        early = evaluate_rule(until_attractor=True, **kwargs)
+        
+        steps_saved = early.pop("steps_saved")
+        assert early == full
+        assert (steps_saved > 0) == saves
+
+
+def test_evaluate_batch_until_attractor():
+    """until_attractor runs per rule and cannot be forced through the batched path"""
+    results = evaluate_batch([0, 4, 30], grid_size=30, steps=40, until_attractor=True)
+    assert all("steps_saved" in r for r in results)
+    assert results[0]["steps_saved"] > 0
+    
+    with pytest.raises(ValueError, match="until_attractor"):
+        evaluate_batch([0, 4], grid_size=30, steps=40, batched=True, until_attractor=True)
+
+
 def test_evaluate_rule_ising():
     """Test that Ising model evaluation works"""
     result = evaluate_rule(
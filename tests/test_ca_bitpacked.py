@@ -0,0 +1,92 @@
+"""
+Tests du moteur bit-packed : parité avec step_ca_vectorized.
+"""
+
+import pytest
+import numpy as np
+from isinglab.core.ca_vectorized import step_ca_vectorized
+from isinglab.core.ca_bitpacked import (
+    pack_grid,
+    unpack_grid,
+    step_ca_bitpacked,
+    create_rule_function_bitpacked,
+    evolve_ca_bitpacked
+)
+from isinglab.brain_modules import get_brain_rule_function
+from isinglab.memory_explorer import MemoryExplorer
+from isinglab.reservoir import CAReservoir
+
+RULES = [
+    ([3], [2, 3]),                    # Life
+    ([3, 6], [2, 3]),                 # HighLife
+    ([0, 1], [8]),                    # B0 : naissances dans le vide
+    ([8], [0]),                       # Comptes extrêmes 0 et 8
+    ([3, 6, 7, 8], [3, 4, 6, 7, 8]),  # Day & Night
+    (list(range(9)), []),
+]
+
+SHAPES = [(1, 1), (3, 1), (5, 7), (16, 64), (10, 65), (33, 130)]
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_pack_unpack_roundtrip(shape):
+    """Compression puis décompression redonne la grille."""
+    rng = np.random.default_rng(0)
+    grid = (rng.random(shape) < 0.5).astype(int)
+    assert np.array_equal(unpack_grid(pack_grid(grid), shape[1]), grid)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("born,survive", RULES)
+def test_parity_with_vectorized(born, survive, shape):
+    """Le circuit bit-sliced donne exactement les mêmes grilles."""
+    rng = np.random.default_rng(1)
+    grid = (rng.random(shape) < 0.4).astype(int)
+
+    expected = grid.copy()
+    current = grid.copy()
+    for _ in range(8):
+        expected = step_ca_vectorized(expected, set(born), set(survive))
+        current = step_ca_bitpacked(current, set(born), set(survive))
+        assert np.array_equal(current, expected)
+
+    assert np.array_equal(evolve_ca_bitpacked(grid, set(born), set(survive), 8), expected)
+
+
+def test_rule_function_factories():
+    """Les points d'entrée exposent le moteur bit-packed."""
+    rng = np.random.default_rng(2)
+    grid = (rng.random((32, 32)) < 0.3).astype(int)
+    reference = step_ca_vectorized(grid, {3}, {2, 3})
+
+    factories = [
+        create_rule_function_bitpacked([3], [2, 3]),
+        MemoryExplorer()._create_rule_function([3], [2, 3], bitpacked=True),
+        get_brain_rule_function('life', bitpacked=True),
+    ]
+    for rule_func in factories:
+        new_grid = rule_func(grid)
+        assert new_grid.dtype == reference.dtype
+        assert np.array_equal(new_grid, reference)
+
+
+def test_reservoir_with_bitpacked_rule():
+    """CAReservoir accepte la fonction règle bit-packed."""
+    reservoir = CAReservoir(
+        rule_function=get_brain_rule_function('life', bitpacked=True),
+        grid_size=(16, 16),
+        steps=5
+    )
+    initial_state = reservoir.encode_input(np.random.rand(16, 16))
+    history = reservoir.evolve(initial_state)
+    assert len(history) == 6
+
+
+def test_invalid_count():
+    """Un compte de voisins hors [0, 8] est refusé."""
+    with pytest.raises(ValueError, match="out of range"):
+        create_rule_function_bitpacked([9], [2])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
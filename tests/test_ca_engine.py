@@ -0,0 +1,152 @@
+"""
+Tests for CAEngine backends: the vectorized step must match the loop reference.
+"""
+import pytest
+import numpy as np
+from isinglab.core import CAEngine
+from isinglab.core.ca_batch import rule_tables, evolve_batch
+
+BOUNDARIES = ["periodic", "fixed", "reflect"]
+
+
+def _run_both(grid_size, rule, ca_type, boundary, seed, steps):
+    """Evolve the same initial grid with both backends and return histories."""
+    histories = []
+    for backend in ["loop", "vectorized"]:
+        engine = CAEngine(grid_size, rule, ca_type=ca_type, boundary=boundary,
+                          seed=seed, backend=backend)
+        histories.append(engine.run(steps))
+    return histories
+
+
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+@pytest.mark.parametrize("rule", [0, 30, 90, 110, 184, 255])
+def test_elementary_parity(rule, boundary):
+    """1D rule-table gather matches the per-cell lookup."""
+    loop_hist, vec_hist = _run_both((37,), rule, "elementary", boundary, seed=7, steps=20)
+
+    assert len(loop_hist) == len(vec_hist)
+    for a, b in zip(loop_hist, vec_hist):
+        assert a.dtype == b.dtype
+        assert np.array_equal(a, b)
+
+
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+@pytest.mark.parametrize("notation", [
+    ([3], [2, 3]),           # Conway's Life
+    ([3, 6], [2, 3]),        # HighLife
+    ([0, 1], [8]),           # B0 rule (births from empty neighborhoods)
+    ([3, 6, 7, 8], [3, 4, 6, 7, 8]),  # Day & Night
+])
+def test_life_parity(notation, boundary):
+    """2D neighbor-count stencil matches the quadruple loop."""
+    born, survive = notation
+    rule = sum(1 << b for b in born) + sum(1 << (s + 9) for s in survive)
+    loop_hist, vec_hist = _run_both((13, 17), rule, "life", boundary, seed=3, steps=10)
+
+    for a, b in zip(loop_hist, vec_hist):
+        assert a.dtype == b.dtype
+        assert np.array_equal(a, b)
+
+
+@pytest.mark.parametrize("grid_size", [(1, 5), (2, 2), (3, 1)])
+def test_life_parity_degenerate_grids(grid_size):
+    """Tiny periodic grids wrap onto themselves identically in both backends."""
+    rule = (1 << 3) | (1 << (2 + 9)) | (1 << (3 + 9))
+    loop_hist, vec_hist = _run_both(grid_size, rule, "life", "periodic", seed=1, steps=5)
+
+    for a, b in zip(loop_hist, vec_hist):
+        assert np.array_equal(a, b)
+
+
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+@pytest.mark.parametrize("ca_type,grid_size,rules", [
+    ("elementary", (29,), [0, 30, 110, 255]),
+    ("life", (11, 14), [8 | (1 << 11) | (1 << 12), 3, 1 << 17, 262143]),
+])
+def test_batch_matches_engine(ca_type, grid_size, rules, boundary):
+    """A stack of rules evolves like one engine per rule."""
+    initial = CAEngine(grid_size, rules[0], ca_type=ca_type, seed=4).grid
+    stack = np.broadcast_to(initial, (len(rules),) + initial.shape).copy()
+    history = evolve_batch(stack, rule_tables(rules, ca_type), 12, boundary)
+
+    for r, rule in enumerate(rules):
+        engine = CAEngine(grid_size, rule, ca_type=ca_type, boundary=boundary, seed=4)
+        for t, state in enumerate(engine.run(12)):
+            assert history[t, r].dtype == state.dtype
+            assert np.array_equal(history[t, r], state)
+
+
+@pytest.mark.parametrize("mode,size", [("ring", 4), ("strided", 3), ("none", None)])
+def test_history_policies(mode, size):
+    """Ring, strided and none modes keep the expected subset of frames."""
+    full = CAEngine((40,), 110, seed=2).run(10)
+    engine = CAEngine((40,), 110, seed=2, history_mode=mode, history_size=size)
+    kept = engine.run(10)
+
+    if mode == "ring":
+        expected = full[-size:]
+    elif mode == "strided":
+        expected = full[::size]
+    else:
+        expected = []
+
+    assert isinstance(kept, list) and len(kept) == len(expected)
+    for a, b in zip(kept, expected):
+        assert np.array_equal(a, b)
+
+    # Non-full modes feed the streaming accumulator with every frame
+    assert engine.stream.n_frames == len(full)
+    assert np.array_equal(engine.stream.last, full[-1])
+
+
+def test_history_policy_validation():
+    """Unknown modes and missing sizes are rejected."""
+    with pytest.raises(ValueError, match="Unknown history mode"):
+        CAEngine((10,), 30, history_mode="sparse")
+    with pytest.raises(ValueError, match="history size"):
+        CAEngine((10,), 30, history_mode="ring")
+
+
+def test_engine_tracks_attractor():
+    """Online detection in the step loop finds the cycle of the trajectory."""
+    # Rule 4 (B1/S... elementary) freezes to a fixed point almost immediately
+    engine = CAEngine((30,), 4, seed=0, track_attractor=True)
+    assert engine.attractor is None
+
+    history = engine.run(10)
+    transient, period = engine.attractor
+    assert period == 1
+    assert np.array_equal(history[transient], history[transient + period])
+
+    assert CAEngine((30,), 4, seed=0).attractor is None
+
+
+@pytest.mark.parametrize("mode,size", [("full", None), ("ring", 6), ("none", None)])
+def test_run_until_attractor(mode, size):
+    """Stopping on the attractor leaves grid, history and stream as a full run"""
+    for rule in [4, 108, 110]:
+        full = CAEngine((30,), rule, seed=5, history_mode=mode, history_size=size)
+        full.run(60)
+        early = CAEngine((30,), rule, seed=5, history_mode=mode, history_size=size)
+        early.run(60, until_attractor=True)
+        
+        assert early.t == full.t
+        assert np.array_equal(early.grid, full.grid)
+        assert len(early.history) == len(full.history)
+        for a, b in zip(early.history, full.history):
+            assert np.array_equal(a, b)
+        if mode != "full":
+            assert early.stream.n_frames == full.stream.n_frames
+            assert early.stream.attractor_analysis() == full.stream.attractor_analysis()
+        assert (early.steps_saved > 0) == (rule != 110)
+
+
+def test_unknown_backend():
+    """Unknown backends are rejected at construction time."""
+    with pytest.raises(ValueError, match="Unknown backend"):
+        CAEngine((10,), 30, backend="gpu")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,140 @@
+"""
+Tests for the persistent evaluation cache.
+"""
+import os
+import time
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+import isinglab.api as api
+from isinglab.api import evaluate_rule
+from isinglab.eval_cache import EvaluationCache, cache_key, set_default_cache
+from isinglab.memory_explorer import MemoryExplorer
+
+
+def _same_metrics(a, b):
+    assert a.keys() == b.keys()
+    for key in a:
+        assert np.array_equal(a[key], b[key]), key
+
+
+def test_cached_evaluation_skips_simulation(tmp_path, monkeypatch):
+    """A repeated evaluation is read back, identical, without simulating"""
+    cache = EvaluationCache(tmp_path)
+    reference = evaluate_rule(rule=110, grid_size=40, steps=40, seed=3)
+
+    first = evaluate_rule(rule=110, grid_size=40, steps=40, seed=3, cache=cache)
+    _same_metrics(first, reference)
+    assert (cache.hits, cache.misses, cache.writes) == (0, 1, 1)
+
+    def no_simulation(*args, **kwargs):
+        raise AssertionError("simulated a cached rule")
+
+    monkeypatch.setattr(api, "_evaluate_rule", no_simulation)
+    _same_metrics(evaluate_rule(rule=110, grid_size=(40,), steps=40, seed=3, cache=cache),
+                  reference)
+    # Another process (a new instance) sees the same entry
+    _same_metrics(evaluate_rule(rule=110, grid_size=40, steps=40, seed=3,
+                                cache=EvaluationCache(tmp_path)), reference)
+    assert cache.hits == 1
+
+
+def test_default_cache_and_key_fields(tmp_path):
+    """Every setting is part of the key; False bypasses the default cache"""
+    cache = EvaluationCache(tmp_path)
+    previous = set_default_cache(cache)
+    try:
+        evaluate_rule(rule=30, grid_size=30, steps=20, seed=1)
+        evaluate_rule(rule=30, grid_size=30, steps=20, seed=2)
+        evaluate_rule(rule=30, grid_size=30, steps=20, seed=1, boundary="fixed")
+        evaluate_rule(rule=30, grid_size=30, steps=20, seed=1)
+        evaluate_rule(rule=30, grid_size=30, steps=20, seed=1, cache=False)
+    finally:
+        set_default_cache(previous)
+
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 3)
+    assert cache_key(rule=np.int64(5), size=(2, 3)) == cache_key(size=[2, 3], rule=5)
+
+
+def test_lru_eviction(tmp_path):
+    """Past max_entries, the least recently used entries are removed"""
+    cache = EvaluationCache(tmp_path, max_entries=4)
+    for k in range(4):
+        cache[cache_key(k=k)] = k
+        time.sleep(0.01)
+    assert cache[cache_key(k=0)] == 0  # Refreshes entry 0
+    time.sleep(0.01)
+
+    cache[cache_key(k=4)] = 4
+    assert cache.evictions >= 1
+    assert len(cache) <= 4
+    assert cache_key(k=0) in cache and cache_key(k=4) in cache
+    assert cache_key(k=1) not in cache
+
+    stats = cache.stats()
+    assert stats['entries'] == len(cache) and stats['writes'] == 5
+
+
+def test_concurrent_writers(tmp_path):
+    """Concurrent writes of one key leave a single complete entry"""
+    cache = EvaluationCache(tmp_path)
+    key = cache_key(rule=110)
+    value = {'history': np.arange(50000)}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: cache.__setitem__(key, value), range(32)))
+
+    assert np.array_equal(EvaluationCache(tmp_path)[key]['history'], value['history'])
+    leftovers = [name for _, _, names in os.walk(tmp_path) for name in names
+                 if name.endswith('.tmp')]
+    assert leftovers == [] and len(cache) == 1
+
+
+def test_batch_reads_and_fills_cache(tmp_path, monkeypatch):
+    """evaluate_batch shares entries with evaluate_rule, batched or in workers"""
+    cache = EvaluationCache(tmp_path)
+    known = evaluate_rule(rule=30, grid_size=40, steps=30, seed=5, cache=cache)
+    reference = api.evaluate_batch([30, 90, 110], grid_size=40, steps=30, seed=5, cache=False)
+
+    batched = api.evaluate_rules_batched
+    simulated = []
+
+    def recording(rules, **kwargs):
+        simulated.extend(rules)
+        return batched(rules, **kwargs)
+
+    monkeypatch.setattr(api, "evaluate_rules_batched", recording)
+    results = api.evaluate_batch([30, 90, 110], grid_size=40, steps=30, seed=5, cache=cache)
+    assert simulated == [90, 110]
+    _same_metrics(results[0], known)
+    for result, expected in zip(results, reference):
+        _same_metrics(result, expected)
+
+    # Every rule is now known: nothing is simulated, in any mode
+    simulated.clear()
+    for kwargs in ({}, {'batched': False}, {'workers': 2, 'chunk_size': 1}):
+        for result, expected in zip(api.evaluate_batch([30, 90, 110], grid_size=40, steps=30,
+                                                       seed=5, cache=tmp_path, **kwargs),
+                                    reference):
+            _same_metrics(result, expected)
+    assert simulated == [] and len(cache) == 3
+
+
+def test_explorer_reuses_candidates(tmp_path):
+    """Equivalent notations share one entry; source and notation are refreshed"""
+    explorer = MemoryExplorer(output_dir=str(tmp_path / "scans"), cache=tmp_path / "cache")
+    first = explorer.evaluate_candidate({'notation': 'B3/S23', 'source': 'a'},
+                                        grid_size=(16, 16), steps=20)
+    again = explorer.evaluate_candidate({'notation': 'B3/S32', 'source': 'b'},
+                                        grid_size=(16, 16), steps=20)
+
+    assert explorer.cache.hits == 1
+    assert len(explorer.cache) == 1  # The inner evaluate_rule is not cached again
+    assert again['notation'] == 'B3/S32' and again['source'] == 'b'
+    assert again['functional_score'] == first['functional_score']
+    assert again['edge_score'] == first['edge_score']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
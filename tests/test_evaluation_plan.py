@@ -0,0 +1,107 @@
+"""Tests pour le plan d'évaluation (trajectoires partagées)"""
+
+import pytest
+import numpy as np
+
+from isinglab.evaluation_plan import TrajectoryPlan
+from isinglab.core.ca_vectorized import evolve_ca_vectorized, create_stack_rule_function_vectorized
+from isinglab.core.rng import make_rng, set_legacy_seeding
+from isinglab.metrics.functional import compute_functional_batch
+from isinglab.meta_learner.filters import (
+    make_plan,
+    quick_density_test,
+    apply_hard_filters
+)
+
+
+@pytest.mark.parametrize("born,survive", [
+    ([3], [2, 3]),    # Life
+    ([3], []),        # Meurt : point fixe vide
+    ([1], [1, 2]),    # Croissance rapide
+])
+def test_plan_matches_sequential_evolution(born, survive):
+    """États du plan identiques à evolve_ca_vectorized, état global inclus (mode legacy)."""
+    requests = [((32, 32), 42, 50), ((32, 32), 43, 50), ((32, 32), 42, 20), ((16, 16), 42, 30)]
+    
+    expected = []
+    for grid_size, seed, steps in requests:
+        np.random.seed(seed)
+        grid = (np.random.rand(*grid_size) < 0.3).astype(int)
+        expected.append(evolve_ca_vectorized(grid, set(born), set(survive), steps))
+    after_sequential = np.random.rand()
+    
+    previous = set_legacy_seeding(True)
+    try:
+        plan = TrajectoryPlan(born, survive)
+        keys = [plan.seeded_initial(grid_size, seed) for grid_size, seed, _ in requests]
+        for key, (_, _, steps) in zip(keys, requests):
+            plan.request(key, steps)
+        
+        for key, (_, _, steps), grid in zip(keys, requests, expected):
+            assert np.array_equal(plan.state(key, steps), grid)
+    finally:
+        set_legacy_seeding(previous)
+    assert np.random.rand() == after_sequential
+    
+    # Trois trajectoires distinctes, au plus 50 + 50 + 30 steps simulés
+    assert plan.n_requests == 4
+    assert plan.n_simulated <= 130
+
+
+def test_plan_leaves_global_state():
+    """Mode par défaut : grilles tirées de make_rng, np.random inchangé."""
+    np.random.seed(0)
+    state = np.random.get_state()
+    
+    plan = TrajectoryPlan([3], [2, 3])
+    key = plan.seeded_initial((32, 32), 42)
+    plan.request(key, 50)
+    plan.run()
+    
+    after = np.random.get_state()
+    assert after[0] == state[0] and np.array_equal(after[1], state[1]) and after[2:] == state[2:]
+    grid = (make_rng(42).random((32, 32)) < 0.3).astype(int)
+    assert np.array_equal(plan.state(key, 50), evolve_ca_vectorized(grid, {3}, {2, 3}, 50))
+
+
+def test_hard_filters_share_trajectories():
+    """Les filtres death / saturation lisent les mêmes deux trajectoires."""
+    plan = make_plan("B3/S23")
+    passed, _ = apply_hard_filters("B3/S23", plan=plan)
+    
+    assert passed
+    assert plan.n_simulated <= 2 * 50
+    
+    # Trajectoire déjà simulée : aucune simulation supplémentaire
+    simulated = plan.n_simulated
+    density = quick_density_test("B3/S23", seed=43, plan=plan)
+    assert plan.n_simulated == simulated
+    assert density == quick_density_test("B3/S23", seed=43)
+
+
+@pytest.mark.parametrize("born,survive", [([3], [2, 3]), ([3], [])])
+def test_functional_tests_share_plan(born, survive):
+    """Tests fonctionnels lus dans le plan : mêmes résultats, une seule pile."""
+    settings = dict(grid_size=(16, 16), n_patterns=3, n_trials=2, n_samples=3,
+                    capacity_steps=20, robustness_steps=20, basin_steps=15, seed=42)
+    stack_func = create_stack_rule_function_vectorized(born, survive)
+    expected = compute_functional_batch(stack_func, **settings)
+    
+    plan = TrajectoryPlan(born, survive)
+    final_key = plan.seeded_initial((16, 16), 42)
+    plan.request(final_key, 50)
+    results = compute_functional_batch(stack_func, plan=plan, **settings)
+    
+    for result, reference in zip(results, expected):
+        assert result == reference
+    
+    # Grille finale simulée avec les patterns, rien à relancer
+    simulated = plan.n_simulated
+    plan.state(final_key, 50)
+    assert plan.n_simulated == simulated
+    assert len(plan.steps_run) == 9
+    assert simulated == sum(plan.steps_run.values())
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
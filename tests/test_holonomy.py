@@ -0,0 +1,203 @@
+"""
+Tests des trajectoires holonomiques : schedule compilé et simulation.
+"""
+
+import pytest
+import numpy as np
+from isinglab.control import (
+    HolonomyPath,
+    generate_linear_ramp_path,
+    generate_multi_stage_path,
+    generate_closed_loop_path
+)
+from isinglab.control import GridSearchOptimizer, RandomSearchOptimizer, BayesianOptimizer
+from isinglab.control.holonomy import ParameterSpace
+from isinglab.pipelines.holonomy_optimization import simulate_with_holonomy_paths
+
+
+def _mean_k1(path: HolonomyPath) -> float:
+    """Coût jouet picklable (évaluable dans un worker)."""
+    return float(np.mean([point.params['k1'] for point in path.points]))
+
+
+def _bowl(path: HolonomyPath) -> float:
+    """Coût jouet lisse, minimum en k_start = 0.8, k_end = 1.6."""
+    k1 = [point.params['k1'] for point in path.points]
+    return (k1[0] - 0.8) ** 2 + (k1[-1] - 1.6) ** 2
+
+
+def _irregular_path() -> HolonomyPath:
+    """Path aux clés hétérogènes et à temps dupliqués."""
+    path = HolonomyPath(space=ParameterSpace.KERNEL_STRENGTHS)
+    path.add_point({'k1': 1.0, 'k2': 0.5}, t=0.0)
+    path.add_point({'k1': 2.0}, t=0.4)
+    path.add_point({'k1': 1.0, 'k3': 0.3}, t=0.4)
+    path.add_point({'k1': 0.5, 'noise': 0.05}, t=0.9)
+    return path
+
+
+@pytest.mark.parametrize("path", [
+    generate_linear_ramp_path(1.0, 2.0, 1.0),
+    generate_multi_stage_path([(1.0, 0.2, 0.0), (0.5, -0.4, 0.3)], duration=1.3),
+    generate_closed_loop_path(1.0, 0.0, 0.5, 0.6),
+    _irregular_path(),
+])
+def test_schedule_matches_interpolate(path):
+    """Le schedule vectorisé reproduit interpolate() à chaque temps."""
+    times = np.linspace(-0.3, 1.7, 101)
+    schedule = path.compile_schedule(times)
+    
+    for k, t in enumerate(times):
+        assert schedule.params_at(k) == path.interpolate(t)
+    
+    expected_k1 = [path.interpolate(t).get('k1', 9.0) for t in times]
+    assert np.array_equal(schedule.get('k1', 9.0), expected_k1)
+    assert np.all(schedule.get('missing', 0.25) == 0.25)
+
+
+def test_simulation_records_schedule_parameters():
+    """Chaque membre enregistre ses paramètres interpolés, jusqu'à la fin de son path."""
+    paths = [generate_linear_ramp_path(1.0, 2.0, 1.0), generate_linear_ramp_path(0.5, 1.0, 0.5)]
+    results = simulate_with_holonomy_paths(
+        paths, grid_size=(8, 8), steps_per_unit_time=20, record_interval=3, seeds=[1, 2]
+    )
+    
+    for path, (state_history, params_history) in zip(paths, results):
+        total_steps = int(path.points[-1].t * 20)
+        recorded = list(range(0, total_steps, 3))
+        assert len(state_history) == len(params_history) == len(recorded)
+        assert params_history == [path.interpolate(step / 20) for step in recorded]
+
+
+def test_cost_cache_skips_identical_paths():
+    """Les paths identiques (paramètres sans effet) ne sont évalués qu'une fois."""
+    calls = []
+    
+    def cost(path):
+        calls.append(path)
+        return _mean_k1(path)
+    
+    # annealing_* n'entre pas dans un path sigmoïde : 2 × 2 paths distincts
+    ranges = {'k_start': (0.5, 1.0, 2), 'k_end': (1.0, 2.0, 2),
+              'annealing_start': (0.0, 0.2, 3), 'annealing_end': (0.3, 0.5, 2)}
+    optimizer = GridSearchOptimizer(ranges, path_generator="smooth_sigmoid", verbose=False)
+    reference = optimizer.optimize(_mean_k1)
+    
+    cache = {}
+    cached = optimizer.optimize(cost, cache=cache, cache_settings={'seed': 1})
+    assert len(calls) == len(cache) == 4
+    assert cached.all_evaluated == reference.all_evaluated
+    assert cached.best_params == reference.best_params
+    
+    # Lots : doublons d'une même unité et des unités en cours simulés une fois
+    batches = []
+    
+    def batch_cost(paths):
+        batches.append(len(paths))
+        return [_mean_k1(p) for p in paths]
+    
+    for batch_size in (16, 5):
+        batches.clear()
+        batched = optimizer.optimize(None, batch_cost_function=batch_cost, batch_size=batch_size,
+                                     cache={}, cache_settings={'seed': 1})
+        assert sum(batches) == 4
+        assert batched.all_evaluated == reference.all_evaluated
+    
+    # Clé indépendante du nom du path, dépendante des réglages
+    path = generate_linear_ramp_path(1.0, 2.0, 1.0)
+    renamed = generate_linear_ramp_path(1.0, 2.0, 1.0, name="other")
+    assert path.cache_key({'seed': 1}) == renamed.cache_key({'seed': 1})
+    assert path.cache_key({'seed': 1}) != path.cache_key({'seed': 2})
+
+
+def test_interrupted_search_returns_best_so_far():
+    """Une interruption renvoie le meilleur des évaluations déjà faites."""
+    streamed = []
+    
+    def cost(path):
+        if len(streamed) == 3:
+            raise KeyboardInterrupt
+        return _mean_k1(path)
+    
+    optimizer = RandomSearchOptimizer({'k_start': (0.5, 1.5), 'k_end': (1.0, 2.0)},
+                                      n_samples=10, verbose=False, seed=0)
+    result = optimizer.optimize(cost, on_result=lambda params, value: streamed.append(value))
+    
+    assert not result.completed
+    assert result.n_evaluations == 3
+    assert result.best_cost == min(streamed)
+
+
+def test_failed_batch_keeps_other_paths():
+    """Un path en échec dans un lot n'emporte pas les autres membres."""
+    def batch(paths):
+        if any(_mean_k1(path) > 1.5 for path in paths):
+            raise ValueError("unstable path")
+        return [_mean_k1(path) for path in paths]
+    
+    ranges = {'k_start': (0.5, 1.5), 'k_end': (1.0, 2.5)}
+    optimizer = RandomSearchOptimizer(ranges, n_samples=12, verbose=False, seed=2)
+    result = optimizer.optimize(None, batch_cost_function=batch, batch_size=4)
+    expected = RandomSearchOptimizer(ranges, n_samples=12, verbose=False, seed=2).optimize(_mean_k1)
+    
+    assert [c for _, c in result.all_evaluated] == [c for _, c in expected.all_evaluated if c <= 1.5]
+    assert 0 < result.n_evaluations < 12
+
+
+def test_parallel_search_matches_serial():
+    """Évaluation dans un pool de processus : mêmes résultats, même ordre."""
+    ranges = {'k_start': (0.5, 1.5), 'k_end': (1.0, 2.0)}
+    serial = RandomSearchOptimizer(ranges, n_samples=6, verbose=False, seed=4).optimize(_mean_k1)
+    parallel = RandomSearchOptimizer(ranges, n_samples=6, verbose=False, seed=4).optimize(
+        _mean_k1, workers=2
+    )
+    
+    assert parallel.all_evaluated == serial.all_evaluated
+    assert parallel.best_params == serial.best_params
+
+
+@pytest.mark.parametrize("batch_size", [None, 3])
+def test_bayesian_search_finds_optimum(batch_size):
+    """Le GP atteint l'optimum avec un petit budget, seul ou par lots."""
+    ranges = {'k_start': (0.5, 1.5), 'k_end': (1.0, 2.0)}
+    batch = (lambda paths: [_bowl(path) for path in paths]) if batch_size else None
+    optimizer = BayesianOptimizer(ranges, n_evaluations=20, verbose=False, seed=0)
+    result = optimizer.optimize(_bowl, batch_cost_function=batch, batch_size=batch_size or 1)
+    
+    assert result.completed
+    assert result.n_evaluations == len(result.all_evaluated) == 20
+    assert result.best_cost == min(cost for _, cost in result.all_evaluated)
+    assert result.best_cost < 1e-2
+    
+    random = RandomSearchOptimizer(ranges, n_samples=20, verbose=False, seed=0).optimize(_bowl)
+    assert result.best_cost < random.best_cost
+
+
+def test_bayesian_search_respects_constraint():
+    """Les régions infaisables ne sont jamais proposées."""
+    def constraint(params):
+        return params['k_end'] - params['k_start'] > 0.5
+    
+    optimizer = BayesianOptimizer({'k_start': (0.5, 1.5), 'k_end': (1.0, 2.0)},
+                                  n_evaluations=15, constraint=constraint,
+                                  verbose=False, seed=1)
+    result = optimizer.optimize(_bowl)
+    
+    assert result.n_evaluations == 15
+    assert all(constraint(params) for params, _ in result.all_evaluated)
+    
+    # Aucun point faisable : rien n'est évalué
+    infeasible = BayesianOptimizer({'k_start': (0.5, 1.5), 'k_end': (1.0, 2.0)},
+                                   n_evaluations=10, constraint=lambda params: False,
+                                   verbose=False, seed=1)
+    calls = []
+    result = infeasible.optimize(lambda path: calls.append(path) or 0.0)
+    assert result.n_evaluations == 0 and not calls
+    
+    grid = GridSearchOptimizer({'k_end': (1.0, 2.0, 2)}, verbose=False)
+    grid.optimize(_mean_k1)
+    assert not hasattr(grid, '_k_end_limit')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
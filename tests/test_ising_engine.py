@@ -0,0 +1,85 @@
+"""
+Tests for IsingEngine update modes (random-site and checkerboard sweeps).
+"""
+import pytest
+import numpy as np
+from isinglab.core import IsingEngine
+
+
+@pytest.mark.parametrize("boundary", ["periodic", "fixed"])
+@pytest.mark.parametrize("dynamics", ["glauber", "metropolis"])
+@pytest.mark.parametrize("temperature", [0.0, 1.0, 2.5])
+def test_acceptance_table_matches_local_energy(dynamics, temperature, boundary):
+    """Table lookups agree with the per-site energy change of the random mode."""
+    engine = IsingEngine((8, 10), J=1.0, h=0.3, temperature=temperature,
+                         dynamics=dynamics, boundary=boundary, seed=0)
+    table = engine.acceptance_table()
+    neighbor_sum = engine._neighbor_sum()
+
+    for i in range(8):
+        for j in range(10):
+            expected = engine._acceptance_probability(np.array(engine._energy_change(i, j)))
+            got = table[(engine.spins[i, j] + 1) // 2, neighbor_sum[i, j] + 4]
+            assert got == pytest.approx(float(expected))
+
+
+def test_acceptance_table_tracks_temperature():
+    """Changing the temperature rebuilds the cached table."""
+    engine = IsingEngine((4, 4), temperature=1.0, seed=0)
+    cold = engine.acceptance_table().copy()
+    engine.temperature = 5.0
+    hot = engine.acceptance_table()
+
+    assert not np.allclose(cold, hot)
+
+
+def test_checkerboard_deterministic():
+    """Same seed gives identical checkerboard trajectories."""
+    runs = []
+    for _ in range(2):
+        engine = IsingEngine((16, 16), temperature=2.0, seed=11, update="checkerboard")
+        runs.append(engine.run(20))
+
+    for a, b in zip(*runs):
+        assert np.array_equal(a, b)
+
+
+def test_checkerboard_matches_random_statistics():
+    """Both update modes sample the same high-temperature energy density."""
+    energies = {}
+    for update in ["random", "checkerboard"]:
+        engine = IsingEngine((16, 16), temperature=3.5, seed=5, update=update)
+        engine.run(30)
+        samples = []
+        for _ in range(40):
+            engine.step()
+            samples.append(engine.total_energy() / engine.spins.size)
+        energies[update] = np.mean(samples)
+
+    assert abs(energies["random"] - energies["checkerboard"]) < 0.1
+
+
+def test_checkerboard_rejects_odd_periodic_lattice():
+    """Odd periodic lattices are not bipartite."""
+    with pytest.raises(ValueError, match="even"):
+        IsingEngine((15, 16), update="checkerboard")
+
+    # Fixed boundaries have no wrap-around bonds, so odd sizes are fine
+    IsingEngine((15, 16), boundary="fixed", update="checkerboard")
+
+
+def test_checkerboard_rejects_n_flips():
+    """A checkerboard step is always one full sweep."""
+    engine = IsingEngine((4, 4), update="checkerboard")
+    with pytest.raises(ValueError, match="n_flips"):
+        engine.step(n_flips=3)
+
+
+def test_unknown_update_mode():
+    """Unknown update modes are rejected at construction time."""
+    with pytest.raises(ValueError, match="Unknown update mode"):
+        IsingEngine((4, 4), update="wolff")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,10 +3,21 @@ Tests for isinglab metrics (entropy, sensitivity, memory, edge_score)
 """
 import pytest
 import numpy as np
-from isinglab.metrics.entropy import shannon_entropy, spatial_entropy, activity_level
-from isinglab.metrics.sensitivity import hamming_distance, hamming_sensitivity
-from isinglab.metrics.memory import detect_cycle, memory_score
-from isinglab.metrics.edge_score import edge_of_chaos_score, lambda_parameter_estimate
+from isinglab.metrics.entropy import (
+    shannon_entropy, spatial_entropy, spatial_entropy_frames, activity_level, temporal_entropy
+)
+from isinglab.metrics.sensitivity import (
+    hamming_distance, hamming_sensitivity, lyapunov_exponent, perturb_states,
+    mutual_information, local_mutual_information
+)
+from isinglab.metrics.memory import (
+    detect_cycle, memory_score, attractor_analysis, return_time_statistics, CycleDetector,
+    ShortCycleDetector, run_until_attractor
+)
+from isinglab.metrics.edge_score import (
+    edge_of_chaos_score, lambda_parameter_estimate, composite_edge_metric
+)
+from isinglab.metrics.streaming import StreamingMetrics, composite_edge_metric_from_stream
 
 
 def test_shannon_entropy_extremes():
@@ -41,6 +52,99 @@ def test_spatial_entropy():
     assert entropy_random > entropy
 
 
+def _spatial_entropy_reference(state, block_size=2, wrap=False):
+    """Per-block dict count (the original nested-loop algorithm)."""
+    if wrap:
+        state = np.pad(state, [(0, block_size - 1)] * state.ndim, mode="wrap")
+    if state.ndim == 1:
+        blocks = [tuple(state[i:i + block_size]) for i in range(len(state) - block_size + 1)]
+    else:
+        h, w = state.shape
+        blocks = [tuple(state[i:i + block_size, j:j + block_size].flatten())
+                  for i in range(h - block_size + 1) for j in range(w - block_size + 1)]
+    if len(set(blocks)) <= 1:
+        return 0.0
+    counts = {}
+    for block in blocks:
+        counts[block] = counts.get(block, 0) + 1
+    p = np.array(list(counts.values())) / len(blocks)
+    return -np.sum(p * np.log2(p)) / np.log2(min(2 ** (block_size ** 2), len(blocks)))
+
+
+@pytest.mark.parametrize("wrap", [False, True])
+@pytest.mark.parametrize("block_size", [1, 2, 3, 5])
+def test_spatial_entropy_matches_reference(block_size, wrap):
+    """Bit-plane codes + bincount match the per-block count (bits, spins, 1D, 2D)"""
+    rng = np.random.default_rng(block_size)
+    grids = [
+        rng.integers(0, 2, (17, 23)),
+        rng.choice([-1, 1], (12, 12)),
+        rng.integers(0, 2, 50),
+        rng.integers(0, 3, (9, 11)),  # generic values use the np.unique path
+    ]
+    for grid in grids:
+        expected = _spatial_entropy_reference(grid, block_size, wrap)
+        assert spatial_entropy(grid, block_size, wrap=wrap) == pytest.approx(expected, abs=1e-12)
+
+
+def test_spatial_entropy_frames_stack():
+    """A stack of frames gives the per-frame entropies"""
+    frames = np.random.default_rng(3).integers(0, 2, (6, 16, 16))
+    frames[2] = 0
+    result = spatial_entropy_frames(frames)
+    
+    assert result.shape == (6,)
+    assert result[2] == 0.0
+    for t in range(6):
+        assert result[t] == pytest.approx(spatial_entropy(frames[t]), abs=1e-15)
+    
+    # 4x4 blocks: 65536 codes per frame, only those that occur are counted
+    stack = spatial_entropy_frames(frames, block_size=4)
+    for t in range(6):
+        assert stack[t] == pytest.approx(_spatial_entropy_reference(frames[t], 4), abs=1e-12)
+    
+    # Grid smaller than a block
+    assert spatial_entropy(np.array([[1]])) == 0.0
+
+
+def test_temporal_entropy_and_mi_on_digests():
+    """Digest keys give the values of whole-state tuple keys"""
+    rng = np.random.default_rng(5)
+    states = [rng.integers(0, 2, (5, 5)) for _ in range(4)]
+    history = [states[k] for k in rng.integers(0, 4, 60)]
+    
+    keys = [tuple(s.flatten()) for s in history]
+    pairs = list(zip(keys[:-1], keys[1:]))
+    p = np.array([pairs.count(pair) for pair in dict.fromkeys(pairs)]) / len(pairs)
+    assert temporal_entropy(history) == pytest.approx(-np.sum(p * np.log2(p)))
+    
+    # Deterministic 4-cycle: MI = H = 2 bits
+    cycle = [states[t % 4] for t in range(41)]
+    assert mutual_information(cycle) == pytest.approx(2.0)
+    assert mutual_information(cycle[:1]) == 0.0
+
+
+def test_local_mutual_information():
+    """Per-cell MI: 1 bit for a blinking cell, ~0 for independent noise"""
+    rng = np.random.default_rng(0)
+    history = rng.integers(0, 2, (400, 4, 5))
+    history[:, 1, 2] = np.arange(400) % 2
+    
+    mi = local_mutual_information(history)
+    assert mi.shape == (4, 5)
+    assert mi[1, 2] == pytest.approx(1.0, abs=1e-3)
+    assert np.delete(mi.ravel(), 7).max() < 0.05
+    
+    blocks = local_mutual_information(history, block_size=2, lag=2)
+    assert blocks.shape == (3, 4)
+    assert local_mutual_information(history, block_size=2, wrap=True).shape == (4, 5)
+    
+    # 3x3 blocks (512 codes) on a 100x100 grid: histograms stay sparse
+    large = rng.integers(0, 2, (20, 100, 100))
+    large_mi = local_mutual_information(large, block_size=3, wrap=True)
+    assert large_mi.shape == (100, 100) and np.all(large_mi >= -1e-12)
+
+
 def test_activity_level():
     """Test activity level calculation"""
     # All zeros
@@ -85,6 +189,77 @@ def test_hamming_sensitivity_stable_rule():
     assert sensitivity < 0.2
 
 
+def _rule90(state):
+    """Elementary rule 90 (XOR of the two neighbors), periodic."""
+    return np.roll(state, 1) ^ np.roll(state, -1)
+
+
+def test_sensitivity_batched_matches_per_sample():
+    """Stacked perturbed trajectories give the per-sample results"""
+    def evolve(state, n_steps):
+        for _ in range(n_steps):
+            state = _rule90(state)
+        return state
+    
+    def evolve_stack(stack, n_steps):
+        for _ in range(n_steps):
+            stack = np.roll(stack, 1, axis=-1) ^ np.roll(stack, -1, axis=-1)
+        return stack
+    
+    initial = np.random.default_rng(0).integers(0, 2, 200).astype(np.int8)
+    for seed in (1, 2, 3):
+        expected = hamming_sensitivity(evolve, initial, steps=20, seed=seed)
+        batched = hamming_sensitivity(evolve, initial, steps=20, seed=seed,
+                                      batch_evolution_func=evolve_stack)
+        assert batched == expected
+        
+        expected = lyapunov_exponent(evolve, initial, steps=15, transient=5, seed=seed)
+        batched = lyapunov_exponent(evolve, initial, steps=15, transient=5, seed=seed,
+                                    batch_evolution_func=evolve_stack)
+        assert batched == expected
+        
+        # Known reference state: the unperturbed run is not simulated again
+        reference = evolve(initial, 20)
+        for batch_func in (None, evolve_stack):
+            shared = hamming_sensitivity(evolve, initial, steps=20, seed=seed,
+                                         batch_evolution_func=batch_func,
+                                         reference_final=reference)
+            assert shared == hamming_sensitivity(evolve, initial, steps=20, seed=seed)
+
+
+def test_perturb_states_flips():
+    """Perturbations invert bits and negate spins, n_flips cells per copy"""
+    rngs = [np.random.default_rng(k) for k in range(4)]
+    bits = np.zeros((6, 6), dtype=np.int8)
+    perturbed = perturb_states(bits, 5, rngs)
+    assert perturbed.shape == (4, 6, 6)
+    assert np.all(perturbed.sum(axis=(1, 2)) == 5)
+    
+    spins = np.full((6, 6), -1, dtype=np.int8)
+    perturbed = perturb_states(spins, 5, rngs)
+    assert set(np.unique(perturbed)) == {-1, 1}
+    assert np.all((perturbed == 1).sum(axis=(1, 2)) == 5)
+
+
+def test_sensitivity_all_up_spins():
+    """An all-+1 spin lattice is perturbed to -1 when spins=True is given"""
+    inputs = []
+
+    def record(state, n_steps):
+        inputs.append(state.copy())
+        return state.copy()
+
+    up = np.ones((10, 10), dtype=np.int8)
+    hamming_sensitivity(record, up, steps=5, perturbation=0.05, n_samples=3, seed=0, spins=True)
+    assert all(set(np.unique(state)) == {-1, 1} for state in inputs[1:])
+    assert all((state == -1).sum() == 5 for state in inputs[1:])
+
+    # Without the hint the heuristic reads the lattice as 0/1 bits
+    inputs.clear()
+    hamming_sensitivity(record, up, steps=5, perturbation=0.05, n_samples=3, seed=0)
+    assert all(set(np.unique(state)) == {0, 1} for state in inputs[1:])
+
+
 def test_detect_cycle():
     """Test cycle detection in state history"""
     # Fixed point (cycle length 1)
@@ -111,6 +286,84 @@ def test_detect_cycle():
         assert isinstance(transient, int)
 
 
+def test_cycle_detector_online():
+    """Online detector reports transient and period at the first repeat"""
+    states = [np.array([1, 0]), np.array([0, 0]), np.array([1, 1]),
+              np.array([0, 1]), np.array([1, 1]), np.array([0, 1])]
+    
+    detector = CycleDetector()
+    reports = [detector.update(s) for s in states]
+    
+    assert reports[:4] == [None] * 4
+    assert reports[4] == (2, 2)
+    assert detector.cycle == (2, 2)
+    assert detector.n_unique_states == 4
+
+
+def test_cycle_detector_fixed_point():
+    """Fixed point is a period-1 cycle, with or without byte verification"""
+    for verify in (True, False):
+        detector = CycleDetector(verify=verify)
+        assert detector.update(np.zeros((4, 4), dtype=np.int8)) is None
+        assert detector.update(np.zeros((4, 4), dtype=np.int8)) == (0, 1)
+
+
+def test_short_cycle_detector_window():
+    """Only periods up to max_period are detected; later states come off the cycle"""
+    cycle = [np.full(3, k) for k in range(4)]
+    states = [np.array([9, 9, 9])] + [cycle[t % 4] for t in range(12)]
+    
+    short = ShortCycleDetector(max_period=3)
+    assert all(short.update(s) is None for s in states)
+    
+    detector = ShortCycleDetector(max_period=4)
+    reports = [detector.update(s) for s in states]
+    assert reports[5] == (1, 4)
+    for t in range(5, 40):
+        assert np.array_equal(detector.state_at(t), cycle[(t - 1) % 4])
+
+
+def test_run_until_attractor_matches_loop():
+    """Early-terminated evolution lands on the same state as the full loop"""
+    def rotate_until_zero(state):
+        # Transient: decrement the counter cell, then rotate forever (period 3)
+        if state[0] > 0:
+            return np.concatenate([[state[0] - 1], state[1:]])
+        return np.concatenate([[0], np.roll(state[1:], 1)])
+    
+    initial = np.array([5, 1, 0, 0])
+    for steps in [0, 3, 8, 9, 50]:
+        expected = initial
+        for _ in range(steps):
+            expected = rotate_until_zero(expected)
+        
+        run = run_until_attractor(rotate_until_zero, initial, steps)
+        assert np.array_equal(run['final_state'], expected)
+        assert run['steps_run'] + run['steps_saved'] == steps
+    
+    assert (run['transient'], run['period']) == (5, 3)
+    assert run['steps_run'] == 8
+
+
+def test_attractor_analysis_long_transient():
+    """Cycle after a long transient is classified with the tail-based rule"""
+    rng = np.random.default_rng(1)
+    transient = [rng.integers(0, 2, (6, 6)) for _ in range(40)]
+    a, b, c = rng.integers(0, 2, (3, 6, 6))
+    history = transient + [[a, b, c][t % 3].copy() for t in range(30)]
+    
+    analysis = attractor_analysis(history)
+    assert analysis["type"] == "cycle"
+    assert analysis["period"] == 3
+    assert analysis["transient"] == len(history) - 6
+    assert analysis["n_unique_states"] == 43
+    
+    stats = return_time_statistics(history)
+    expected = [t - (40 + (t - 40) % 3) for t in range(43, 70)]
+    assert stats["mean_return_time"] == pytest.approx(np.mean(expected))
+    assert stats["recurrence_rate"] == 27 / 70
+
+
 def test_memory_score_calculation():
     """Test memory score calculation on synthetic history"""
     # Fixed point history
@@ -205,6 +458,30 @@ def test_metrics_determinism():
     assert spatial1 == spatial2
 
 
+def _synthetic_histories():
+    """Fixed point, 2-cycle after a transient, and random trajectories"""
+    rng = np.random.default_rng(0)
+    fixed = [rng.integers(0, 2, (8, 8)) for _ in range(5)]
+    fixed += [fixed[-1].copy() for _ in range(20)]
+    
+    a, b = rng.integers(0, 2, (2, 8, 8))
+    cycle = [rng.integers(0, 2, (8, 8)) for _ in range(30)]
+    cycle += [a.copy() if t % 2 == 0 else b.copy() for t in range(250)]
+    
+    chaotic = [rng.integers(0, 2, 50) for _ in range(60)]
+    return [fixed, cycle, chaotic]
+
+
+@pytest.mark.parametrize("history", _synthetic_histories())
+def test_streaming_metrics_match_history(history):
+    """Streaming accumulator reproduces the full-history metrics"""
+    stream = StreamingMetrics.from_history(history)
+    
+    assert composite_edge_metric_from_stream(stream) == composite_edge_metric(history)
+    assert stream.lambda_estimate() == lambda_parameter_estimate(history)
+    assert stream.memory_score() == memory_score(history)
+
+
 if __name__ == "__main__":
     print("Running isinglab metrics tests...")
     pytest.main([__file__, "-v"])
@@ -9,8 +9,10 @@ Validation :
 
 import pytest
 import numpy as np
-from isinglab.oscillators import KuramotoXYEngine, MultiKernelConfig
-from isinglab.analysis import detect_vortices, compute_winding_number
+from isinglab.oscillators import KuramotoXYEngine, KuramotoXYEnsemble, MultiKernelConfig
+from isinglab.analysis import (
+    detect_vortices, detect_vortices_batch, count_defects, compute_winding_number
+)
 
 
 class TestKuramotoBasic:
@@ -114,6 +116,105 @@ class TestMultiKernel:
         # Vérifier que le champ n'est pas uniforme
         std_phase = np.std(phase_field)
         assert std_phase > 0.5, f"std devrait être > 0.5, obtenu {std_phase:.3f}"
+    
+    @pytest.mark.parametrize("shape,k3_range", [((48, 40), 7), ((12, 10), 7)])
+    def test_fft_backend_matches_direct(self, shape, k3_range):
+        """
+        Couplage FFT = somme directe (normalisation incluse), y compris quand
+        la portée dépasse la grille (voisins comptés plusieurs fois).
+        """
+        config = MultiKernelConfig(
+            k1_strength=1.0, k1_range=1,
+            k2_strength=0.5, k2_range=3, k2_sign=-1.0,
+            k3_strength=0.3, k3_range=k3_range,
+            noise_amplitude=0.05
+        )
+        engines = [KuramotoXYEngine(shape=shape, config=config, seed=7, backend=backend)
+                   for backend in ("direct", "fft")]
+        for engine in engines:
+            engine.reset()
+            for _ in range(5):
+                engine.step()
+        
+        direct, fft = (engine.get_phase_field().astype(np.float64) for engine in engines)
+        assert np.max(np.abs(np.angle(np.exp(1j * (direct - fft))))) < 1e-4
+    
+    def test_auto_backend_selection(self):
+        """Backend "auto" : somme directe pour K1 seul, FFT pour les longues portées."""
+        engine = KuramotoXYEngine(shape=(16, 16), config=MultiKernelConfig(), seed=1)
+        engine.reset()
+        engine.step()
+        assert not engine._use_fft()
+        
+        engine.config = MultiKernelConfig(k3_strength=0.2)
+        assert engine._use_fft()
+        
+        with pytest.raises(ValueError, match="Unknown backend"):
+            KuramotoXYEngine(shape=(8, 8), backend="gpu")
+    
+    @pytest.mark.parametrize("backend", ["direct", "fft", "auto"])
+    def test_ensemble_matches_single_engines(self, backend):
+        """Chaque membre de l'ensemble suit exactement son moteur individuel."""
+        configs = [
+            MultiKernelConfig(k1_strength=1.0, noise_amplitude=0.05, annealing_rate=0.3),
+            MultiKernelConfig(k1_strength=0.8, k2_strength=0.4, k2_sign=-1.0),
+            MultiKernelConfig(k1_strength=0.6, k3_strength=0.3, k3_range=3, dt=0.05),
+        ]
+        seeds = [3, 4, 5]
+        
+        ensemble = KuramotoXYEnsemble(shape=(12, 10), configs=configs, seeds=seeds, backend=backend)
+        ensemble.reset()
+        engines = []
+        for config, seed in zip(configs, seeds):
+            engine = KuramotoXYEngine(shape=(12, 10), config=config, seed=seed, backend=backend)
+            engine.reset()
+            engines.append(engine)
+        
+        for step in range(15):
+            if step == 8:
+                # Changement de configuration en cours de route (chemins holonomiques)
+                configs[0] = MultiKernelConfig(k1_strength=1.4, k3_strength=0.2, k3_range=3)
+                ensemble.set_configs(configs)
+                engines[0].config = configs[0]
+            ensemble.step()
+            for engine in engines:
+                engine.step()
+        
+        phases = ensemble.get_phase_field()
+        r, psi = ensemble.get_order_parameter()
+        assert phases.shape == (3, 12, 10)
+        assert r.shape == psi.shape == (3,)
+        for b, engine in enumerate(engines):
+            np.testing.assert_allclose(phases[b], engine.get_phase_field(), atol=1e-6)
+            assert r[b] == pytest.approx(engine.get_order_parameter()[0], abs=1e-6)
+    
+    @pytest.mark.parametrize("backend", ["direct", "auto"])
+    def test_ensemble_run_matches_steps(self, backend):
+        """run(n) en un appel = n appels à step(), y compris après set_parameters et par blocs."""
+        configs = [
+            MultiKernelConfig(k1_strength=1.0, noise_amplitude=0.05, annealing_rate=0.3),
+            MultiKernelConfig(k1_strength=0.6, k3_strength=0.3, k3_range=3),
+        ]
+        stepped = KuramotoXYEnsemble(shape=(9, 7), configs=configs, seeds=[1, 2], backend=backend)
+        batched = KuramotoXYEnsemble(shape=(9, 7), configs=configs, seeds=[1, 2], backend=backend)
+        stepped.reset()
+        batched.reset()
+        
+        for n_steps in (5, 4, 70):
+            for _ in range(n_steps):
+                stepped.step()
+            batched.run(n_steps)
+            assert np.array_equal(batched.get_phase_field(), stepped.get_phase_field())
+            
+            parameters = dict(strengths=np.array([[0.8, 0.4, 0.0], [1.2, 0.0, 0.0]]),
+                              signs=np.array([[1.0, -1.0, 1.0], [1.0, 1.0, 1.0]]),
+                              noise_amplitude=np.array([0.02, 0.04]))
+            stepped.set_parameters(**parameters)
+            batched.set_parameters(**parameters)
+        
+        assert np.array_equal(batched.t, stepped.t)
+        assert batched.iteration == stepped.iteration == 79
+        assert batched.configs[0].k2_sign == -1.0
 
 
 class TestDefectDetection:
@@ -156,6 +257,58 @@ class TestDefectDetection:
         # Winding number devrait être proche de 0 partout
         assert np.max(np.abs(winding_uniform)) < 0.1
     
+    def test_winding_matches_plaquette_loop(self):
+        """Le calcul vectorisé reproduit la somme plaquette par plaquette."""
+        rng = np.random.default_rng(0)
+        phase_field = rng.uniform(0, 2 * np.pi, (9, 13)).astype(np.float32)
+        
+        def wrap(d):
+            return np.arctan2(np.sin(d), np.cos(d))
+        
+        h, w = phase_field.shape
+        expected = np.zeros((h, w))
+        for i in range(h):
+            for j in range(w):
+                p00 = phase_field[i, j]
+                p01 = phase_field[i, (j + 1) % w]
+                p10 = phase_field[(i + 1) % h, j]
+                p11 = phase_field[(i + 1) % h, (j + 1) % w]
+                expected[i, j] = (wrap(p01 - p00) + wrap(p11 - p01)
+                                  + wrap(p10 - p11) + wrap(p00 - p10)) / (2 * np.pi)
+        
+        np.testing.assert_allclose(compute_winding_number(phase_field), expected, atol=1e-5)
+        
+        metrics = detect_vortices(phase_field, threshold=0.5)
+        positions = [(i, j) for i in range(h) for j in range(w) if abs(expected[i, j]) > 0.5]
+        assert metrics.defect_positions == positions
+        assert metrics.defect_charges == [1 if expected[p] > 0 else -1 for p in positions]
+    
+    def test_batch_detection_matches_single(self):
+        """Détection sur une pile (T, H, W) = détection champ par champ."""
+        rng = np.random.default_rng(1)
+        history = rng.uniform(0, 2 * np.pi, (4, 16, 16)).astype(np.float32)
+        
+        batch = detect_vortices_batch(history, threshold=0.5)
+        n_positive, n_negative = count_defects(history, threshold=0.5)
+        for t, field in enumerate(history):
+            single = detect_vortices(field, threshold=0.5)
+            assert batch[t] == single
+            assert (n_positive[t], n_negative[t]) == (single.n_positive, single.n_negative)
+    
+    def test_local_order_matches_neighbor_mean(self):
+        """Filtre boîte périodique = moyenne de e^{iθ} sur le voisinage."""
+        engine = KuramotoXYEngine(shape=(6, 9), seed=2)
+        engine.reset()
+        phase = engine.get_phase_field()
+        radius = 2
+        
+        order = engine.get_local_order(radius)
+        for i, j in [(0, 0), (3, 4), (5, 8)]:
+            rows = [(i + d) % 6 for d in range(-radius, radius + 1)]
+            cols = [(j + d) % 9 for d in range(-radius, radius + 1)]
+            z = np.mean(np.exp(1j * phase[np.ix_(rows, cols)]))
+            assert order[i, j] == pytest.approx(np.abs(z), abs=1e-6)
+    
     def test_annihilation_potential(self):
         """Test du calcul du potentiel d'annihilation."""
         metrics = detect_vortices(
@@ -0,0 +1,102 @@
+"""
+Tests for per-engine random streams and the legacy seeding flag.
+"""
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from isinglab.api import evaluate_rule, evaluate_rules_batched, _evaluate_unit
+from isinglab.core import CAEngine, IsingEngine
+from isinglab.core.rng import legacy_seeding, set_legacy_seeding, make_rng, spawn_seeds, spawn_rngs
+
+
+@pytest.fixture
+def legacy():
+    """Enable legacy seeding for one test."""
+    previous = set_legacy_seeding(True)
+    yield
+    set_legacy_seeding(previous)
+
+
+def test_engines_leave_global_state_alone():
+    """Seeded engines draw from their own stream, not np.random"""
+    np.random.seed(0)
+    expected = np.random.rand(3)
+
+    np.random.seed(0)
+    CAEngine((20,), 30, seed=1).run(5)
+    IsingEngine((8, 8), seed=2).run(2)
+    assert np.array_equal(np.random.rand(3), expected)
+
+
+def test_same_seed_same_stream():
+    """Equal seeds give equal grids; spawned children are independent"""
+    assert np.array_equal(CAEngine((30,), 30, seed=7).grid, CAEngine((30,), 30, seed=7).grid)
+
+    children = spawn_seeds(7, 2)
+    grid_a = CAEngine((64,), 30, seed=children[0]).grid
+    grid_b = CAEngine((64,), 30, seed=children[1]).grid
+    assert not np.array_equal(grid_a, grid_b)
+
+    # spawn_seeds does not consume the parent: same children every call
+    again = spawn_seeds(7, 2)
+    assert np.array_equal(CAEngine((64,), 30, seed=again[0]).grid, grid_a)
+
+
+def test_legacy_seeding_matches_global_seed(legacy):
+    """Legacy mode reproduces np.random.seed + np.random draws"""
+    np.random.seed(11)
+    expected = np.random.randint(0, 2, size=25).astype(np.int8)
+    assert np.array_equal(CAEngine((25,), 30, seed=11).grid, expected)
+
+    rngs = spawn_rngs(5, 3)
+    assert rngs[0] is rngs[2]
+    # Unseeded streams continue the global state
+    np.random.seed(5)
+    drawn = make_rng(None).random(4)
+    np.random.seed(5)
+    assert np.array_equal(drawn, np.random.rand(4))
+
+
+@pytest.mark.parametrize("grid_size,ca_type,rule", [(40, "elementary", 110), ((12, 12), "life", 224)])
+def test_legacy_batched_matches_evaluate_rule(legacy, grid_size, ca_type, rule):
+    """Batched evaluation draws the global stream as evaluate_rule does"""
+    expected = [evaluate_rule(r, grid_size=grid_size, steps=40, seed=5, ca_type=ca_type)
+                for r in (rule, rule + 2)]
+    after_serial = np.random.rand()
+    batched = evaluate_rules_batched([rule, rule + 2], grid_size=grid_size, steps=40, seed=5,
+                                     ca_type=ca_type)
+
+    assert batched == expected
+    assert np.random.rand() == after_serial
+
+
+def test_work_units_carry_seeding_mode():
+    """A worker applies the unit's seeding mode, whatever its own default"""
+    previous = set_legacy_seeding(True)
+    try:
+        expected = [evaluate_rule(r, grid_size=40, steps=40, seed=5) for r in (30, 110)]
+    finally:
+        set_legacy_seeding(previous)
+
+    unit = ([30, 110], 40, 40, 5, "elementary", "periodic", False, False, False, True)
+    assert _evaluate_unit(unit) == expected
+    assert not legacy_seeding()
+    assert _evaluate_unit(unit[:-1] + (False,)) != expected
+
+
+def test_threaded_evaluation_is_reproducible():
+    """Concurrent evaluations in threads match the serial results"""
+    kwargs = [dict(rule=rule, grid_size=40, steps=40, seed=seed)
+              for rule in (30, 90, 110) for seed in (1, 2)]
+    kwargs.append(dict(rule={"T": 2.0}, grid_size=12, steps=5, seed=3))
+
+    serial = [evaluate_rule(**kw) for kw in kwargs]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = list(executor.map(lambda kw: evaluate_rule(**kw), kwargs))
+
+    assert threaded == serial
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
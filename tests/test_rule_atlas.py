@@ -0,0 +1,113 @@
+"""
+Tests for the precomputed rule atlas.
+"""
+import pytest
+import numpy as np
+
+import isinglab.pipelines.regime_search as regime_search
+from isinglab.api import evaluate_rule
+from isinglab.core.rng import set_legacy_seeding
+from isinglab.mapping_profiles import get_target_profile_for_system, suggest_ca_rules_for_profile
+from isinglab.rule_atlas import build_atlas, load_atlas
+
+
+PROTOCOL = dict(grid_size=48, steps=60, seed=7)
+
+
+@pytest.fixture(scope="module")
+def elementary_atlas(tmp_path_factory):
+    return build_atlas(tmp_path_factory.mktemp("atlas") / "elementary",
+                       ca_type="elementary", chunk_size=100, **PROTOCOL)
+
+
+def test_atlas_matches_evaluate_rule(elementary_atlas):
+    """Stored metrics are exactly evaluate_rule's"""
+    assert elementary_atlas.n_evaluated == 256
+    assert elementary_atlas.matches("elementary", 48, 60, 7)
+    assert not elementary_atlas.matches("elementary", 48, 61, 7)
+    previous = set_legacy_seeding(True)
+    try:
+        assert not elementary_atlas.matches("elementary", 48, 60, 7)
+    finally:
+        set_legacy_seeding(previous)
+    assert elementary_atlas.metrics_of(30)["grid_size"] == (48,)
+    for rule in (0, 30, 90, 110, 184):
+        assert elementary_atlas.metrics_of(rule) == evaluate_rule(rule=rule, **PROTOCOL)
+
+
+def test_queries_match_brute_force(elementary_atlas):
+    """Range filters and nearest-target lookup agree with a scan of the records"""
+    records = elementary_atlas.records(range(256))
+    ranges = {"entropy": (0.3, 0.9), "activity": (None, 0.6), "unknown_metric": (0, 1)}
+    expected = [r["rule"] for r in records
+                if 0.3 <= r["entropy"] <= 0.9 and r["activity"] <= 0.6]
+    assert elementary_atlas.query(ranges).tolist() == expected
+
+    by_edge = elementary_atlas.query(ranges, order_by="edge_score", limit=5).tolist()
+    assert by_edge == sorted(expected, key=lambda rule: (-records[rule]["edge_score"], rule))[:5]
+
+    targets = {"edge_score": 0.3, "memory_score": 0.5}
+    distance = {r["rule"]: np.hypot(r["edge_score"] - 0.3, r["memory_score"] - 0.5) for r in records}
+    assert elementary_atlas.nearest(targets, k=8).tolist() == \
+        sorted(distance, key=lambda rule: (distance[rule], rule))[:8]
+
+
+def test_build_resumes_and_checks_protocol(tmp_path):
+    """Partial builds are resumed; another protocol is refused"""
+    path = tmp_path / "life"
+    settings = dict(ca_type="life", grid_size=(12, 12), steps=16)
+    atlas = build_atlas(path, rules=range(0, 1 << 18, 8192), **settings)
+    assert atlas.n_evaluated == 32 and len(atlas) == 1 << 18
+    assert atlas.metrics_of(1) is None
+
+    atlas = build_atlas(path, rules=[6152, 8192], **settings)
+    assert atlas.n_evaluated == 33
+    assert atlas.metrics_of(6152) == evaluate_rule(rule=6152, grid_size=(12, 12), steps=16,
+                                                   ca_type="life")
+    assert load_atlas("life", path).n_evaluated == 33
+    assert load_atlas("life", tmp_path / "missing") is None
+
+    with pytest.raises(ValueError):
+        build_atlas(path, rules=[1], ca_type="life", grid_size=(12, 12), steps=17)
+    previous = set_legacy_seeding(True)
+    try:
+        with pytest.raises(ValueError):
+            build_atlas(path, rules=[1], **settings)
+    finally:
+        set_legacy_seeding(previous)
+
+
+def test_profile_suggestions_and_regime_search(elementary_atlas, monkeypatch):
+    """Profiles are matched against the atlas; matching searches skip simulation"""
+    profile = get_target_profile_for_system("spin", "room", "short")
+    profile["target_metrics"] = {"entropy": (0.7, 1.0), "activity": (0.3, 0.7)}
+    suggestions = suggest_ca_rules_for_profile(profile, n_suggestions=12, atlas=elementary_atlas)
+    assert len(suggestions) == len(set(suggestions)) == 12
+    in_range = elementary_atlas.query(profile["target_metrics"]).tolist()
+    n_in_range = min(12, len(in_range))
+    assert n_in_range > 0 and set(suggestions[:n_in_range]) <= set(in_range)
+
+    # Too few rules in range: the nearest ones complete the list
+    narrow = dict(profile, target_metrics={"entropy": (0.99, 1.0), "activity": (0.5, 0.5)})
+    assert len(set(suggest_ca_rules_for_profile(narrow, n_suggestions=12, atlas=elementary_atlas))) == 12
+
+    heuristic = suggest_ca_rules_for_profile(profile, n_suggestions=5, atlas=False)
+    assert set(heuristic) <= {30, 45, 86, 89, 105, 122, 126, 129, 135, 149, 169}
+    with pytest.raises(ValueError):
+        suggest_ca_rules_for_profile(profile, ca_type="life", atlas=False)
+
+    def no_simulation(*args, **kwargs):
+        raise AssertionError("simulated rules held by the atlas")
+
+    monkeypatch.setattr(regime_search, "evaluate_batch", no_simulation)
+    results_df, top_rules = regime_search.run_regime_search(
+        profile, rule_pool=[30, 110, 184], grid_size=48, steps=60, seeds_per_rule=1,
+        base_seed=7, atlas=elementary_atlas
+    )
+    assert results_df["rule"].tolist() == [30, 110, 184]
+    assert results_df["edge_score"].tolist() == \
+        [evaluate_rule(rule=rule, **PROTOCOL)["edge_score"] for rule in (30, 110, 184)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
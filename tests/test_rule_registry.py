@@ -0,0 +1,140 @@
+"""
+Tests du registre de règles : codes 18 bits, distances de Hamming et scoring par lots.
+"""
+import random
+import pytest
+import numpy as np
+
+from isinglab.closed_loop_agi import ClosedLoopAGI
+from isinglab.memory_explorer import life_rule_to_int
+from isinglab.meta_learner import RuleRegistry, MetaModel
+from isinglab.meta_learner.feature_engineering import (
+    extract_feature_matrix, extract_rule_features, features_to_vector
+)
+from isinglab.meta_learner.selector import CandidateSelector
+from isinglab.meta_learner.rule_registry import (
+    rule_code, notation_code, code_lists, code_notation, hamming_distances, neighbor_codes
+)
+
+
+def _random_rule(rng):
+    born = sorted(rng.sample(range(9), rng.randint(1, 4)))
+    survive = sorted(rng.sample(range(9), rng.randint(1, 4)))
+    return born, survive
+
+
+def test_codes_round_trip():
+    """Même encodage que life_rule_to_int ; notation canonique."""
+    rng = random.Random(0)
+    for _ in range(50):
+        born, survive = _random_rule(rng)
+        code = rule_code(born, survive)
+        assert code == life_rule_to_int(born, survive)
+        assert code_lists(code) == (born, survive)
+        assert notation_code(code_notation(code)) == code
+    assert notation_code('B63/S32') == notation_code('B36/S23')
+    with pytest.raises(ValueError):
+        rule_code([9], [2])
+
+
+def test_distances_match_set_distance():
+    """popcount(XOR) = taille des différences symétriques B et S."""
+    rng = random.Random(1)
+    rules = [_random_rule(rng) for _ in range(40)]
+    registry = RuleRegistry.from_rules(
+        [{'born': b, 'survive': s, 'edge_score': 0.1 * k} for k, (b, s) in enumerate(rules)],
+        metrics=['edge_score']
+    )
+    born, survive = rules[0]
+    expected = [len(set(born) ^ set(b)) + len(set(survive) ^ set(s)) for b, s in rules]
+    assert registry.distances(rule_code(born, survive)).tolist() == expected
+    assert registry.distances(registry.codes).shape == (40, 40)
+    assert np.array_equal(hamming_distances(registry.codes[:, None], registry.codes),
+                          registry.distances(registry.codes))
+    assert registry.nearest(registry.codes[3]) == (3, 0)
+    assert registry.column('edge_score')[5] == pytest.approx(0.5)
+
+
+def test_neighbors_match_mutations():
+    """neighbor_codes reproduit CandidateSelector._mutate_rule, dans le même ordre."""
+    selector = CandidateSelector.__new__(CandidateSelector)
+    rng = random.Random(2)
+    for born, survive in [([3], [2]), ([3], [2, 3])] + [_random_rule(rng) for _ in range(20)]:
+        expected = [rule_code(b, s) for b, s in selector._mutate_rule(born, survive)]
+        assert neighbor_codes(rule_code(born, survive)).tolist() == expected
+    assert len(neighbor_codes(rule_code([3], [2]), keep_nonempty=False)) == 18
+
+
+def test_registry_growth_and_updates():
+    """Capacité doublée au besoin ; une règle répétée garde sa ligne."""
+    registry = RuleRegistry(metrics=['score'], capacity=2)
+    for k in range(10):
+        assert registry.add(k + 1, score=k) == k
+    assert registry.add(3, score=42.0) == 2
+    registry.add(rule_code([3], [2, 3]), 'B3/S23', novelty=0.5)
+
+    assert len(registry) == 11 and 3 in registry and 0 not in registry
+    assert registry.column('score')[2] == 42.0
+    assert np.isnan(registry.column('score')[10])
+    assert registry.notations[10] == 'B3/S23'
+    assert registry.row(rule_code([3], [2, 3])) == 10
+    assert registry.rows([3, 0, rule_code([3], [2, 3])]).tolist() == [2, -1, 10]
+    assert RuleRegistry().rows([3]).tolist() == [-1]
+
+
+def test_diversity_filter_accepts_registry():
+    """_is_diverse_enough : même verdict pour une liste ou un registre."""
+    agi = ClosedLoopAGI()
+    hof = [{'notation': 'B3/S23', 'born': [3], 'survive': [2, 3]},
+           {'notation': 'B36/S23', 'born': [3, 6], 'survive': [2, 3]}]
+    registry = RuleRegistry.from_rules(hof)
+
+    for candidate in ({'born': [3, 6], 'survive': [2, 3, 4]}, {'born': [1, 5, 7], 'survive': [0]}):
+        assert agi._is_diverse_enough(candidate, hof) == agi._is_diverse_enough(candidate, registry)
+    assert agi._is_diverse_enough({'born': [3, 6], 'survive': [2, 3, 4]}, registry) == \
+        (False, "Too similar to B36/S23 (dist=1)")
+    assert agi._is_diverse_enough({'born': [3]}, RuleRegistry()) == (True, "HoF empty")
+
+
+def test_feature_matrix_matches_rule_features():
+    """Lignes de extract_feature_matrix = vecteurs de extract_rule_features."""
+    codes = np.arange(0, 1 << 18, 97)
+    expected = np.array([features_to_vector(extract_rule_features(born=b, survive=s))
+                         for b, s in map(code_lists, codes)])
+    assert np.array_equal(extract_feature_matrix(codes), expected)
+
+
+def test_batch_scoring_matches_single_predictions():
+    """predict_proba_batch et le pool construit par lots = scoring règle par règle."""
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 1 << 18, size=60)
+    model = MetaModel()
+    assert model.predict_proba_batch(codes).tolist() == [0.5] * 60
+
+    model.train(extract_feature_matrix(codes), (codes & 0b1000 > 0).astype(int))
+    batch = model.predict_proba_batch(codes)
+    single = [model.predict_proba(born=b, survive=s) for b, s in map(code_lists, codes)]
+    assert batch == pytest.approx(single, rel=1e-12)
+
+    class SingleRuleModel:
+        def predict_proba(self, notation, born, survive):
+            return model.predict_proba(notation=notation, born=born, survive=survive)
+
+    memory = [{'notation': 'B3/S23', 'metadata': {'times_evaluated': 1}},
+              {'notation': 'B36/S23', 'metadata': {'times_evaluated': 2}}]
+    pools = []
+    for meta_model in (model, SingleRuleModel()):
+        random.seed(0)
+        pools.append(CandidateSelector(meta_model, memory, use_bandit=False)._build_candidate_pool(50))
+    batched, single_pool = pools
+    assert [c['notation'] for c in batched] == [c['notation'] for c in single_pool]
+    assert [c['score'] for c in batched] == pytest.approx([c['score'] for c in single_pool], rel=1e-12)
+    assert len({c['notation'] for c in batched}) == 50
+
+    penalized = next(c for c in batched if c['notation'] == 'B36/S23')
+    assert penalized['times_evaluated'] == 2
+    assert penalized['score'] == pytest.approx(penalized['raw_score'] * 0.7)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,146 @@
+"""
+Tests du stockage des règles : snapshot JSON + journal append-only.
+"""
+import sys
+import json
+import subprocess
+from pathlib import Path
+import pytest
+import numpy as np
+
+import isinglab.rules as rules_module
+from isinglab.rules import RuleStore, load_rules, add_or_update_rule, load_hof_rules
+from isinglab.meta_learner.dynamic_memory import DynamicMemoryManager
+from isinglab.meta_learner.memory_aggregator import MemoryAggregator
+
+
+def _rule(notation, score=0.0):
+    return {'notation': notation, 'scores': {'memory_score': score}}
+
+
+def test_upserts_append_to_log(tmp_path):
+    """Les upserts sont journalisés sans réécrire le snapshot."""
+    path = tmp_path / 'memory.json'
+    store = RuleStore(path)
+    store.upsert(_rule('B3/S23', 0.1))
+    store.flush()
+    snapshot = path.read_bytes()
+
+    assert store.upsert(_rule('B36/S23', np.float64(0.2)))
+    assert not store.upsert({'notation': 'B3/S23', 'tier': 'hof'})
+    store.flush()
+    store.flush()  # Rien de nouveau : aucune ligne
+
+    assert path.read_bytes() == snapshot
+    assert len(store.log_path.read_text().splitlines()) == 1 + 2
+
+    reloaded = load_rules(path)
+    assert [r['notation'] for r in reloaded] == ['B3/S23', 'B36/S23']
+    assert reloaded[0] == {'notation': 'B3/S23', 'scores': {'memory_score': 0.1}, 'tier': 'hof'}
+
+    # Modification en place : persistée par touch() ou sync()
+    store.get('B36/S23')['scores']['memory_score'] = 0.5
+    store.sync(store.rules)
+    assert load_rules(path)[1]['scores']['memory_score'] == 0.5
+
+
+def test_compaction_and_crash_safety(tmp_path):
+    """Compaction au-delà du seuil ; lignes tronquées et journaux périmés ignorés."""
+    path = tmp_path / 'memory.json'
+    store = RuleStore(path, min_compact=4)
+    for k in range(12):
+        store.upsert(_rule(f'B{k % 3}/S', k))
+        store.flush()
+
+    assert len(store.log_path.read_text().splitlines()) <= 1 + 4
+    payload = json.loads(path.read_text())
+    assert payload['meta']['count'] == 3
+    expected = [_rule('B0/S', 9), _rule('B1/S', 10), _rule('B2/S', 11)]
+    assert load_rules(path) == expected
+
+    # Crash au milieu d'une ligne
+    with open(store.log_path, 'a') as fh:
+        fh.write('{"notation": "B7/S", "sco')
+    assert load_rules(path) == expected
+
+    # Snapshot réécrit par un autre outil : le journal ne s'applique plus
+    path.write_text(json.dumps({'rules': [_rule('B8/S')]}))
+    assert [r['notation'] for r in load_rules(path)] == ['B8/S']
+    store.refresh()
+    store.upsert(_rule('B1/S1'))
+    store.flush()
+    assert [r['notation'] for r in load_rules(path)] == ['B8/S', 'B1/S1']
+
+
+def test_close_compacts_log(tmp_path):
+    """close() et la fin du processus replient le journal dans le snapshot."""
+    path = tmp_path / 'memory.json'
+    with RuleStore(path) as store:
+        store.upsert(_rule('B3/S23', 0.1))
+        store.flush()
+        store.upsert(_rule('B36/S23', 0.2))
+        store.flush()
+        store.upsert(_rule('B3/S23', 0.3))
+
+    assert not store.log_path.exists()
+    assert json.loads(path.read_text())['rules'] == [_rule('B3/S23', 0.3), _rule('B36/S23', 0.2)]
+    store.upsert(_rule('B2/S', 0.4))
+    store.flush()
+    assert load_rules(path)[-1] == _rule('B2/S', 0.4)
+
+    # Sortie du processus sans close()
+    script = (f"from isinglab.rules import RuleStore\n"
+              f"store = RuleStore({str(path)!r})\n"
+              f"store.upsert({{'notation': 'B1/S'}})\n"
+              f"store.flush()\n")
+    subprocess.run([sys.executable, '-c', script], check=True, cwd=Path(__file__).parent.parent)
+    assert not store.log_path.exists()
+    assert json.loads(path.read_text())['rules'][-1] == {'notation': 'B1/S'}
+
+
+def test_hof_updates_are_incremental(tmp_path, monkeypatch):
+    """add_or_update_rule ajoute une ligne au journal du HoF."""
+    monkeypatch.setattr(rules_module, 'HOF_PATH', tmp_path / 'hof_rules.json')
+    monkeypatch.setattr(rules_module, '_HOF_STORE', None)
+
+    assert add_or_update_rule({'notation': 'B3/S23', 'tier': 'champion'})
+    snapshot = (tmp_path / 'hof_rules.json').read_bytes()
+    assert add_or_update_rule({'notation': 'B36/S23'})
+    assert not add_or_update_rule({'notation': 'B3/S23', 'edge_score': 0.3})
+
+    assert (tmp_path / 'hof_rules.json').read_bytes() == snapshot
+    assert load_hof_rules() == [
+        {'notation': 'B3/S23', 'tier': 'champion', 'edge_score': 0.3},
+        {'notation': 'B36/S23'}
+    ]
+
+
+def test_memory_managers_round_trip(tmp_path):
+    """DynamicMemoryManager et MemoryAggregator relisent ce qu'ils écrivent."""
+    manager = DynamicMemoryManager(memory_path=tmp_path / 'agi_memory.json')
+    manager.aggregate_memory()
+    manager.add_or_update_rule({'notation': 'B3/S23', 'functional_score': 0.2})
+    manager.add_or_update_rule({'notation': 'B3/S23', 'functional_score': 0.4})
+    manager.save_memory()
+
+    again = DynamicMemoryManager(memory_path=tmp_path / 'agi_memory.json')
+    again.aggregate_memory()
+    assert again.memory_rules == [{'notation': 'B3/S23', 'functional_score': 0.4}]
+
+    aggregator = MemoryAggregator(hof_path=tmp_path / 'none.json',
+                                  scans_dir=tmp_path / 'scans',
+                                  output_path=tmp_path / 'meta_memory.json')
+    aggregator.meta_memory = [aggregator.normalize_rule_entry({'notation': 'B36/S23'}, 'test')]
+    aggregator.save()
+    memory = aggregator.aggregate()
+    memory[0]['labels'].append('hof')
+    aggregator.save()
+
+    reader = MemoryAggregator(hof_path=tmp_path / 'none.json',
+                              scans_dir=tmp_path / 'scans',
+                              output_path=tmp_path / 'meta_memory.json')
+    assert reader.load_existing_meta_memory()[0]['labels'] == ['hof']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])